@@ -13,7 +13,9 @@ library MontgomeryMLDSA {
     /// ----------------------------------------------------------------------
     /// Low-level Montgomery reduction (matches Dilithium / BoringSSL pattern)
     /// ----------------------------------------------------------------------
-    /// Input:  x < 2^64 (ми це гарантуємо у викликах)
+    /// Input:  x < Q * 2^32 (ми це гарантуємо у викликах: a*b < Q^2).
+    ///         Для більших x < 2^64 сума x + a*Q переповнює 64 біти
+    ///         (див. scripts/reduction_check.py --all-domains).
     /// Output: x * R^{-1} mod Q, в інтервалі [0, Q)
     function montgomeryReduce(uint256 x) internal pure returns (uint256) {
         unchecked {
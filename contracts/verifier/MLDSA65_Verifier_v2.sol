@@ -294,9 +294,14 @@ contract MLDSA65_Verifier_v2 {
             return false;
         }
 
+        // Stage markers are plain comments; scripts/stage_probe.py turns them into
+        // gasleft() checkpoints in an instrumented copy of the sources.
+        // @gas-stage decode_pk
         DecodedPublicKey memory dpk = _decodePublicKey(pk);
+        // @gas-stage decode_sig
         DecodedSignature memory dsig = _decodeSignature(sig);
 
+        // _compute_w closes the last stage itself (it is also called directly by test harnesses)
         MLDSA65_PolyVec.PolyVecK memory w = _compute_w(dpk, dsig);
         w;
         message_digest;
@@ -593,13 +598,16 @@ contract MLDSA65_Verifier_v2 {
         bytes32 rho = dpk.rho;
 
         // 1) NTT(z)
+        // @gas-stage ntt_z
         MLDSA65_PolyVec.PolyVecL memory z_ntt = MLDSA65_PolyVec.nttL(dsig.z);
 
         // 2) Optional challenge polynomial in NTT domain (only if c != 0)
         bool hasChallenge = (dsig.c != bytes32(0));
         int32[256] memory c_ntt;
         if (hasChallenge) {
+            // @gas-stage challenge
             int32[256] memory c_poly = _challengePoly(dsig.c);
+            // @gas-stage ntt_c
             c_ntt = MLDSA65_PolyVec._nttPoly(c_poly);
         }
 
@@ -609,12 +617,14 @@ contract MLDSA65_Verifier_v2 {
 
             // A·z part
             for (uint256 j = 0; j < MLDSA65_PolyVec.L; ++j) {
+                // @gas-stage expandA
                 int32[256] memory a_ntt = _expandA_poly_ntt(
                     rho,
                     uint8(k),
                     uint8(j)
                 );
 
+                // @gas-stage a_mul_z
                 int32[256] memory prod_ntt = MLDSA65_Poly.pointwiseMul(
                     a_ntt,
                     z_ntt.polys[j]
@@ -624,6 +634,7 @@ contract MLDSA65_Verifier_v2 {
             }
 
             // - c·t1 part (only if we have a non-zero challenge seed)
+            // @gas-stage c_mul_t1
             if (hasChallenge) {
                 int32[256] memory t1_ntt = MLDSA65_PolyVec._nttPoly(
                     dpk.t1.polys[k]
@@ -636,6 +647,7 @@ contract MLDSA65_Verifier_v2 {
             }
 
             // Back to time domain via PolyVecK.inttK
+            // @gas-stage intt_w
             MLDSA65_PolyVec.PolyVecK memory tmpK;
             tmpK.polys[0] = acc_ntt;
 
@@ -646,8 +658,10 @@ contract MLDSA65_Verifier_v2 {
         }
 
         // hints are still unused; full decomposition/hint logic is out-of-scope here
+        // (no w1 = UseHint(h, w) / w1 packing yet, hence no w1_pack stage)
         dsig.h;
 
+        // @gas-stage-end
         return w;
     }
 }
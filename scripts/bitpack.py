@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fixed-width coefficient packing for PQ keys / signatures, vectorized over any batch shape.
+
+pack(vals, bits) / unpack(buf, bits) treat the last axis as one coefficient stream; every
+leading axis is batch (e.g. [B, K, 256] -> [B, K, 32 * bits]). Bit order:
+  little   FIPS-204 SimpleBitPack / BitPack: coefficient i occupies bits [i*bits, (i+1)*bits)
+           of the little-endian bit stream; the layout _decodeT1Packed reads (4 x 10 bit -> 5 bytes)
+  big      Falcon: coefficients written MSB first (pk h, 14 bit -> 4 coefficients per 7 bytes)
+
+Fast path: as many byte-aligned groups of lcm(bits, 8) bits as fit in 64 bits are assembled / split
+as uint64 words with array shifts (w1 / eta 4 bit: 16 coefficients per word, t1 10 bit: 4, z 20 bit: 2,
+Falcon 14 bit: 4). Widths whose group exceeds 64 bits (t0 13 bit) use the bit-matrix path (packbits).
+Both paths are cross-checked by `check`.
+
+ENCODINGS adds the value map of each FIPS-204 field (stored = offset - v for the signed ones);
+the ML-DSA-65 pk / sig batch codecs are mldsa65_ref.pk_decode_batch / sig_decode_batch.
+
+Usage:
+  python3 scripts/bitpack.py check
+  python3 scripts/bitpack.py bench --batch 4096 --repeat 5
+  python3 scripts/bitpack.py bench --encoding t1 --encoding z --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+T1_KAT = ROOT / "vectors" / "mldsa65_t1_kat_001.json"
+
+BIT_ORDERS = ("little", "big")
+
+# name -> bits, offset (stored = offset - v; None = stored as is), bit order, coefficients per poly
+ENCODINGS: Dict[str, Dict[str, Any]] = {
+    "t1":        {"bits": 10, "offset": None,    "order": "little", "n": 256},  # pk t1 (SimpleBitPack, 2^10 - 1)
+    "t0":        {"bits": 13, "offset": 1 << 12, "order": "little", "n": 256},  # sk t0 (BitPack, 2^12 - 1, 2^12)
+    "eta":       {"bits": 4,  "offset": 4,       "order": "little", "n": 256},  # sk s1 / s2 (BitPack, eta = 4)
+    "z":         {"bits": 20, "offset": 1 << 19, "order": "little", "n": 256},  # sig z (BitPack, gamma1 - 1, gamma1)
+    "w1":        {"bits": 4,  "offset": None,    "order": "little", "n": 256},  # w1Encode ((q - 1) / (2 gamma2) - 1 = 15)
+    "falcon_pk": {"bits": 14, "offset": None,    "order": "big",    "n": 512},  # Falcon-512 pk h (q = 12289)
+}
+
+
+def _group(bits: int) -> int:
+    """Coefficients per uint64 word (as many byte-aligned groups as fit), or 0 when one group does not fit."""
+    span = math.lcm(bits, 8)
+    return (64 // span) * span // bits
+
+
+def _check_args(bits: int, order: str) -> None:
+    if not 1 <= bits <= 32:
+        raise ValueError(f"bits must be in [1, 32], got {bits}")
+    if order not in BIT_ORDERS:
+        raise ValueError(f"unknown bit order {order!r} (expected one of {', '.join(BIT_ORDERS)})")
+
+
+def _pack_bits(vals: np.ndarray, bits: int, order: str) -> np.ndarray:
+    sh = np.arange(bits) if order == "little" else np.arange(bits - 1, -1, -1)
+    b = ((vals[..., None] >> sh) & 1).astype(np.uint8)
+    b = b.reshape(vals.shape[:-1] + (vals.shape[-1] * bits,))
+    return np.packbits(b, axis=-1, bitorder=order)
+
+
+def _unpack_bits(buf: np.ndarray, bits: int, order: str) -> np.ndarray:
+    b = np.unpackbits(buf, axis=-1, bitorder=order).astype(np.int64)
+    b = b.reshape(buf.shape[:-1] + (buf.shape[-1] * 8 // bits, bits))
+    sh = np.arange(bits) if order == "little" else np.arange(bits - 1, -1, -1)
+    return (b << sh).sum(axis=-1)
+
+
+def _pack_words(vals: np.ndarray, bits: int, order: str, g: int) -> np.ndarray:
+    nb = g * bits // 8
+    v = vals.reshape(vals.shape[:-1] + (vals.shape[-1] // g, g)).astype(np.uint64)
+    if order == "little":
+        sh = np.arange(g, dtype=np.uint64) * np.uint64(bits)
+        w = np.bitwise_or.reduce(v << sh, axis=-1).astype("<u8")
+        raw = w.view(np.uint8).reshape(w.shape + (8,))[..., :nb]
+    else:
+        sh = np.arange(g - 1, -1, -1, dtype=np.uint64) * np.uint64(bits) + np.uint64(64 - 8 * nb)
+        w = np.bitwise_or.reduce(v << sh, axis=-1).astype(">u8")
+        raw = w.view(np.uint8).reshape(w.shape + (8,))[..., :nb]
+    return np.ascontiguousarray(raw).reshape(vals.shape[:-1] + (-1,))
+
+
+def _unpack_words(buf: np.ndarray, bits: int, order: str, g: int) -> np.ndarray:
+    nb = g * bits // 8
+    m = buf.shape[-1] // nb
+    wide = np.zeros(buf.shape[:-1] + (m, 8), dtype=np.uint8)
+    wide[..., :nb] = buf.reshape(buf.shape[:-1] + (m, nb))
+    mask = np.uint64((1 << bits) - 1)
+    if order == "little":
+        w = wide.view("<u8")
+        sh = np.arange(g, dtype=np.uint64) * np.uint64(bits)
+    else:
+        w = wide.view(">u8")
+        sh = np.arange(g - 1, -1, -1, dtype=np.uint64) * np.uint64(bits) + np.uint64(64 - 8 * nb)
+    vals = (w >> sh) & mask
+    return vals.reshape(buf.shape[:-1] + (m * g,)).astype(np.int64)
+
+
+def pack(vals, bits: int, order: str = "little") -> np.ndarray:
+    """[..., n] coefficients in [0, 2^bits) -> [..., n * bits / 8] uint8."""
+    _check_args(bits, order)
+    vals = np.asarray(vals, dtype=np.int64)
+    n = vals.shape[-1]
+    if (n * bits) % 8:
+        raise ValueError(f"{n} x {bits}-bit coefficients do not fill whole bytes")
+    if vals.size and (vals.min() < 0 or vals.max() >> bits):
+        raise ValueError(f"coefficient out of range for {bits}-bit packing: [{vals.min()}, {vals.max()}]")
+    g = _group(bits)
+    if g and n % g == 0:
+        return _pack_words(vals, bits, order, g)
+    return _pack_bits(vals, bits, order)
+
+
+def unpack(buf, bits: int, order: str = "little") -> np.ndarray:
+    """[..., m] bytes -> [..., m * 8 / bits] int64 coefficients."""
+    _check_args(bits, order)
+    buf = np.asarray(buf, dtype=np.uint8)
+    m = buf.shape[-1]
+    if (m * 8) % bits:
+        raise ValueError(f"{m} bytes is not a whole number of {bits}-bit coefficients")
+    g = _group(bits)
+    if g and m % (g * bits // 8) == 0:
+        return _unpack_words(buf, bits, order, g)
+    return _unpack_bits(buf, bits, order)
+
+
+def encode(vals, name: str) -> np.ndarray:
+    """Pack field `name` of ENCODINGS (applies offset - v for the signed fields)."""
+    enc = ENCODINGS[name]
+    vals = np.asarray(vals, dtype=np.int64)
+    if enc["offset"] is not None:
+        vals = enc["offset"] - vals
+    return pack(vals, enc["bits"], enc["order"])
+
+
+def decode(buf, name: str) -> np.ndarray:
+    enc = ENCODINGS[name]
+    vals = unpack(buf, enc["bits"], enc["order"])
+    return vals if enc["offset"] is None else enc["offset"] - vals
+
+
+def field_range(name: str) -> Tuple[int, int]:
+    """Inclusive (lo, hi) of the values `encode(…, name)` accepts."""
+    enc = ENCODINGS[name]
+    top = (1 << enc["bits"]) - 1
+    if enc["offset"] is None:
+        return 0, top
+    return enc["offset"] - top, enc["offset"]
+
+
+def decode_t1_solidity(src: bytes, k: int = 6) -> List[List[int]]:
+    """Line-by-line transliteration of MLDSA65_Verifier_v2._decodeT1Packed (layout oracle)."""
+    t1 = []
+    for p in range(k):
+        poly = [0] * 256
+        for group in range(64):
+            b0, b1, b2, b3, b4 = src[p * 320 + 5 * group:p * 320 + 5 * group + 5]
+            poly[4 * group + 0] = (b0 | ((b1 & 0x03) << 8)) & 0x03FF
+            poly[4 * group + 1] = ((b1 >> 2) | ((b2 & 0x0F) << 6)) & 0x03FF
+            poly[4 * group + 2] = ((b2 >> 4) | ((b3 & 0x3F) << 4)) & 0x03FF
+            poly[4 * group + 3] = ((b3 >> 6) | (b4 << 2)) & 0x03FF
+        t1.append(poly)
+    return t1
+
+
+def check(seed: int) -> int:
+    import mldsa65_ref as ref
+
+    rng = np.random.default_rng(seed)
+    fails: List[str] = []
+
+    for order in BIT_ORDERS:
+        for bits in range(1, 33):
+            n = 8 * 3 * 5 * 7  # fills whole bytes and whole groups for every width
+            vals = rng.integers(0, 1 << bits, size=(3, 2, n), dtype=np.int64)
+            vals[0, 0, :] = (1 << bits) - 1
+            vals[0, 1, :] = 0
+            fast, slow = pack(vals, bits, order), _pack_bits(vals, bits, order)
+            if not np.array_equal(fast, slow):
+                fails.append(f"pack {order}/{bits}: word path != bit path")
+            if not np.array_equal(unpack(fast, bits, order), vals):
+                fails.append(f"round trip {order}/{bits}")
+            if not np.array_equal(_unpack_bits(fast, bits, order), vals):
+                fails.append(f"unpack {order}/{bits}: bit path")
+
+    for name, enc in ENCODINGS.items():
+        lo, hi = field_range(name)
+        vals = rng.integers(lo, hi + 1, size=(4, 3, enc["n"]), dtype=np.int64)
+        vals[0, 0, 0], vals[0, 0, 1] = lo, hi
+        if not np.array_equal(decode(encode(vals, name), name), vals):
+            fails.append(f"round trip {name}")
+        try:
+            encode(np.full((1, enc["n"]), hi + 1), name)
+            fails.append(f"{name}: out-of-range value accepted")
+        except ValueError:
+            pass
+
+    kat = json.loads(T1_KAT.read_text(encoding="utf-8"))
+    pk = bytes.fromhex(kat["pubkey"].removeprefix("0x"))
+    t1 = unpack(np.frombuffer(pk[:1920], dtype=np.uint8).reshape(6, 320), 10)
+    if t1.tolist() != kat["t1"] or decode_t1_solidity(pk) != kat["t1"]:
+        fails.append(f"t1 layout != _decodeT1Packed ({T1_KAT.name})")
+    rnd = rng.integers(0, 256, size=1920, dtype=np.uint8).tobytes()
+    if unpack(np.frombuffer(rnd, dtype=np.uint8).reshape(6, 320), 10).tolist() != decode_t1_solidity(rnd):
+        fails.append("t1 layout != _decodeT1Packed (random bytes)")
+
+    keys = ref.keygen_batch([bytes([i]) * 32 for i in range(3)])
+    msgs = [bytes([0x42, i]) for i in range(3)]
+    sigs = ref.sign_batch([sk for _, sk in keys], msgs)
+    pks = np.frombuffer(b"".join(pk for pk, _ in keys), dtype=np.uint8).reshape(3, ref.PK_BYTES)
+    sb = np.frombuffer(b"".join(sigs), dtype=np.uint8).reshape(3, ref.SIG_BYTES)
+    rho, t1b = ref.pk_decode_batch(pks)
+    c_tilde, z, h, ok = ref.sig_decode_batch(sb)
+    for i, (pk, _) in enumerate(keys):
+        r1, t1s = ref.pk_decode(pk)
+        c1, z1, h1 = ref.sig_decode(sigs[i])
+        if rho[i].tobytes() != r1 or not np.array_equal(t1b[i], t1s):
+            fails.append(f"pk_decode_batch[{i}] != pk_decode")
+        if c_tilde[i].tobytes() != c1 or not np.array_equal(z[i], z1) or not ok[i] or not np.array_equal(h[i], h1):
+            fails.append(f"sig_decode_batch[{i}] != sig_decode")
+    if not np.array_equal(ref.pk_encode_batch(rho, t1b), pks):
+        fails.append("pk_encode_batch round trip")
+    if not np.array_equal(ref.sig_encode_batch(c_tilde, z, h), sb):
+        fails.append("sig_encode_batch round trip")
+
+    bad = sb.copy()
+    bad[0, -1] = ref.OMEGA + 1                       # hint end index past omega
+    bad[1, ref.SIG_BYTES - ref.K - 1] = 1            # non-zero padding after the last hint
+    _, _, _, ok_bad = ref.sig_decode_batch(bad)
+    for i in range(2):
+        if ok_bad[i] != (ref.hint_unpack(bad[i, ref.SIG_BYTES - ref.OMEGA - ref.K:].tobytes()) is not None):
+            fails.append(f"malformed hint [{i}]: batch validity != hint_unpack")
+
+    for f in fails:
+        print(f"FAIL {f}")
+    print(f"bitpack check: {'OK' if not fails else f'{len(fails)} failure(s)'}")
+    return 1 if fails else 0
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench(names: List[str], batch: int, repeat: int, seed: int, as_json: bool) -> int:
+    import mldsa65_ref as ref
+
+    rng = np.random.default_rng(seed)
+    rows: List[Dict[str, Any]] = []
+
+    for name in names:
+        enc = ENCODINGS[name]
+        lo, hi = field_range(name)
+        vals = rng.integers(lo, hi + 1, size=(batch, enc["n"]), dtype=np.int64)
+        buf = encode(vals, name)
+        raw = vals if enc["offset"] is None else enc["offset"] - vals
+        mb = buf.nbytes / 1e6
+        for path, p_fn, u_fn in (
+            ("words" if _group(enc["bits"]) else "bits",
+             lambda: encode(vals, name), lambda: decode(buf, name)),
+            ("bits", lambda: _pack_bits(raw, enc["bits"], enc["order"]),
+             lambda: _unpack_bits(buf, enc["bits"], enc["order"])),
+        ):
+            rows.append({"what": name, "path": path, "bytes": buf.nbytes,
+                         "pack_mb_s": mb / _best(p_fn, repeat), "unpack_mb_s": mb / _best(u_fn, repeat)})
+            if path == "bits":
+                break
+
+    nk = max(1, min(batch, 64))
+    keys = ref.keygen_batch([int(i).to_bytes(32, "little") for i in range(nk)])
+    sigs = ref.sign_batch([sk for _, sk in keys], [b"bitpack"] * nk)
+    reps = -(-batch // nk)
+    pks = np.tile(np.frombuffer(b"".join(pk for pk, _ in keys), dtype=np.uint8).reshape(nk, -1), (reps, 1))[:batch]
+    sb = np.tile(np.frombuffer(b"".join(sigs), dtype=np.uint8).reshape(nk, -1), (reps, 1))[:batch]
+    rho, t1 = ref.pk_decode_batch(pks)
+    c_tilde, z, h, _ = ref.sig_decode_batch(sb)
+    for what, arr, enc_fn, dec_fn in (
+        ("mldsa65_pk", pks, lambda: ref.pk_encode_batch(rho, t1), lambda: ref.pk_decode_batch(pks)),
+        ("mldsa65_sig", sb, lambda: ref.sig_encode_batch(c_tilde, z, h), lambda: ref.sig_decode_batch(sb)),
+    ):
+        mb = arr.nbytes / 1e6
+        rows.append({"what": what, "path": "batch", "bytes": arr.nbytes,
+                     "pack_mb_s": mb / _best(enc_fn, repeat), "unpack_mb_s": mb / _best(dec_fn, repeat)})
+    one = [pk for pk, _ in keys][0]
+    t = _best(lambda: [ref.pk_decode(one) for _ in range(64)], repeat)
+    rows.append({"what": "mldsa65_pk", "path": "per-key loop", "bytes": 64 * len(one),
+                 "pack_mb_s": None, "unpack_mb_s": 64 * len(one) / 1e6 / t})
+
+    if as_json:
+        print(json.dumps({"batch": batch, "repeat": repeat, "rows": rows}, indent=2))
+        return 0
+    print(f"batch={batch} repeat={repeat} (best of)")
+    print("| encoding | path | bytes | pack MB/s | unpack MB/s |")
+    print("|---|---|---:|---:|---:|")
+    for r in rows:
+        pk = "" if r["pack_mb_s"] is None else f"{r['pack_mb_s']:.1f}"
+        print(f"| {r['what']} | {r['path']} | {r['bytes']} | {pk} | {r['unpack_mb_s']:.1f} |")
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Vectorized fixed-width coefficient packing (FIPS-204 / Falcon).")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    c = sub.add_parser("check", help="round trips, word path == bit path, _decodeT1Packed layout, batch pk/sig codecs")
+    c.add_argument("--seed", type=int, default=1)
+
+    b = sub.add_parser("bench", help="pack / unpack throughput in MB/s")
+    b.add_argument("--encoding", action="append", default=[], choices=sorted(ENCODINGS))
+    b.add_argument("--batch", type=int, default=4096, help="polynomials per field / keys and signatures per batch")
+    b.add_argument("--repeat", type=int, default=5)
+    b.add_argument("--seed", type=int, default=1)
+    b.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    if args.cmd == "check":
+        return check(args.seed)
+    return bench(args.encoding or list(ENCODINGS), args.batch, args.repeat, args.seed, args.json)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
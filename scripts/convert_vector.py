@@ -1,26 +1,21 @@
-import json, base64
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 
-src = "test_vectors/vector_raw.json"
-dst = "test_vectors/vector_001.json"
+"""
+test_vectors/vector_raw.json (base64 dump) -> test_vectors/vector_001.json
+({"public_key_raw", "signature_raw", "msg_hash"}, read by MLDSA_RealVector / MLDSA_StructuralParser tests).
 
-with open(src) as f:
-    d = json.load(f)
+Thin wrapper over scripts/convert_vectors.py --format raw; extra arguments are passed through.
+"""
 
-# Extract fields
-pk_b64 = d["pq_pubkey_b64"]
-sig_b64 = d["sig_pq_b64"]
-msg_hash = d["msg_hash"]
+import sys
+from pathlib import Path
 
-pk_raw = base64.b64decode(pk_b64).hex()
-sig_raw = base64.b64decode(sig_b64).hex()
+from convert_vectors import main
 
-out = {
-    "public_key_raw": "0x" + pk_raw,
-    "signature_raw": "0x" + sig_raw,
-    "msg_hash": msg_hash
-}
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "test_vectors" / "vector_raw.json"
+DST = ROOT / "test_vectors" / "vector_001.json"
 
-with open(dst, "w") as f:
-    json.dump(out, f, indent=2)
-
-print("Wrote", dst)
+if __name__ == "__main__":
+    raise SystemExit(main([str(SRC), "--format", "raw", "--out", str(DST)] + sys.argv[1:]))
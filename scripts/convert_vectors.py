@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming base64 / hex -> hex JSON or .vpak converter for PQ signature vectors.
+
+Replaces the one-off decode_vectors.py / convert_vector.py / decode_real_pq.py (now thin wrappers).
+Records are streamed, never loaded as a whole file:
+  *.jsonl                         one vector object per line (parsed in the workers)
+  {"vectors": [...], ...}         the array is read incrementally with JSONDecoder.raw_decode
+  [...]                           same, top-level array
+  {...}                           a single raw dump (e.g. test_vectors/vector_raw.json)
+Field names follow vpack.KEYS (pq_pubkey_b64 / pubkey.b64 / pubkey_hex / public_key_raw, sig_pq_b64 /
+signature_hex / signature_raw, msg_hash, expected, ...); base64 is decoded straight into bytes.
+Batches of records go to a process pool (bounded window, output order = input order).
+
+Every record is validated against its scheme (record `pq_scheme` / `scheme`, else --scheme):
+  mldsa65     pk 1952, sig 3309, msg 32
+  falcon512   pk 897,  sig 42..752 (compressed / padded), msg 32
+  falcon1024  pk 1793, sig 42..1462, msg 32
+Invalid records fail the run (exit 1, first errors listed) unless --skip-invalid drops them.
+
+Output formats (--format):
+  pack    {"vectors": [{"name", "msg_hash", "pubkey_hex", "signature_hex", "expected"}]}  (sweep harness / mldsa65_real_hex.json;
+          `expected` only for labelled records, an unlabelled vector is measured but not checked;
+          --expected true|false labels the records that carry none)
+  raw     {"public_key_raw", "signature_raw", "msg_hash"} for exactly one record (test_vectors/vector_001.json)
+  jsonl   one pack-shaped vector per line
+  vpak    binary pack (scripts/vpack.py)
+
+Usage:
+  python3 scripts/convert_vectors.py test_vectors/mldsa65_real.json --out test_vectors/mldsa65_real_hex.json
+  python3 scripts/convert_vectors.py test_vectors/vector_raw.json --format raw --out test_vectors/vector_001.json
+  python3 scripts/convert_vectors.py dumps/*.jsonl --format vpak --out .tmp/real.vpak --jobs 8 --skip-invalid
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from vpack import PackWriter, file_sha256, record_from_json
+
+
+FORMATS = ("pack", "raw", "jsonl", "vpak")
+BATCH = 256
+WINDOW_PER_JOB = 4
+READ_CHUNK = 1 << 20
+
+# scheme -> field -> (min, max) length in bytes
+SCHEMES: Dict[str, Dict[str, Tuple[int, int]]] = {
+    "mldsa65": {"pk": (1952, 1952), "sig": (3309, 3309), "msg": (32, 32)},
+    "falcon512": {"pk": (897, 897), "sig": (42, 752), "msg": (32, 32)},
+    "falcon1024": {"pk": (1793, 1793), "sig": (42, 1462), "msg": (32, 32)},
+}
+SCHEME_ALIASES = {"mldsa65": "mldsa65", "dilithium3": "mldsa65", "falcon512": "falcon512", "falcon1024": "falcon1024"}
+
+
+def scheme_of(obj: Dict[str, Any], default: str) -> str:
+    raw = obj.get("pq_scheme") or obj.get("scheme") or default
+    key = re.sub(r"[^a-z0-9]", "", str(raw).lower())
+    return SCHEME_ALIASES.get(key, key)
+
+
+def validate(rec: Dict[str, Any], scheme: str) -> Optional[str]:
+    limits = SCHEMES.get(scheme)
+    if limits is None:
+        return f"unknown scheme {scheme!r} (known: {', '.join(SCHEMES)})"
+    for field, (lo, hi) in limits.items():
+        n = len(rec[field])
+        if not lo <= n <= hi:
+            want = str(lo) if lo == hi else f"{lo}..{hi}"
+            return f"{field} is {n} bytes, {scheme} expects {want}"
+    return None
+
+
+def pack_item(rec: Dict[str, Any]) -> Dict[str, Any]:
+    item: Dict[str, Any] = {
+        "name": rec["name"],
+        "msg_hash": "0x" + rec["msg"].hex(),
+        "pubkey_hex": "0x" + rec["pk"].hex(),
+        "signature_hex": "0x" + rec["sig"].hex(),
+    }
+    if rec["expected"] is not None:   # unknown stays unknown (as vpack.export_hex)
+        item["expected"] = rec["expected"]
+    if rec.get("mutation"):
+        item["mutation"] = rec["mutation"]
+    return item
+
+
+HEX_KEYS = ("msg_hash", "pubkey_hex", "signature_hex")
+
+
+def _indented(item: Dict[str, Any]) -> str:
+    # same text as json.dump(..., indent=2) produces for a flat object at depth 2, without the
+    # pure-Python indenting encoder; "0x..." strings never need escaping, so they skip the encoder too
+    body = ",\n".join(f'      "{k}": ' + (f'"{v}"' if k in HEX_KEYS else json.dumps(v)) for k, v in item.items())
+    return "    {\n" + body + "\n    }"
+
+
+def _convert_batch(
+        task: Tuple[int, List[Any], str, str, str, str, Optional[bool]]) -> List[Tuple[int, Any, Optional[str]]]:
+    """Worker: (first index, objects or JSON lines, default scheme, name format, stem, fmt, default expected)
+    -> [(index, out, error)]."""
+    start, items, default_scheme, name_fmt, stem, fmt, expected = task
+    out: List[Tuple[int, Any, Optional[str]]] = []
+    for k, obj in enumerate(items):
+        i = start + k
+        try:
+            if isinstance(obj, str):
+                obj = json.loads(obj)
+            if not isinstance(obj, dict):
+                raise ValueError(f"expected a JSON object, got {type(obj).__name__}")
+            rec = record_from_json(obj, i)
+            if rec["name"] == f"v{i:06d}":
+                rec["name"] = name_fmt.format(stem=stem, i=i, n=i + 1)
+            if rec["expected"] is None:
+                rec["expected"] = expected
+            err = validate(rec, scheme_of(obj, default_scheme))
+        except (ValueError, TypeError) as e:  # bad JSON / hex / base64 (binascii.Error is a ValueError)
+            out.append((i, None, f"#{i}: {e}"))
+            continue
+        if err:
+            out.append((i, None, f"#{i} {rec['name']}: {err}"))
+        elif fmt == "vpak":
+            out.append((i, rec, None))
+        elif fmt == "raw":
+            out.append((i, {"public_key_raw": "0x" + rec["pk"].hex(), "signature_raw": "0x" + rec["sig"].hex(),
+                            "msg_hash": "0x" + rec["msg"].hex()}, None))
+        else:
+            item = pack_item(rec)
+            text = json.dumps(item) if fmt == "jsonl" else _indented(item)
+            out.append((i, text, None))
+    return out
+
+
+def _iter_array(f, buf: str, pos: int) -> Iterator[Any]:
+    """Yield the elements of a JSON array whose '[' ends at buf[:pos], refilling buf from f as needed."""
+    dec = json.JSONDecoder()
+    ws = re.compile(r"[\s,]*")
+    while True:
+        pos = ws.match(buf, pos).end()
+        while pos >= len(buf) - 1:
+            more = f.read(READ_CHUNK)
+            if not more:
+                break
+            buf = buf[pos:] + more
+            pos = ws.match(buf, 0).end()
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        while True:
+            try:
+                obj, end = dec.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError:
+                more = f.read(READ_CHUNK)
+                if not more:
+                    raise
+                buf = buf[pos:] + more
+                pos = 0
+        yield obj
+        pos = end
+        if pos > READ_CHUNK:
+            buf, pos = buf[pos:], 0
+
+
+def iter_records(path: Path) -> Iterator[Any]:
+    """Stream vector objects (or raw JSONL lines) from one input file."""
+    if path.suffix == ".jsonl":
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield line
+        return
+    with path.open("r", encoding="utf-8") as f:
+        buf = f.read(READ_CHUNK)
+        head = buf.lstrip()
+        if head.startswith("["):
+            yield from _iter_array(f, buf, buf.index("[") + 1)
+            return
+        key = re.compile(r'"vectors"\s*:\s*\[')
+        m = key.search(buf)
+        while m is None:
+            more = f.read(READ_CHUNK)
+            if not more:
+                break
+            buf += more
+            m = key.search(buf)
+        if m is not None:
+            yield from _iter_array(f, buf, m.end())
+            return
+        obj = json.loads(buf)
+        yield obj.get("vector", obj) if isinstance(obj, dict) else obj
+
+
+def _batches(paths: List[Path], scheme: str, name_fmt: str, fmt: str,
+             expected: Optional[bool]) -> Iterator[Tuple[int, List[Any], str, str, str, str, Optional[bool]]]:
+    i = 0
+    for p in paths:
+        items: List[Any] = []
+        for obj in iter_records(p):
+            items.append(obj)
+            if len(items) == BATCH:
+                yield (i, items, scheme, name_fmt, p.stem, fmt, expected)
+                i += len(items)
+                items = []
+        if items:
+            yield (i, items, scheme, name_fmt, p.stem, fmt, expected)
+            i += len(items)
+
+
+def _ordered(pool, fn, tasks, window: int):
+    # like pool.map, but only `window` batches are read ahead of the writer
+    pending = deque()
+    for t in tasks:
+        pending.append(pool.submit(fn, t))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def convert(paths: List[Path], out: Path, fmt: str, scheme: str, name_fmt: str, jobs: int,
+            skip_invalid: bool, expected: Optional[bool] = None) -> Tuple[int, List[str]]:
+    """Returns (records written, errors). Nothing is left at `out` when errors abort the run."""
+    tasks = _batches(paths, scheme, name_fmt, fmt, expected)
+    pool = None
+    if jobs <= 1:
+        results = map(_convert_batch, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = _ordered(pool, _convert_batch, tasks, jobs * WINDOW_PER_JOB)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    errors: List[str] = []
+    written = 0
+    raw: List[Dict[str, Any]] = []
+    # sources by content, not path: meta is hashed into the pack id
+    writer = PackWriter(out, {"scheme": scheme, "source_sha256": [file_sha256(p) for p in paths]}) if fmt == "vpak" else None
+    f = None if fmt in ("vpak", "raw") else tmp.open("w", encoding="utf-8")
+    try:
+        if fmt == "pack":
+            f.write('{\n  "vectors": [')
+        for batch in results:
+            for _i, item, err in batch:
+                if err:
+                    errors.append(err)
+                    continue
+                if errors and not skip_invalid:
+                    continue
+                if fmt == "vpak":
+                    writer.add_record(item)
+                elif fmt == "raw":
+                    raw.append(item)
+                elif fmt == "jsonl":
+                    f.write(item + "\n")
+                else:
+                    f.write(("\n" if written == 0 else ",\n") + item)
+                written += 1
+        if fmt == "pack":
+            f.write("\n  ]\n}" if written else "]\n}")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if f is not None:
+            f.close()
+
+    ok = not errors or skip_invalid
+    if fmt == "raw" and ok and written != 1:
+        errors.append(f"--format raw needs exactly one record, got {written}")
+        ok = False
+    if not ok:
+        if writer is not None:
+            writer.abort()
+        tmp.unlink(missing_ok=True)
+        return written, errors
+    if writer is not None:
+        writer.close()
+    elif fmt == "raw":
+        with tmp.open("w", encoding="utf-8") as g:
+            json.dump(raw[0], g, indent=2)
+        tmp.replace(out)
+    else:
+        tmp.replace(out)
+    return written, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Stream PQ vector dumps (base64 / hex) into hex JSON or .vpak.")
+    ap.add_argument("inputs", nargs="+")
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--format", choices=FORMATS, default="", help="default: from --out suffix (.vpak, .jsonl) else pack")
+    ap.add_argument("--scheme", default="mldsa65", help="scheme for records without pq_scheme / scheme")
+    ap.add_argument("--name-format", default="{stem}_{i:06d}",
+                    help="name for records without one ({stem}, {i} 0-based, {n} 1-based)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--skip-invalid", action="store_true", help="drop invalid records instead of failing")
+    ap.add_argument("--expected", choices=("true", "false"), default=None,
+                    help="`expected` for records without one (default: leave them unlabelled)")
+    args = ap.parse_args(argv)
+
+    out = Path(args.out)
+    fmt = args.format or {".vpak": "vpak", ".jsonl": "jsonl"}.get(out.suffix, "pack")
+    paths = [Path(p) for p in args.inputs]
+    for p in paths:
+        if not p.exists():
+            raise SystemExit(f"missing input: {p}")
+    scheme = scheme_of({}, args.scheme)
+    if scheme not in SCHEMES:
+        raise SystemExit(f"unknown scheme {args.scheme!r} (known: {', '.join(SCHEMES)})")
+
+    t0 = time.perf_counter()
+    try:
+        expected = None if args.expected is None else args.expected == "true"
+        written, errors = convert(paths, out, fmt, scheme, args.name_format, args.jobs, args.skip_invalid, expected)
+    except json.JSONDecodeError as e:
+        raise SystemExit(f"bad JSON input: {e}")
+    dt = time.perf_counter() - t0
+
+    for e in errors[:20]:
+        print(f"INVALID {e}", file=sys.stderr)
+    if len(errors) > 20:
+        print(f"INVALID ... {len(errors) - 20} more", file=sys.stderr)
+    if errors and not args.skip_invalid or (fmt == "raw" and written != 1):
+        print(f"FAILED: {len(errors)} invalid record(s); nothing written to {out}", file=sys.stderr)
+        return 1
+    print(f"WROTE {out} ({fmt}): {written} vectors" + (f", {len(errors)} skipped" if errors else "")
+          + f" in {dt:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Local read-only JSON query service over data/results.jsonl (asyncio, stdlib only).
+
+The dataset is held in memory as an indexed model: rows in file order, row ids per surface_id and
+per canonical rid (scheme::bench_name), the latest record per rid (same rule as the readiness table),
+the weakest-link / path results (scripts/path_cost.py) and the readiness table rows. Every query is
+answered from an immutable snapshot of that model, so requests never wait for a reload.
+
+Reload: the file is polled (size, mtime) and read with scripts/jsonl_tail.py: an append parses only
+the new complete lines, any other change re-reads the file. Parsing and the weakest-link pass run
+in a worker thread; the new snapshot is swapped in when it is complete. Row / history lists are
+append-only and shared between snapshots, each snapshot reading only its first n rows. The
+weakest-link / readiness results depend only on the latest record per rid, so they are recomputed
+only when a reload changed one; an append of older or unparsable rows reuses the previous ones.
+
+Endpoints (GET, JSON):
+  /health                                     rows, rids, offset, reload counters
+  /latest?scheme=&chain_profile=&surface_layer=&surface_prefix=&rid=
+                                              latest row per rid
+  /history?surface_id=... | ?rid=...  [&since=&until=&limit=]
+                                              rows over time (ts_utc order); since / until are
+                                              ISO dates or date-times (naive = UTC)
+  /weakest-link[?rid=...&roots=1]             effective bits, bottleneck, critical edge, path gas
+  /readiness[?category=...]                   protocol_readiness table rows
+
+Usage:
+  python3 scripts/dataset_service.py                     # http://127.0.0.1:8765
+  python3 scripts/dataset_service.py --port 0 --poll 0.5
+  curl -s 'http://127.0.0.1:8765/latest?scheme=falcon'
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import jsonl_tail
+import path_cost
+from make_protocol_readiness import Record, is_newer, readiness_rows
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+
+MAX_REQUEST_LINE = 8192
+
+Row = Dict[str, Any]
+
+
+# ---- model ----
+
+@dataclass(frozen=True)
+class Snapshot:
+    version: int
+    n: int                                   # rows visible to this snapshot
+    offset: int
+    rows: List[Row]                          # shared, append-only
+    by_surface: Dict[str, List[int]]         # shared, append-only index lists
+    by_rid: Dict[str, List[int]]
+    latest: Dict[str, Record]                # private copy
+    paths: Dict[str, path_cost.PathCost]
+    readiness: List[Row]
+    roots: List[str]
+    loaded_at: float
+
+    def history(self, ids: List[int]) -> List[Row]:
+        return [self.rows[i] for i in ids[:bisect_left(ids, self.n)]]
+
+
+@dataclass
+class Dataset:
+    """Loader state; only touched from the reload worker."""
+    path: Path
+    rows: List[Row] = field(default_factory=list)
+    by_surface: Dict[str, List[int]] = field(default_factory=dict)
+    by_rid: Dict[str, List[int]] = field(default_factory=dict)
+    latest: Dict[str, Tuple[str, int, Record]] = field(default_factory=dict)
+    latest_version: int = 0   # bumped whenever a rid's latest record changes
+    # (latest_version, latest, paths, readiness rows, roots) of the last snapshot
+    derived: Optional[Tuple[int, Dict[str, Record], Dict[str, path_cost.PathCost], List[Row], List[str]]] = None
+    tailer: jsonl_tail.Tailer = field(init=False)
+    version: int = 0
+    appends: int = 0
+    rebuilds: int = 0
+
+    def __post_init__(self) -> None:
+        self.tailer = jsonl_tail.Tailer(self.path)
+
+    def _ingest(self, line: bytes) -> None:
+        try:
+            obj = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(obj, dict):
+            return
+        i = len(self.rows)
+        self.rows.append(obj)
+        if obj.get("surface_id"):
+            self.by_surface.setdefault(str(obj["surface_id"]), []).append(i)
+        try:
+            r = Record.from_json(obj)
+        except Exception:
+            return
+        self.by_rid.setdefault(r.rid, []).append(i)
+        prev = self.latest.get(r.rid)
+        if prev is None or is_newer(r.ts, i, prev[0], prev[1]):
+            self.latest[r.rid] = (r.ts, i, r)
+            self.latest_version += 1
+
+    def refresh(self) -> Tuple[str, Snapshot]:
+        """Consume new complete lines (or re-read everything); returns (what happened, new snapshot)."""
+        appended, lines = self.tailer.read()
+        mode = "append" if self.version else "load"
+        if not appended:
+            mode = "rebuild" if self.version else "load"
+            # new containers: snapshots taken so far keep the old ones
+            self.rows, self.by_surface, self.by_rid, self.latest = [], {}, {}, {}
+            self.latest_version += 1
+        for line in lines:
+            if line.strip():
+                self._ingest(line)
+        if mode == "append":
+            self.appends += 1
+        elif mode == "rebuild":
+            self.rebuilds += 1
+        self.version += 1
+        return mode, self.snapshot()
+
+    def snapshot(self) -> Snapshot:
+        if self.derived is None or self.derived[0] != self.latest_version:
+            latest = {rid: rec for rid, (_, __, rec) in self.latest.items()}
+            graph = path_cost.build_graph(latest)
+            paths = path_cost.evaluate(latest, graph)
+            eff = {rid: pc.bits for rid, pc in paths.items()}
+            self.derived = (self.latest_version, latest, paths, readiness_rows(latest, eff),
+                            path_cost.roots(graph, include_leaves=True))
+        _, latest, paths, readiness, roots = self.derived   # never mutated, shared between snapshots
+        return Snapshot(self.version, len(self.rows), self.tailer.offset, self.rows, self.by_surface, self.by_rid,
+                        latest, paths, readiness, roots, time.time())
+
+
+# ---- queries ----
+
+class BadRequest(Exception):
+    pass
+
+
+def _one(q: Dict[str, List[str]], key: str) -> str:
+    return q.get(key, [""])[-1]
+
+
+def _limit(q: Dict[str, List[str]]) -> int:
+    try:
+        return max(0, int(_one(q, "limit") or 0))
+    except ValueError:
+        raise BadRequest("limit must be an integer")
+
+
+def _ts(v: Any) -> Optional[float]:
+    if not isinstance(v, str) or not v:
+        return None
+    try:
+        dt = datetime.fromisoformat(v.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _bound(q: Dict[str, List[str]], key: str) -> Optional[float]:
+    v = _one(q, key)
+    if not v:
+        return None
+    t = _ts(v)
+    if t is None:
+        raise BadRequest(f"{key} must be an ISO date or date-time, got {v!r}")
+    return t
+
+
+def q_health(s: Snapshot, q: Dict[str, List[str]], ds: Dataset) -> Any:
+    return {"rows": s.n, "rids": len(s.latest), "offset": s.offset, "version": s.version,
+            "appends": ds.appends, "rebuilds": ds.rebuilds, "loaded_at": s.loaded_at}
+
+
+def q_latest(s: Snapshot, q: Dict[str, List[str]], ds: Dataset) -> Any:
+    eq = {k: _one(q, k) for k in ("scheme", "chain_profile", "surface_layer") if _one(q, k)}
+    prefix, rid = _one(q, "surface_prefix"), _one(q, "rid")
+    out = []
+    for key in sorted(s.latest):
+        m = s.latest[key].meta
+        if rid and key != rid:
+            continue
+        if any(str(m.get(k, "")) != v for k, v in eq.items()):
+            continue
+        if prefix and not str(m.get("surface_id", "")).startswith(prefix):
+            continue
+        out.append(dict(m, rid=key))
+    return out
+
+
+def q_history(s: Snapshot, q: Dict[str, List[str]], ds: Dataset) -> Any:
+    surface, rid = _one(q, "surface_id"), _one(q, "rid")
+    if bool(surface) == bool(rid):
+        raise BadRequest("give exactly one of surface_id= or rid=")
+    ids = s.by_surface.get(surface, []) if surface else s.by_rid.get(rid, [])
+    since, until = _bound(q, "since"), _bound(q, "until")
+    # compared as instants, not strings: 2026-01-04 vs 2026-01-04T14:19:37Z, +02:00 offsets, ...
+    timed = [(_ts(r.get("ts_utc")), r) for r in s.history(ids)]
+    timed.sort(key=lambda tr: float("-inf") if tr[0] is None else tr[0])
+    if since is not None or until is not None:
+        # a row without a readable ts_utc cannot be placed in a window
+        timed = [(t, r) for t, r in timed if t is not None
+                 and (since is None or t >= since) and (until is None or t < until)]
+    rows = [r for _, r in timed]
+    limit = _limit(q)
+    return rows[-limit:] if limit else rows
+
+
+def q_weakest_link(s: Snapshot, q: Dict[str, List[str]], ds: Dataset) -> Any:
+    rid = _one(q, "rid")
+    keys = [rid] if rid else (s.roots if _one(q, "roots") in ("1", "true") else sorted(s.paths))
+    out = []
+    for k in keys:
+        pc = s.paths.get(k)
+        if pc is None:
+            continue
+        out.append({"rid": k, "effective_security_bits": pc.bits, "bottleneck": pc.bottleneck,
+                    "critical_edge": list(pc.critical_edge) if pc.critical_edge else None, "issue": pc.issue or None,
+                    "path": path_cost.chain(s.paths, k), "path_gas": pc.gas, "gas_per_bit": pc.gas_per_bit})
+    return out
+
+
+def q_readiness(s: Snapshot, q: Dict[str, List[str]], ds: Dataset) -> Any:
+    cat = _one(q, "category")
+    return [r for r in s.readiness if not cat or r["category"] == cat]
+
+
+ROUTES: Dict[str, Callable[[Snapshot, Dict[str, List[str]], Dataset], Any]] = {
+    "/health": q_health,
+    "/latest": q_latest,
+    "/history": q_history,
+    "/weakest-link": q_weakest_link,
+    "/readiness": q_readiness,
+}
+
+
+# ---- server ----
+
+class Service:
+    def __init__(self, path: Path, poll: float) -> None:
+        self.ds = Dataset(path)
+        self.poll = poll
+        self.snap: Optional[Snapshot] = None
+        self._stat: Tuple[int, int] = (-1, -1)
+
+    def _stat_now(self) -> Tuple[int, int]:
+        try:
+            st = self.ds.path.stat()
+        except OSError:
+            return (-1, -1)
+        return (st.st_size, st.st_mtime_ns)
+
+    async def reload(self) -> None:
+        stat = self._stat_now()
+        if stat == self._stat or stat[0] < 0:
+            return
+        t0 = time.perf_counter()
+        mode, snap = await asyncio.get_running_loop().run_in_executor(None, self.ds.refresh)
+        self._stat, self.snap = stat, snap
+        print(f"[serve] {mode}: {snap.n} rows, {len(snap.latest)} rids (v{snap.version}, "
+              f"{(time.perf_counter() - t0) * 1000:.0f} ms)", flush=True)
+
+    async def watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll)
+            try:
+                await self.reload()
+            except Exception as e:  # keep serving the last good snapshot
+                print(f"[serve] reload failed: {e}", flush=True)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=10)
+            while (await asyncio.wait_for(reader.readline(), timeout=10)) not in (b"\r\n", b"\n", b""):
+                pass
+            status, body = self.respond(line)
+        except (asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+        data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        head = (f"HTTP/1.1 {status}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n")
+        writer.write(head.encode("ascii") + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    def respond(self, line: bytes) -> Tuple[str, Any]:
+        parts = line.decode("latin-1").split()
+        if len(line) > MAX_REQUEST_LINE or len(parts) != 3:
+            return "400 Bad Request", {"error": "malformed request line"}
+        method, target, _ = parts
+        if method != "GET":
+            return "405 Method Not Allowed", {"error": "read-only service: GET only"}
+        url = urlsplit(target)
+        fn = ROUTES.get(unquote(url.path).rstrip("/") or "/")
+        if fn is None:
+            return "404 Not Found", {"error": f"unknown endpoint {url.path}", "endpoints": sorted(ROUTES)}
+        snap = self.snap
+        if snap is None:
+            return "503 Service Unavailable", {"error": f"dataset not loaded yet: {self.ds.path}"}
+        try:
+            return "200 OK", fn(snap, parse_qs(url.query), self.ds)
+        except BadRequest as e:
+            return "400 Bad Request", {"error": str(e)}
+
+
+async def serve(path: Path, host: str, port: int, poll: float) -> None:
+    svc = Service(path, poll)
+    await svc.reload()
+    server = await asyncio.start_server(svc.handle, host, port)
+    bound = server.sockets[0].getsockname()
+    print(f"[serve] listening on http://{bound[0]}:{bound[1]} ({path})", flush=True)
+    async with server:
+        await asyncio.gather(server.serve_forever(), svc.watch())
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Read-only dataset query service (localhost).")
+    ap.add_argument("--jsonl", default=str(DATA_JSONL))
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765, help="0 = any free port")
+    ap.add_argument("--poll", type=float, default=1.0, help="seconds between change checks")
+    args = ap.parse_args()
+
+    path = Path(args.jsonl)
+    if not path.exists():
+        raise SystemExit(f"Missing {path}")
+    try:
+        asyncio.run(serve(path, args.host, args.port, args.poll))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
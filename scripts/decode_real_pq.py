@@ -1,28 +1,23 @@
-import json, base64
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 
-data = json.load(open("tmp.json"))
-sig_b64 = data["sig_pq_b64"]
-pk_b64  = data["pq_pubkey_b64"]
-msg     = data["msg_hash"].replace("0x","")
+"""
+Raw PQ dump (default ./tmp.json: pq_pubkey_b64, sig_pq_b64, msg_hash) -> test_vectors/mldsa65_real_hex.json
+as a one-vector pack named real001. The dump carries no label, so it is written with expected = true
+(--expected true; `--expected false` after the input overrides it) and stays a checked vector.
 
-sig_hex = base64.b64decode(sig_b64).hex()
-pk_hex  = base64.b64decode(pk_b64).hex()
+Thin wrapper over scripts/convert_vectors.py; `python3 scripts/decode_real_pq.py dump.json` converts another file.
+"""
 
-print("PUBKEY HEX:\n", pk_hex)
-print("\nSIGNATURE HEX:\n", sig_hex)
-print("\nMSG HASH:\n", msg)
+import sys
+from pathlib import Path
 
-# rewrite vector file
-vec = {
-    "vectors":[
-        {
-            "name":"real001",
-            "msg_hash": msg,
-            "pubkey_hex": pk_hex,
-            "signature_hex": sig_hex,
-            "expected": True
-        }
-    ]
-}
+from convert_vectors import main
 
-json.dump(vec, open("test_vectors/mldsa65_real_hex.json","w"), indent=2)
+ROOT = Path(__file__).resolve().parents[1]
+OUTPUT = ROOT / "test_vectors" / "mldsa65_real_hex.json"
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else "tmp.json"
+    raise SystemExit(main([src, "--out", str(OUTPUT), "--name-format", "real{n:03d}",
+                            "--expected", "true"] + sys.argv[2:]))
@@ -1,28 +1,21 @@
-import json
-import base64
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
 
-INPUT = "test_vectors/mldsa65_real.json"
-OUTPUT = "test_vectors/mldsa65_real_hex.json"
+"""
+test_vectors/mldsa65_real.json (base64) -> test_vectors/mldsa65_real_hex.json (sweep pack shape).
 
-def b64_to_hex(b64str):
-    raw = base64.b64decode(b64str)
-    return "0x" + raw.hex()
+Thin wrapper over scripts/convert_vectors.py (streaming, validated, parallel); extra arguments are
+passed through, e.g. `--jobs 8` or `--format vpak --out .tmp/mldsa65_real.vpak`.
+"""
 
-with open(INPUT, "r") as f:
-    data = json.load(f)
+import sys
+from pathlib import Path
 
-out = {"vectors": []}
+from convert_vectors import main
 
-for v in data["vectors"]:
-    out["vectors"].append({
-        "name": v["name"],
-        "msg_hash": v["msg_hash"],                  # already hex
-        "pubkey_hex": b64_to_hex(v["pubkey.b64"]), # NEW
-        "signature_hex": b64_to_hex(v["sig_pq_b64"]),
-        "expected": v["expected"]
-    })
+ROOT = Path(__file__).resolve().parents[1]
+INPUT = ROOT / "test_vectors" / "mldsa65_real.json"
+OUTPUT = ROOT / "test_vectors" / "mldsa65_real_hex.json"
 
-with open(OUTPUT, "w") as f:
-    json.dump(out, f, indent=2)
-
-print("Done! Wrote:", OUTPUT)
+if __name__ == "__main__":
+    raise SystemExit(main([str(INPUT), "--out", str(OUTPUT)] + sys.argv[1:]))
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offline FIPS-204 ExpandA for ML-DSA-65 + packedA_ntt export for the PreA benches.
+
+ExpandA(rho) is SHAKE128 rejection sampling into A_hat[6][5][256] (already NTT domain),
+see mldsa65_ref.expand_a. This is NOT what contracts/verifier/MLDSA65_ExpandA.sol computes: that
+library is a synthetic keccak256(rho || row || col || i) PRF in the time domain, so the blobs here
+are no KATs for it (--check recomputes the synthetic matrix and reports that it differs).
+
+Many rho values are expanded in parallel on a process pool; results are cached on disk, keyed by
+rho (expanded matrix) and by rho + layout (packed blob):
+
+  .tmp/expand_a_cache/v1/<rho>.npy              expanded A_hat, uint32 [6, 5, 256]
+  .tmp/expand_a_cache/v1/<rho>.<layout>.bin     packedA_ntt for that layout
+
+Layouts (row-major A[k][l][256], no padding between polynomials; spec/prea_abi_convention.md):
+  u32le     uint32 little-endian per coefficient (the "v1" recommendation)       30720 bytes
+  u32be     uint32 big-endian (mload/shr-friendly word order)                   30720 bytes
+  u24le     3 bytes little-endian per coefficient (q < 2^23)                    23040 bytes
+  prea_v1   "PREA" || version=1 || params_id=1 (ML-DSA-65) || u32le payload     30726 bytes
+
+Usage:
+  python3 scripts/expand_a.py --rho 0x00 --rho 0x01 --export-dir .tmp/packedA
+  python3 scripts/expand_a.py --from-pack .tmp/mldsa65_ref_pack.json --layout u32le --jobs 8
+  python3 scripts/expand_a.py --rho-file rhos.txt --layout u24le --export-dir .tmp/packedA
+
+Short rho values are left-padded to 32 bytes, i.e. `--rho 0x01` is bytes32(uint256(1)).
+The export dir gets one <rho>.<layout>.bin per matrix plus packedA_manifest.json
+(rho, layout, length, packedA_ntt as hex, keccak256(packedA_ntt) = the CommitA `hashA` input); its
+"expand_a" field names the construction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    from Crypto.Hash import keccak  # pycryptodome
+except Exception:
+    keccak = None
+
+from mldsa65_ref import K, L, N, Q, expand_a
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = ROOT / ".tmp" / "expand_a_cache" / "v1"
+
+PREA_FORMAT_ID = b"PREA"
+PREA_VERSION = 1
+PREA_PARAMS_MLDSA65 = 1
+
+LAYOUTS = ("u32le", "u32be", "u24le", "prea_v1")
+EXPAND_A = "fips204-shake128"   # not the synthetic keccak PRF of contracts/verifier/MLDSA65_ExpandA.sol
+
+
+def keccak256(data: bytes) -> bytes:
+    if keccak is None:
+        raise SystemExit("missing dependency for keccak256. Install pycryptodome: pip install pycryptodome")
+    k = keccak.new(digest_bits=256)
+    k.update(data)
+    return k.digest()
+
+
+def synthetic_a(rho: bytes) -> np.ndarray:
+    """MLDSA65_ExpandA.expandA_poly for every (row, col): 24 LE bits of keccak256(rho || row || col || i) mod q."""
+    a = np.empty((K, L, N), dtype=np.uint32)
+    for k in range(K):
+        for l in range(L):
+            for i in range(N):
+                h = keccak256(rho + bytes([k, l]) + i.to_bytes(2, "big"))
+                a[k, l, i] = int.from_bytes(h[:3], "little") % Q
+    return a
+
+
+def parse_rho(s: str) -> bytes:
+    h = s.strip().lower().removeprefix("0x")
+    if not h or len(h) > 64:
+        raise SystemExit(f"bad rho {s!r}: expected up to 32 bytes of hex")
+    return bytes.fromhex(h.rjust(64, "0"))
+
+
+def pack_a(a: np.ndarray, layout: str) -> bytes:
+    """Serialize A_hat[K][L][256] (coefficients in [0, q)) row-major in the given layout."""
+    flat = np.ascontiguousarray(a.reshape(-1), dtype=np.uint32)
+    if layout == "u32le":
+        return flat.astype("<u4").tobytes()
+    if layout == "u32be":
+        return flat.astype(">u4").tobytes()
+    if layout == "u24le":
+        b = flat.astype("<u4").view(np.uint8).reshape(-1, 4)[:, :3]
+        return np.ascontiguousarray(b).tobytes()
+    if layout == "prea_v1":
+        return PREA_FORMAT_ID + bytes([PREA_VERSION, PREA_PARAMS_MLDSA65]) + pack_a(a, "u32le")
+    raise SystemExit(f"unknown layout {layout!r} (expected one of {', '.join(LAYOUTS)})")
+
+
+def unpack_a(blob: bytes, layout: str) -> np.ndarray:
+    if layout == "prea_v1":
+        if blob[:4] != PREA_FORMAT_ID:
+            raise ValueError("missing PREA format id")
+        return unpack_a(blob[6:], "u32le")
+    if layout in ("u32le", "u32be"):
+        dt = "<u4" if layout == "u32le" else ">u4"
+        flat = np.frombuffer(blob, dtype=dt)
+    elif layout == "u24le":
+        b = np.frombuffer(blob, dtype=np.uint8).reshape(-1, 3).astype(np.uint32)
+        flat = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+    else:
+        raise ValueError(f"unknown layout {layout!r}")
+    return flat.astype(np.int64).reshape(K, L, N)
+
+
+def _expand_one(rho_hex: str) -> str:
+    """Worker: expand one rho and write the .npy cache entry (atomic). Returns rho_hex."""
+    a = expand_a(bytes.fromhex(rho_hex)).astype(np.uint32)
+    path = CACHE_DIR / f"{rho_hex}.npy"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        np.save(f, a)
+    tmp.replace(path)
+    return rho_hex
+
+
+def expand_many(rhos: List[bytes], jobs: int) -> Dict[bytes, np.ndarray]:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    missing = sorted({r.hex() for r in rhos if not (CACHE_DIR / f"{r.hex()}.npy").exists()})
+    if missing:
+        if jobs <= 1 or len(missing) == 1:
+            for h in missing:
+                _expand_one(h)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as ex:
+                list(ex.map(_expand_one, missing, chunksize=max(1, len(missing) // (jobs * 4))))
+    return {r: np.load(CACHE_DIR / f"{r.hex()}.npy").astype(np.int64) for r in rhos}
+
+
+def packed(rho: bytes, a: np.ndarray, layout: str) -> bytes:
+    path = CACHE_DIR / f"{rho.hex()}.{layout}.bin"
+    if path.exists():
+        return path.read_bytes()
+    blob = pack_a(a, layout)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(blob)
+    tmp.replace(path)
+    return blob
+
+
+def rhos_from_pack(path: Path) -> List[bytes]:
+    pack = json.loads(path.read_text(encoding="utf-8"))
+    contract_layout = pack.get("pk_layout") == "contract"
+    out: List[bytes] = []
+    for v in pack.get("vectors") or []:
+        pk_hex = v.get("pubkey_hex") or v.get("pk") or ""
+        pk = bytes.fromhex(str(pk_hex).removeprefix("0x"))
+        if len(pk) < 32:
+            continue
+        out.append(pk[-32:] if contract_layout else pk[:32])
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Batched ML-DSA-65 ExpandA with on-disk cache and packedA_ntt export.")
+    ap.add_argument("--rho", action="append", default=[], help="rho as hex (repeatable; short values left-padded)")
+    ap.add_argument("--rho-file", default="", help="file with one rho hex per line")
+    ap.add_argument("--from-pack", default="", help="take rho from every pubkey in a vector pack")
+    ap.add_argument("--layout", action="append", default=[], choices=LAYOUTS, help="packing layout (repeatable)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--export-dir", default="", help="write <rho>.<layout>.bin + packedA_manifest.json here")
+    ap.add_argument("--check", action="store_true",
+                    help="unpack every blob and compare with the expanded matrix; "
+                         "report the mismatch with the synthetic Solidity ExpandA")
+    args = ap.parse_args()
+
+    rhos = [parse_rho(r) for r in args.rho]
+    if args.rho_file:
+        rhos += [parse_rho(line) for line in Path(args.rho_file).read_text(encoding="utf-8").splitlines()
+                 if line.strip() and not line.lstrip().startswith("#")]
+    if args.from_pack:
+        rhos += rhos_from_pack(Path(args.from_pack))
+    rhos = list(dict.fromkeys(rhos))
+    if not rhos:
+        raise SystemExit("no rho given (use --rho, --rho-file or --from-pack)")
+    layouts = list(dict.fromkeys(args.layout or ["u32le"]))
+
+    cached_before = sum(1 for r in rhos if (CACHE_DIR / f"{r.hex()}.npy").exists())
+    t0 = time.perf_counter()
+    mats = expand_many(rhos, args.jobs)
+    dt = time.perf_counter() - t0
+
+    manifest: List[Dict[str, object]] = []
+    export = Path(args.export_dir) if args.export_dir else None
+    if export is not None:
+        export.mkdir(parents=True, exist_ok=True)
+
+    if args.check:
+        # the cached matrices are FIPS-204 A_hat; the in-repo Solidity ExpandA is a different (synthetic) PRF
+        for rho in rhos:
+            same = int(np.count_nonzero(synthetic_a(rho) == mats[rho]))
+            print(f"NOTE rho={rho.hex()}: {same}/{K * L * N} coefficients equal MLDSA65_ExpandA.sol "
+                  f"(synthetic keccak PRF); these blobs are not KATs for the Solidity ExpandA", file=sys.stderr)
+
+    for rho in rhos:
+        for layout in layouts:
+            blob = packed(rho, mats[rho], layout)
+            if args.check and not np.array_equal(unpack_a(blob, layout), mats[rho]):
+                raise SystemExit(f"round-trip mismatch for rho={rho.hex()} layout={layout}")
+            if export is not None:
+                (export / f"{rho.hex()}.{layout}.bin").write_bytes(blob)
+                manifest.append({
+                    "rho": "0x" + rho.hex(),
+                    "layout": layout,
+                    "length": len(blob),
+                    "packedA_ntt": "0x" + blob.hex(),
+                    "packedA_keccak": "0x" + keccak256(blob).hex(),
+                })
+
+    if export is not None:
+        (export / "packedA_manifest.json").write_text(
+            json.dumps({"scheme": "mldsa65", "expand_a": EXPAND_A, "shape": [K, L, N], "entries": manifest},
+                       indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    print(f"EXPANDED {len(rhos)} rho ({cached_before} cached) x {len(layouts)} layouts in {dt:.2f}s"
+          + (f"; exported to {export}" if export is not None else ""), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Function-level gas attribution: ingest `forge test --gas-report` tables as child records.
+
+Usage:
+  # run forge in this repo (or a vendor checkout) and attach to a dataset row
+  python3 scripts/gas_report_ingest.py --parent mldsa65::verify_poc_foundry \\
+      --cwd vendors/ml-dsa-65-ethereum-verification --match-test test_verify_gas_poc
+
+  # ingest a saved report (table text or `--gas-report --json` output)
+  python3 scripts/gas_report_ingest.py --parent mldsa65::verify_poc_foundry --from-log /tmp/gas_report.txt
+
+Output: data/gas_attribution.jsonl, one JSON object per (contract, function):
+  ts_utc, parent_rid, repo, commit, source, kind=function|deployment, contract, function,
+  calls, min, avg, median, max   (functions)
+  deploy_gas, deploy_size         (deployment)
+
+`parent_rid` is the canonical "scheme::bench_name" id used by the reports.
+Re-ingesting the same (parent_rid, commit) replaces the previous child records.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+ATTR_JSONL = ROOT / "data" / "gas_attribution.jsonl"
+
+SOURCE = "forge_gas_report"
+
+# Table rows use ASCII '|' (older forge) or box-drawing '│' (newer forge).
+_ROW = re.compile(r"^\s*[|│](.*)[|│]\s*$")
+_CONTRACT = re.compile(r"^(?P<name>\S+)\s+[Cc]ontract$")
+
+
+def utc_ts() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def git_head(repo_path: Path) -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+            text=True, stderr=subprocess.DEVNULL,
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def _as_int(x: Any) -> Optional[int]:
+    try:
+        return int(float(str(x).replace(",", "").strip()))
+    except Exception:
+        return None
+
+
+def _cells(line: str) -> Optional[List[str]]:
+    m = _ROW.match(line)
+    if not m:
+        return None
+    return [c.strip() for c in re.split(r"[|│]", m.group(1))]
+
+
+def parse_table_report(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse forge's markdown-ish gas report tables:
+
+      | src/Foo.sol:Foo Contract |                 |     |        |     |         |
+      | Deployment Cost          | Deployment Size |     |        |     |         |
+      | 104019                   | 263             |     |        |     |         |
+      | Function Name            | Min             | Avg | Median | Max | # Calls |
+      | bar                      | 22340           | ... | ...    | ... | 1       |
+    """
+    out: List[Dict[str, Any]] = []
+    contract: Optional[str] = None
+    expect_deploy = False
+    in_funcs = False
+
+    for line in text.splitlines():
+        cells = _cells(line)
+        if cells is None or not any(cells):
+            continue
+        first = cells[0]
+
+        m = _CONTRACT.match(first)
+        if m and not any(cells[1:]):
+            contract = m.group("name")
+            expect_deploy = False
+            in_funcs = False
+            continue
+        if contract is None:
+            continue
+
+        low = first.lower()
+        if low == "deployment cost":
+            expect_deploy = True
+            in_funcs = False
+            continue
+        if low == "function name":
+            in_funcs = True
+            expect_deploy = False
+            continue
+        if set(first) <= set("-=+:"):
+            continue
+
+        if expect_deploy:
+            gas = _as_int(first)
+            size = _as_int(cells[1]) if len(cells) > 1 else None
+            if gas is not None:
+                out.append({"kind": "deployment", "contract": contract, "function": "",
+                            "deploy_gas": gas, "deploy_size": size})
+            expect_deploy = False
+            continue
+
+        if in_funcs and len(cells) >= 6:
+            vals = [_as_int(c) for c in cells[1:6]]
+            if any(v is None for v in vals):
+                continue
+            mn, avg, med, mx, calls = vals
+            out.append({"kind": "function", "contract": contract, "function": first,
+                        "calls": calls, "min": mn, "avg": avg, "median": med, "max": mx})
+    return out
+
+
+def parse_json_report(obj: Any) -> List[Dict[str, Any]]:
+    """`forge test --gas-report --json`: [{contract, deployment:{gas,size}, functions:{sig:{...}}}]."""
+    out: List[Dict[str, Any]] = []
+    if not isinstance(obj, list):
+        return out
+    for c in obj:
+        if not isinstance(c, dict):
+            continue
+        contract = str(c.get("contract") or "")
+        dep = c.get("deployment") or {}
+        if isinstance(dep, dict) and dep.get("gas") is not None:
+            out.append({"kind": "deployment", "contract": contract, "function": "",
+                        "deploy_gas": _as_int(dep.get("gas")), "deploy_size": _as_int(dep.get("size"))})
+        funcs = c.get("functions") or {}
+        if not isinstance(funcs, dict):
+            continue
+        for fn, st in funcs.items():
+            if not isinstance(st, dict):
+                continue
+            out.append({"kind": "function", "contract": contract, "function": str(fn),
+                        "calls": _as_int(st.get("calls")), "min": _as_int(st.get("min")),
+                        "avg": _as_int(st.get("mean", st.get("avg"))),
+                        "median": _as_int(st.get("median")), "max": _as_int(st.get("max"))})
+    return out
+
+
+def parse_gas_report(text: str) -> List[Dict[str, Any]]:
+    s = text.strip()
+    if s.startswith("["):
+        try:
+            return parse_json_report(json.loads(s))
+        except json.JSONDecodeError:
+            pass
+    return parse_table_report(text)
+
+
+def known_rids(jsonl_path: Path) -> Dict[str, str]:
+    """rid -> repo of the latest row in file order."""
+    rids: Dict[str, str] = {}
+    if not jsonl_path.exists():
+        return rids
+    with jsonl_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                r = json.loads(s)
+            except Exception:
+                continue
+            if r.get("scheme") and r.get("bench_name"):
+                rids[f"{r['scheme']}::{r['bench_name']}"] = str(r.get("repo") or "")
+    return rids
+
+
+def write_children(path: Path, parent_rid: str, commit: str, children: List[Dict[str, Any]]) -> None:
+    kept: List[str] = []
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                r = json.loads(s)
+            except Exception:
+                continue
+            if r.get("parent_rid") == parent_rid and r.get("commit") == commit:
+                continue
+            kept.append(s)
+    kept.extend(json.dumps(c, ensure_ascii=False) for c in children)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("\n".join(kept) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def run_forge(cwd: Path, extra: List[str]) -> str:
+    cmd = ["forge", "test", "--gas-report"] + extra
+    p = subprocess.run(cmd, cwd=str(cwd), text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if p.returncode != 0:
+        tail = "\n".join(p.stdout.splitlines()[-80:])
+        raise SystemExit(f"forge failed (rc={p.returncode})\n---- forge output tail ----\n{tail}")
+    return p.stdout
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Ingest forge --gas-report tables as child records of a bench row.")
+    ap.add_argument("--parent", required=True, help="parent rid, e.g. mldsa65::verify_poc_foundry")
+    ap.add_argument("--cwd", default=".", help="forge project dir (repo root or vendors/<repo>)")
+    ap.add_argument("--match-path", default="")
+    ap.add_argument("--match-contract", default="")
+    ap.add_argument("--match-test", default="")
+    ap.add_argument("--from-log", default="", help="parse this saved report instead of running forge")
+    ap.add_argument("--repo", default="", help="provenance repo (default: parent row's repo)")
+    ap.add_argument("--commit", default="", help="provenance commit (default: git HEAD of --cwd)")
+    ap.add_argument("--out", default=str(ATTR_JSONL))
+    args = ap.parse_args()
+
+    if "::" not in args.parent:
+        raise SystemExit("--parent must be a canonical rid 'scheme::bench_name'")
+    parents = known_rids(DATA_JSONL)
+    if args.parent not in parents:
+        print(f"WARN: parent {args.parent} not found in {DATA_JSONL}", file=sys.stderr)
+
+    cwd = Path(args.cwd) if Path(args.cwd).is_absolute() else ROOT / args.cwd
+
+    if args.from_log:
+        text = Path(args.from_log).read_text(encoding="utf-8", errors="replace")
+    else:
+        extra: List[str] = []
+        if args.match_path:
+            extra += ["--match-path", args.match_path]
+        if args.match_contract:
+            extra += ["--match-contract", args.match_contract]
+        if args.match_test:
+            extra += ["--match-test", args.match_test]
+        text = run_forge(cwd, extra)
+
+    parsed = parse_gas_report(text)
+    if not any(p["kind"] == "function" for p in parsed):
+        raise SystemExit("no function rows found in gas report")
+
+    commit = args.commit or git_head(cwd)
+    repo = args.repo or parents.get(args.parent) or cwd.name
+    ts = utc_ts()
+
+    children = [
+        dict({"ts_utc": ts, "parent_rid": args.parent, "repo": repo, "commit": commit, "source": SOURCE}, **p)
+        for p in parsed
+    ]
+    write_children(Path(args.out), args.parent, commit, children)
+
+    nfun = sum(1 for c in children if c["kind"] == "function")
+    ncon = len({c["contract"] for c in children})
+    print(f"APPENDED {nfun} function rows ({ncon} contracts) for {args.parent} to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
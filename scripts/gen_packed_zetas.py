@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
-import re
 from pathlib import Path
 
+from gen_zetas import zetas
+
+# Застарілий one-word-per-zeta layout; інші layout-и генерує scripts/gen_zetas.py
 ROOT = Path(__file__).resolve().parents[1]
-src = ROOT / "contracts" / "ntt" / "NTT_MLDSA_Zetas.sol"
 out = ROOT / "contracts" / "ntt" / "NTT_MLDSA_Zetas_New.sol"
 
-text = src.read_text()
-
-# Витягуємо всі числа з рядків `return XXXXX;`
-vals = [int(m.group(1)) for m in re.finditer(r"return\s+(\d+);", text)]
+# Одне джерело істини: ntt_ref.ZETAS (звірено з NTT_MLDSA_Zetas.sol)
+vals = zetas()
 if len(vals) != 256:
     raise SystemExit(f"Expected 256 zetas, found {len(vals)}")
 
@@ -44,13 +43,14 @@ library NTT_MLDSA_Zetas {{
     ;
 
     /// @notice Get single zeta value by index
-    /// @param i Index in range [0, 255]
-    /// @return z Zeta value at index i
     function getZeta(uint256 i) internal pure returns (uint256 z) {{
-        if (i >= 256) revert("Zeta index OOB");
+        if (i >= 256) revert("Zeta OOB");
+
+        bytes memory tbl = ZETAS_PACKED;
+
         assembly {{
-            let offset := mul(i, 32)
-            z := mload(add(add(ZETAS_PACKED, 32), offset))
+            let off := mul(i, 32)         // i * 32
+            z := mload(add(add(tbl, 32), off))
         }}
     }}
 }}
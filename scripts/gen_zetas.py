@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Zeta-table layout generator + gas harness for the ML-DSA-65 NTT.
+
+One source of truth (ntt_ref.ZETAS: zeta[k] = 1753^bitrev8(k) mod q, checked against the
+`case` table in contracts/ntt/NTT_MLDSA_Zetas.sol) is emitted as several table layouts:
+
+  switch    existing NTT_MLDSA_Zetas.getZeta (assembly switch), the baseline      (not generated)
+  word      one uint256 word per zeta, uint256[256] in memory                     8192 bytes
+  packed8   8 x 32-bit lanes per word, uint256[32]                               1024 bytes
+  mont8     packed8 of zeta * 2^32 mod q; butterflies use Montgomery reduction   1024 bytes
+  layer8    per-layer contiguous packed8 tables (layer l = zeta[2^l .. 2^(l+1)),
+            each layer word-aligned), uint256[34]; the NTT walks a layer pointer  1088 bytes
+
+Each layout is a library contracts/ntt/zetas/<lib>.sol with table() (materialize once per NTT),
+an accessor and a matching forward NTT kernel + lookup loop in
+test/NTT_MLDSA_ZetaLayouts_Gas.t.sol. The test checks every kernel against
+NTT_MLDSA_Real.ntt and logs "zeta_layout::<layout>::<metric> gas: <N>".
+
+Nothing generated is kept in the tree unless it compiles: every command first writes the files
+into a throwaway copy of the project (.tmp/gen_zetas) and runs `forge build` there. `gen` copies
+them into the tree only after that build succeeds; `bench` runs the test in the copy, so gas can
+be measured without touching the tree.
+
+Usage:
+  python3 scripts/gen_zetas.py gen                          # forge build, then write libraries + gas test
+  python3 scripts/gen_zetas.py gen --layouts word,packed8   # a subset (e.g. leave out one that fails to build)
+  python3 scripts/gen_zetas.py gen --check                  # exit 1 if generated files in the tree are stale
+  python3 scripts/gen_zetas.py bench                        # forge run -> rows in data/results.jsonl
+  python3 scripts/gen_zetas.py bench --from-log /tmp/zetas.out --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ntt_ref import N, Q, ZETAS
+
+
+ROOT = Path(__file__).resolve().parents[1]
+OUT_DIR = ROOT / "contracts" / "ntt" / "zetas"
+TEST_OUT = ROOT / "test" / "NTT_MLDSA_ZetaLayouts_Gas.t.sol"
+SWITCH_SRC = ROOT / "contracts" / "ntt" / "NTT_MLDSA_Zetas.sol"
+WORK_DIR = ROOT / ".tmp" / "gen_zetas"
+
+Q_INV = 4236238847  # -q^-1 mod 2^32, as MontgomeryMLDSA.Q_INV
+LANE = 32
+LANES = 256 // LANE
+
+HEADER = "// SPDX-License-Identifier: MIT\npragma solidity ^0.8.20;\n"
+GEN_NOTE = "/// @dev DO NOT EDIT BY HAND. Regenerate via scripts/gen_zetas.py"
+
+MARKER = "zeta_layout"
+TEST_CONTRACT = "NTT_MLDSA_ZetaLayouts_Gas_Test"
+
+
+def zetas() -> List[int]:
+    z = [int(v) for v in ZETAS]
+    if SWITCH_SRC.exists():
+        cases = {int(m.group(1)): int(m.group(2))
+                 for m in re.finditer(r"case\s+(\d+)\s*\{\s*z\s*:=\s*(\d+)\s*\}", SWITCH_SRC.read_text(encoding="utf-8"))}
+        if cases and [cases.get(i) for i in range(N)] != z:
+            raise SystemExit(f"{SWITCH_SRC.relative_to(ROOT)} disagrees with ntt_ref.ZETAS")
+    return z
+
+
+def pack_words(vals: List[int]) -> List[int]:
+    """8 x 32-bit lanes per word, lane i at bits [32*i, 32*i + 32); tail zero-padded."""
+    words = []
+    for w in range(0, len(vals), LANES):
+        word = 0
+        for i, v in enumerate(vals[w:w + LANES]):
+            word |= v << (LANE * i)
+        words.append(word)
+    return words
+
+
+def layer_offsets() -> List[int]:
+    offs, off = [], 0
+    for layer in range(8):
+        offs.append(off)
+        off += max(1, (1 << layer) // LANES)
+    return offs
+
+
+def layouts() -> Dict[str, Dict[str, Any]]:
+    z = zetas()
+    mont = [(v << 32) % Q for v in z]
+    layer_words: List[int] = []
+    for layer in range(8):
+        layer_words += pack_words(z[1 << layer:2 << layer])
+    return {
+        "word": {"lib": "NTT_MLDSA_ZetasWord", "words": z,
+                 "desc": "one uint256 word per zeta"},
+        "packed8": {"lib": "NTT_MLDSA_ZetasPacked8", "words": pack_words(z),
+                    "desc": "8 x 32-bit zetas per word"},
+        "mont8": {"lib": "NTT_MLDSA_ZetasMont8", "words": pack_words(mont),
+                  "desc": "8 x 32-bit Montgomery-domain zetas (zeta * 2^32 mod q) per word"},
+        "layer8": {"lib": "NTT_MLDSA_ZetasLayer8", "words": layer_words,
+                   "desc": "per-layer contiguous 8 x 32-bit tables, word-aligned"},
+    }
+
+
+# ---- Solidity emitters ----
+
+def _table_fn(words: List[int]) -> str:
+    lines = [f"    function table() internal pure returns (uint256[{len(words)}] memory t) {{",
+             "        assembly (\"memory-safe\") {"]
+    for i, w in enumerate(words):
+        dst = "t" if i == 0 else f"add(t, {hex(32 * i)})"
+        lines.append(f"            mstore({dst}, {hex(w)})")
+    lines += ["        }", "    }"]
+    return "\n".join(lines)
+
+
+def _lane_at(ptr: str, idx: str) -> str:
+    return f"and(shr(shl(5, and({idx}, 7)), mload(add({ptr}, shl(5, shr(3, {idx}))))), 0xffffffff)"
+
+
+def emit_library(name: str, spec: Dict[str, Any]) -> str:
+    lib, words = spec["lib"], spec["words"]
+    n = len(words)
+    head = f"""{HEADER}
+/// @title {lib}
+/// @notice ML-DSA-65 NTT zetas: {spec['desc']} (auto-generated)
+{GEN_NOTE}
+library {lib} {{
+    uint256 internal constant Q = {Q};
+    uint256 internal constant WORDS = {n};
+
+    /// @notice Materialize the table in memory; call once per NTT, then index it.
+{_table_fn(words)}
+"""
+    if name == "word":
+        body = """
+    /// @notice zeta[k], k in [0, 256)
+    function at(uint256[256] memory t, uint256 k) internal pure returns (uint256 z) {
+        assembly ("memory-safe") {
+            z := mload(add(t, shl(5, k)))
+        }
+    }
+"""
+    elif name in ("packed8", "mont8"):
+        what = "zeta[k] * 2^32 mod Q" if name == "mont8" else "zeta[k]"
+        body = f"""
+    /// @notice {what}, k in [0, 256)
+    function at(uint256[{n}] memory t, uint256 k) internal pure returns (uint256 z) {{
+        assembly ("memory-safe") {{
+            z := {_lane_at("t", "k")}
+        }}
+    }}
+"""
+        if name == "mont8":
+            body += f"""
+    /// @notice zm * a * 2^-32 mod Q for zm = at(t, k), a < Q (montgomeryReduce of zm * a < Q^2)
+    function montMul(uint256 zm, uint256 a) internal pure returns (uint256 r) {{
+        assembly {{
+            let x := mul(zm, a)
+            let m := and(mul(and(x, 0xffffffff), {Q_INV}), 0xffffffff)
+            r := shr(32, add(x, mul(m, {Q})))
+            if iszero(lt(r, {Q})) {{ r := sub(r, {Q}) }}
+        }}
+    }}
+"""
+    else:
+        offs = layer_offsets()
+        packed_offs = sum(o << (8 * i) for i, o in enumerate(offs))
+        body = f"""
+    /// @notice Memory pointer to layer `layer`'s table (zeta[2^layer + j] is lane j)
+    /// @dev Word offsets per layer: {offs}
+    function layer(uint256[{n}] memory t, uint256 layerIdx) internal pure returns (uint256 p) {{
+        assembly ("memory-safe") {{
+            p := add(t, shl(5, and(shr(shl(3, layerIdx), {hex(packed_offs)}), 0xff)))
+        }}
+    }}
+
+    /// @notice zeta[2^layer + j] for p = layer(t, layer)
+    function at(uint256 p, uint256 j) internal pure returns (uint256 z) {{
+        assembly ("memory-safe") {{
+            z := {_lane_at("p", "j")}
+        }}
+    }}
+"""
+    return head + body + "}\n"
+
+
+# Per-layout pieces of the generated NTT kernel and lookup loop.
+def kernel_parts(name: str, spec: Dict[str, Any]) -> Dict[str, str]:
+    if name == "switch":
+        return {"table": "", "layer": "", "zeta": "uint256 zeta = NTT_MLDSA_Zetas.getZeta(k);",
+                "mul": "mulmod(zeta, a[j + len], Q)", "lookup": "acc += NTT_MLDSA_Zetas.getZeta(k);"}
+    lib, n = spec["lib"], len(spec["words"])
+    table = f"uint256[{n}] memory zt = {lib}.table();"
+    if name == "layer8":
+        # no k / running layer index: the block index within layer l is start >> (8 - l), which keeps
+        # the live locals of the legacy (non via-ir) pipeline well under the 16-slot stack reach
+        return {"table": table, "layer": f"uint256 zp = {lib}.layer(zt, l);",
+                "zeta": f"uint256 zeta = {lib}.at(zp, start >> (8 - l));",
+                "mul": "mulmod(zeta, a[j + len], Q)", "lookup": ""}
+    mul = f"{lib}.montMul(zeta, a[j + len])" if name == "mont8" else "mulmod(zeta, a[j + len], Q)"
+    return {"table": table, "layer": "", "zeta": f"uint256 zeta = {lib}.at(zt, k);", "mul": mul,
+            "lookup": f"acc += {lib}.at(zt, k);"}
+
+
+def emit_test(specs: Dict[str, Dict[str, Any]]) -> str:
+    z = zetas()
+    names = ["switch"] + list(specs)
+    imports = ['import "forge-std/Test.sol";',
+               'import {NTT_MLDSA_Real} from "../contracts/ntt/NTT_MLDSA_Real.sol";',
+               'import {NTT_MLDSA_Zetas} from "../contracts/ntt/NTT_MLDSA_Zetas.sol";']
+    imports += [f'import {{{s["lib"]}}} from "../contracts/ntt/zetas/{s["lib"]}.sol";' for s in specs.values()]
+
+    mont_sum = sum((v << 32) % Q for v in z[1:])
+    parts = [f"""{HEADER}
+{chr(10).join(imports)}
+
+/// @notice Zeta-table layout micro-benchmarks (auto-generated by scripts/gen_zetas.py).
+/// @dev Every layout runs the same forward NTT loop as NTT_MLDSA_Real.ntt, differing only in
+///      how zeta[k] is fetched and multiplied; results must equal NTT_MLDSA_Real.ntt.
+///      Emits one log line per (layout, metric) for scripts/gen_zetas.py bench:
+///        "{MARKER}::<layout>::lookup gas: <N>"   sum of zeta[1..255] incl. table()
+///        "{MARKER}::<layout>::ntt gas: <N>"      one forward NTT incl. table()
+contract {TEST_CONTRACT} is Test {{
+    uint256 constant Q = {Q};
+    uint256 constant N = {N};
+    // sum of zeta[1..255] as stored (plain / Montgomery domain)
+    uint256 constant ZETA_SUM = {sum(z[1:])};
+    uint256 constant ZETA_SUM_MONT = {mont_sum};
+
+    function _input() internal pure returns (uint256[256] memory a) {{
+        for (uint256 i = 0; i < N; i++) {{
+            a[i] = uint256(keccak256(abi.encode(i))) % Q;
+        }}
+    }}
+"""]
+    for name in names:
+        p = kernel_parts(name, specs.get(name, {}))
+        lookup_loop = f"""            for (uint256 k = 1; k < N; k++) {{
+                {p['lookup']}
+            }}"""
+        if name == "layer8":
+            lib = specs[name]["lib"]
+            lookup_loop = f"""            for (uint256 l = 0; l < 8; l++) {{
+                uint256 zp = {lib}.layer(zt, l);
+                for (uint256 j = 0; j < (uint256(1) << l); j++) {{
+                    acc += {lib}.at(zp, j);
+                }}
+            }}"""
+        table = f"\n            {p['table']}" if p["table"] else ""
+        layer = f"\n                {p['layer']}" if p["layer"] else ""
+        if name == "layer8":
+            head, step = """
+            for (uint256 l = 0; l < 8; l++) {
+                uint256 len = 128 >> l;""", ""
+        else:
+            head, step = """
+            uint256 k = 1;
+            for (uint256 len = 128; len > 0; len >>= 1) {""", "\n                    k++;"
+        lookup_decl = f"\n            uint256[{len(specs[name]['words'])}] memory zt = {specs[name]['lib']}.table();" if name != "switch" else ""
+        want_sum = "ZETA_SUM_MONT" if name == "mont8" else "ZETA_SUM"
+        parts.append(f"""
+    // ---------------- {name} ----------------
+
+    function _lookup_{name}() internal pure returns (uint256 acc) {{
+        unchecked {{{lookup_decl}
+{lookup_loop}
+        }}
+    }}
+
+    function _ntt_{name}(uint256[256] memory a) internal pure returns (uint256[256] memory) {{
+        unchecked {{{table}{head}{layer}
+                for (uint256 start = 0; start < N; start += 2 * len) {{
+                    {p['zeta']}
+                    for (uint256 j = start; j < start + len; j++) {{
+                        uint256 aj = a[j];
+                        uint256 t = {p['mul']};
+                        a[j] = addmod(aj, t, Q);
+                        a[j + len] = addmod(aj, Q - t, Q);
+                    }}{step}
+                }}
+            }}
+            return a;
+        }}
+    }}
+
+    function test_zeta_layout_{name}() public {{
+        uint256 g0 = gasleft();
+        uint256 acc = _lookup_{name}();
+        uint256 gLookup = g0 - gasleft();
+        assertEq(acc, {want_sum}, "{name}: zeta table mismatch");
+
+        uint256[256] memory want = NTT_MLDSA_Real.ntt(_input());
+        uint256[256] memory a = _input();
+        g0 = gasleft();
+        a = _ntt_{name}(a);
+        uint256 gNtt = g0 - gasleft();
+        for (uint256 i = 0; i < N; i++) {{
+            assertEq(a[i], want[i], "{name}: ntt mismatch");
+        }}
+
+        emit log_named_uint("{MARKER}::{name}::lookup gas", gLookup);
+        emit log_named_uint("{MARKER}::{name}::ntt gas", gNtt);
+    }}
+""")
+    parts.append("}\n")
+    return "".join(parts)
+
+
+def select(names: str) -> Dict[str, Dict[str, Any]]:
+    specs = layouts()
+    if not names:
+        return specs
+    want = [n.strip() for n in names.split(",") if n.strip()]
+    bad = [n for n in want if n not in specs]
+    if bad:
+        raise SystemExit(f"unknown layout(s) {', '.join(bad)}; choose from {', '.join(specs)}")
+    return {n: specs[n] for n in want}
+
+
+def generated_files(specs: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[Path, str]:
+    """Tree path -> text of every generated file (the libraries of `specs` + the gas test)."""
+    specs = layouts() if specs is None else specs
+    files = {OUT_DIR / f"{s['lib']}.sol": emit_library(name, s) for name, s in specs.items()}
+    files[TEST_OUT] = emit_test(specs)
+    return files
+
+
+# ---- workdir / forge ----
+
+def build_workdir(work: Path, files: Dict[Path, str]) -> None:
+    """Throwaway copy of the project (contracts/, foundry config, lib/ linked) with `files` written in."""
+    if work.exists():
+        shutil.rmtree(work)
+    (work / "test").mkdir(parents=True)
+    shutil.copytree(ROOT / "contracts", work / "contracts")
+    for name in ("foundry.toml", "remappings.txt"):
+        if (ROOT / name).exists():
+            shutil.copy2(ROOT / name, work / name)
+    if (ROOT / "lib").exists():
+        (work / "lib").symlink_to(ROOT / "lib", target_is_directory=True)
+    for path, text in files.items():
+        dst = work / path.relative_to(ROOT)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_text(text, encoding="utf-8")
+
+
+def forge(work: Path, *args: str, check: bool = True) -> Tuple[int, str]:
+    try:
+        p = subprocess.run(["forge", *args], cwd=str(work), text=True,
+                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except FileNotFoundError:
+        raise SystemExit("forge not found on PATH (https://book.getfoundry.sh)")
+    if check and p.returncode != 0:
+        tail = "\n".join(p.stdout.splitlines()[-80:])
+        raise SystemExit(f"forge {args[0]} failed (rc={p.returncode})\n---- forge output tail ----\n{tail}")
+    return p.returncode, p.stdout
+
+
+# ---- bench / ingestion ----
+
+def parse_log(text: str) -> Dict[Tuple[str, str], int]:
+    rx = re.compile(re.escape(MARKER) + r"::(\w+)::(\w+)\s+gas\s*[:=]\s*([0-9]+)")
+    out: Dict[Tuple[str, str], int] = {}
+    for m in rx.finditer(text):
+        out.setdefault((m.group(1), m.group(2)), int(m.group(3)))
+    return out
+
+
+def run_forge(work: Path) -> str:
+    return forge(work, "test", "--match-contract", TEST_CONTRACT, "-vv")[1]
+
+
+def bench_rows(gas: Dict[Tuple[str, str], int], denom: str, bits: float) -> List[Dict[str, Any]]:
+    specs = layouts()
+    rows = []
+    for (layout, metric), g in sorted(gas.items()):
+        spec = specs.get(layout)
+        table_bytes = 32 * len(spec["words"]) if spec else None
+        desc = spec["desc"] if spec else "NTT_MLDSA_Zetas.getZeta switch"
+        row: Dict[str, Any] = {
+            "scheme": "mldsa65",
+            "bench_name": f"ntt_zetas_{layout}_{metric}",
+            "chain_profile": "EVM/L1",
+            "gas": g,
+            "denominator": denom,
+            "denom_bits": bits,
+            "variant": f"zetas/{layout}",
+            "notes": f"zeta layout {layout} ({desc}); {metric}"
+                     + (f"; table {table_bytes} bytes" if table_bytes else ""),
+        }
+        if table_bytes:
+            row["variant_params"] = {"layout": layout, "table_bytes": table_bytes}
+        rows.append(row)
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="ML-DSA NTT zeta-table layouts: codegen + forge gas harness.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    g = sub.add_parser("gen", help="forge build the generated files, then write them into the tree")
+    g.add_argument("--check", action="store_true", help="do not build or write; exit 1 if a generated file in the tree is stale")
+    b = sub.add_parser("bench", help="run the gas test and append one row per (layout, metric)")
+    for sp in (g, b):
+        sp.add_argument("--layouts", default="", help="comma list of layouts (default: all)")
+    b.add_argument("--from-log", default="", help="parse this forge output instead of running forge")
+    b.add_argument("--denom", default="security_equiv_bits")
+    b.add_argument("--bits", type=float, default=192.0)
+    b.add_argument("--dry-run", action="store_true", help="print the rows; do not append")
+    args = ap.parse_args()
+
+    files = generated_files(select(args.layouts))
+    if args.cmd == "gen":
+        if args.check:
+            # only what was generated into the tree; nothing is there until a build succeeded
+            stale = [path for path, text in files.items()
+                     if path.exists() and path.read_text(encoding="utf-8") != text]
+            for path in stale:
+                print(f"STALE {path.relative_to(ROOT)}")
+            return 1 if stale else 0
+        build_workdir(WORK_DIR, files)
+        forge(WORK_DIR, "build")
+        for path, text in files.items():
+            if path.exists() and path.read_text(encoding="utf-8") == text:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+            print(f"WROTE {path.relative_to(ROOT)}")
+        return 0
+
+    if args.from_log:
+        text = Path(args.from_log).read_text(encoding="utf-8", errors="replace")
+    else:
+        build_workdir(WORK_DIR, files)
+        text = run_forge(WORK_DIR)
+    gas = parse_log(text)
+    if not gas:
+        raise SystemExit(f"no '{MARKER}::<layout>::<metric> gas: N' lines found")
+
+    print("| layout | lookup gas | ntt gas | table bytes |")
+    print("|---|---:|---:|---:|")
+    specs = layouts()
+    for layout in sorted({k[0] for k in gas}, key=lambda l: gas.get((l, "ntt"), 1 << 62)):
+        tb = 32 * len(specs[layout]["words"]) if layout in specs else ""
+        print(f"| {layout} | {gas.get((layout, 'lookup'), '')} | {gas.get((layout, 'ntt'), '')} | {tb} |")
+
+    rows = bench_rows(gas, args.denom, args.bits)
+    payload = json.dumps(rows, ensure_ascii=False)
+    if args.dry_run:
+        print(payload)
+        return 0
+    return subprocess.call([sys.executable, str(ROOT / "scripts" / "parse_bench.py"), payload])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
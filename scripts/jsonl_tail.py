@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Offset tailing of an append-only JSONL file (data/results.jsonl).
+
+A Tailer remembers how many bytes it has consumed (`offset`) and a hash of the last 4 KiB before that
+offset (`tail`). If the file only grew and those bytes are unchanged, a read returns just the new
+complete lines; a torn last line (no newline yet) is left for the next read. Any other change
+(truncated, rewritten in place, first read) starts over from byte 0.
+
+Shared by watch_reports.py, dataset_service.py (in-memory state) and query.py (offset / tail kept in
+the index manifest).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
+
+TAIL_BYTES = 4096
+
+
+def tail_sha(f: BinaryIO, end: int) -> str:
+    """sha1 of the last TAIL_BYTES bytes of `f` before byte `end`."""
+    start = max(0, end - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(end - start)).hexdigest()
+
+
+def complete_lines(data: bytes) -> Tuple[List[bytes], int]:
+    """(lines of `data` up to its last newline, bytes they span); blank lines are kept."""
+    end = data.rfind(b"\n") + 1
+    return data[:end].splitlines(), end
+
+
+class Tailer:
+    """Consumed-bytes state of one file; `offset` / `tail` may be restored from a previous run."""
+
+    def __init__(self, path: Path, offset: int = 0, tail: str = "") -> None:
+        self.path = path
+        self.offset = offset
+        self.tail = tail
+
+    def read(self) -> Tuple[bool, List[bytes]]:
+        """(appended, new complete lines); appended is False when the lines start again at byte 0."""
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            appended = not (self.offset == 0 or size < self.offset or tail_sha(f, self.offset) != self.tail)
+            if not appended:
+                self.offset = 0
+            f.seek(self.offset)
+            lines, end = complete_lines(f.read(size - self.offset))
+            self.offset += end
+            self.tail = tail_sha(f, self.offset)
+        return appended, lines
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Render the gas-per-secure-bit charts straight from data/results.jsonl (stdlib only, plain SVG).
+
+Charts:
+  docs/gas_per_secure_bit.svg          bars, latest row per (repo, bench_name, chain_profile), every layer
+  docs/gas_per_secure_bit_big.svg      bars, same selection restricted to the execution layer (README headline)
+  docs/charts/layer_<layer>.svg        bars, latest rows of one surface_layer, coloured by scheme
+  docs/charts/scheme_<scheme>.svg      scatter, every measurement of one scheme over time, one series per bench
+
+Bars and points use a log10 gas/secure-bit axis (values span ~1 .. 1e6). Rows without a positive
+gas_per_secure_bit (assumption rows with gas=0) are not drawn.
+
+Each SVG starts with a `chart-input-sha256` comment: the hash of the chart spec, the renderer version and
+the projected data slice it was drawn from. A chart whose hash is unchanged is not rewritten, so adding a
+falcon row only re-renders the charts that contain it. Files in docs/charts/ carrying the marker that no
+longer correspond to a chart are removed.
+
+Usage:
+  python3 scripts/make_charts.py                 # render stale charts
+  python3 scripts/make_charts.py --check         # exit 1 if any chart is stale (CI)
+  python3 scripts/make_charts.py --force         # re-render everything
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATASET = ROOT / "data" / "results.jsonl"
+DOCS = ROOT / "docs"
+CHART_DIR = DOCS / "charts"
+
+RENDER_VERSION = 1  # part of every chart hash: bump when the drawing code changes
+MARKER = "chart-input-sha256"
+MARKER_RX = re.compile(r"<!-- " + MARKER + r": ([0-9a-f]{64}) -->")
+FONT = "Arial, sans-serif"
+
+# Known schemes keep the colours of the original hand-drawn charts; others get a stable hash-derived hue.
+SCHEME_COLORS = {
+    "ecdsa": "#94a3b8",
+    "p256": "#64748b",
+    "falcon": "#60a5fa",
+    "falcon1024": "#3b82f6",
+    "mldsa65": "#10b981",
+    "dilithium": "#f97316",
+}
+SERIES_COLORS = ["#2563eb", "#f97316", "#10b981", "#e11d48", "#7c3aed", "#0891b2", "#ca8a04", "#64748b"]
+
+
+# ---- data ----
+
+def load_rows(path: Path) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rows.append(json.loads(line))
+    return rows
+
+
+def _float(x: Any) -> Optional[float]:
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+    return v if math.isfinite(v) else None
+
+
+def point(r: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Projection of a dataset row onto the fields a chart draws (None if it has nothing to draw)."""
+    gpb = _float(r.get("gas_per_secure_bit"))
+    if gpb is None or gpb <= 0:
+        return None
+    bits = _float(r.get("denom_bits")) or _float(r.get("security_metric_value"))
+    return {
+        "ts": str(r.get("ts_utc") or ""),
+        "repo": str(r.get("repo") or ""),
+        "bench": str(r.get("bench_name") or ""),
+        "chain": str(r.get("chain_profile") or ""),
+        "scheme": str(r.get("scheme") or "unknown"),
+        "layer": str(r.get("surface_layer") or "unspecified"),
+        "gas": int(_float(r.get("gas_verify")) or 0),
+        "gpb": round(gpb, 6),
+        "bits": int(bits) if bits else None,
+    }
+
+
+def latest(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Newest point per (repo, bench, chain); later file order wins ts ties (as in view_latest.py)."""
+    out: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for p in points:
+        k = (p["repo"], p["bench"], p["chain"])
+        if k not in out or p["ts"] >= out[k]["ts"]:
+            out[k] = p
+    return sorted(out.values(), key=lambda p: (p["gpb"], p["bench"], p["repo"]))
+
+
+def slug(s: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", s.lower()).strip("_") or "unknown"
+
+
+def scheme_color(scheme: str) -> str:
+    if scheme in SCHEME_COLORS:
+        return SCHEME_COLORS[scheme]
+    h = int(hashlib.sha256(scheme.encode("utf-8")).hexdigest()[:4], 16) * 360 // 65536
+    return f"hsl({h},55%,50%)"
+
+
+# ---- svg helpers ----
+
+def esc(s: str) -> str:
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def f1(x: float) -> str:
+    return f"{x:.1f}"
+
+
+def value_label(v: float) -> str:
+    return f"{v:,.0f}" if v >= 1000 else f"{v:.1f}"
+
+
+def decade_label(e: int) -> str:
+    v = 10 ** e
+    for div, suf in ((10 ** 9, "G"), (10 ** 6, "M"), (10 ** 3, "K")):
+        if v >= div:
+            return f"{v // div}{suf}"
+    return f"{v:g}" if e >= 0 else f"{10.0 ** e:g}"
+
+
+def log_axis(values: List[float]) -> Tuple[int, int]:
+    lo = math.floor(math.log10(min(values)))
+    hi = math.ceil(math.log10(max(values)))
+    return lo, max(hi, lo + 1)
+
+
+def text(x: float, y: float, s: str, size: int, anchor: str = "middle", extra: str = "") -> str:
+    return (f'<text x="{f1(x)}" y="{f1(y)}" font-size="{size}" text-anchor="{anchor}" '
+            f'font-family="{FONT}"{extra}>{esc(s)}</text>')
+
+
+def short(s: str, n: int) -> str:
+    return s if len(s) <= n else s[:n - 1] + "…"
+
+
+def frame(width: int, height: int, digest: str, title: str, subtitle: str, size: int) -> List[str]:
+    return [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f"<!-- {MARKER}: {digest} -->",
+        "<!-- generated by scripts/make_charts.py from data/results.jsonl; do not edit by hand -->",
+        '<rect x="0" y="0" width="100%" height="100%" fill="white"/>',
+        text(width / 2, 36, title, size + 8, extra=' font-weight="bold" fill="#1a1a1a"'),
+        text(width / 2, 62, subtitle, size, extra=' fill="#666"'),
+    ]
+
+
+def y_axis(out: List[str], left: float, top: float, plot_w: float, plot_h: float, lo: int, hi: int, size: int) -> None:
+    out.append(f'<line x1="{f1(left)}" y1="{f1(top)}" x2="{f1(left)}" y2="{f1(top + plot_h)}" stroke="#111" stroke-width="2"/>')
+    out.append(f'<line x1="{f1(left)}" y1="{f1(top + plot_h)}" x2="{f1(left + plot_w)}" y2="{f1(top + plot_h)}" stroke="#111" stroke-width="2"/>')
+    for e in range(lo, hi + 1):
+        y = top + plot_h - (e - lo) / (hi - lo) * plot_h
+        if e > lo:
+            out.append(f'<line x1="{f1(left)}" y1="{f1(y)}" x2="{f1(left + plot_w)}" y2="{f1(y)}" stroke="#ddd" stroke-width="1" stroke-dasharray="4"/>')
+        out.append(f'<line x1="{f1(left - 6)}" y1="{f1(y)}" x2="{f1(left)}" y2="{f1(y)}" stroke="#111" stroke-width="1"/>')
+        out.append(text(left - 10, y + 5, decade_label(e), size, "end"))
+    mid = top + plot_h / 2
+    out.append(text(28, mid, "gas / secure bit (log)", size + 2, extra=f' transform="rotate(-90 28 {f1(mid)})"'))
+
+
+def y_of(v: float, top: float, plot_h: float, lo: int, hi: int) -> float:
+    return top + plot_h - (math.log10(v) - lo) / (hi - lo) * plot_h
+
+
+# ---- charts ----
+
+def bar_chart(digest: str, title: str, subtitle: str, pts: List[Dict[str, Any]], big: bool = False) -> str:
+    size = 16 if big else 12
+    slot = max(70, min(130, 1250 // max(len(pts), 1))) if big else max(48, min(90, 1250 // max(len(pts), 1)))
+    left, top, plot_h = 110, 90, 480 if big else 420
+    plot_w = max(len(pts), 1) * slot
+    width = max(int(left + plot_w + 60), 900)
+    height = int(top + plot_h + (260 if big else 230))
+    out = frame(width, height, digest, title, subtitle, size)
+    if not pts:
+        out.append(text(width / 2, top + plot_h / 2, "no measured rows", size + 4, extra=' fill="#666"'))
+        out.append("</svg>")
+        return "\n".join(out) + "\n"
+    lo, hi = log_axis([p["gpb"] for p in pts])
+    lo = min(lo, 0)
+    y_axis(out, left, top, plot_w, plot_h, lo, hi, size)
+    base = top + plot_h
+    for i, p in enumerate(pts):
+        x = left + i * slot + slot * 0.1
+        w = slot * 0.8
+        cx = x + w / 2
+        y = y_of(p["gpb"], top, plot_h, lo, hi)
+        out.append("")
+        out.append(f"<!-- {esc(p['scheme'])} :: {esc(p['bench'])} ({esc(p['repo'])}, {esc(p['ts'])}) -->")
+        out.append(f'<rect x="{f1(x)}" y="{f1(y)}" width="{f1(w)}" height="{f1(base - y)}" fill="{scheme_color(p["scheme"])}"/>')
+        out.append(text(cx, y - 6, value_label(p["gpb"]), size))
+        ly = base + 18
+        out.append(text(cx, ly, short(p["bench"], 40), size, "end", f' transform="rotate(-45 {f1(cx)} {f1(ly)})"'))
+        note = f"{p['scheme']}" + (f", {p['bits']}-bit" if p["bits"] else "")
+        out.append(text(cx, ly + size + 2, note, size - 3, "end",
+                        f' fill="#666" transform="rotate(-45 {f1(cx)} {f1(ly + size + 2)})"'))
+    out.append("")
+    out.append(text(left, height - 34, "Latest row per (repo, bench_name, chain_profile); gas divided by the row's security bits.",
+                    size - 2, "start"))
+    out.append(text(left, height - 16, "Rows with gas = 0 (assumption rows) are omitted; see data/results.csv for provenance.",
+                    size - 2, "start"))
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+def _epoch(ts: str) -> float:
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def scatter_chart(digest: str, title: str, subtitle: str, pts: List[Dict[str, Any]]) -> str:
+    size = 12
+    left, top, plot_w, plot_h = 110, 90, 860, 400
+    benches = sorted({p["bench"] for p in pts})
+    width = left + plot_w + 60
+    height = top + plot_h + 70 + 18 * len(benches) + 30
+    out = frame(width, height, digest, title, subtitle, size)
+    lo, hi = log_axis([p["gpb"] for p in pts])
+    y_axis(out, left, top, plot_w, plot_h, lo, hi, size)
+    xs = [_epoch(p["ts"]) for p in pts]
+    x0, x1 = min(xs), max(xs)
+    if x1 - x0 < 86400:
+        x0, x1 = x0 - 86400, x1 + 86400
+    pad = (x1 - x0) * 0.05
+    x0, x1 = x0 - pad, x1 + pad
+    base = top + plot_h
+    for k in range(5):
+        t = x0 + (x1 - x0) * (k + 0.5) / 5
+        x = left + (t - x0) / (x1 - x0) * plot_w
+        out.append(f'<line x1="{f1(x)}" y1="{f1(base)}" x2="{f1(x)}" y2="{f1(base + 6)}" stroke="#111" stroke-width="1"/>')
+        out.append(text(x, base + 22, datetime.fromtimestamp(t, timezone.utc).strftime("%Y-%m-%d"), size))
+    color = {b: SERIES_COLORS[i % len(SERIES_COLORS)] for i, b in enumerate(benches)}
+    for p, t in sorted(zip(pts, xs), key=lambda pt: (pt[0]["bench"], pt[1], pt[0]["repo"])):
+        x = left + (t - x0) / (x1 - x0) * plot_w
+        y = y_of(p["gpb"], top, plot_h, lo, hi)
+        out.append(f'<circle cx="{f1(x)}" cy="{f1(y)}" r="5" fill="{color[p["bench"]]}" fill-opacity="0.8">'
+                   f'<title>{esc(p["bench"])} @ {esc(p["ts"])}: {value_label(p["gpb"])} gas/bit ({p["gas"]:,} gas)</title></circle>')
+    ly = base + 50
+    for i, b in enumerate(benches):
+        y = ly + 18 * i
+        out.append(f'<circle cx="{left + 6}" cy="{f1(y - 4)}" r="5" fill="{color[b]}"/>')
+        out.append(text(left + 18, y, b, size, "start"))
+    out.append(text(left, height - 12, "Every measured row of this scheme (all commits); hover a point for gas and timestamp.",
+                    size - 2, "start"))
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+# ---- planning / incremental write ----
+
+def digest_of(spec: Dict[str, Any], pts: List[Dict[str, Any]]) -> str:
+    payload = {"render_version": RENDER_VERSION, "spec": spec, "points": pts}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def plan(rows: List[Dict[str, Any]]) -> List[Tuple[Path, Dict[str, Any], List[Dict[str, Any]]]]:
+    """(output path, chart spec, data slice) for every chart the dataset implies."""
+    pts = [p for p in (point(r) for r in rows) if p is not None]
+    cur = latest(pts)
+    charts: List[Tuple[Path, Dict[str, Any], List[Dict[str, Any]]]] = [
+        (DOCS / "gas_per_secure_bit.svg",
+         {"kind": "bar", "title": "Gas per secure bit (lower is better)",
+          "subtitle": "All measured surfaces, latest snapshot per bench"}, cur),
+        (DOCS / "gas_per_secure_bit_big.svg",
+         {"kind": "bar", "big": True, "title": "Gas per secure bit (lower is better): execution layer",
+          "subtitle": "Signature verification on EVM, latest snapshot per bench"},
+         [p for p in cur if p["layer"] == "execution"]),
+    ]
+    for layer in sorted({p["layer"] for p in cur}):
+        charts.append((CHART_DIR / f"layer_{slug(layer)}.svg",
+                       {"kind": "bar", "title": f"Gas per secure bit: {layer} layer",
+                        "subtitle": "Latest snapshot per bench, coloured by scheme"},
+                       [p for p in cur if p["layer"] == layer]))
+    for scheme in sorted({p["scheme"] for p in pts}):
+        sel = sorted((p for p in pts if p["scheme"] == scheme), key=lambda p: (p["ts"], p["bench"], p["repo"]))
+        charts.append((CHART_DIR / f"scheme_{slug(scheme)}.svg",
+                       {"kind": "scatter", "title": f"Gas per secure bit over time: {scheme}",
+                        "subtitle": "One point per dataset row, one colour per bench"}, sel))
+    return charts
+
+
+def existing_digest(path: Path) -> Optional[str]:
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        m = MARKER_RX.search(f.read(512))
+    return m.group(1) if m else None
+
+
+def render(spec: Dict[str, Any], pts: List[Dict[str, Any]], digest: str) -> str:
+    if spec["kind"] == "scatter":
+        return scatter_chart(digest, spec["title"], spec["subtitle"], pts)
+    return bar_chart(digest, spec["title"], spec["subtitle"], pts, bool(spec.get("big")))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Render gas-per-secure-bit SVG charts from the dataset (incremental).")
+    ap.add_argument("--jsonl", default=str(DATASET))
+    ap.add_argument("--check", action="store_true", help="do not write; exit 1 if any chart is stale")
+    ap.add_argument("--force", action="store_true", help="re-render charts even if their input hash is unchanged")
+    args = ap.parse_args()
+
+    charts = plan(load_rows(Path(args.jsonl)))
+    stale: List[str] = []
+    wrote = 0
+    for path, spec, pts in charts:
+        digest = digest_of(spec, pts)
+        rel = path.relative_to(ROOT).as_posix()
+        if not args.force and existing_digest(path) == digest:
+            continue
+        stale.append(rel)
+        if args.check:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(render(spec, pts, digest), encoding="utf-8")
+        wrote += 1
+        print(f"[chart] {rel} ({len(pts)} rows)")
+
+    wanted = {path for path, _, _ in charts}
+    for old in sorted(CHART_DIR.glob("*.svg")) if CHART_DIR.exists() else []:
+        if old not in wanted and existing_digest(old) is not None:
+            stale.append(old.relative_to(ROOT).as_posix())
+            if not args.check:
+                old.unlink()
+                print(f"[chart] removed {old.relative_to(ROOT).as_posix()}")
+
+    if args.check:
+        for s in stale:
+            print(f"stale: {s}")
+        return 1 if stale else 0
+    print(f"[chart] {wrote} rendered, {len(charts) - wrote} unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
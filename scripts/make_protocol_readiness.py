@@ -14,10 +14,15 @@ Canonical schema expectations (tolerant):
 Output:
 - reports/protocol_readiness.md
 
+Optional input:
+- data/gas_attribution.jsonl (scripts/gas_report_ingest.py) -> "Top gas consumers per surface"
+
 Design goals:
 - Conservative: effective_security_bits is capped by weakest dependency.
 - Reproducible: keep only latest record per canonical ID by ts_utc (fallback to file order).
 - Tolerant: skip malformed/meta records instead of failing.
+- Incremental-friendly: vendor blocks (<!-- X_BEGIN --> ... <!-- X_END -->) already in the
+  report are kept, so a re-render does not force every vendor block to be rendered again.
 
 Important correctness note:
 - DO NOT use obj["surface"] as record id. In this repo it is a "surface class"
@@ -27,14 +32,22 @@ Important correctness note:
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_JSONL = ROOT / "data" / "results.jsonl"
 OUT_MD = ROOT / "reports" / "protocol_readiness.md"
+ATTR_JSONL = ROOT / "data" / "gas_attribution.jsonl"
+
+# First vendor block written by scripts/readiness_blocks.py; everything from here on is kept.
+BLOCK_BEGIN_RX = re.compile(r"^<!-- [A-Z0-9_]+_BEGIN -->$", re.MULTILINE)
+
+# Functions listed per surface in "Top gas consumers per surface".
+TOP_CONSUMERS_N = 5
 
 
 # Grant-facing target bits (display hint only).
@@ -217,6 +230,15 @@ class Record:
         )
 
 
+def is_newer(ts: str, i: int, prev_ts: str, prev_i: int) -> bool:
+    """Latest-record rule: later ts_utc wins; a ts beats none; equal (or both missing) -> later line."""
+    if ts and prev_ts and ts > prev_ts:
+        return True
+    if ts and not prev_ts:
+        return True
+    return (ts == prev_ts and i > prev_i) or (not ts and not prev_ts and i > prev_i)
+
+
 def load_latest_records(jsonl_path: Path) -> Dict[str, Record]:
     """
     Keep only the latest record per canonical rid using ts_utc (fallback to later line).
@@ -238,20 +260,9 @@ def load_latest_records(jsonl_path: Path) -> Dict[str, Record]:
             except Exception:
                 continue
 
-            ts = r.ts
             prev = latest.get(r.rid)
-            if prev is None:
-                latest[r.rid] = (ts, i, r)
-                continue
-
-            prev_ts, prev_i, _ = prev
-
-            if ts and prev_ts and ts > prev_ts:
-                latest[r.rid] = (ts, i, r)
-            elif ts and not prev_ts:
-                latest[r.rid] = (ts, i, r)
-            elif (ts == prev_ts and i > prev_i) or (not ts and not prev_ts and i > prev_i):
-                latest[r.rid] = (ts, i, r)
+            if prev is None or is_newer(r.ts, i, prev[0], prev[1]):
+                latest[r.rid] = (r.ts, i, r)
 
     return {rid: rec for rid, (_, __, rec) in latest.items()}
 
@@ -291,14 +302,28 @@ def resolve_dep_rid(dep: str, records: Dict[str, Record]) -> str:
     return dep
 
 
-def compute_effective_security_bits(records: Dict[str, Record]) -> Dict[str, int]:
+def exact_bits(r: Record) -> float:
+    """Own bits as in the readiness table (effective, then equiv / metric value) without its int truncation."""
+    for k in ("effective_security_bits", "security_equiv_bits", "security_metric_value"):
+        try:
+            return float(str(r.meta[k]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return 0.0
+
+
+def compute_effective_security_bits(records: Dict[str, Record],
+                                    own: Optional[Callable[[Record], float]] = None) -> Dict[str, int]:
     """
     Weakest-link model: effective(r) = min( own(r), effective(dep1), ...).
+    `own` overrides the integer own-bits rule (e.g. fractional bits from the raw row).
     """
     memo: Dict[str, int] = {}
     visiting: Set[str] = set()
 
     def own_bits(r: Record) -> int:
+        if own is not None:
+            return own(r)
         if r.effective_security_bits is not None:
             return int(r.effective_security_bits)
         if r.security_equiv_bits is not None:
@@ -365,6 +390,107 @@ def fmt_int(x: Optional[int]) -> str:
     return "-" if x is None else str(x)
 
 
+def readiness_rows(records: Dict[str, Record], eff_map: Dict[str, int]) -> List[Dict[str, Any]]:
+    """One dict per table row (category, rid order), the values behind the markdown table."""
+    rows: List[Dict[str, Any]] = []
+    for rid, r in sorted(records.items(), key=lambda t: (t[1].category, t[0])):
+        eff = eff_map.get(r.rid, 0)
+
+        own = r.effective_security_bits if r.effective_security_bits is not None else r.security_equiv_bits
+        own_i = int(own) if own is not None else 0
+
+        target = DEFAULT_TARGET_BITS_BY_CATEGORY.get(r.category, 0)
+        if not target:
+            target = max(own_i, int(eff))
+
+        cap_dep = find_cap_reason(r, eff_map, records)
+        rows.append({
+            "category": r.category,
+            "rid": rid,
+            "gas": r.gas,
+            "effective_security_bits": eff,
+            "target_bits": target,
+            "verified": _verified_cell(r.meta),
+            "capped_by": cap_dep,
+            "blocker": blocker_text(cap_dep) if cap_dep else "",
+        })
+    return rows
+
+
+def load_latest_attribution(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    parent_rid -> function rows of the latest ingest (max ts_utc) for that parent.
+    """
+    by_parent: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except Exception:
+                continue
+            if obj.get("kind") != "function":
+                continue
+            rid = str(obj.get("parent_rid") or "")
+            if not rid:
+                continue
+            ts = str(obj.get("ts_utc") or "")
+            by_parent.setdefault(rid, {}).setdefault(ts, []).append(obj)
+    return {rid: ingests[max(ingests)] for rid, ingests in by_parent.items()}
+
+
+def top_consumers_lines(records: Dict[str, Record], attribution: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+    lines: List[str] = []
+    lines.append("## Top gas consumers per surface")
+    lines.append("")
+
+    parents = [rid for rid in sorted(attribution) if rid in records]
+    if not parents:
+        lines.append("_No function-level attribution ingested yet._ "
+                     "Run `python3 scripts/gas_report_ingest.py --parent <scheme::bench_name> ...` "
+                     "to attach `forge test --gas-report` tables to a dataset row.")
+        lines.append("")
+        return lines
+
+    lines.append("From `data/gas_attribution.jsonl` (forge `--gas-report`, latest ingest per row). "
+                 f"Top {TOP_CONSUMERS_N} external functions ranked by total = avg × calls; "
+                 "internal library calls are inlined into their caller.")
+    lines.append("")
+
+    by_surface: Dict[str, List[str]] = {}
+    for rid in parents:
+        sid = str(records[rid].meta.get("surface_id") or "unclassified")
+        by_surface.setdefault(sid, []).append(rid)
+
+    for sid in sorted(by_surface):
+        for rid in by_surface[sid]:
+            r = records[rid]
+            funcs = attribution[rid]
+            commit = str(funcs[0].get("commit") or "")[:12]
+            lines.append(f"### `{sid}` — `{rid}` (row gas {fmt_int(r.gas)}; commit `{commit}`)")
+            lines.append("")
+            lines.append("| Contract | Function | Calls | Avg | Median | Max | Total |")
+            lines.append("|---|---|---:|---:|---:|---:|---:|")
+
+            def total(o: Dict[str, Any]) -> int:
+                return (_as_int(o.get("avg")) or 0) * (_as_int(o.get("calls")) or 0)
+
+            ranked = sorted(funcs, key=lambda o: (-total(o), str(o.get("contract")), str(o.get("function"))))
+            for o in ranked[:TOP_CONSUMERS_N]:
+                contract = str(o.get("contract") or "").split(":")[-1]
+                lines.append(
+                    f"| `{contract}` | `{o.get('function')}` | {fmt_int(_as_int(o.get('calls')))} | "
+                    f"{fmt_int(_as_int(o.get('avg')))} | {fmt_int(_as_int(o.get('median')))} | "
+                    f"{fmt_int(_as_int(o.get('max')))} | {total(o)} |"
+                )
+            lines.append("")
+    return lines
+
+
 def main() -> None:
     if not DATA_JSONL.exists():
         raise SystemExit(f"Missing {DATA_JSONL}")
@@ -372,9 +498,6 @@ def main() -> None:
     records = load_latest_records(DATA_JSONL)
     eff_map = compute_effective_security_bits(records)
 
-    rows = list(records.items())
-    rows.sort(key=lambda t: (t[1].category, t[0]))
-
     OUT_MD.parent.mkdir(parents=True, exist_ok=True)
 
     lines: List[str] = []
@@ -390,23 +513,10 @@ def main() -> None:
     lines.append("| Category | Surface | Gas | effective_security_bits | Target (bits) | Verified | Capped by | Blocker |")
     lines.append("|---|---|---:|---:|---:|---|---|---|")
 
-    for _, r in rows:
-        eff = eff_map.get(r.rid, 0)
-
-        own = r.effective_security_bits if r.effective_security_bits is not None else r.security_equiv_bits
-        own_i = int(own) if own is not None else 0
-
-        target = DEFAULT_TARGET_BITS_BY_CATEGORY.get(r.category, 0)
-        if not target:
-            target = max(own_i, int(eff))
-
-        cap_dep = find_cap_reason(r, eff_map, records)
-        blocker = blocker_text(cap_dep) if cap_dep else ""
-
-        verified = _verified_cell(r.meta)
-
+    for row in readiness_rows(records, eff_map):
         lines.append(
-            f"| {r.category} | `{r.rid}` | {fmt_int(r.gas)} | {eff} | {target} | {verified} | {cap_dep or '-'} | {blocker} |"
+            f"| {row['category']} | `{row['rid']}` | {fmt_int(row['gas'])} | {row['effective_security_bits']} | "
+            f"{row['target_bits']} | {row['verified']} | {row['capped_by'] or '-'} | {row['blocker']} |"
         )
 
     lines.append("")
@@ -417,8 +527,18 @@ def main() -> None:
     lines.append("- `Verified` is ✅ only when the dataset row includes an `onchain_proof` bundle.")
     lines.append("")
 
-    OUT_MD.write_text("\n".join(lines), encoding="utf-8")
-    print(f"Wrote {OUT_MD}")
+    lines.extend(top_consumers_lines(records, load_latest_attribution(ATTR_JSONL)))
+
+    text = "\n".join(lines)
+    old = OUT_MD.read_text(encoding="utf-8") if OUT_MD.exists() else ""
+    m = BLOCK_BEGIN_RX.search(old)
+    if m:
+        text += "\n" + old[m.start():]
+
+    old_rows = {ln for ln in old.splitlines() if ln.startswith("| ") and "` |" in ln}
+    changed = [ln.split("`")[1] for ln in lines if ln.startswith("| ") and "` |" in ln and ln not in old_rows]
+    OUT_MD.write_text(text, encoding="utf-8")
+    print(f"Wrote {OUT_MD} ({len(changed)} table rows changed{': ' + ', '.join(changed) if changed else ''})")
 
 
 if __name__ == "__main__":
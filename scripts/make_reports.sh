@@ -1,50 +1,36 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# Runners call this script at the end; the rebuild orchestrator sets SKIP_REPORTS=1
+# and regenerates reports once after all vendors are merged.
+if [ "${SKIP_REPORTS:-0}" = "1" ]; then
+  echo "[skip] SKIP_REPORTS=1; not regenerating reports"
+  exit 0
+fi
+
 echo "[pre] Dedup data/results.jsonl (scheme,bench_name,repo,commit)"
 python3 scripts/dedup_results.py || true
 
-echo "[0/5] Rebuild data/results.csv from data/results.jsonl"
-python3 scripts/parse_bench.py --regen data/results.jsonl
-
-echo "[1/5] Sanity: required files"
+echo "[1/2] Sanity: required files"
 test -f data/results.jsonl
 test -f scripts/parse_bench.py
 
-# Step 2 (JSONL sanity) and Step 3 (CSV uniqueness) are redundant:
-# - dedup_results.py already validates JSONL structure and removes duplicates.
-# - parse_bench.py --regen builds CSV 1:1 from valid JSONL.
-# Skipping to save 2 extra parse passes.
-
-echo "[4/5] Generate reports"
-if test -f scripts/report_weakest_link.py; then
-  python3 scripts/report_weakest_link.py
-else
-  echo "WARN: scripts/report_weakest_link.py not found; skipping"
-fi
-
-echo "[5/5] Generate protocol readiness"
-python3 scripts/make_protocol_readiness.py
-
-# Post-process: inject ML-DSA-65 vendor measurements (pinned ref)
-if test -f scripts/patch_protocol_readiness_mldsa.py; then
-  python3 scripts/patch_protocol_readiness_mldsa.py --jsonl data/results.jsonl --report reports/protocol_readiness.md
-else
-  echo "WARN: scripts/patch_protocol_readiness_mldsa.py not found; skipping"
-fi
-
-# Post-process: inject Falcon vendor measurements (pinned ref)
-if test -f scripts/patch_protocol_readiness_falcon.py; then
-  python3 scripts/patch_protocol_readiness_falcon.py data/results.jsonl reports/protocol_readiness.md
-else
-  echo "WARN: scripts/patch_protocol_readiness_falcon.py not found; skipping"
-fi
-
-# Post-process: inject Dilithium vendor measurements (pinned ref)
-if test -f scripts/patch_protocol_readiness_ethdilithium.py; then
-  python3 scripts/patch_protocol_readiness_ethdilithium.py --jsonl data/results.jsonl --report reports/protocol_readiness.md
+# Every derived artifact is a stage of scripts/report_build.py, which only reruns a stage whose
+# dataset slice, generator script or extra inputs changed since the last build (or whose output was
+# touched outside the build). Stages, in order:
+#   csv                 parse_bench.py --regen             -> data/results.csv
+#   weakest_link        report_weakest_link.py             -> reports/weakest_link_report.md
+#   readiness           make_protocol_readiness.py         -> reports/protocol_readiness.md (outside vendor blocks)
+#   *_block             readiness_blocks.py --only ...     -> the MLDSA65 / FALCON / ETHDILITHIUM vendor blocks
+#   pareto              pareto_frontier.py                 -> reports/pareto_frontier.md + data/pareto_frontier.json
+#   paths               path_cost.py                       -> reports/path_cost.md
+#   charts              make_charts.py                     -> docs/*.svg (per-chart hashes on top)
+# Set REPORTS_FORCE=1 to rebuild everything.
+echo "[2/2] Build reports (incremental)"
+if [ "${REPORTS_FORCE:-0}" = "1" ]; then
+  python3 scripts/report_build.py --force
 else
-  echo "WARN: scripts/patch_protocol_readiness_ethdilithium.py not found; skipping"
+  python3 scripts/report_build.py
 fi
 
 echo "Done."
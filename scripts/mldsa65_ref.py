@@ -0,0 +1,725 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ML-DSA-65 (FIPS-204) reference: keygen / sign / verify, batched with NumPy.
+
+Built on scripts/ntt_ref.py (same zetas and butterflies as NTT_MLDSA_Real; `intt` is the
+FIPS-204 NTT^-1) and on the 10-bit t1 packing read by MLDSA65_Verifier_v2._decodeT1Packed.
+Hashing is hashlib SHAKE128/SHAKE256; the polynomial arithmetic of a whole batch of keys /
+signing attempts / verifications runs as one array pass.
+
+Encodings are FIPS-204:
+  pk  = rho(32) || t1 (6 x 320)                                  1952 bytes
+  sk  = rho || K || tr || s1 || s2 || t0                         4032 bytes
+  sig = c_tilde(48) || z (5 x 640) || hint (omega + k = 61)      3309 bytes
+MLDSA65_Verifier_v2 currently reads t1 || rho; `--pk-layout contract` emits that order.
+
+Usage:
+  python3 scripts/mldsa65_ref.py check
+  python3 scripts/mldsa65_ref.py gen-pack --count 2000 --invalid 1 --out .tmp/mldsa65_ref_pack.json
+  python3 scripts/mldsa65_ref.py gen-pack --count 200 --intermediates --out .tmp/mldsa65_ref_diff.json
+  python3 scripts/mldsa65_ref.py verify-pack .tmp/mldsa65_ref_pack.json
+  python3 scripts/mldsa65_ref.py gen-pack --count 2000 --out .tmp/mldsa65_ref_pack.vpak   (binary, scripts/vpack.py)
+
+Pack shape (same as the sweep harness, test/MLDSA_VerifySweep_Gas.t.sol):
+  {"vector_pack_id", "scheme", "pk_layout", "seed",
+   "vectors": [{"name", "msg_hash", "pubkey_hex", "signature_hex", "expected", "mutation",
+                ["mu", "c_tilde", "c", "w_approx", "w1"]}]}
+`c` is the challenge polynomial, `w_approx` = NTT^-1(A*NTT(z) - NTT(c)*NTT(t1*2^d)) and
+`w1` = UseHint(h, w_approx), both as k x 256 coefficients, for differential checks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import bitpack
+from ntt_ref import N, Q, intt, matvec_ntt, ntt
+from vpack import PackWriter, VectorPack
+
+
+# ML-DSA-65 parameters (FIPS-204, Table 1)
+K = 6
+L = 5
+D = 13
+TAU = 49
+LAMBDA = 192
+GAMMA1 = 1 << 19
+GAMMA2 = (Q - 1) // 32
+ETA = 4
+BETA = TAU * ETA
+OMEGA = 55
+
+CTILDE_BYTES = LAMBDA // 4
+T1_BITS = 10
+Z_BITS = 20
+ETA_BITS = 4
+T0_BITS = D
+W1_BITS = 4
+
+PK_BYTES = 32 + K * 32 * T1_BITS
+SK_BYTES = 128 + (L + K) * 32 * ETA_BITS + K * 32 * T0_BITS
+SIG_BYTES = CTILDE_BYTES + L * 32 * Z_BITS + OMEGA + K
+
+MUTATIONS = ("c_tilde_flip", "z_flip", "z_norm", "hint_malformed", "msg_flip", "pk_flip")
+
+
+# -----------------------------
+# Hashing / sampling
+# -----------------------------
+
+def H(data: bytes, n: int) -> bytes:
+    return hashlib.shake_256(data).digest(n)
+
+
+def rej_ntt_poly(seed: bytes) -> np.ndarray:
+    """RejNTTPoly: SHAKE128, 3 bytes per candidate (top bit cleared), keep < q."""
+    n = 168 * 5
+    while True:
+        buf = np.frombuffer(hashlib.shake_128(seed).digest(n), dtype=np.uint8).reshape(-1, 3).astype(np.int64)
+        c = buf[:, 0] | (buf[:, 1] << 8) | ((buf[:, 2] & 0x7F) << 16)
+        c = c[c < Q]
+        if c.size >= N:
+            return c[:N]
+        n *= 2
+
+
+def expand_a(rho: bytes) -> np.ndarray:
+    """ExpandA: A_hat[r][s] = RejNTTPoly(rho || s || r), already in the NTT domain. Shape [K, L, 256]."""
+    return np.stack([
+        np.stack([rej_ntt_poly(rho + bytes([s, r])) for s in range(L)]) for r in range(K)
+    ])
+
+
+def rej_bounded_poly(seed: bytes) -> np.ndarray:
+    """RejBoundedPoly for eta = 4: half-bytes b < 9 map to 4 - b (low nibble first)."""
+    n = 256
+    while True:
+        buf = np.frombuffer(H(seed, n), dtype=np.uint8)
+        nib = np.stack((buf & 0x0F, buf >> 4), axis=-1).reshape(-1).astype(np.int64)
+        nib = nib[nib < 9]
+        if nib.size >= N:
+            return ETA - nib[:N]
+        n *= 2
+
+
+def expand_s(rho_p: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    s1 = np.stack([rej_bounded_poly(rho_p + r.to_bytes(2, "little")) for r in range(L)])
+    s2 = np.stack([rej_bounded_poly(rho_p + (r + L).to_bytes(2, "little")) for r in range(K)])
+    return s1, s2
+
+
+def expand_mask(rho_pp: bytes, kappa: int) -> np.ndarray:
+    out = np.empty((L, N), dtype=np.int64)
+    for r in range(L):
+        v = np.frombuffer(H(rho_pp + (kappa + r).to_bytes(2, "little"), 32 * Z_BITS), dtype=np.uint8)
+        out[r] = GAMMA1 - bit_unpack(v, Z_BITS)
+    return out
+
+
+def sample_in_ball(c_tilde: bytes) -> np.ndarray:
+    n = 8 + 136
+    buf = H(c_tilde, n)
+    signs = int.from_bytes(buf[:8], "little")
+    pos = 8
+    c = np.zeros(N, dtype=np.int64)
+    for i in range(N - TAU, N):
+        while True:
+            if pos >= n:
+                n *= 2
+                buf = H(c_tilde, n)
+            j = buf[pos]
+            pos += 1
+            if j <= i:
+                break
+        c[i] = c[j]
+        c[j] = 1 - 2 * ((signs >> (i + TAU - N)) & 1)
+    return c
+
+
+# -----------------------------
+# Rounding (vectorized over any shape)
+# -----------------------------
+
+def _mod_pm(r: np.ndarray, alpha: int) -> np.ndarray:
+    r0 = r % alpha
+    return np.where(r0 > alpha // 2, r0 - alpha, r0)
+
+
+def centered(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.int64) % Q
+    return np.where(x > Q // 2, x - Q, x)
+
+
+def inf_norm(x: np.ndarray, axes: Tuple[int, ...]) -> np.ndarray:
+    return np.abs(centered(x)).max(axis=axes)
+
+
+def power2round(t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    r = t % Q
+    r0 = _mod_pm(r, 1 << D)
+    return (r - r0) >> D, r0
+
+
+def decompose(r: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    r = r % Q
+    r0 = _mod_pm(r, 2 * GAMMA2)
+    wrap = (r - r0) == Q - 1
+    r1 = np.where(wrap, 0, (r - r0) // (2 * GAMMA2))
+    r0 = np.where(wrap, r0 - 1, r0)
+    return r1, r0
+
+
+def high_bits(r: np.ndarray) -> np.ndarray:
+    return decompose(r)[0]
+
+
+def low_bits(r: np.ndarray) -> np.ndarray:
+    return decompose(r)[1]
+
+
+def make_hint(z: np.ndarray, r: np.ndarray) -> np.ndarray:
+    return (high_bits(r) != high_bits(r + z)).astype(np.int64)
+
+
+def use_hint(h: np.ndarray, r: np.ndarray) -> np.ndarray:
+    m = (Q - 1) // (2 * GAMMA2)
+    r1, r0 = decompose(r)
+    return np.where(h == 1, np.where(r0 > 0, (r1 + 1) % m, (r1 - 1) % m), r1)
+
+
+# -----------------------------
+# Bit packing (little-endian bit order, as SimpleBitPack / BitPack and _decodeT1Packed; scripts/bitpack.py)
+# -----------------------------
+
+def bit_pack(vals: np.ndarray, bits: int) -> np.ndarray:
+    return bitpack.pack(vals, bits)
+
+
+def bit_unpack(buf: np.ndarray, bits: int) -> np.ndarray:
+    return bitpack.unpack(buf, bits)
+
+
+def pk_encode(rho: bytes, t1: np.ndarray) -> bytes:
+    return rho + bit_pack(t1, T1_BITS).tobytes()
+
+
+def pk_decode(pk: bytes) -> Tuple[bytes, np.ndarray]:
+    rho = pk[:32]
+    t1 = bit_unpack(np.frombuffer(pk[32:], dtype=np.uint8).reshape(K, 32 * T1_BITS), T1_BITS)
+    return rho, t1
+
+
+def pk_to_contract_layout(pk: bytes) -> bytes:
+    """FIPS rho || t1  ->  t1 || rho (what MLDSA65_Verifier_v2._decodePublicKeyRaw reads)."""
+    return pk[32:] + pk[:32]
+
+
+def pk_from_contract_layout(pk: bytes) -> bytes:
+    return pk[-32:] + pk[:-32]
+
+
+def sk_encode(rho: bytes, key: bytes, tr: bytes, s1: np.ndarray, s2: np.ndarray, t0: np.ndarray) -> bytes:
+    return (rho + key + tr
+            + bit_pack(ETA - s1, ETA_BITS).tobytes()
+            + bit_pack(ETA - s2, ETA_BITS).tobytes()
+            + bit_pack((1 << (D - 1)) - t0, T0_BITS).tobytes())
+
+
+def sk_decode(sk: bytes) -> Tuple[bytes, bytes, bytes, np.ndarray, np.ndarray, np.ndarray]:
+    rho, key, tr = sk[:32], sk[32:64], sk[64:128]
+    off = 128
+    n_eta = 32 * ETA_BITS
+    s1 = ETA - bit_unpack(np.frombuffer(sk[off:off + L * n_eta], dtype=np.uint8).reshape(L, n_eta), ETA_BITS)
+    off += L * n_eta
+    s2 = ETA - bit_unpack(np.frombuffer(sk[off:off + K * n_eta], dtype=np.uint8).reshape(K, n_eta), ETA_BITS)
+    off += K * n_eta
+    n_t0 = 32 * T0_BITS
+    t0 = (1 << (D - 1)) - bit_unpack(np.frombuffer(sk[off:off + K * n_t0], dtype=np.uint8).reshape(K, n_t0), T0_BITS)
+    return rho, key, tr, s1, s2, t0
+
+
+def hint_pack(h: np.ndarray) -> bytes:
+    y = bytearray(OMEGA + K)
+    idx = 0
+    for i in range(K):
+        for j in np.flatnonzero(h[i]).tolist():
+            y[idx] = j
+            idx += 1
+        y[OMEGA + i] = idx
+    return bytes(y)
+
+
+def hint_unpack(y: bytes) -> Optional[np.ndarray]:
+    h = np.zeros((K, N), dtype=np.int64)
+    idx = 0
+    for i in range(K):
+        end = y[OMEGA + i]
+        if end < idx or end > OMEGA:
+            return None
+        first = idx
+        while idx < end:
+            if idx > first and y[idx - 1] >= y[idx]:
+                return None
+            h[i][y[idx]] = 1
+            idx += 1
+    if any(y[i] != 0 for i in range(idx, OMEGA)):
+        return None
+    return h
+
+
+def sig_encode(c_tilde: bytes, z: np.ndarray, h: np.ndarray) -> bytes:
+    return c_tilde + bit_pack(GAMMA1 - centered(z), Z_BITS).tobytes() + hint_pack(h)
+
+
+def sig_decode(sig: bytes) -> Tuple[bytes, np.ndarray, Optional[np.ndarray]]:
+    c_tilde = sig[:CTILDE_BYTES]
+    n_z = 32 * Z_BITS
+    zb = np.frombuffer(sig[CTILDE_BYTES:CTILDE_BYTES + L * n_z], dtype=np.uint8).reshape(L, n_z)
+    z = GAMMA1 - bit_unpack(zb, Z_BITS)
+    return c_tilde, z, hint_unpack(sig[CTILDE_BYTES + L * n_z:])
+
+
+def hint_pack_batch(h: np.ndarray) -> np.ndarray:
+    """hint_pack for h[B, K, N] -> [B, OMEGA + K] uint8 (raises if a row has more than OMEGA hints)."""
+    h = np.asarray(h)
+    B = h.shape[0]
+    ends = np.cumsum((h != 0).sum(axis=-1), axis=1)
+    if B and ends[:, -1].max() > OMEGA:
+        raise ValueError(f"more than OMEGA={OMEGA} hints in a signature")
+    y = np.zeros((B, OMEGA + K), dtype=np.uint8)
+    b, _, j = np.nonzero(h)
+    first = np.concatenate(([0], np.cumsum(np.bincount(b, minlength=B))[:-1]))
+    y[b, np.arange(len(b)) - first[b]] = j
+    y[:, OMEGA:] = ends
+    return y
+
+
+def hint_unpack_batch(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """hint_unpack for y[B, OMEGA + K] -> (h[B, K, N], ok[B]); h of a malformed row is all zero."""
+    y = np.asarray(y, dtype=np.uint8)
+    B = y.shape[0]
+    idx, ends = y[:, :OMEGA].astype(np.int64), y[:, OMEGA:].astype(np.int64)
+    starts = np.concatenate((np.zeros((B, 1), dtype=np.int64), ends[:, :-1]), axis=1)
+    ok = (ends >= starts).all(axis=1) & (ends[:, -1] <= OMEGA)
+    pos = np.arange(OMEGA)
+    used = pos[None, :] < ends[:, -1:]
+    row = (ends[:, None, :] <= pos[None, :, None]).sum(axis=-1)
+    ok &= ~(~used & (idx != 0)).any(axis=1)
+    same = used[:, 1:] & (row[:, 1:] == row[:, :-1])
+    ok &= ~(same & (idx[:, :-1] >= idx[:, 1:])).any(axis=1)
+    h = np.zeros((B, K, N), dtype=np.int64)
+    b, p = np.nonzero(used & ok[:, None])
+    h[b, row[b, p], idx[b, p]] = 1
+    return h, ok
+
+
+def pk_encode_batch(rho: np.ndarray, t1: np.ndarray) -> np.ndarray:
+    """rho[B, 32], t1[B, K, N] -> pk[B, PK_BYTES] uint8 (FIPS rho || t1)."""
+    t1b = bitpack.encode(t1, "t1").reshape(t1.shape[0], -1)
+    return np.concatenate((np.asarray(rho, dtype=np.uint8), t1b), axis=1)
+
+
+def pk_decode_batch(pks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """pk[B, PK_BYTES] uint8 (FIPS layout) -> (rho[B, 32], t1[B, K, N])."""
+    pks = np.asarray(pks, dtype=np.uint8)
+    return pks[:, :32], bitpack.decode(pks[:, 32:].reshape(-1, K, 32 * T1_BITS), "t1")
+
+
+def sig_encode_batch(c_tilde: np.ndarray, z: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """c_tilde[B, CTILDE_BYTES], z[B, L, N], h[B, K, N] -> sig[B, SIG_BYTES] uint8."""
+    zb = bitpack.encode(centered(np.asarray(z) % Q), "z").reshape(z.shape[0], -1)
+    return np.concatenate((np.asarray(c_tilde, dtype=np.uint8), zb, hint_pack_batch(h)), axis=1)
+
+
+def sig_decode_batch(sigs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """sig[B, SIG_BYTES] uint8 -> (c_tilde, z[B, L, N], h[B, K, N], hint_ok[B])."""
+    sigs = np.asarray(sigs, dtype=np.uint8)
+    n_z = L * 32 * Z_BITS
+    z = bitpack.decode(sigs[:, CTILDE_BYTES:CTILDE_BYTES + n_z].reshape(-1, L, 32 * Z_BITS), "z")
+    h, ok = hint_unpack_batch(sigs[:, CTILDE_BYTES + n_z:])
+    return sigs[:, :CTILDE_BYTES], z, h, ok
+
+
+def w1_encode(w1: np.ndarray) -> bytes:
+    return bit_pack(w1, W1_BITS).tobytes()
+
+
+def format_message(msg: bytes, ctx: bytes = b"") -> bytes:
+    """M' for pure ML-DSA: 0 || |ctx| || ctx || M."""
+    if len(ctx) > 255:
+        raise ValueError("context longer than 255 bytes")
+    return bytes([0, len(ctx)]) + ctx + msg
+
+
+# -----------------------------
+# Batched algorithms
+# -----------------------------
+
+def keygen_batch(seeds: Sequence[bytes]) -> List[Tuple[bytes, bytes]]:
+    """ML-DSA.KeyGen_internal for each 32-byte seed xi. Returns [(pk, sk)]."""
+    rhos, keys, A, s1, s2 = [], [], [], [], []
+    for xi in seeds:
+        exp = H(xi + bytes([K, L]), 128)
+        rho, rho_p, key = exp[:32], exp[32:96], exp[96:]
+        rhos.append(rho)
+        keys.append(key)
+        A.append(expand_a(rho))
+        a, b = expand_s(rho_p)
+        s1.append(a)
+        s2.append(b)
+    S1 = np.stack(s1)
+    S2 = np.stack(s2)
+    t = (intt(matvec_ntt(np.stack(A), ntt(S1))) + S2) % Q
+    T1, T0 = power2round(t)
+
+    out: List[Tuple[bytes, bytes]] = []
+    for i in range(len(seeds)):
+        pk = pk_encode(rhos[i], T1[i])
+        tr = H(pk, 64)
+        out.append((pk, sk_encode(rhos[i], keys[i], tr, S1[i], S2[i], T0[i])))
+    return out
+
+
+def sign_batch(sks: Sequence[bytes], msgs: Sequence[bytes], rnds: Optional[Sequence[bytes]] = None,
+               ctx: bytes = b"") -> List[bytes]:
+    """ML-DSA.Sign (hedged if rnd is random, deterministic with rnd = 0^32); all rejection loops run together."""
+    B = len(sks)
+    rnds = rnds if rnds is not None else [bytes(32)] * B
+    A_cache: Dict[bytes, np.ndarray] = {}
+    A, s1, s2, t0, mus, rho_pps = [], [], [], [], [], []
+    for sk, msg, rnd in zip(sks, msgs, rnds):
+        rho, key, tr, a, b, c = sk_decode(sk)
+        if rho not in A_cache:
+            A_cache[rho] = expand_a(rho)
+        A.append(A_cache[rho])
+        s1.append(a)
+        s2.append(b)
+        t0.append(c)
+        mu = H(tr + format_message(msg, ctx), 64)
+        mus.append(mu)
+        rho_pps.append(H(key + rnd + mu, 64))
+
+    A_hat = np.stack(A)
+    s1_hat = ntt(np.stack(s1) % Q)
+    s2_hat = ntt(np.stack(s2) % Q)
+    t0_hat = ntt(np.stack(t0) % Q)
+
+    kappa = np.zeros(B, dtype=np.int64)
+    sigs: List[Optional[bytes]] = [None] * B
+    pending = np.arange(B)
+
+    while pending.size:
+        y = np.stack([expand_mask(rho_pps[i], int(kappa[i])) for i in pending])
+        w = intt(matvec_ntt(A_hat[pending], ntt(y % Q)))
+        w1 = high_bits(w)
+        c_tildes = [H(mus[i] + w1_encode(w1[n]), CTILDE_BYTES) for n, i in enumerate(pending)]
+        c_hat = ntt(np.stack([sample_in_ball(ct) for ct in c_tildes]) % Q)[:, None, :]
+
+        cs1 = intt(c_hat * s1_hat[pending] % Q)
+        cs2 = intt(c_hat * s2_hat[pending] % Q)
+        z = centered(y + cs1)
+        r0 = low_bits(w - cs2)
+        ct0 = intt(c_hat * t0_hat[pending] % Q)
+        h = make_hint(-ct0 % Q, (w - cs2 + ct0) % Q)
+
+        ok = ((np.abs(z).max(axis=(1, 2)) < GAMMA1 - BETA)
+              & (np.abs(r0).max(axis=(1, 2)) < GAMMA2 - BETA)
+              & (inf_norm(ct0, (1, 2)) < GAMMA2)
+              & (h.sum(axis=(1, 2)) <= OMEGA))
+
+        for n in np.flatnonzero(ok).tolist():
+            sigs[int(pending[n])] = sig_encode(c_tildes[n], z[n], h[n])
+        kappa[pending[~ok]] += L
+        pending = pending[~ok]
+
+    return [s for s in sigs if s is not None]
+
+
+def verify_batch(pks: Sequence[bytes], msgs: Sequence[bytes], sigs: Sequence[bytes],
+                 ctx: bytes = b"") -> Tuple[List[bool], List[Dict[str, Any]]]:
+    """ML-DSA.Verify for each triple; also returns the intermediates (mu, c_tilde, c, w_approx, w1)."""
+    B = len(pks)
+    ok = [False] * B
+    trace: List[Dict[str, Any]] = [{} for _ in range(B)]
+
+    live: List[int] = []
+    A, t1, z, c, hints = [], [], [], [], []
+    A_cache: Dict[bytes, np.ndarray] = {}
+    for i, (pk, msg, sig) in enumerate(zip(pks, msgs, sigs)):
+        if len(pk) != PK_BYTES or len(sig) != SIG_BYTES:
+            trace[i]["reject"] = "length"
+            continue
+        rho, t1_i = pk_decode(pk)
+        c_tilde, z_i, h_i = sig_decode(sig)
+        mu = H(H(pk, 64) + format_message(msg, ctx), 64)
+        trace[i].update(mu=mu, c_tilde=c_tilde)
+        if h_i is None:
+            trace[i]["reject"] = "hint_encoding"
+            continue
+        if rho not in A_cache:
+            A_cache[rho] = expand_a(rho)
+        live.append(i)
+        A.append(A_cache[rho])
+        t1.append(t1_i)
+        z.append(z_i)
+        c.append(sample_in_ball(c_tilde))
+        hints.append(h_i)
+
+    if not live:
+        return ok, trace
+
+    Z = np.stack(z)
+    C = np.stack(c)
+    c_hat = ntt(C % Q)[:, None, :]
+    t1_hat = ntt(np.stack(t1) << D)
+    w_approx = intt((matvec_ntt(np.stack(A), ntt(Z % Q)) - c_hat * t1_hat % Q) % Q)
+    w1 = use_hint(np.stack(hints), w_approx)
+    z_ok = np.abs(Z).max(axis=(1, 2)) < GAMMA1 - BETA
+
+    for n, i in enumerate(live):
+        ct = H(trace[i]["mu"] + w1_encode(w1[n]), CTILDE_BYTES)
+        good = bool(z_ok[n]) and ct == trace[i]["c_tilde"]
+        ok[i] = good
+        trace[i].update(c=C[n], w_approx=w_approx[n], w1=w1[n])
+        if not good:
+            trace[i]["reject"] = "z_norm" if not z_ok[n] else "c_tilde_mismatch"
+    return ok, trace
+
+
+# -----------------------------
+# Invalid triples
+# -----------------------------
+
+def _flip(buf: bytes, byte_lo: int, byte_hi: int, rng: np.random.Generator) -> bytes:
+    b = bytearray(buf)
+    pos = int(rng.integers(byte_lo, byte_hi))
+    b[pos] ^= 1 << int(rng.integers(0, 8))
+    return bytes(b)
+
+
+def mutate(kind: str, pk: bytes, msg: bytes, sig: bytes, rng: np.random.Generator) -> Tuple[bytes, bytes, bytes]:
+    if kind == "c_tilde_flip":
+        return pk, msg, _flip(sig, 0, CTILDE_BYTES, rng)
+    if kind == "z_flip":
+        return pk, msg, _flip(sig, CTILDE_BYTES, CTILDE_BYTES + L * 32 * Z_BITS, rng)
+    if kind == "z_norm":
+        c_tilde, z, h = sig_decode(sig)
+        z = z.copy()
+        z[int(rng.integers(0, L)), int(rng.integers(0, N))] = GAMMA1 - BETA
+        return pk, msg, sig_encode(c_tilde, z, h)
+    if kind == "hint_malformed":
+        b = bytearray(sig)
+        b[-1] = OMEGA + 1
+        return pk, msg, bytes(b)
+    if kind == "msg_flip":
+        return pk, _flip(msg, 0, len(msg), rng), sig
+    if kind == "pk_flip":
+        return _flip(pk, 32, PK_BYTES, rng), msg, sig
+    raise ValueError(f"unknown mutation {kind}")
+
+
+# -----------------------------
+# Packs
+# -----------------------------
+
+def _chunk_seed(seed: int, chunk: int) -> bytes:
+    return H(b"mldsa65_ref" + seed.to_bytes(8, "little") + chunk.to_bytes(8, "little"), 32)
+
+
+def gen_chunk(task: Tuple[int, int, int, int, int, bool, str]) -> List[Dict[str, Any]]:
+    seed, chunk, start, count, invalid_per_valid, intermediates, layout = task
+    base = _chunk_seed(seed, chunk)
+    rng = np.random.default_rng(int.from_bytes(base[:8], "little"))
+
+    xis = [H(base + b"xi" + i.to_bytes(4, "little"), 32) for i in range(count)]
+    msgs = [H(base + b"msg" + i.to_bytes(4, "little"), 32) for i in range(count)]
+    keys = keygen_batch(xis)
+    sigs = sign_batch([sk for _pk, sk in keys], msgs)
+
+    triples: List[Tuple[str, str, bytes, bytes, bytes, bool]] = []
+    for i, ((pk, _sk), msg, sig) in enumerate(zip(keys, msgs, sigs)):
+        name = f"mldsa65_ref_{start + i:06d}"
+        triples.append((name, "", pk, msg, sig, True))
+        for m in range(invalid_per_valid):
+            kind = MUTATIONS[(start + i + m) % len(MUTATIONS)]
+            mpk, mmsg, msig = mutate(kind, pk, msg, sig, rng)
+            triples.append((f"{name}_{kind}", kind, mpk, mmsg, msig, False))
+
+    oks, traces = verify_batch([t[2] for t in triples], [t[3] for t in triples], [t[4] for t in triples])
+
+    out: List[Dict[str, Any]] = []
+    for (name, kind, pk, msg, sig, expected), got, tr in zip(triples, oks, traces):
+        if got != expected:
+            raise SystemExit(f"{name}: reference verify returned {got}, expected {expected}")
+        v: Dict[str, Any] = {
+            "name": name,
+            "msg_hash": "0x" + msg.hex(),
+            "pubkey_hex": "0x" + (pk_to_contract_layout(pk) if layout == "contract" else pk).hex(),
+            "signature_hex": "0x" + sig.hex(),
+            "expected": expected,
+            "mutation": kind,
+        }
+        if intermediates:
+            v["mu"] = "0x" + tr["mu"].hex() if "mu" in tr else ""
+            v["c_tilde"] = "0x" + tr["c_tilde"].hex() if "c_tilde" in tr else ""
+            if "c" in tr:
+                v["c"] = tr["c"].tolist()
+                v["w_approx"] = tr["w_approx"].tolist()
+                v["w1"] = tr["w1"].tolist()
+            v["reject"] = tr.get("reject", "")
+        out.append(v)
+    return out
+
+
+def gen_pack(count: int, seed: int, invalid: int, intermediates: bool, layout: str,
+             jobs: int, chunk: int) -> Dict[str, Any]:
+    tasks = []
+    for ci, start in enumerate(range(0, count, chunk)):
+        tasks.append((seed, ci, start, min(chunk, count - start), invalid, intermediates, layout))
+
+    vectors: List[Dict[str, Any]] = []
+    if jobs <= 1 or len(tasks) == 1:
+        for t in tasks:
+            vectors.extend(gen_chunk(t))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            for part in ex.map(gen_chunk, tasks):
+                vectors.extend(part)
+
+    body = json.dumps(vectors, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return {
+        "vector_pack_id": hashlib.sha256(body).hexdigest(),
+        "scheme": "mldsa65",
+        "pk_layout": layout,
+        "seed": seed,
+        "vectors": vectors,
+    }
+
+
+def write_vpak(pack: Dict[str, Any], out: Path) -> str:
+    meta = {k: pack[k] for k in ("scheme", "pk_layout", "seed")}
+    with PackWriter(out, meta) as w:
+        for v in pack["vectors"]:
+            w.add(v["name"], bytes.fromhex(v["pubkey_hex"][2:]), bytes.fromhex(v["signature_hex"][2:]),
+                  bytes.fromhex(v["msg_hash"][2:]), v["expected"], v.get("mutation") or "")
+    return VectorPack(out).pack_id
+
+
+def verify_pack(path: Path) -> int:
+    if path.suffix == ".vpak":
+        vp = VectorPack(path)
+        layout = vp.meta.get("pk_layout", "fips")
+        vecs = [{"name": v["name"], "expected": v["expected"], "pk": bytes(v["pk"]), "msg": bytes(v["msg"]),
+                 "sig": bytes(v["sig"])} for v in vp]
+    else:
+        pack = json.loads(path.read_text(encoding="utf-8"))
+        layout = pack.get("pk_layout", "fips")
+        vecs = [dict(v, pk=bytes.fromhex(v["pubkey_hex"].removeprefix("0x")),
+                     msg=bytes.fromhex(v["msg_hash"].removeprefix("0x")),
+                     sig=bytes.fromhex(v["signature_hex"].removeprefix("0x"))) for v in pack.get("vectors") or []]
+    pks = [pk_from_contract_layout(v["pk"]) if layout == "contract" else v["pk"] for v in vecs]
+    msgs = [v["msg"] for v in vecs]
+    sigs = [v["sig"] for v in vecs]
+    oks, _ = verify_batch(pks, msgs, sigs)
+    # a vector without `expected` is record-only: verified, never counted as agreeing or not
+    labelled = [(v, got) for v, got in zip(vecs, oks) if v.get("expected") is not None]
+    bad = [v["name"] for v, got in labelled if bool(v["expected"]) != got]
+    extra = f"; {len(vecs) - len(labelled)} unlabelled (recorded only)" if len(labelled) < len(vecs) else ""
+    if bad:
+        print(f"FAIL: {len(bad)}/{len(labelled)} vectors disagree with 'expected' ({', '.join(bad[:5])}){extra}")
+        return 1
+    print(f"OK: {len(labelled)} vectors in {path} agree with 'expected'{extra}")
+    return 0
+
+
+def check() -> int:
+    seeds = [bytes([i]) * 32 for i in range(4)]
+    keys = keygen_batch(seeds)
+    for pk, sk in keys:
+        if len(pk) != PK_BYTES or len(sk) != SK_BYTES:
+            print(f"FAIL: sizes pk={len(pk)} sk={len(sk)}")
+            return 1
+    msgs = [b"mldsa65_ref check %d" % i for i in range(len(keys))]
+    sigs = sign_batch([sk for _pk, sk in keys], msgs)
+    if any(len(s) != SIG_BYTES for s in sigs):
+        print("FAIL: signature size")
+        return 1
+    oks, _ = verify_batch([pk for pk, _sk in keys], msgs, sigs)
+    if not all(oks):
+        print("FAIL: valid signatures rejected")
+        return 1
+
+    rng = np.random.default_rng(0)
+    for kind in MUTATIONS:
+        pk, msg, sig = mutate(kind, keys[0][0], msgs[0], sigs[0], rng)
+        if verify_batch([pk], [msg], [sig])[0][0]:
+            print(f"FAIL: mutation {kind} accepted")
+            return 1
+
+    # t1 packing must match the verifier's _decodeT1Packed (4 x 10 bits -> 5 bytes)
+    _rho, t1 = pk_decode(keys[0][0])
+    src = keys[0][0][32:]
+    b0, b1, b2, b3, b4 = src[:5]
+    legacy = [(b0 | ((b1 & 0x03) << 8)) & 0x3FF, ((b1 >> 2) | ((b2 & 0x0F) << 6)) & 0x3FF,
+              ((b2 >> 4) | ((b3 & 0x3F) << 4)) & 0x3FF, ((b3 >> 6) | (b4 << 2)) & 0x3FF]
+    if t1[0][:4].tolist() != legacy:
+        print("FAIL: t1 packing differs from _decodeT1Packed")
+        return 1
+
+    print(f"OK: keygen/sign/verify round-trip on {len(keys)} keys; {len(MUTATIONS)} mutation kinds rejected")
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="ML-DSA-65 (FIPS-204) batched reference + vector pack generator.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("check", help="self-check: round-trip, mutations, t1 packing")
+
+    g = sub.add_parser("gen-pack", help="generate valid + invalid (pk, msg, sig) triples")
+    g.add_argument("--count", type=int, default=1000, help="number of valid triples")
+    g.add_argument("--invalid", type=int, default=1, help="invalid triples per valid one (mutations cycle)")
+    g.add_argument("--seed", type=int, default=1)
+    g.add_argument("--intermediates", action="store_true", help="include mu, c_tilde, c, w_approx, w1")
+    g.add_argument("--pk-layout", choices=("fips", "contract"), default="fips")
+    g.add_argument("--jobs", type=int, default=1)
+    g.add_argument("--chunk", type=int, default=256, help="keys per batch / worker task")
+    g.add_argument("--out", required=True)
+
+    v = sub.add_parser("verify-pack", help="re-verify a pack against its 'expected' flags")
+    v.add_argument("pack")
+
+    args = ap.parse_args()
+
+    if args.cmd == "check":
+        return check()
+    if args.cmd == "verify-pack":
+        return verify_pack(Path(args.pack))
+
+    t0 = time.perf_counter()
+    pack = gen_pack(args.count, args.seed, args.invalid, args.intermediates, args.pk_layout,
+                    args.jobs, args.chunk)
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if out.suffix == ".vpak":
+        write_vpak(pack, out)
+    else:
+        out.write_text(json.dumps(pack, separators=(",", ":")) + "\n", encoding="utf-8")
+    dt = time.perf_counter() - t0
+    print(f"WROTE {len(pack['vectors'])} vectors ({args.count} valid) to {out} in {dt:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
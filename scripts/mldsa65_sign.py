@@ -2,19 +2,27 @@
 import json
 import hashlib
 
-# Placeholder signer for generating deterministic test vectors
+from mldsa65_ref import keygen_batch, sign_batch
 
-def fake_sign(msg: bytes):
+# Deterministic ML-DSA-65 signer for test vectors (FIPS-204 reference in mldsa65_ref.py).
+# For packs of many valid/invalid triples use: mldsa65_ref.py gen-pack
+
+KEYGEN_SEED = hashlib.sha256(b"mldsa65_sign keygen seed").digest()
+
+
+def sign(msg: bytes):
     h = hashlib.sha256(msg).digest()
+    (pk, sk), = keygen_batch([KEYGEN_SEED])
+    sig, = sign_batch([sk], [msg])
     return {
         "message": msg.hex(),
-        "signature": "00" * 3309,
-        "pubkey": "11" * 1952,
+        "signature": sig.hex(),
+        "pubkey": pk.hex(),
         "hash": h.hex(),
     }
 
 if __name__ == "__main__":
-    v = fake_sign(b"test-message")
+    v = sign(b"test-message")
     with open("test_vectors/vector_001.json", "w") as f:
         json.dump(v, f, indent=2)
     print("Generated test_vectors/vector_001.json")
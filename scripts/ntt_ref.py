@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vectorized ML-DSA NTT reference (q = 8380417, n = 256) on batches of polynomials.
+
+All functions act on the LAST axis and accept any leading shape, e.g. a single
+polynomial [256], a vector [l, 256], a matrix [k, l, 256] or a batch [batch, k, l, 256].
+Arithmetic is int64 (coefficients < 2^23, products < 2^46), Montgomery reduction is
+uint64 and bit-exact with contracts/field/MontgomeryMLDSA.sol.
+
+Zeta ordering matches contracts/ntt/NTT_MLDSA_Zetas.sol:
+  ZETAS[0] = 1, ZETAS[i] = 1753^bitrev8(i) mod q
+and the butterflies match NTT_MLDSA_Real (CT forward with k = 1..255, GS inverse with
+k = 255..1, then * 256^-1). `intt` is the true inverse (-zeta, as FIPS-204); `intt_sol`
+reproduces NTT_MLDSA_Real.intt bit for bit (+zeta) for KATs against the contract.
+
+Library use (from a sibling script):
+  from ntt_ref import ntt, intt, pointwise_mul, to_montgomery
+
+KAT generation (input, ntt = NTT_MLDSA_Real.ntt(input), intt = NTT_MLDSA_Real.intt(ntt)):
+  python3 scripts/ntt_ref.py kat --count 100000 --out .tmp/ntt_kat.npz
+  python3 scripts/ntt_ref.py kat --count 1000 --format jsonl --out .tmp/ntt_kat.jsonl
+  python3 scripts/ntt_ref.py check      # cross-check against the scalar reference
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+
+Q = 8380417
+N = 256
+OMEGA = 1753                # primitive 512-th root of unity mod q
+N_INV = pow(N, Q - 2, Q)    # 8347681, as NTT_MLDSA_Real.N_INV
+
+# Montgomery parameters, as MontgomeryMLDSA.sol (R = 2^32)
+Q_INV = 4236238847          # -q^-1 mod 2^32
+R2 = 2365951                # 2^64 mod q
+MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def bit_reverse(x: int, bits: int) -> int:
+    y = 0
+    for _ in range(bits):
+        y = (y << 1) | (x & 1)
+        x >>= 1
+    return y
+
+
+def generate_zetas() -> np.ndarray:
+    z = np.empty(N, dtype=np.int64)
+    z[0] = 1
+    for i in range(1, N):
+        z[i] = pow(OMEGA, bit_reverse(i, 8), Q)
+    return z
+
+
+ZETAS = generate_zetas()
+
+
+# Rows per block for the butterfly passes; keeps the working set in cache.
+_CHUNK = 256
+
+
+def _as_coeffs(a) -> np.ndarray:
+    arr = np.asarray(a, dtype=np.int64)
+    if arr.shape[-1] != N:
+        raise ValueError(f"last axis must be {N}, got shape {arr.shape}")
+    return arr
+
+
+def _reduce_once(x: np.ndarray) -> None:
+    """x in [0, 2q) -> [0, q), in place (branch-free via the int64 sign bit)."""
+    x -= Q
+    x += (x >> 63) & Q
+
+
+def _ntt_rows(x: np.ndarray) -> None:
+    rows = x.shape[0]
+    k = 1
+    length = N // 2
+    while length >= 1:
+        blocks = N // (2 * length)
+        v = x.reshape(rows, blocks, 2, length)
+        z = ZETAS[k:k + blocks].reshape(blocks, 1)
+        k += blocks
+        lo = v[:, :, 0, :]
+        hi = v[:, :, 1, :]
+        t = hi * z
+        t %= Q
+        np.subtract(lo, t, out=hi)
+        hi += (hi >> 63) & Q
+        lo += t
+        _reduce_once(lo)
+        length //= 2
+
+
+def _gs_rows(x: np.ndarray, sign: int) -> None:
+    rows = x.shape[0]
+    k = N - 1
+    length = 1
+    while length < N:
+        blocks = N // (2 * length)
+        v = x.reshape(rows, blocks, 2, length)
+        z = ZETAS[k - np.arange(blocks)].reshape(blocks, 1)
+        k -= blocks
+        lo = v[:, :, 0, :]
+        hi = v[:, :, 1, :]
+        d = hi - lo if sign < 0 else lo - hi
+        d += (d >> 63) & Q
+        lo += hi
+        _reduce_once(lo)
+        d *= z
+        d %= Q
+        hi[...] = d
+        length *= 2
+    x *= N_INV
+    x %= Q
+
+
+def _by_rows(a, fn, *extra) -> np.ndarray:
+    x = _as_coeffs(a) % Q
+    shape = x.shape
+    flat = np.ascontiguousarray(x.reshape(-1, N))
+    for i in range(0, flat.shape[0], _CHUNK):
+        fn(flat[i:i + _CHUNK], *extra)
+    return flat.reshape(shape)
+
+
+def ntt(a) -> np.ndarray:
+    """Forward NTT (Cooley–Tukey, decimation-in-time), standard domain in and out."""
+    return _by_rows(a, _ntt_rows)
+
+
+def intt(a) -> np.ndarray:
+    """Inverse NTT (Gentleman–Sande with -zeta, as FIPS-204 NTT^-1): intt(ntt(a)) == a."""
+    return _by_rows(a, _gs_rows, -1)
+
+
+def intt_sol(a) -> np.ndarray:
+    """
+    Bit-exact NTT_MLDSA_Real.intt: same butterflies but with +zeta, so it inverts ntt()
+    only up to a per-coefficient sign (hence the +-1 tolerance in its basis-vector test).
+    """
+    return _by_rows(a, _gs_rows, 1)
+
+
+def pointwise_mul(a, b) -> np.ndarray:
+    """Coefficient-wise product in the NTT domain (broadcasts over leading axes)."""
+    return (_as_coeffs(a) % Q) * (_as_coeffs(b) % Q) % Q
+
+
+def matvec_ntt(A, v) -> np.ndarray:
+    """A[..., k, l, 256] · v[..., l, 256] -> [..., k, 256], everything in the NTT domain."""
+    A = _as_coeffs(A) % Q
+    v = _as_coeffs(v) % Q
+    prod = (A * v[..., None, :, :]) % Q
+    # l <= 7 terms of < 2^23 each: the sum stays far below 2^63
+    return prod.sum(axis=-2) % Q
+
+
+def montgomery_reduce(x) -> np.ndarray:
+    """Bit-exact MontgomeryMLDSA.montgomeryReduce for 0 <= x < 2^64: x * 2^-32 mod q in [0, q)."""
+    x = np.asarray(x).astype(np.uint64)
+    a = ((x & MASK32) * np.uint64(Q_INV)) & MASK32
+    c = (x + a * np.uint64(Q)) >> np.uint64(32)    # uint64 wraparound == the Solidity & MASK64
+    c = np.where(c >= np.uint64(Q), c - np.uint64(Q), c)
+    return c.astype(np.int64)
+
+
+def montgomery_mul(a, b) -> np.ndarray:
+    return montgomery_reduce((np.asarray(a, dtype=np.int64) * np.asarray(b, dtype=np.int64)).astype(np.uint64))
+
+
+def to_montgomery(a) -> np.ndarray:
+    return montgomery_reduce((np.asarray(a, dtype=np.int64) * R2).astype(np.uint64))
+
+
+def from_montgomery(a) -> np.ndarray:
+    return montgomery_reduce(np.asarray(a, dtype=np.int64).astype(np.uint64))
+
+
+# -----------------------------
+# Scalar reference (NTT_MLDSA_Real line by line), used by `check`
+# -----------------------------
+
+def ntt_scalar(a: List[int]) -> List[int]:
+    a = list(a)
+    k = 1
+    length = 128
+    while length > 0:
+        for start in range(0, N, 2 * length):
+            z = int(ZETAS[k])
+            k += 1
+            for j in range(start, start + length):
+                t = (z * a[j + length]) % Q
+                a[j], a[j + length] = (a[j] + t) % Q, (a[j] - t) % Q
+        length >>= 1
+    return a
+
+
+def intt_sol_scalar(a: List[int]) -> List[int]:
+    a = list(a)
+    k = 255
+    length = 1
+    while length < N:
+        for start in range(0, N, 2 * length):
+            z = int(ZETAS[k])
+            k -= 1
+            for j in range(start, start + length):
+                u, v = a[j], a[j + length]
+                a[j], a[j + length] = (u + v) % Q, (z * (u - v)) % Q
+        length <<= 1
+    return [(x * N_INV) % Q for x in a]
+
+
+def montgomery_reduce_scalar(x: int) -> int:
+    x &= 0xFFFFFFFFFFFFFFFF
+    a = ((x & 0xFFFFFFFF) * Q_INV) & 0xFFFFFFFF
+    c = ((x + a * Q) & 0xFFFFFFFFFFFFFFFF) >> 32
+    return c - Q if c >= Q else c
+
+
+def check(samples: int, seed: int) -> int:
+    rng = np.random.default_rng(seed)
+    polys = rng.integers(0, Q, size=(samples, N), dtype=np.int64)
+    fwd = ntt(polys)
+    inv = intt(fwd)
+    if not np.array_equal(inv, polys):
+        print("FAIL: intt(ntt(a)) != a")
+        return 1
+    for i in range(samples):
+        if fwd[i].tolist() != ntt_scalar(polys[i].tolist()):
+            print(f"FAIL: ntt mismatch vs scalar reference at sample {i}")
+            return 1
+        if intt_sol(polys[i]).tolist() != intt_sol_scalar(polys[i].tolist()):
+            print(f"FAIL: intt_sol mismatch vs scalar reference at sample {i}")
+            return 1
+
+    xs = rng.integers(0, Q, size=(2, 4096), dtype=np.int64)
+    mm = montgomery_mul(xs[0], xs[1])
+    for a, b, got in zip(xs[0].tolist(), xs[1].tolist(), mm.tolist()):
+        if got != montgomery_reduce_scalar(a * b):
+            print("FAIL: montgomery_mul mismatch vs scalar reference")
+            return 1
+    if not np.array_equal(from_montgomery(to_montgomery(xs[0])), xs[0]):
+        print("FAIL: from_montgomery(to_montgomery(x)) != x")
+        return 1
+
+    # convolution theorem: intt(ntt(a) * ntt(b)) == a * b mod (X^256 + 1)
+    a, b = polys[0].tolist(), polys[1 % samples].tolist()
+    neg = [0] * N
+    for i in range(N):
+        for j in range(N):
+            if i + j < N:
+                neg[i + j] = (neg[i + j] + a[i] * b[j]) % Q
+            else:
+                neg[i + j - N] = (neg[i + j - N] - a[i] * b[j]) % Q
+    if intt(pointwise_mul(ntt(a), ntt(b))).tolist() != neg:
+        print("FAIL: pointwise_mul does not implement negacyclic convolution")
+        return 1
+
+    print(f"OK: ntt/intt_sol/montgomery match the scalar reference on {samples} random polynomials")
+    return 0
+
+
+def write_kats(out: Path, count: int, seed: int, fmt: str, chunk: int) -> None:
+    rng = np.random.default_rng(seed)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "npz":
+        inp = rng.integers(0, Q, size=(count, N), dtype=np.int64)
+        fwd = ntt(inp)
+        inv = intt_sol(fwd)
+        np.savez(out, input=inp.astype(np.uint32), ntt=fwd.astype(np.uint32),
+                 intt=inv.astype(np.uint32), zetas=ZETAS.astype(np.uint32),
+                 seed=np.array([seed], dtype=np.uint64))
+        return
+
+    with out.open("w", encoding="utf-8") as f:
+        done = 0
+        while done < count:
+            m = min(chunk, count - done)
+            inp = rng.integers(0, Q, size=(m, N), dtype=np.int64)
+            fwd = ntt(inp)
+            inv = intt_sol(fwd)
+            for i in range(m):
+                f.write(json.dumps({"id": done + i, "input": inp[i].tolist(),
+                                    "ntt": fwd[i].tolist(), "intt": inv[i].tolist()},
+                                   separators=(",", ":")))
+                f.write("\n")
+            done += m
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Vectorized ML-DSA NTT reference + KAT generator.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    k = sub.add_parser("kat", help="generate random NTT/INTT KATs")
+    k.add_argument("--count", type=int, default=100000)
+    k.add_argument("--seed", type=int, default=1)
+    k.add_argument("--format", choices=("npz", "jsonl"), default="npz")
+    k.add_argument("--chunk", type=int, default=8192, help="polynomials per batch for jsonl")
+    k.add_argument("--out", required=True)
+
+    c = sub.add_parser("check", help="cross-check vectorized ops against the scalar reference")
+    c.add_argument("--samples", type=int, default=32)
+    c.add_argument("--seed", type=int, default=1)
+
+    args = ap.parse_args()
+
+    if args.cmd == "check":
+        return check(args.samples, args.seed)
+
+    t0 = time.perf_counter()
+    write_kats(Path(args.out), args.count, args.seed, args.format, args.chunk)
+    dt = time.perf_counter() - t0
+    print(f"WROTE {args.count} KATs to {args.out} in {dt:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
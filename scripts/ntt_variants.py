@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+NTT kernel variant generator + autotuner (ML-DSA-65 forward NTT, q = 8380417).
+
+Every variant is the NTT_MLDSA_Real.ntt butterfly network with the layer loop fully
+specialized (constant len per pass) and zetas from NTT_MLDSA_ZetasPacked8 (scripts/gen_zetas.py),
+parameterized by:
+
+  asm      0 = Solidity a[j] (bounds-checked), 1 = inline-assembly inner loop on the memory pointer
+  merge    layers per pass: 1, or 2 (radix-4 style: 4 coefficients loaded once per two layers)
+  unroll   butterflies per inner-loop iteration (capped at the pass length)
+  reduce   reduce every r-th layer: in between, butterflies are lazy (x + t, x + q - t) and
+           coefficients grow by < q per layer; the last layer always reduces (canonical output)
+
+Variant id: a<asm>m<merge>u<unroll>r<reduce>, e.g. a1m2u4r8.
+
+  check   simulate each variant's exact operation order in Python against ntt_ref.ntt on the
+          KATs plus random inputs, and report the largest intermediate coefficient
+  bench   generate every variant + one test contract per variant (KAT asserts, gas log
+          "ntt_variant::<id> gas: <N>") + a size wrapper per variant into a throwaway copy of
+          the project (.tmp/ntt_variants), `forge build` it and drop every variant the compiler
+          rejects (e.g. stack too deep; reported as BUILD FAILED), run forge once on the rest,
+          read deployed sizes from out/, append one dataset row per variant that built and ran
+          and print the gas / bytecode Pareto front
+  emit    write one variant as a standalone library (e.g. to adopt it in contracts/ntt/; the
+          zetas library it imports is written by `scripts/gen_zetas.py gen`)
+
+Usage:
+  python3 scripts/ntt_variants.py check
+  python3 scripts/ntt_variants.py bench --asm 0,1 --merge 1,2 --unroll 1,4 --reduce 1,8
+  python3 scripts/ntt_variants.py bench --from-log /tmp/ntt_variants.out --dry-run
+  python3 scripts/ntt_variants.py emit a1m2u4r8 --out contracts/ntt/NTT_MLDSA_Tuned.sol
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+import gen_zetas
+from gen_zetas import zetas
+from ntt_ref import N, Q, ntt
+
+
+ROOT = Path(__file__).resolve().parents[1]
+WORK_DIR = ROOT / ".tmp" / "ntt_variants"
+TEST_FILE = "NTT_Variants_Gas.t.sol"
+ZETAS_LIB = "NTT_MLDSA_ZetasPacked8"
+MARKER = "ntt_variant"
+BASELINE = "real"
+
+GRID = {"asm": (0, 1), "merge": (1, 2), "unroll": (1, 2, 4), "reduce": (1, 2, 4, 8)}
+LAYERS = 8
+
+
+# ---- variant plan ----
+
+def variant_id(p: Dict[str, int]) -> str:
+    return f"a{p['asm']}m{p['merge']}u{p['unroll']}r{p['reduce']}"
+
+
+def parse_id(vid: str) -> Dict[str, int]:
+    m = re.fullmatch(r"a([01])m([12])u(\d+)r(\d+)", vid)
+    if not m:
+        raise SystemExit(f"bad variant id {vid!r} (expected a<0|1>m<1|2>u<N>r<N>)")
+    return {"asm": int(m.group(1)), "merge": int(m.group(2)), "unroll": int(m.group(3)), "reduce": int(m.group(4))}
+
+
+def eager(layer: int, reduce_every: int) -> bool:
+    return (layer + 1) % reduce_every == 0 or layer == LAYERS - 1
+
+
+def passes(p: Dict[str, int]) -> List[Dict[str, Any]]:
+    """[{layers: [l, ...], len: L, inner: loop count per block, unroll: U}] in execution order."""
+    out = []
+    for l0 in range(0, LAYERS, p["merge"]):
+        layers = list(range(l0, min(l0 + p["merge"], LAYERS)))
+        length = N >> (l0 + 1)
+        inner = length >> (len(layers) - 1)
+        out.append({"layers": layers, "len": length, "inner": inner, "unroll": min(p["unroll"], inner),
+                    "eager": [eager(l, p["reduce"]) for l in layers]})
+    return out
+
+
+# ---- Python model of the emitted code ----
+
+def _bfly(x: int, y: int, z: int, is_eager: bool) -> Tuple[int, int]:
+    t = (z * y) % Q
+    if is_eager:
+        return (x + t) % Q, (x + Q - t) % Q
+    return x + t, x + Q - t
+
+
+def simulate(p: Dict[str, int], a: List[int], zs: List[int]) -> Tuple[List[int], int]:
+    """Same operation order as the generated kernel; returns (output, max intermediate)."""
+    a = list(a)
+    peak = max(a) if a else 0
+    for ps in passes(p):
+        L, H = ps["len"], ps["len"] // 2
+        k = 1 << ps["layers"][0]
+        for start in range(0, N, 2 * L):
+            if len(ps["layers"]) == 1:
+                z = zs[k]
+                for j in range(start, start + L):
+                    a[j], a[j + L] = _bfly(a[j], a[j + L], z, ps["eager"][0])
+            else:
+                z1, z2, z3 = zs[k], zs[2 * k], zs[2 * k + 1]
+                e1, e2 = ps["eager"]
+                for j in range(start, start + H):
+                    y0, y2 = _bfly(a[j], a[j + L], z1, e1)
+                    y1, y3 = _bfly(a[j + H], a[j + L + H], z1, e1)
+                    a[j], a[j + H] = _bfly(y0, y1, z2, e2)
+                    a[j + L], a[j + L + H] = _bfly(y2, y3, z3, e2)
+            k += 1
+        peak = max(peak, max(a))
+    return a, peak
+
+
+def kats(count: int, seed: int) -> List[List[int]]:
+    rng = random.Random(seed)
+    out = [[0] * N, [Q - 1] * N]
+    out += [[rng.randrange(Q) for _ in range(N)] for _ in range(max(0, count - 2))]
+    return out[:max(count, 2)]
+
+
+def grid(sel: Dict[str, List[int]]) -> List[Dict[str, int]]:
+    keys = list(GRID)
+    return [dict(zip(keys, vals)) for vals in itertools.product(*(sel.get(k) or GRID[k] for k in keys))]
+
+
+def check(variants: List[Dict[str, int]], n_random: int, seed: int) -> int:
+    zs = zetas()
+    inputs = kats(4, seed) + kats(n_random + 2, seed + 1)[2:]
+    want = [list(map(int, ntt(np.array(x, dtype=np.int64)))) for x in inputs]
+    bad = 0
+    print("| variant | passes | inputs | max intermediate | ok |")
+    print("|---|---:|---:|---:|---|")
+    for p in variants:
+        peak = 0
+        ok = True
+        for x, w in zip(inputs, want):
+            got, pk = simulate(p, x, zs)
+            peak = max(peak, pk)
+            ok &= got == w
+        bad += not ok
+        print(f"| {variant_id(p)} | {len(passes(p))} | {len(inputs)} | {peak} ({peak / Q:.2f}q) | {'yes' if ok else 'NO'} |")
+    return 1 if bad else 0
+
+
+# ---- Solidity emitters ----
+
+def _sol_bfly(x: str, y: str, z: str, is_eager: bool, dst: Tuple[str, str], ind: str) -> List[str]:
+    t = f"mulmod({z}, {y}, Q)"
+    pre: List[str] = []
+    if x.startswith("a["):
+        pre, x = [f"{ind}uint256 x = {x};"], "x"
+    if is_eager:
+        return pre + [f"{ind}uint256 t = {t};",
+                      f"{ind}{dst[0]} = addmod({x}, t, Q);",
+                      f"{ind}{dst[1]} = addmod({x}, Q - t, Q);"]
+    return pre + [f"{ind}uint256 t = {t};",
+                  f"{ind}{dst[0]} = {x} + t;",
+                  f"{ind}{dst[1]} = {x} + Q - t;"]
+
+
+def _asm_bfly(x: str, y: str, z: str, is_eager: bool) -> Tuple[str, str, str]:
+    """(let t, first, second) as Yul expressions."""
+    t = f"mulmod({z}, {y}, {Q})"
+    if is_eager:
+        return t, f"addmod({x}, t, {Q})", f"addmod({x}, sub({Q}, t), {Q})"
+    return t, f"add({x}, t)", f"sub(add({x}, {Q}), t)"
+
+
+def emit_pass(ps: Dict[str, Any], asm: bool) -> List[str]:
+    L, H, U = ps["len"], ps["len"] // 2, ps["unroll"]
+    k0 = 1 << ps["layers"][0]
+    merged = len(ps["layers"]) == 2
+    ind = " " * 12
+    lines = [f"{ind}// layer{'s' if merged else ''} {', '.join(map(str, ps['layers']))}: len {L}"
+             f"{', merged' if merged else ''}; {'reduce' if ps['eager'][-1] else 'lazy'}",
+             f"{ind}k = {k0};",
+             f"{ind}for (uint256 start = 0; start < N; start += {2 * L}) {{"]
+    ind2 = ind + "    "
+    if merged:
+        lines += [f"{ind2}uint256 z1 = {ZETAS_LIB}.at(zt, k);",
+                  f"{ind2}uint256 z2 = {ZETAS_LIB}.at(zt, 2 * k);",
+                  f"{ind2}uint256 z3 = {ZETAS_LIB}.at(zt, 2 * k + 1);"]
+    else:
+        lines.append(f"{ind2}uint256 z = {ZETAS_LIB}.at(zt, k);")
+    inner = H if merged else L
+
+    if asm:
+        lines += [f"{ind2}assembly (\"memory-safe\") {{",
+                  f"{ind2}    let p := add(a, shl(5, start))",
+                  f"{ind2}    for {{ let e := add(p, {32 * inner}) }} lt(p, e) {{ p := add(p, {32 * U}) }} {{"]
+        ind3 = ind2 + "        "
+        for u in range(U):
+            base = f"add(p, {32 * u})" if u else "p"
+            at = lambda off: base if off == 0 else f"add(p, {32 * u + 32 * off})"
+            lines.append(f"{ind3}{{")
+            if merged:
+                e1, e2 = ps["eager"]
+                lines += [f"{ind3}    let x0 := mload({at(0)})", f"{ind3}    let x1 := mload({at(H)})",
+                          f"{ind3}    let x2 := mload({at(L)})", f"{ind3}    let x3 := mload({at(L + H)})"]
+                for (xa, xb, z, da, db) in (("x0", "x2", "z1", "y0", "y2"), ("x1", "x3", "z1", "y1", "y3")):
+                    t, f1, f2 = _asm_bfly(xa, xb, z, e1)
+                    lines += [f"{ind3}    let t := {t}" if da == "y0" else f"{ind3}    t := {t}",
+                              f"{ind3}    let {da} := {f1}", f"{ind3}    let {db} := {f2}"]
+                for (xa, xb, z, oa, ob) in (("y0", "y1", "z2", 0, H), ("y2", "y3", "z3", L, L + H)):
+                    t, f1, f2 = _asm_bfly(xa, xb, z, e2)
+                    lines += [f"{ind3}    t := {t}", f"{ind3}    mstore({at(oa)}, {f1})", f"{ind3}    mstore({at(ob)}, {f2})"]
+            else:
+                t, f1, f2 = _asm_bfly("x", f"mload({at(L)})", "z", ps["eager"][0])
+                lines += [f"{ind3}    let x := mload({at(0)})", f"{ind3}    let t := {t}",
+                          f"{ind3}    mstore({at(0)}, {f1})", f"{ind3}    mstore({at(L)}, {f2})"]
+            lines.append(f"{ind3}}}")
+        lines += [f"{ind2}    }}", f"{ind2}}}"]
+    else:
+        lines.append(f"{ind2}for (uint256 j = start; j < start + {inner}; j += {U}) {{")
+        ind3 = ind2 + "    "
+        for u in range(U):
+            j = f"j + {u}" if u else "j"
+            jx = lambda off: j if off == 0 else (f"j + {u + off}" if u else f"j + {off}")
+            lines.append(f"{ind3}{{")
+            if merged:
+                e1, e2 = ps["eager"]
+                lines += [f"{ind3}    uint256 y0;", f"{ind3}    uint256 y1;", f"{ind3}    uint256 y2;", f"{ind3}    uint256 y3;"]
+                lines += [f"{ind3}    {{"] + _sol_bfly(f"a[{jx(0)}]", f"a[{jx(L)}]", "z1", e1, ("y0", "y2"), ind3 + "        ") + [f"{ind3}    }}"]
+                lines += [f"{ind3}    {{"] + _sol_bfly(f"a[{jx(H)}]", f"a[{jx(L + H)}]", "z1", e1, ("y1", "y3"), ind3 + "        ") + [f"{ind3}    }}"]
+                lines += [f"{ind3}    {{"] + _sol_bfly("y0", "y1", "z2", e2, (f"a[{jx(0)}]", f"a[{jx(H)}]"), ind3 + "        ") + [f"{ind3}    }}"]
+                lines += [f"{ind3}    {{"] + _sol_bfly("y2", "y3", "z3", e2, (f"a[{jx(L)}]", f"a[{jx(L + H)}]"), ind3 + "        ") + [f"{ind3}    }}"]
+            else:
+                lines += _sol_bfly(f"a[{jx(0)}]", f"a[{jx(L)}]", "z", ps["eager"][0], (f"a[{jx(0)}]", f"a[{jx(L)}]"), ind3 + "    ")
+            lines.append(f"{ind3}}}")
+        lines.append(f"{ind2}}}")
+    lines += [f"{ind2}k++;", f"{ind}}}"]
+    return lines
+
+
+def library_name(vid: str) -> str:
+    return f"NTT_MLDSA_V_{vid}"
+
+
+def emit_library(p: Dict[str, int], zetas_import: str) -> str:
+    vid = variant_id(p)
+    body: List[str] = []
+    for ps in passes(p):
+        body += emit_pass(ps, bool(p["asm"]))
+        body.append("")
+    return f"""// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import {{{ZETAS_LIB}}} from "{zetas_import}";
+
+/// @title {library_name(vid)}
+/// @notice ML-DSA-65 forward NTT variant {vid}: asm={p['asm']} merge={p['merge']} unroll={p['unroll']} reduce={p['reduce']}
+/// @dev DO NOT EDIT BY HAND. Generated by scripts/ntt_variants.py; output equals NTT_MLDSA_Real.ntt.
+library {library_name(vid)} {{
+    uint256 internal constant Q = {Q};
+    uint256 internal constant N = {N};
+
+    function ntt(uint256[256] memory a) internal pure returns (uint256[256] memory) {{
+        unchecked {{
+            uint256[32] memory zt = {ZETAS_LIB}.table();
+            uint256 k;
+
+{chr(10).join(body).rstrip()}
+            return a;
+        }}
+    }}
+}}
+"""
+
+
+def _pack(vals: List[int]) -> List[int]:
+    return [sum(v << (32 * i) for i, v in enumerate(vals[w:w + 8])) for w in range(0, len(vals), 8)]
+
+
+def emit_test(variants: List[Dict[str, int]], kat_in: List[List[int]], kat_out: List[List[int]]) -> str:
+    vids = [variant_id(p) for p in variants]
+    imports = ['import "forge-std/Test.sol";',
+               'import {NTT_MLDSA_Real} from "../contracts/ntt/NTT_MLDSA_Real.sol";']
+    imports += [f'import {{{library_name(v)}}} from "../contracts/ntt/variants/{library_name(v)}.sol";' for v in vids]
+
+    kat_fns = []
+    for i, (x, y) in enumerate(zip(kat_in, kat_out)):
+        for tag, vals in (("in", x), ("out", y)):
+            stores = "\n".join(f"            mstore({'w' if j == 0 else f'add(w, {hex(32 * j)})'}, {hex(v)})"
+                               for j, v in enumerate(_pack(vals)))
+            kat_fns.append(f"""    function _kat_{tag}_{i}() internal pure returns (uint256[256] memory) {{
+        uint256[32] memory w;
+        assembly ("memory-safe") {{
+{stores}
+        }}
+        return _unpack(w);
+    }}
+""")
+    dispatch_in = "\n".join(f"        if (i == {i}) return _kat_in_{i}();" for i in range(len(kat_in)))
+    dispatch_out = "\n".join(f"        if (i == {i}) return _kat_out_{i}();" for i in range(len(kat_in)))
+
+    contracts = []
+    for vid, call in [(BASELINE, "NTT_MLDSA_Real.ntt")] + [(v, f"{library_name(v)}.ntt") for v in vids]:
+        contracts.append(f"""
+contract NTTV_{vid}_Test is NTTVariantKATs {{
+    function test_ntt_variant() public {{
+        for (uint256 i = 0; i < KATS; i++) {{
+            uint256[256] memory want = _katOut(i);
+            uint256[256] memory a = _katIn(i);
+            uint256 g0 = gasleft();
+            a = {call}(a);
+            uint256 used = g0 - gasleft();
+            for (uint256 j = 0; j < 256; j++) {{
+                assertEq(a[j], want[j], "{vid}: KAT mismatch");
+            }}
+            if (i == KATS - 1) {{
+                emit log_named_uint("{MARKER}::{vid} gas", used);
+            }}
+        }}
+    }}
+}}
+
+contract NTTV_{vid}_Size {{
+    function ntt(uint256[256] memory a) external pure returns (uint256[256] memory) {{
+        return {call}(a);
+    }}
+}}
+""")
+
+    return f"""// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+{chr(10).join(imports)}
+
+/// @notice NTT variant KATs + gas (auto-generated by scripts/ntt_variants.py; throwaway workdir only).
+/// @dev KATs are ntt_ref.ntt outputs (= NTT_MLDSA_Real.ntt). Gas is logged for the last KAT as
+///      "{MARKER}::<variant> gas: <N>"; NTTV_<variant>_Size wraps the kernel for deployed-size readout.
+abstract contract NTTVariantKATs is Test {{
+    uint256 constant KATS = {len(kat_in)};
+
+    function _unpack(uint256[32] memory w) internal pure returns (uint256[256] memory a) {{
+        for (uint256 i = 0; i < 256; i++) {{
+            a[i] = (w[i >> 3] >> ((i & 7) * 32)) & 0xffffffff;
+        }}
+    }}
+
+{chr(10).join(kat_fns)}
+    function _katIn(uint256 i) internal pure returns (uint256[256] memory) {{
+{dispatch_in}
+        revert("kat");
+    }}
+
+    function _katOut(uint256 i) internal pure returns (uint256[256] memory) {{
+{dispatch_out}
+        revert("kat");
+    }}
+}}
+{"".join(contracts)}"""
+
+
+# ---- workdir / forge ----
+
+def build_workdir(work: Path, variants: List[Dict[str, int]], n_kats: int, seed: int) -> None:
+    # the zetas library is generated here too, so the workdir does not depend on a gen_zetas.py gen
+    files = {gen_zetas.OUT_DIR / f"{ZETAS_LIB}.sol": gen_zetas.emit_library("packed8", gen_zetas.layouts()["packed8"])}
+    vdir = ROOT / "contracts" / "ntt" / "variants"
+    for p in variants:
+        files[vdir / f"{library_name(variant_id(p))}.sol"] = emit_library(p, f"../zetas/{ZETAS_LIB}.sol")
+
+    ins = kats(n_kats, seed)
+    outs = [list(map(int, ntt(np.array(x, dtype=np.int64)))) for x in ins]
+    files[ROOT / "test" / TEST_FILE] = emit_test(variants, ins, outs)
+    gen_zetas.build_workdir(work, files)
+
+
+def compile_errors(text: str) -> List[Tuple[str, int]]:
+    """(file, line) of every compiler error in forge build output; warnings are skipped."""
+    out: List[Tuple[str, int]] = []
+    kind = ""
+    for line in text.splitlines():
+        s = line.strip()
+        if re.match(r"(Warning|Note|Info)\b", s):
+            kind = "warning"
+        elif re.match(r"\w*Error\b", s):
+            kind = "error"
+        m = re.match(r"-->\s*(\S+?\.sol):(\d+)", s)
+        if m and kind == "error":
+            out.append((m.group(1), int(m.group(2))))
+    return out
+
+
+def failing_variants(test_src: str, errors: List[Tuple[str, int]]) -> Optional[Set[str]]:
+    """Variant ids the errors point at (library or own test contract); None if one points elsewhere."""
+    owners: List[Tuple[int, str]] = []
+    for i, line in enumerate(test_src.splitlines(), 1):
+        m = re.match(r"contract NTTV_(\w+?)_(?:Test|Size)\b", line)
+        if m:
+            owners.append((i, m.group(1)))
+    bad: Set[str] = set()
+    for path, line in errors:
+        name = Path(path).name
+        if name.startswith(library_name("")):
+            bad.add(name[len(library_name("")):-len(".sol")])
+            continue
+        owner = [vid for start, vid in owners if start <= line] if name == TEST_FILE else []
+        if not owner or owner[-1] == BASELINE:
+            return None
+        bad.add(owner[-1])
+    return bad or None
+
+
+def buildable(work: Path, variants: List[Dict[str, int]], n_kats: int, seed: int) -> List[Dict[str, int]]:
+    """`variants` minus those that fail `forge build`; leaves `work` holding the rest, built."""
+    keep = list(variants)
+    while True:
+        build_workdir(work, keep, n_kats, seed)
+        rc, text = gen_zetas.forge(work, "build", check=False)
+        if rc == 0:
+            return keep
+        bad = failing_variants((work / "test" / TEST_FILE).read_text(encoding="utf-8"), compile_errors(text))
+        if bad is None and keep:
+            # an error no variant owns (or no location at all): build each variant on its own
+            bad = set()
+            for p in keep:
+                build_workdir(work, [p], n_kats, seed)
+                if gen_zetas.forge(work, "build", check=False)[0] != 0:
+                    bad.add(variant_id(p))
+        if not bad:
+            tail = "\n".join(text.splitlines()[-80:])
+            raise SystemExit(f"forge build failed outside the variants\n---- forge output tail ----\n{tail}")
+        for vid in sorted(bad):
+            print(f"BUILD FAILED {vid} (dropped)", file=sys.stderr)
+        keep = [p for p in keep if variant_id(p) not in bad]
+
+
+def run_forge(work: Path) -> str:
+    return gen_zetas.forge(work, "test", "--match-path", f"test/{TEST_FILE}", "-vv")[1]
+
+
+def parse_log(text: str) -> Dict[str, int]:
+    rx = re.compile(re.escape(MARKER) + r"::(\w+)\s+gas\s*[:=]\s*([0-9]+)")
+    out: Dict[str, int] = {}
+    for m in rx.finditer(text):
+        out.setdefault(m.group(1), int(m.group(2)))
+    return out
+
+
+def deployed_sizes(work: Path) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    art_dir = work / "out" / TEST_FILE
+    if not art_dir.exists():
+        return out
+    for f in art_dir.glob("NTTV_*_Size.json"):
+        try:
+            obj = json.loads(f.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        code = ((obj.get("deployedBytecode") or {}).get("object") or "").removeprefix("0x")
+        out[f.stem[len("NTTV_"):-len("_Size")]] = len(code) // 2
+    return out
+
+
+def pareto(points: Dict[str, Tuple[int, Optional[int]]]) -> List[str]:
+    """Variants not dominated in (gas, size); size-less points compete on gas only."""
+    front = []
+    for v, (g, s) in points.items():
+        dominated = False
+        for w, (g2, s2) in points.items():
+            if w == v:
+                continue
+            if s is None or s2 is None:
+                if g2 < g:
+                    dominated = True
+            elif g2 <= g and s2 <= s and (g2 < g or s2 < s):
+                dominated = True
+            if dominated:
+                break
+        if not dominated:
+            front.append(v)
+    return sorted(front, key=lambda v: points[v][0])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="ML-DSA NTT kernel variants: generate, check, benchmark, pick the Pareto front.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def grid_args(p: argparse.ArgumentParser) -> None:
+        for k in GRID:
+            p.add_argument(f"--{k}", default="", help=f"comma list (default: {','.join(map(str, GRID[k]))})")
+
+    c = sub.add_parser("check", help="simulate every variant against ntt_ref.ntt")
+    grid_args(c)
+    c.add_argument("--random", type=int, default=16, help="random inputs on top of the KATs")
+    c.add_argument("--seed", type=int, default=1)
+
+    b = sub.add_parser("bench", help="generate, run forge once, append rows, print the Pareto front")
+    grid_args(b)
+    b.add_argument("--kats", type=int, default=4)
+    b.add_argument("--seed", type=int, default=1)
+    b.add_argument("--from-log", default="", help="parse this forge output instead of running forge")
+    b.add_argument("--build-only", action="store_true", help="write the workdir and stop (no forge)")
+    b.add_argument("--denom", default="security_equiv_bits")
+    b.add_argument("--bits", type=float, default=192.0)
+    b.add_argument("--dry-run", action="store_true", help="print the rows; do not append")
+
+    e = sub.add_parser("emit", help="write one variant library")
+    e.add_argument("variant")
+    e.add_argument("--out", required=True)
+    e.add_argument("--zetas-import", default="./zetas/NTT_MLDSA_ZetasPacked8.sol")
+    args = ap.parse_args()
+
+    if args.cmd == "emit":
+        p = parse_id(args.variant)
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(emit_library(p, args.zetas_import), encoding="utf-8")
+        print(f"WROTE {out}")
+        return 0
+
+    sel = {k: [int(x) for x in str(getattr(args, k)).split(",") if x.strip()] for k in GRID}
+    for v in sel["merge"]:
+        if v not in (1, 2):
+            raise SystemExit("--merge supports 1 and 2")
+    variants = grid(sel)
+
+    if args.cmd == "check":
+        return check(variants, args.random, args.seed)
+
+    if args.from_log:
+        text = Path(args.from_log).read_text(encoding="utf-8", errors="replace")
+    elif args.build_only:
+        build_workdir(WORK_DIR, variants, args.kats, args.seed)
+        print(f"GENERATED {len(variants)} variants under {WORK_DIR}", file=sys.stderr)
+        return 0
+    else:
+        built = buildable(WORK_DIR, variants, args.kats, args.seed)
+        print(f"BUILT {len(built)}/{len(variants)} variants under {WORK_DIR}", file=sys.stderr)
+        text = run_forge(WORK_DIR)
+
+    gas = parse_log(text)
+    if not gas:
+        raise SystemExit(f"no '{MARKER}::<variant> gas: N' lines found")
+    sizes = deployed_sizes(WORK_DIR)
+    points = {v: (g, sizes.get(v)) for v, g in gas.items()}
+    front = set(pareto(points))
+
+    base = gas.get(BASELINE)
+    print("| variant | gas | vs real | bytecode | pareto |")
+    print("|---|---:|---:|---:|---|")
+    for v in sorted(points, key=lambda v: points[v][0]):
+        g, s = points[v]
+        rel = f"{(g - base) / base * 100:+.1f}%" if base else ""
+        print(f"| {v} | {g} | {rel} | {s if s is not None else ''} | {'*' if v in front else ''} |")
+
+    rows = []
+    for v, (g, s) in sorted(points.items()):
+        params: Dict[str, Any] = {} if v == BASELINE else dict(parse_id(v))
+        if s is not None:
+            params["bytecode_size"] = s
+        rows.append({
+            "scheme": "mldsa65",
+            "bench_name": f"ntt_variant_{v}",
+            "chain_profile": "EVM/L1",
+            "gas": g,
+            "denominator": args.denom,
+            "denom_bits": args.bits,
+            "variant": f"ntt/{v}",
+            "variant_params": params,
+            "notes": ("NTT_MLDSA_Real.ntt baseline" if v == BASELINE else f"generated forward NTT variant {v}")
+                     + ("; pareto(gas, bytecode)" if v in front else ""),
+        })
+    payload = json.dumps(rows, ensure_ascii=False)
+    if args.dry_run:
+        print(payload)
+        return 0
+    return subprocess.call([sys.executable, str(ROOT / "scripts" / "parse_bench.py"), payload])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
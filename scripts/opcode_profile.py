@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opcode-level gas profile from a local anvil/geth-style debug trace (structLogs).
+
+Aggregates gas
+  - per opcode        (MULMOD vs MUL+MOD, SLOAD of zetas, MLOAD/MSTORE, ...)
+  - per source line   (pc -> instruction -> solc source map -> file:line)
+  - per call stack    (internal jumps tagged i/o in the source map + external call depth)
+and writes folded-stack flamegraph inputs plus a summary linked to a dataset row.
+
+Getting a trace (anvil running locally; the verifier deployed there):
+  cast rpc debug_traceTransaction <txhash> '{"enableMemory":false}' > trace.json
+  python3 scripts/opcode_profile.py --parent mldsa65::verify_poc_foundry --trace trace.json \\
+      --artifact out/MLDSA65_Verifier_v2.sol/MLDSA65_Verifier_v2.json
+
+  # or let the script fetch it
+  python3 scripts/opcode_profile.py --parent mldsa65::verify_poc_foundry --rpc http://127.0.0.1:8545 \\
+      --tx 0x... --artifact out/MLDSA65_Verifier_v2.sol/MLDSA65_Verifier_v2.json
+
+Gas per step is the gas delta to the next step in the same frame, so memory expansion
+is charged to the opcode that caused it. Calls are charged their own overhead only
+(the callee's steps are attributed inside the callee). Source mapping applies to the
+frame depth given by --depth (default 1: the contract the trace entered first).
+
+Outputs (under data/opcode_profile/<scheme>__<bench_name>/):
+  stacks.folded   "frame;frame;...;OPCODE gas"  (flamegraph.pl / speedscope / inferno)
+  lines.folded    "file:line;OPCODE gas"
+  summary.md      top opcodes / lines / files
+and child records in data/opcode_profile.jsonl (kind=opcode|line|file, replace on parent_rid+commit).
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import re
+import urllib.request
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from gas_report_ingest import git_head, known_rids, utc_ts, write_children
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+PROFILE_JSONL = ROOT / "data" / "opcode_profile.jsonl"
+PROFILE_DIR = ROOT / "data" / "opcode_profile"
+
+SOURCE = "debug_trace"
+TOP_N = 25
+
+# -----------------------------
+# Trace loading
+# -----------------------------
+
+def load_struct_logs(obj: Any) -> List[Dict[str, Any]]:
+    """Accept raw structLogs, {structLogs}, or a JSON-RPC envelope {result:{structLogs}}."""
+    if isinstance(obj, dict) and "result" in obj:
+        obj = obj["result"]
+    if isinstance(obj, dict):
+        obj = obj.get("structLogs", obj.get("struct_logs"))
+    if not isinstance(obj, list):
+        raise SystemExit("trace: expected structLogs (debug_traceTransaction / debug_traceCall output)")
+    return obj
+
+
+def fetch_trace(rpc: str, tx: str) -> Any:
+    body = json.dumps({
+        "jsonrpc": "2.0", "id": 1, "method": "debug_traceTransaction",
+        "params": [tx, {"enableMemory": False, "disableStorage": True, "disableStack": True}],
+    }).encode("utf-8")
+    req = urllib.request.Request(rpc, data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=300) as resp:
+        out = json.loads(resp.read().decode("utf-8"))
+    if out.get("error"):
+        raise SystemExit(f"rpc error: {out['error']}")
+    return out
+
+
+def step_costs(logs: List[Dict[str, Any]]) -> List[int]:
+    """
+    Self gas of each step. Same-frame steps: gas[i] - gas[i+1] (includes memory expansion).
+    Call steps: (gas before - gas after return) minus everything charged inside the callee.
+    """
+    n = len(logs)
+    cost = [0] * n
+    open_calls: List[Tuple[int, int]] = []   # (step index, depth)
+    child_sum: List[int] = []
+
+    for i, s in enumerate(logs):
+        depth = int(s.get("depth", 1))
+        gas = int(s.get("gas", 0))
+
+        while open_calls and depth <= open_calls[-1][1]:
+            ci, _cd = open_calls.pop()
+            inner = child_sum.pop()
+            cost[ci] = max(0, int(logs[ci]["gas"]) - gas - inner)
+            if child_sum:
+                child_sum[-1] += cost[ci] + inner
+
+        nxt = logs[i + 1] if i + 1 < n else None
+        ndepth = int(nxt.get("depth", 1)) if nxt else 0
+        if nxt is not None and ndepth == depth:
+            cost[i] = gas - int(nxt.get("gas", 0))
+        elif nxt is not None and ndepth > depth:
+            open_calls.append((i, depth))
+            child_sum.append(0)
+            continue
+        else:
+            cost[i] = int(s.get("gasCost", 0))
+
+        if child_sum:
+            child_sum[-1] += cost[i]
+
+    # calls that never returned (trace truncated): fall back to the reported cost
+    for ci, _cd in open_calls:
+        cost[ci] = int(logs[ci].get("gasCost", 0))
+    return cost
+
+
+# -----------------------------
+# Source maps
+# -----------------------------
+
+@dataclass
+class SrcEntry:
+    start: int
+    length: int
+    file_id: int
+    jump: str
+
+
+def decode_source_map(sm: str) -> List[SrcEntry]:
+    """solc compressed source map: 's:l:f:j:m;...' with empty fields inherited from the previous entry."""
+    out: List[SrcEntry] = []
+    s, l, f, j = 0, 0, -1, "-"
+    for item in sm.split(";"):
+        parts = item.split(":")
+        if len(parts) > 0 and parts[0] != "":
+            s = int(parts[0])
+        if len(parts) > 1 and parts[1] != "":
+            l = int(parts[1])
+        if len(parts) > 2 and parts[2] != "":
+            f = int(parts[2])
+        if len(parts) > 3 and parts[3] != "":
+            j = parts[3]
+        out.append(SrcEntry(s, l, f, j))
+    return out
+
+
+def pc_to_instr(code_hex: str) -> Dict[int, int]:
+    code = bytes.fromhex(code_hex[2:] if code_hex.startswith("0x") else code_hex)
+    out: Dict[int, int] = {}
+    pc = 0
+    idx = 0
+    while pc < len(code):
+        out[pc] = idx
+        op = code[pc]
+        pc += 1 + (op - 0x5F if 0x60 <= op <= 0x7F else 0)
+        idx += 1
+    return out
+
+
+def _walk(node: Any, fn) -> None:
+    if isinstance(node, dict):
+        fn(node)
+        for v in node.values():
+            _walk(v, fn)
+    elif isinstance(node, list):
+        for v in node:
+            _walk(v, fn)
+
+
+@dataclass
+class SourceIndex:
+    paths: Dict[int, str]
+    line_starts: Dict[int, List[int]]
+    functions: Dict[int, List[Tuple[int, int, str]]]   # file_id -> [(start, end, "Contract.fn")]
+
+    def line_of(self, file_id: int, offset: int) -> Optional[int]:
+        starts = self.line_starts.get(file_id)
+        if starts is None:
+            return None
+        return bisect.bisect_right(starts, offset) + 1
+
+    def function_at(self, file_id: int, offset: int) -> Optional[str]:
+        best: Optional[Tuple[int, str]] = None
+        for start, end, name in self.functions.get(file_id, ()):
+            if start <= offset < end and (best is None or end - start < best[0]):
+                best = (end - start, name)
+        return best[1] if best else None
+
+
+def build_source_index(out_dir: Path) -> SourceIndex:
+    """Source ids, line tables and function ranges from forge artifacts (ast + id)."""
+    paths: Dict[int, str] = {}
+    functions: Dict[int, List[Tuple[int, int, str]]] = defaultdict(list)
+    seen_asts = set()
+
+    for art in sorted(out_dir.rglob("*.json")):
+        if "build-info" in art.parts:
+            continue
+        try:
+            obj = json.loads(art.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        ast = obj.get("ast") if isinstance(obj, dict) else None
+        if not isinstance(ast, dict) or obj.get("id") is None:
+            continue
+        fid = int(obj["id"])
+        paths[fid] = str(ast.get("absolutePath") or "")
+        if fid in seen_asts:
+            continue
+        seen_asts.add(fid)
+
+        for unit in ast.get("nodes") or []:
+            if not isinstance(unit, dict) or unit.get("nodeType") != "ContractDefinition":
+                continue
+            cname = unit.get("name") or "?"
+
+            def visit(n: Dict[str, Any], cname: str = cname) -> None:
+                if n.get("nodeType") in ("FunctionDefinition", "ModifierDefinition") and n.get("src"):
+                    s, l, _f = (int(x) for x in str(n["src"]).split(":")[:3])
+                    name = n.get("name") or n.get("kind") or "fallback"
+                    functions[fid].append((s, s + l, f"{cname}.{name}"))
+
+            _walk(unit, visit)
+
+    line_starts: Dict[int, List[int]] = {}
+    for fid, rel in paths.items():
+        p = ROOT / rel
+        if not p.exists():
+            continue
+        data = p.read_bytes()
+        line_starts[fid] = [i + 1 for i, b in enumerate(data) if b == 0x0A]
+    return SourceIndex(paths, line_starts, dict(functions))
+
+
+# -----------------------------
+# Profile
+# -----------------------------
+
+@dataclass
+class Profile:
+    by_op: Dict[str, List[int]]          # op -> [gas, count]
+    by_line: Dict[str, List[int]]        # "file:line" -> [gas, count]
+    by_file: Dict[str, int]
+    stacks: Dict[str, int]
+    lines_folded: Dict[str, int]
+    total: int
+    steps: int
+    mem_expansion: Optional[int]
+
+
+def _mem_cost(size_bytes: int) -> int:
+    w = (size_bytes + 31) // 32
+    return 3 * w + (w * w) // 512
+
+
+def profile(logs: List[Dict[str, Any]], costs: List[int], root_label: str,
+            depth0: int, smap: Optional[List[SrcEntry]], instr: Optional[Dict[int, int]],
+            idx: Optional[SourceIndex]) -> Profile:
+    by_op: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    by_line: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    by_file: Dict[str, int] = defaultdict(int)
+    stacks: Dict[str, int] = defaultdict(int)
+    lines_folded: Dict[str, int] = defaultdict(int)
+
+    fn_stack: List[str] = []
+    pending_push = False
+    have_mem = any("memSize" in s for s in logs[:16])
+    mem_exp = 0 if have_mem else None
+
+    for i, s in enumerate(logs):
+        op = str(s.get("op", "?"))
+        g = costs[i]
+        depth = int(s.get("depth", 1))
+        by_op[op][0] += g
+        by_op[op][1] += 1
+
+        if mem_exp is not None and i + 1 < len(logs) and int(logs[i + 1].get("depth", 1)) == depth:
+            before = int(s.get("memSize", 0))
+            after = int(logs[i + 1].get("memSize", before))
+            if after > before:
+                mem_exp += _mem_cost(after) - _mem_cost(before)
+
+        frames: List[str] = [root_label] + [f"call@{d}" for d in range(depth0 + 1, depth + 1)]
+        loc = None
+        if depth == depth0 and smap is not None and instr is not None and idx is not None:
+            ii = instr.get(int(s.get("pc", -1)))
+            if ii is not None and ii < len(smap):
+                e = smap[ii]
+                if e.file_id >= 0 and e.file_id in idx.paths:
+                    line = idx.line_of(e.file_id, e.start)
+                    path = idx.paths[e.file_id]
+                    loc = f"{path}:{line}"
+                    by_file[path] += g
+                    fname = idx.function_at(e.file_id, e.start)
+                    if fname:
+                        if pending_push or not fn_stack:
+                            fn_stack.append(fname)
+                        else:
+                            fn_stack[-1] = fname
+                pending_push = e.jump == "i"
+                if e.jump == "o" and len(fn_stack) > 1:
+                    fn_stack.pop()
+            frames[1:1] = fn_stack
+        elif depth < depth0:
+            frames = ["<caller>"]
+
+        if loc is not None:
+            by_line[loc][0] += g
+            by_line[loc][1] += 1
+            lines_folded[f"{loc};{op}"] += g
+        stacks[";".join(frames + [op])] += g
+
+    return Profile(dict(by_op), dict(by_line), dict(by_file), dict(stacks), dict(lines_folded),
+                   sum(costs), len(logs), mem_exp)
+
+
+def write_folded(path: Path, folded: Dict[str, int]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f"{k} {v}" for k, v in sorted(folded.items()) if v > 0]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _pct(x: int, total: int) -> str:
+    return f"{100.0 * x / total:.1f}%" if total else "-"
+
+
+def render_summary(parent_rid: str, commit: str, prof: Profile) -> str:
+    out: List[str] = []
+    out.append(f"# Opcode profile: `{parent_rid}`")
+    out.append("")
+    out.append(f"- commit: `{commit}`")
+    out.append(f"- steps: {prof.steps}")
+    out.append(f"- total gas (execution, excl. intrinsic): {prof.total}")
+    if prof.mem_expansion is not None:
+        out.append(f"- memory expansion gas: {prof.mem_expansion} ({_pct(prof.mem_expansion, prof.total)})")
+    mul = prof.by_op.get("MUL", [0, 0])[1]
+    mod = prof.by_op.get("MOD", [0, 0])[1] + prof.by_op.get("SMOD", [0, 0])[1]
+    mulmod = prof.by_op.get("MULMOD", [0, 0])[1]
+    out.append(f"- MULMOD: {mulmod} | MUL: {mul} | MOD+SMOD: {mod} | SLOAD: {prof.by_op.get('SLOAD', [0, 0])[1]}")
+    out.append("")
+
+    out.append("## Gas by opcode")
+    out.append("")
+    out.append("| opcode | gas | share | count |")
+    out.append("|---|---:|---:|---:|")
+    for op, (g, c) in sorted(prof.by_op.items(), key=lambda kv: -kv[1][0])[:TOP_N]:
+        out.append(f"| {op} | {g} | {_pct(g, prof.total)} | {c} |")
+    out.append("")
+
+    if prof.by_file:
+        out.append("## Gas by source file")
+        out.append("")
+        out.append("| file | gas | share |")
+        out.append("|---|---:|---:|")
+        for f, g in sorted(prof.by_file.items(), key=lambda kv: -kv[1]):
+            out.append(f"| `{f}` | {g} | {_pct(g, prof.total)} |")
+        out.append("")
+
+    if prof.by_line:
+        out.append("## Hottest source lines")
+        out.append("")
+        out.append("| line | gas | share | steps |")
+        out.append("|---|---:|---:|---:|")
+        for loc, (g, c) in sorted(prof.by_line.items(), key=lambda kv: -kv[1][0])[:TOP_N]:
+            out.append(f"| `{loc}` | {g} | {_pct(g, prof.total)} | {c} |")
+        out.append("")
+
+    out.append("Flamegraph inputs: `stacks.folded` (call stacks), `lines.folded` (source lines).")
+    return "\n".join(out) + "\n"
+
+
+def slug(rid: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", rid.replace("::", "__"))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Opcode / source-line / call-stack gas profile from a debug trace.")
+    ap.add_argument("--parent", required=True, help="parent rid, e.g. mldsa65::verify_poc_foundry")
+    ap.add_argument("--trace", default="", help="saved debug_traceTransaction/debug_traceCall JSON")
+    ap.add_argument("--rpc", default="", help="fetch the trace from this node (anvil) instead of --trace")
+    ap.add_argument("--tx", default="", help="transaction hash for --rpc")
+    ap.add_argument("--artifact", default="", help="forge artifact of the contract at --depth (for source maps)")
+    ap.add_argument("--out-dir", default="out", help="forge build output dir (source ids + ASTs)")
+    ap.add_argument("--depth", type=int, default=1, help="trace depth the artifact's code runs at")
+    ap.add_argument("--repo", default="", help="provenance repo (default: parent row's repo)")
+    ap.add_argument("--commit", default="", help="provenance commit (default: git HEAD)")
+    ap.add_argument("--out", default=str(PROFILE_JSONL))
+    args = ap.parse_args()
+
+    if "::" not in args.parent:
+        raise SystemExit("--parent must be a canonical rid 'scheme::bench_name'")
+    parents = known_rids(DATA_JSONL)
+
+    if args.trace:
+        raw = json.loads(Path(args.trace).read_text(encoding="utf-8"))
+    elif args.rpc and args.tx:
+        raw = fetch_trace(args.rpc, args.tx)
+    else:
+        raise SystemExit("need --trace <file> or --rpc <url> --tx <hash>")
+    logs = load_struct_logs(raw)
+    if not logs:
+        raise SystemExit("trace has no steps")
+    costs = step_costs(logs)
+
+    smap = instr = idx = None
+    root_label = args.parent
+    if args.artifact:
+        art = json.loads(Path(args.artifact).read_text(encoding="utf-8"))
+        dep = art.get("deployedBytecode") or {}
+        smap = decode_source_map(str(dep.get("sourceMap") or ""))
+        instr = pc_to_instr(str(dep.get("object") or ""))
+        out_dir = Path(args.out_dir) if Path(args.out_dir).is_absolute() else ROOT / args.out_dir
+        idx = build_source_index(out_dir)
+        root_label = Path(args.artifact).stem
+
+    prof = profile(logs, costs, root_label, args.depth, smap, instr, idx)
+
+    commit = args.commit or git_head(ROOT)
+    repo = args.repo or parents.get(args.parent) or ROOT.name
+    ts = utc_ts()
+
+    dest = PROFILE_DIR / slug(args.parent)
+    write_folded(dest / "stacks.folded", prof.stacks)
+    if prof.lines_folded:
+        write_folded(dest / "lines.folded", prof.lines_folded)
+    (dest / "summary.md").write_text(render_summary(args.parent, commit, prof), encoding="utf-8")
+
+    base = {"ts_utc": ts, "parent_rid": args.parent, "repo": repo, "commit": commit, "source": SOURCE}
+    children: List[Dict[str, Any]] = []
+    for op, (g, c) in sorted(prof.by_op.items(), key=lambda kv: -kv[1][0]):
+        children.append(dict(base, kind="opcode", key=op, gas=g, count=c))
+    for f, g in sorted(prof.by_file.items(), key=lambda kv: -kv[1]):
+        children.append(dict(base, kind="file", key=f, gas=g))
+    for loc, (g, c) in sorted(prof.by_line.items(), key=lambda kv: -kv[1][0])[:TOP_N]:
+        children.append(dict(base, kind="line", key=loc, gas=g, count=c))
+    write_children(Path(args.out), args.parent, commit, children)
+
+    print(f"PROFILED {prof.steps} steps, {prof.total} gas for {args.parent} -> {dest.relative_to(ROOT)}/")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pareto frontier of gas vs effective security per (chain_profile, surface_layer).
+
+Input is the compiled weakest-link view used by reports/protocol_readiness.md: the latest record
+per canonical id (scheme::bench_name) and its effective_security_bits (own bits capped by every
+depends_on). A surface is on the frontier of its partition when no other surface there costs no
+more gas and has no fewer effective bits with at least one of the two strictly better. Surfaces
+with identical (gas, bits) are all on the frontier.
+
+Per partition: sort by (gas asc, bits desc) and sweep keeping the best bits seen; a point is on
+the frontier iff it beats that running maximum (or ties the last frontier point exactly). The
+frontier is then increasing in both gas and bits, so the frontier points dominating a surface
+are one contiguous run found with two bisects. O(n log n) per partition.
+
+Outputs:
+- reports/pareto_frontier.md     frontier report (dominated surfaces list their dominators)
+- data/pareto_frontier.json      frontier + dominance export for charting
+
+Usage:
+  python3 scripts/pareto_frontier.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from make_protocol_readiness import Record, compute_effective_security_bits, exact_bits, load_latest_records
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+OUT_MD = ROOT / "reports" / "pareto_frontier.md"
+OUT_JSON = ROOT / "data" / "pareto_frontier.json"
+
+UNSPECIFIED = "unspecified"
+
+
+@dataclass
+class Point:
+    rid: str
+    gas: int
+    bits: float
+    frontier: bool = False
+    dominated_by: List[str] = field(default_factory=list)   # frontier dominators, cheapest first
+
+
+Partition = Tuple[str, str]  # (chain_profile, surface_layer)
+
+
+def _bits(v: float) -> float:
+    return int(v) if float(v).is_integer() else v
+
+
+def load_points(jsonl_path: Path) -> Dict[Partition, List[Point]]:
+    """
+    Latest record per rid with its weakest-link effective bits, grouped by partition. Rows without a
+    positive gas (baseline / assumption nodes, gas 0) are not surfaces and are skipped, as in make_charts.
+    """
+    records = load_latest_records(jsonl_path)
+    eff = compute_effective_security_bits(records, own=exact_bits)
+    parts: Dict[Partition, List[Point]] = {}
+    for rid, r in records.items():
+        if r.gas is None or r.gas <= 0 or rid.endswith("_assumption"):
+            continue
+        key = (str(r.meta.get("chain_profile") or UNSPECIFIED), str(r.meta.get("surface_layer") or UNSPECIFIED))
+        parts.setdefault(key, []).append(Point(rid, int(r.gas), _bits(float(eff.get(rid, 0)))))
+    return parts
+
+
+def frontier(points: List[Point]) -> List[Point]:
+    """Mark frontier / dominated_by on `points`; returns them sorted by (gas, -bits, rid)."""
+    pts = sorted(points, key=lambda p: (p.gas, -p.bits, p.rid))
+    front: List[Point] = []
+    for p in pts:
+        last = front[-1] if front else None
+        if last is None or p.bits > last.bits or (p.gas == last.gas and p.bits == last.bits):
+            p.frontier = True
+            front.append(p)
+
+    gas = [f.gas for f in front]
+    bits = [f.bits for f in front]      # non-decreasing along the frontier
+    for p in pts:
+        if p.frontier:
+            continue
+        # frontier points with gas <= p.gas and bits >= p.bits: [lo, hi)
+        lo, hi = bisect_left(bits, p.bits), bisect_right(gas, p.gas)
+        p.dominated_by = [f.rid for f in front[lo:hi]]
+    return pts
+
+
+def _gpb(p: Point) -> str:
+    return f"{p.gas / p.bits:.2f}" if p.bits else "-"
+
+
+def _dominated_cell(p: Point, by_rid: Dict[str, Point]) -> str:
+    if p.frontier:
+        return "-"
+    best = by_rid[p.dominated_by[0]]
+    more = f" (+{len(p.dominated_by) - 1} more)" if len(p.dominated_by) > 1 else ""
+    return f"`{best.rid}` ({best.gas - p.gas:+,} gas, {_bits(best.bits - p.bits):+} bits){more}"
+
+
+def render(parts: Dict[Partition, List[Point]]) -> str:
+    lines: List[str] = []
+    lines.append("# Pareto Frontier: gas vs effective security (auto-generated)")
+    lines.append("")
+    lines.append("Generated from `data/results.jsonl`; `effective_security_bits` is the weakest-link value from "
+                 "`reports/protocol_readiness.md`. Within each (chain_profile, surface_layer) a surface is on the "
+                 "frontier when no other surface costs no more gas and has no fewer effective bits, one of them "
+                 "strictly.")
+    lines.append("")
+    lines.append("Reproduce:")
+    lines.append("```bash")
+    lines.append("python3 scripts/pareto_frontier.py")
+    lines.append("```")
+
+    for (chain, layer), pts in sorted(parts.items()):
+        by_rid = {p.rid: p for p in pts}
+        n_front = sum(p.frontier for p in pts)
+        lines.append("")
+        lines.append(f"## {chain} · {layer} ({n_front} of {len(pts)} on the frontier)")
+        lines.append("")
+        lines.append("| Surface | Gas | effective_security_bits | gas/bit | Frontier | Dominated by (cheapest frontier point) |")
+        lines.append("|---|---:|---:|---:|---|---|")
+        for p in pts:
+            lines.append(f"| `{p.rid}` | {p.gas:,} | {p.bits:g} | {_gpb(p)} | {'✅' if p.frontier else ''} | "
+                         f"{_dominated_cell(p, by_rid)} |")
+
+    lines.append("")
+    lines.append("Notes:")
+    lines.append("- Rows are in gas order; frontier points are increasing in both gas and effective bits.")
+    lines.append("- `Dominated by` names the cheapest frontier surface that dominates the row, with its gas and bits "
+                 "delta; `+N more` counts the other frontier surfaces that also dominate it.")
+    lines.append("- Baseline / assumption rows (gas 0) are not surfaces and are left out.")
+    lines.append("- Surfaces capped to 0 bits by a missing or cyclic dependency still count as points (0 bits).")
+    return "\n".join(lines) + "\n"
+
+
+def export(parts: Dict[Partition, List[Point]]) -> str:
+    out = []
+    for (chain, layer), pts in sorted(parts.items()):
+        out.append({
+            "chain_profile": chain,
+            "surface_layer": layer,
+            "frontier": [{"rid": p.rid, "gas": p.gas, "effective_security_bits": p.bits}
+                         for p in pts if p.frontier],
+            "dominated": [{"rid": p.rid, "gas": p.gas, "effective_security_bits": p.bits,
+                           "dominated_by": p.dominated_by} for p in pts if not p.frontier],
+        })
+    return json.dumps({"partitions": out}, indent=2, ensure_ascii=False) + "\n"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Pareto frontier of gas vs effective security bits.")
+    ap.add_argument("--jsonl", default=str(DATA_JSONL))
+    ap.add_argument("--out", default=str(OUT_MD))
+    ap.add_argument("--export", default=str(OUT_JSON))
+    args = ap.parse_args()
+
+    jsonl_path = Path(args.jsonl)
+    if not jsonl_path.exists():
+        raise SystemExit(f"Missing {jsonl_path}")
+
+    parts = {k: frontier(v) for k, v in load_points(jsonl_path).items()}
+    for path, text in ((Path(args.out), render(parts)), (Path(args.export), export(parts))):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    n = sum(len(v) for v in parts.values())
+    n_front = sum(p.frontier for v in parts.values() for p in v)
+    print(f"Wrote {args.out} and {args.export} ({n_front} of {n} surfaces on a frontier, {len(parts)} partitions)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@
 import ast
 import csv
 import json
+import os
 import subprocess
 import sys
 from datetime import datetime, timezone
@@ -52,8 +53,22 @@ CSV_FIELDS = [
     "vector_pack_ref",
     "vector_pack_id",
     "vector_id",
+    "gas_stat",
+    "gas_n",
+    "gas_min",
+    "gas_p50",
+    "gas_p95",
+    "gas_max",
+    "gas_stddev",
 ]
 
+# Per-input gas distribution written by scripts/sweep_vector_pack.py.
+GAS_DIST_FIELDS = ["gas_n", "gas_min", "gas_p50", "gas_p95", "gas_max", "gas_stddev"]
+
+# When set, rows are appended to this staging JSONL instead of data/results.*
+# (used by scripts/rebuild_orchestrator.py so that only one writer touches the dataset).
+STAGE_ENV = "PARSE_BENCH_STAGE"
+
 
 def normalize_chain_profile(v: Any) -> str:
     if v is None:
@@ -354,6 +369,25 @@ def normalize_row(raw: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, An
     if isinstance(vector_id, str) and vector_id:
         out["vector_id"] = vector_id
 
+    # Sweep rows: `gas` is the `gas_stat` statistic of the per-vector distribution
+    gas_stat = raw.get("gas_stat")
+    if isinstance(gas_stat, str) and gas_stat:
+        out["gas_stat"] = gas_stat
+
+    for k in GAS_DIST_FIELDS:
+        v = raw.get(k)
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[k] = v
+
+    # Generated code variants (zeta layouts, NTT kernels): id + generator parameters
+    variant = raw.get("variant")
+    if isinstance(variant, str) and variant:
+        out["variant"] = variant
+
+    variant_params = raw.get("variant_params")
+    if isinstance(variant_params, dict) and variant_params:
+        out["variant_params"] = variant_params
+
     depends_on = raw.get("depends_on")
     if isinstance(depends_on, list) and depends_on:
         out["depends_on"] = [str(x) for x in depends_on]
@@ -513,6 +547,16 @@ def main() -> int:
         print("WARN: No valid rows found in input", file=sys.stderr)
         return 0
 
+    stage = os.environ.get(STAGE_ENV, "").strip()
+    if stage:
+        stage_path = Path(stage)
+        stage_path.parent.mkdir(parents=True, exist_ok=True)
+        with stage_path.open("a", encoding="utf-8") as f:
+            for r in normalized:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        print(f"STAGED {len(normalized)} rows to {stage_path}")
+        return 0
+
     # Append JSONL
     with jsonl_path.open("a", encoding="utf-8") as f:
         for r in normalized:
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+End-to-end execution-path cost over the depends_on DAG (spec/case_graph.md).
+
+Nodes are the compiled records of reports/protocol_readiness.md (latest per scheme::bench_name) and
+an edge r -> d means "r's execution path goes through d" (depends_on, resolved like the readiness
+table). One memoized post-order pass computes, per node, over the subgraph below it:
+
+  path gas        gas(r) + max(path gas(d)): the heaviest root-to-leaf chain (critical path)
+  bottleneck bits min(own_bits(r), bottleneck(d)): the weakest-link effective_security_bits
+  critical edge   the edge through which the bottleneck reaches r (none when r's own bits bind)
+  gas/bit         path gas / bottleneck bits (end-to-end gas per effective secure bit)
+
+Each node and edge is visited once (iterative DFS, dependency tokens resolved through an index),
+so evaluating every root is O(V + E). A dependency that does not resolve to a record or closes a
+cycle caps the path at 0 bits, matching the readiness table.
+
+Output:
+- reports/path_cost.md (roots = nodes nothing depends on; by default those with a dependency)
+
+Usage:
+  python3 scripts/path_cost.py                      # write reports/path_cost.md
+  python3 scripts/path_cost.py --all --stdout       # include dependency-free roots, print instead
+  python3 scripts/path_cost.py --root falcon::falcon_handleOps_userOp_e2e --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from make_protocol_readiness import KNOWN_DEP_PREFIXES, Record, exact_bits, load_latest_records
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+OUT_MD = ROOT / "reports" / "path_cost.md"
+
+Graph = Dict[str, List[str]]
+
+
+@dataclass
+class PathCost:
+    rid: str
+    gas: int                                # path gas (critical chain)
+    bits: float                             # bottleneck (effective) bits; int when integral
+    next: Optional[str] = None              # next node on the critical gas chain
+    bottleneck: str = ""                    # node (or unresolved token) whose bits bind
+    critical_edge: Optional[Tuple[str, str]] = None
+    issue: str = ""                         # "missing dep" / "cycle" when the cap comes from one
+
+    @property
+    def gas_per_bit(self) -> Optional[float]:
+        return self.gas / self.bits if self.bits > 0 else None
+
+
+def build_graph(records: Dict[str, Record]) -> Graph:
+    """rid -> resolved dependency ids; same rules as make_protocol_readiness.resolve_dep_rid, O(1) per token."""
+    by_name: Dict[str, List[str]] = {}
+    for rid in records:
+        if "::" in rid:
+            by_name.setdefault(rid.rsplit("::", 1)[1], []).append(rid)
+
+    def resolve(dep: str) -> str:
+        dep = dep.strip()
+        if not dep or dep in records or "::" in dep:
+            return dep
+        hits = by_name.get(dep, [])
+        if len(hits) == 1:
+            return hits[0]
+        pref = [f"{p}::{dep}" for p in KNOWN_DEP_PREFIXES if f"{p}::{dep}" in records]
+        return pref[0] if len(pref) == 1 else dep
+
+    return {rid: [resolve(d) for d in r.depends_on] for rid, r in records.items()}
+
+
+def _own_bits(r: Record) -> float:
+    # fractional bits are kept, as in pareto_frontier (dataset_service /weakest-link serves these)
+    v = exact_bits(r)
+    return int(v) if v.is_integer() else v
+
+
+def evaluate(records: Dict[str, Record], graph: Graph) -> Dict[str, PathCost]:
+    """PathCost for every node, each subgraph evaluated once (post-order over the DAG)."""
+    memo: Dict[str, PathCost] = {}
+    on_stack: Dict[str, bool] = {}
+    deps_of = {rid: sorted(set(deps)) for rid, deps in graph.items()}
+
+    def combine(rid: str) -> PathCost:
+        r = records[rid]
+        pc = PathCost(rid, int(r.gas or 0), _own_bits(r), bottleneck=rid)
+        best_gas, best_bits = -1, None
+        for dep in deps_of[rid]:
+            sub = memo.get(dep)
+            if sub is None:  # unresolved token or back edge: 0 bits, no gas
+                sub = PathCost(dep, 0, 0, bottleneck=dep,
+                               issue="cycle" if on_stack.get(dep) else "missing dep")
+            # only a finished node continues the chain: a back edge or unresolved token would loop or dangle
+            if dep in memo and sub.gas > best_gas:
+                best_gas, pc.next = sub.gas, dep
+            if sub.bits < pc.bits and (best_bits is None or sub.bits < best_bits.bits):
+                best_bits = sub
+        if best_gas > 0:
+            pc.gas += best_gas
+        if best_bits is not None:
+            pc.bits, pc.bottleneck, pc.issue = best_bits.bits, best_bits.bottleneck, best_bits.issue
+            pc.critical_edge = best_bits.critical_edge or (rid, best_bits.rid)
+        return pc
+
+    for start in sorted(records):
+        if start in memo:
+            continue
+        on_stack[start] = True
+        stack = [(start, iter(deps_of[start]))]
+        while stack:
+            rid, deps = stack[-1]
+            for dep in deps:
+                if dep in records and dep not in memo and not on_stack.get(dep):
+                    on_stack[dep] = True
+                    stack.append((dep, iter(deps_of[dep])))
+                    break
+            else:
+                stack.pop()
+                memo[rid] = combine(rid)
+                on_stack[rid] = False
+    return memo
+
+
+def chain(memo: Dict[str, PathCost], rid: str) -> List[str]:
+    out, seen = [rid], {rid}
+    while memo.get(out[-1]) is not None and memo[out[-1]].next is not None:
+        nxt = memo[out[-1]].next
+        if nxt in seen:   # defensive: evaluate() never links into a cycle
+            break
+        out.append(nxt)
+        seen.add(nxt)
+    return out
+
+
+def roots(graph: Graph, include_leaves: bool) -> List[str]:
+    """Nodes no other node depends on (optionally only those with a dependency of their own)."""
+    depended = {d for deps in graph.values() for d in deps}
+    return sorted(r for r in graph if r not in depended and (include_leaves or graph[r]))
+
+
+def render(memo: Dict[str, PathCost], selected: List[str], n_roots: int) -> str:
+    lines: List[str] = []
+    lines.append("# Execution-Path Cost (auto-generated)")
+    lines.append("")
+    lines.append("Generated from `data/results.jsonl` over the `depends_on` DAG (see `spec/case_graph.md`). "
+                 "Path gas is the heaviest chain below each root; bottleneck bits is the weakest-link "
+                 "`effective_security_bits`; the critical edge is where that bottleneck enters the path.")
+    lines.append("")
+    lines.append("Reproduce:")
+    lines.append("```bash")
+    lines.append("python3 scripts/path_cost.py")
+    lines.append("```")
+    lines.append("")
+    lines.append("| Root | Critical gas path | Path gas | Bottleneck bits | Critical edge | Gas / effective bit |")
+    lines.append("|---|---|---:|---:|---|---:|")
+    for rid in selected:
+        pc = memo[rid]
+        path = " → ".join(f"`{n}`" for n in chain(memo, rid))
+        edge = "-" if pc.critical_edge is None else f"`{pc.critical_edge[0]}` → `{pc.critical_edge[1]}`"
+        if pc.issue:
+            edge += f" ({pc.issue})"
+        gpb = "-" if pc.gas_per_bit is None else f"{pc.gas_per_bit:.2f}"
+        lines.append(f"| `{rid}` | {path} | {pc.gas:,} | {pc.bits:g} | {edge} | {gpb} |")
+    if not selected:
+        lines.append("| _(no root with a dependency)_ |  |  |  |  |  |")
+    lines.append("")
+    lines.append("Notes:")
+    lines.append(f"- {len(selected)} of {n_roots} roots shown (roots without dependencies are single-node paths; "
+                 "`--all` lists them).")
+    lines.append("- Baseline / assumption nodes carry gas 0, so path gas equals the measured root unless a dependency "
+                 "is itself a measured surface.")
+    lines.append("- Critical edge `-` means the root's own denominator is the bottleneck.")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="End-to-end path gas / bottleneck bits over the depends_on DAG.")
+    ap.add_argument("--jsonl", default=str(DATA_JSONL))
+    ap.add_argument("--out", default=str(OUT_MD))
+    ap.add_argument("--root", action="append", default=[], help="evaluate these node ids (repeatable)")
+    ap.add_argument("--all", action="store_true", help="include roots without dependencies")
+    ap.add_argument("--stdout", action="store_true", help="print instead of writing --out")
+    ap.add_argument("--format", choices=("md", "json"), default="md")
+    args = ap.parse_args()
+
+    jsonl_path = Path(args.jsonl)
+    if not jsonl_path.exists():
+        raise SystemExit(f"Missing {jsonl_path}")
+
+    records = load_latest_records(jsonl_path)
+    graph = build_graph(records)
+    memo = evaluate(records, graph)
+    all_roots = roots(graph, include_leaves=True)
+    for rid in args.root:
+        if rid not in memo:
+            raise SystemExit(f"unknown node {rid!r} (expected scheme::bench_name)")
+    selected = args.root or roots(graph, include_leaves=args.all)
+
+    if args.format == "json":
+        text = json.dumps([dict(asdict(memo[r]), path=chain(memo, r), gas_per_bit=memo[r].gas_per_bit)
+                           for r in selected], indent=2) + "\n"
+    else:
+        text = render(memo, selected, len(all_roots))
+    if args.stdout or args.format == "json" or args.root:
+        sys.stdout.write(text)
+        return 0
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.out).write_text(text, encoding="utf-8")
+    print(f"Wrote {args.out} ({len(selected)} roots, {len(memo)} nodes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
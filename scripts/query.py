@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Query the results dataset: filters, latest-per-key, group-by aggregates, sorted top-N.
+
+The source (data/results.jsonl by default, or a results.csv) is indexed once into a columnar cache
+under .tmp/query_index/<source>/ and memory-mapped on every query:
+  - numeric columns   float64 (blank / missing = NaN)
+  - text columns      int32 codes (-1 = blank) + a vocabulary (blob + offsets, also mmap'd)
+  - ts                int64 epoch seconds of ts_utc; rows are stored in ts order (file order on ties)
+  - row               int64 position of the row in the source (file order)
+Dict / list values are stored as compact JSON text. An appended JSONL source is indexed incrementally
+(scripts/jsonl_tail.py, offset / tail kept in the manifest); any other change rebuilds the index.
+
+Blanks never crash a query: NaN / blank sort last in either direction and are skipped by aggregates.
+
+Usage:
+  python3 scripts/query.py --scheme mldsa65 --sort gas_per_secure_bit --top 10
+  python3 scripts/query.py --latest-by repo,bench_name,chain_profile --cols ts_utc,repo,bench_name,gas_verify
+  python3 scripts/query.py --surface-prefix sig:: --group-by scheme --agg count,min:gas_verify,p50:gas_per_secure_bit
+  python3 scripts/query.py --where chain_profile=EVM/L1 --since 30d --sort=-ts_utc --top 5 --format json
+  python3 scripts/query.py --source data/results.csv --where 'gas_verify>100000' --format csv
+
+Filters (all ANDed): --where col=v | col!=v | col^=prefix | col~=regex | col>n | col>=n | col<n | col<=n
+(repeatable; comma-separated values in `col=a,b` mean any of), plus shortcuts --scheme, --surface-layer,
+--surface-prefix, --chain-profile, --since / --until (ISO date/time or Nd / Nh ago).
+Sort descending with --sort=-col. Aggregates: count, and min / max / mean / sum / p50 / p95 / n (non-blank count) as fn:column.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import math
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import jsonl_tail
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOURCE = ROOT / "data" / "results.jsonl"
+INDEX_DIR = ROOT / ".tmp" / "query_index"
+INDEX_VERSION = 3
+
+DEFAULT_COLS = ["ts_utc", "repo", "scheme", "bench_name", "chain_profile", "gas_verify", "gas_per_secure_bit"]
+AGG_FNS = ("count", "n", "min", "max", "mean", "sum", "p50", "p95")
+TEXT_COLS = {"ts_utc", "repo", "commit", "vector_id", "vector_pack_id"}  # never numeric, even if they look it
+
+
+# ---- parsing ----
+
+def parse_ts(s: Any) -> Optional[int]:
+    if not isinstance(s, str) or not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def parse_when(s: str) -> int:
+    """ISO date/time, or a relative age like 7d / 12h / 30m."""
+    m = re.fullmatch(r"(\d+)([dhm])", s.strip())
+    if m:
+        unit = {"d": "days", "h": "hours", "m": "minutes"}[m.group(2)]
+        return int((datetime.now(timezone.utc) - timedelta(**{unit: int(m.group(1))})).timestamp())
+    ts = parse_ts(s)
+    if ts is None:
+        raise SystemExit(f"bad time {s!r} (expected ISO date/time or Nd / Nh / Nm)")
+    return ts
+
+
+def _scalar(v: Any) -> Any:
+    if isinstance(v, (dict, list)):
+        return json.dumps(v, sort_keys=True, separators=(",", ":"))
+    return v
+
+
+def _num(v: Any) -> Optional[float]:
+    if isinstance(v, bool):
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str) and v.strip():
+        try:
+            return float(v)
+        except ValueError:
+            return None
+    return None
+
+
+def _py(v: float) -> Any:
+    """Stored float -> JSON-friendly value (NaN -> None, integral -> int)."""
+    if math.isnan(v):
+        return None
+    return int(v) if v.is_integer() and abs(v) < 2 ** 53 else v
+
+
+def read_rows(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """Rows of a JSONL or CSV source; returns (rows, bytes consumed)."""
+    data = path.read_bytes()
+    if path.suffix == ".csv":
+        return list(csv.DictReader(io.StringIO(data.decode("utf-8")))), len(data)
+    lines, end = jsonl_tail.complete_lines(data)  # a torn last line is left for the next update
+    return _parse_jsonl(path, lines, 0), end
+
+
+def _parse_jsonl(path: Path, lines: List[bytes], start: int) -> List[Dict[str, Any]]:
+    rows = []
+    for i, line in enumerate(lines):
+        if line.strip():
+            try:
+                o = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise SystemExit(f"{path}: bad JSON after byte {start} (line +{i + 1}): {e}")
+            if isinstance(o, dict):
+                rows.append(o)
+    return rows
+
+
+# ---- columnar index ----
+
+class Vocab:
+    """Text values of one column: utf-8 blob + offsets (both mmap'd), value -> code lookups on demand."""
+
+    def __init__(self, blob: np.ndarray, offs: np.ndarray):
+        self.blob, self.offs = blob, offs
+        self._values: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.offs) - 1
+
+    def __getitem__(self, code: int) -> str:
+        if code < 0:
+            return ""
+        return bytes(self.blob[self.offs[code]:self.offs[code + 1]]).decode("utf-8")
+
+    def values(self) -> List[str]:
+        if self._values is None:
+            raw = self.blob.tobytes()
+            o = self.offs.tolist()
+            self._values = [raw[o[i]:o[i + 1]].decode("utf-8") for i in range(len(o) - 1)]
+        return self._values
+
+    def codes(self, pred: Callable[[str], bool]) -> np.ndarray:
+        return np.array([i for i, v in enumerate(self.values()) if pred(v)], dtype=np.int32)
+
+
+def _encode_vocab(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    enc = [v.encode("utf-8") for v in values]
+    offs = np.zeros(len(enc) + 1, dtype=np.int64)
+    offs[1:] = np.cumsum([len(b) for b in enc])
+    return np.frombuffer(b"".join(enc), dtype=np.uint8).copy(), offs
+
+
+class Index:
+    def __init__(self, path: Path):
+        self.dir = path
+        self.manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+        self.n = int(self.manifest["rows"])
+        self.kinds: Dict[str, str] = self.manifest["columns"]
+        self._cols: Dict[str, np.ndarray] = {}
+        self._vocab: Dict[str, Vocab] = {}
+
+    def col(self, name: str) -> np.ndarray:
+        if name not in self._cols:
+            if name not in self.kinds and name not in ("ts", "row"):
+                raise SystemExit(f"unknown column {name!r} (known: {', '.join(sorted(self.kinds))})")
+            self._cols[name] = np.load(self.dir / f"col_{name}.npy", mmap_mode="r")
+        return self._cols[name]
+
+    def take(self, name: str, rows: np.ndarray) -> np.ndarray:
+        """Column values at `rows` (sorted, unique); no gather when that is every row."""
+        c = np.asarray(self.col(name))
+        return c if len(rows) == self.n else c[rows]
+
+    def vocab(self, name: str) -> Vocab:
+        if name not in self._vocab:
+            self._vocab[name] = Vocab(np.load(self.dir / f"vblob_{name}.npy", mmap_mode="r"),
+                                      np.load(self.dir / f"voff_{name}.npy", mmap_mode="r"))
+        return self._vocab[name]
+
+    def value(self, name: str, row: int) -> Any:
+        if self.kinds[name] == "num":
+            return _py(float(self.col(name)[row]))
+        return self.vocab(name)[int(self.col(name)[row])]
+
+
+def _index_dir(source: Path) -> Path:
+    key = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()[:12]
+    return INDEX_DIR / f"{source.stem}-{key}"
+
+
+def _is_num(vals: List[Any]) -> bool:
+    types = set(map(type, vals))
+    if types <= {int, float, type(None)}:
+        return True
+    if bool in types or dict in types or list in types:
+        return False
+    return all(_num(v) is not None for v in vals if v is not None and v != "")
+
+
+def _encode_text(vals: List[Any], lookup: Dict[str, int]) -> np.ndarray:
+    """Codes for `vals`, extending `lookup` (value -> code, insertion ordered) in place."""
+    setdefault = lookup.setdefault
+    return np.fromiter(
+        (-1 if v is None or v == "" else setdefault(v if type(v) is str else str(_scalar(v)), len(lookup))
+         for v in vals), dtype=np.int32, count=len(vals))
+
+
+def build_index(source: Path, rebuild: bool = False) -> Index:
+    """Create or refresh the columnar index for `source`; returns it opened."""
+    d = _index_dir(source)
+    st = source.stat()
+    prev: Optional[Index] = None
+    tailer = jsonl_tail.Tailer(source)
+    if (d / "manifest.json").exists() and not rebuild:
+        idx = Index(d)
+        m = idx.manifest
+        if m.get("version") == INDEX_VERSION and m["mtime_ns"] == st.st_mtime_ns and m["size"] == st.st_size:
+            return idx
+        if m.get("version") == INDEX_VERSION and source.suffix == ".jsonl":
+            prev, tailer = idx, jsonl_tail.Tailer(source, m["consumed"], m["tail"])
+
+    if source.suffix == ".jsonl":
+        start = tailer.offset
+        appended, lines = tailer.read()
+        if not appended:
+            prev, start = None, 0
+        rows, consumed, tail = _parse_jsonl(source, lines, start), tailer.offset, tailer.tail
+    else:
+        rows, consumed = read_rows(source)
+        tail = ""
+    names: Dict[str, None] = dict.fromkeys(prev.kinds if prev else [])
+    for r in rows:
+        names.update(dict.fromkeys(r))
+    n_prev = prev.n if prev else 0
+    n = n_prev + len(rows)
+
+    seen_ts: Dict[Any, int] = {}
+    ts_new = np.fromiter((seen_ts[t] if t in seen_ts else seen_ts.setdefault(t, parse_ts(t) or 0)
+                          for t in (r.get("ts_utc") for r in rows)), dtype=np.int64, count=len(rows))
+    ts = np.concatenate((np.asarray(prev.col("ts")), ts_new)) if prev else ts_new
+    order = np.argsort(ts, kind="stable")
+
+    kinds: Dict[str, str] = {}
+    rownum = np.arange(n_prev, n, dtype=np.int64)
+    if prev:
+        rownum = np.concatenate((np.asarray(prev.col("row")), rownum))
+    cols: Dict[str, np.ndarray] = {"ts": ts[order], "row": rownum[order]}
+    vocabs: Dict[str, List[str]] = {}
+    for k in names:
+        vals = [r.get(k) for r in rows]
+        was = prev.kinds.get(k) if prev else None
+        if was != "text" and k not in TEXT_COLS and _is_num(vals):
+            kinds[k] = "num"
+            if str in set(map(type, vals)):
+                vals = [_num(v) for v in vals]
+            new = np.array(vals, dtype=np.float64)  # None -> NaN
+            old = np.asarray(prev.col(k)) if was else np.full(n_prev, np.nan)
+            cols[k] = np.concatenate((old, new))[order]
+            continue
+        # text; a column only ever widens from num to text, never back
+        kinds[k] = "text"
+        lookup: Dict[str, int] = {}
+        if was == "text":
+            lookup = {v: i for i, v in enumerate(prev.vocab(k).values())}
+            old = np.asarray(prev.col(k))
+        elif was == "num":
+            old = _encode_text([None if math.isnan(x) else (int(x) if x.is_integer() else x)
+                                for x in np.asarray(prev.col(k)).tolist()], lookup)
+        else:
+            old = np.full(n_prev, -1, dtype=np.int32)
+        new = _encode_text(vals, lookup)
+        cols[k] = np.concatenate((old, new))[order]
+        vocabs[k] = list(lookup)
+
+    if prev is not None:
+        prev._cols.clear()
+        prev._vocab.clear()
+    d.mkdir(parents=True, exist_ok=True)
+    for k, arr in cols.items():
+        tmp = d / f"col_{k}.npy.tmp"
+        with tmp.open("wb") as f:
+            np.save(f, arr)
+        tmp.replace(d / f"col_{k}.npy")
+    for k, values in vocabs.items():
+        blob, offs = _encode_vocab(values)
+        for name, arr in ((f"vblob_{k}", blob), (f"voff_{k}", offs)):
+            tmp = d / f"{name}.npy.tmp"
+            with tmp.open("wb") as f:
+                np.save(f, arr)
+            tmp.replace(d / f"{name}.npy")
+    manifest = {
+        "version": INDEX_VERSION, "source": str(source), "rows": n, "columns": kinds,
+        "size": st.st_size, "mtime_ns": st.st_mtime_ns, "consumed": consumed, "tail": tail,
+    }
+    (d / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return Index(d)
+
+
+# ---- query ----
+
+FILTER_RX = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s*(!=|\^=|~=|>=|<=|=|>|<)\s*(.*)$")
+
+
+def apply_filter(idx: Index, mask: np.ndarray, expr: str) -> np.ndarray:
+    m = FILTER_RX.match(expr)
+    if not m:
+        raise SystemExit(f"bad --where {expr!r} (col=v, col!=v, col^=prefix, col~=regex, col>n, ...)")
+    name, op, val = m.groups()
+    col = idx.col(name)
+    if idx.kinds.get(name) == "num":
+        if op in ("^=", "~="):
+            raise SystemExit(f"{op} needs a text column; {name} is numeric")
+        nums = [_num(v) for v in val.split(",")] if val else []
+        if None in nums:
+            raise SystemExit(f"bad --where {expr!r}: {name} is numeric, {val!r} is not a number")
+        if op in ("=", "!="):
+            hit = np.isin(col, np.array(nums)) if nums else np.isnan(col)
+            return mask & (hit if op == "=" else ~hit)
+        if len(nums) != 1:
+            raise SystemExit(f"bad --where {expr!r}: {op} takes one value")
+        x = nums[0]
+        with np.errstate(invalid="ignore"):
+            hit = {">": col > x, ">=": col >= x, "<": col < x, "<=": col <= x}[op]
+        return mask & hit
+    voc = idx.vocab(name)
+    if op in ("=", "!="):
+        wanted = set(val.split(",")) if val else set()
+        codes = voc.codes(lambda v: v in wanted)
+        hit = np.isin(col, codes)
+        if "" in wanted or not val:
+            hit |= col < 0
+        return mask & (hit if op == "=" else ~hit)
+    if op == "^=":
+        return mask & np.isin(col, voc.codes(lambda v: v.startswith(val)))
+    if op == "~=":
+        rx = re.compile(val)
+        return mask & np.isin(col, voc.codes(lambda v: rx.search(v) is not None))
+    # ordered comparison on text: numeric when the bound is a number (a column holding one "n/a"
+    # is text, its numbers still compare as numbers; non-numeric values never match), else
+    # lexicographic (ISO timestamps compare correctly)
+    bound: Any = _num(val)
+    key: Callable[[str], Any] = str if bound is None else _num
+    if bound is None:
+        bound = val
+    cmp = {">": lambda a: a > bound, ">=": lambda a: a >= bound,
+           "<": lambda a: a < bound, "<=": lambda a: a <= bound}[op]
+
+    def pred(v: str) -> bool:
+        k = key(v)
+        return k is not None and cmp(k)
+
+    return mask & np.isin(col, voc.codes(pred))
+
+
+def _group_keys(idx: Index, rows: np.ndarray, keys: Sequence[str]) -> Tuple[np.ndarray, int]:
+    """One int64 id per row (equal ids <=> equal values in every key column) and the id range."""
+    gid = np.zeros(len(rows), dtype=np.int64)
+    span = 1
+    for k in keys:
+        c = idx.take(k, rows)
+        if idx.kinds.get(k) == "num":
+            _, c = np.unique(c, return_inverse=True)  # NaNs collapse into one trailing group
+            size = int(c.max()) + 1 if len(c) else 1
+        else:
+            c = c.astype(np.int64) + 1
+            size = len(idx.vocab(k)) + 1
+        if span * size >= 2 ** 62:
+            _, gid = np.unique(gid, return_inverse=True)
+            span = int(gid.max()) + 1 if len(gid) else 1
+        gid = gid * size + c
+        span *= size
+    return gid, span
+
+
+def groups(idx: Index, rows: np.ndarray, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(dense group of each row, first row position, last row position) with groups in key order."""
+    gid, span = _group_keys(idx, rows, keys)
+    pos = np.arange(len(rows))
+    if span > max(4 * len(rows), 1 << 20):
+        _, first, inv = np.unique(gid, return_index=True, return_inverse=True)
+        last = np.empty(len(first), dtype=np.int64)
+        last[inv] = pos  # fancy assignment: the last write per group wins
+        return inv, first, last
+    # small key space: a direct-address table instead of a sort
+    present = np.zeros(span, dtype=bool)
+    present[gid] = True
+    dense = np.cumsum(present) - 1
+    inv = dense[gid]
+    g = int(dense[-1]) + 1 if span else 0
+    first = np.empty(g, dtype=np.int64)
+    first[inv[::-1]] = pos[::-1]
+    last = np.empty(g, dtype=np.int64)
+    last[inv] = pos
+    return inv, first, last
+
+
+def latest_by(idx: Index, rows: np.ndarray, keys: Sequence[str]) -> np.ndarray:
+    """Last row (rows are in ts order) of each key group, in ts order."""
+    if not len(rows):
+        return rows
+    _, _, last = groups(idx, rows, keys)
+    return rows[np.sort(last)]
+
+
+def _sort_key(idx: Index, rows: np.ndarray, name: str, desc: bool) -> np.ndarray:
+    """float key per row, ascending order = requested order, blanks (+inf) last."""
+    if name == "ts_utc":
+        name = "ts"
+    col = np.asarray(idx.col(name))[rows]
+    if name != "ts" and idx.kinds.get(name) != "num":
+        vals = idx.vocab(name).values()
+        rank = np.empty(len(vals) + 1, dtype=np.float64)  # text: by value
+        rank[np.argsort(np.array(vals, dtype=object), kind="stable") + 1] = np.arange(len(vals))
+        rank[0] = np.nan
+        col = rank[col.astype(np.int64) + 1]
+    key = col.astype(np.float64)
+    return np.where(np.isnan(key), np.inf, -key if desc else key)
+
+
+def _rank(key: np.ndarray, top: int) -> np.ndarray:
+    """Positions of `key` in ascending (stable) order, only the first `top` if > 0."""
+    if 0 < top < len(key):
+        part = np.argpartition(key, top - 1)[:top]
+        cut = key[part].max()
+        part = np.flatnonzero(key <= cut)  # keep ties at the cut so the stable order is exact
+        return part[np.argsort(key[part], kind="stable")][:top]
+    return np.argsort(key, kind="stable")
+
+
+def sort_rows(idx: Index, rows: np.ndarray, spec: str, top: int = 0) -> np.ndarray:
+    """`rows` ordered by column `spec` ('-col' = descending); NaN / blank always last."""
+    return rows[_rank(_sort_key(idx, rows, spec.lstrip("-+"), spec.startswith("-")), top)]
+
+
+def aggregate(idx: Index, rows: np.ndarray, keys: Sequence[str],
+              aggs: Sequence[str]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """(first row of each group, {aggregate label: float array per group}); groups in key order."""
+    if keys:
+        inv, first, _ = groups(idx, rows, keys)
+    else:
+        inv, first = np.zeros(len(rows), dtype=np.int64), np.zeros(1 if len(rows) else 0, dtype=np.int64)
+    ng = len(first)
+    stats: Dict[str, np.ndarray] = {}
+    for spec in aggs:
+        fn, _, col = spec.partition(":")
+        if fn not in AGG_FNS:
+            raise SystemExit(f"unknown aggregate {fn!r} (expected one of {', '.join(AGG_FNS)})")
+        if fn == "count":
+            stats["count"] = np.bincount(inv, minlength=ng).astype(np.float64)
+            continue
+        if not col or idx.kinds.get(col) != "num":
+            raise SystemExit(f"aggregate {spec!r} needs a numeric column")
+        v = idx.take(col, rows)
+        ok = ~np.isnan(v)
+        g, v = inv[ok], v[ok]
+        n = np.bincount(g, minlength=ng)
+        if fn == "n":
+            res = n.astype(np.float64)
+        elif fn in ("sum", "mean"):
+            s = np.bincount(g, weights=v, minlength=ng)
+            res = s if fn == "sum" else np.divide(s, n, out=np.full(ng, np.nan), where=n > 0)
+        else:
+            # group rows contiguously (stable; small ints take numpy's radix sort), then select per group
+            v = v[np.argsort(g.astype(np.uint16) if ng <= 1 << 16 else g, kind="stable")]
+            has = n > 0
+            m = n[has]
+            start = np.cumsum(m) - m
+            res = np.full(ng, np.nan)
+            if not len(v):
+                pass
+            elif fn == "min":
+                res[has] = np.minimum.reduceat(v, start)
+            elif fn == "max":
+                res[has] = np.maximum.reduceat(v, start)
+            else:
+                k = np.maximum(np.ceil((0.5 if fn == "p50" else 0.95) * m).astype(np.int64) - 1, 0)  # nearest rank
+                if len(m) <= 4096:
+                    res[has] = [np.partition(v[s0:s0 + mi], ki)[ki] for s0, mi, ki in zip(start, m, k)]
+                else:
+                    o = np.argsort(v)
+                    o = o[np.argsort(np.repeat(np.arange(len(m)), m)[o], kind="stable")]
+                    res[has] = v[o][start + k]
+        stats[f"{fn}:{col}"] = res
+    return rows[first] if len(rows) else first, stats
+
+
+# ---- output ----
+
+def _fmt(v: Any) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, float):
+        return f"{v:.4f}".rstrip("0").rstrip(".")
+    return str(v)
+
+
+def emit(records: List[Dict[str, Any]], cols: List[str], fmt: str) -> None:
+    if fmt == "json":
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+    elif fmt == "jsonl":
+        for r in records:
+            print(json.dumps(r, ensure_ascii=False))
+    elif fmt == "csv":
+        w = csv.writer(sys.stdout)
+        w.writerow(cols)
+        for r in records:
+            w.writerow([_fmt(r.get(c)) for c in cols])
+    else:
+        cells = [[_fmt(r.get(c)) for c in cols] for r in records]
+        widths = [max([len(c)] + [len(row[i]) for row in cells]) for i, c in enumerate(cols)]
+        print("  ".join(c.ljust(w) for c, w in zip(cols, widths)).rstrip())
+        for row in cells:
+            print("  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip())
+
+
+def run(args: argparse.Namespace) -> Tuple[List[Dict[str, Any]], List[str]]:
+    source = Path(args.source)
+    if not source.exists():
+        raise SystemExit(f"missing source: {source}")
+    idx = build_index(source, args.rebuild)
+
+    mask = np.ones(idx.n, dtype=bool)
+    wheres = list(args.where)
+    for opt, col, op in (("scheme", "scheme", "="), ("surface_layer", "surface_layer", "="),
+                         ("surface_prefix", "surface_id", "^="), ("chain_profile", "chain_profile", "=")):
+        if getattr(args, opt):
+            wheres.append(f"{col}{op}{getattr(args, opt)}")
+    for w in wheres:
+        mask = apply_filter(idx, mask, w)
+    ts = idx.col("ts")
+    if args.since:
+        mask &= ts >= parse_when(args.since)
+    if args.until:
+        mask &= ts <= parse_when(args.until)
+    rows = np.flatnonzero(mask)
+
+    if args.latest_by:
+        rows = latest_by(idx, rows, [k.strip() for k in args.latest_by.split(",") if k.strip()])
+
+    if args.group_by or args.agg:
+        keys = [k.strip() for k in args.group_by.split(",") if k.strip()]
+        aggs = [a.strip() for a in (args.agg or "count").split(",") if a.strip()]
+        firsts, stats = aggregate(idx, rows, keys, aggs)
+        order = np.arange(len(firsts))
+        if args.sort:
+            name, desc = args.sort.lstrip("-+"), args.sort.startswith("-")
+            if name in stats:
+                key = np.where(np.isnan(stats[name]), np.inf, -stats[name] if desc else stats[name])
+            elif name in keys:
+                key = _sort_key(idx, firsts, name, desc)
+            else:
+                raise SystemExit(f"--sort {name!r} is neither a group key nor an aggregate")
+            order = _rank(key, args.top)
+        elif args.top > 0:
+            order = order[:args.top]
+        records = []
+        for gi in order.tolist():
+            r = {k: idx.value(k, int(firsts[gi])) for k in keys}
+            r.update((label, _py(float(res[gi]))) for label, res in stats.items())
+            records.append(r)
+        cols = keys + list(stats)
+        return records, cols
+
+    if args.sort:
+        rows = sort_rows(idx, rows, args.sort, args.top)
+    elif args.top > 0:
+        rows = rows[:args.top]
+    cols = [c.strip() for c in args.cols.split(",")] if args.cols else [c for c in DEFAULT_COLS if c in idx.kinds]
+    for c in cols:
+        if c not in idx.kinds:
+            raise SystemExit(f"unknown column {c!r} (known: {', '.join(sorted(idx.kinds))})")
+    records = [{c: idx.value(c, int(r)) for c in cols} for r in rows]
+    return records, cols
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Filter / group / rank the results dataset through a cached columnar index.")
+    ap.add_argument("--source", default=str(DEFAULT_SOURCE), help="results.jsonl (default) or a results.csv")
+    ap.add_argument("--where", action="append", default=[], help="col=v | col!=v | col^=p | col~=re | col>n ... (repeatable)")
+    ap.add_argument("--scheme", default="")
+    ap.add_argument("--surface-layer", default="")
+    ap.add_argument("--surface-prefix", default="", help="surface_id prefix, e.g. sig::")
+    ap.add_argument("--chain-profile", default="")
+    ap.add_argument("--since", default="", help="ISO date/time or Nd / Nh / Nm ago")
+    ap.add_argument("--until", default="")
+    ap.add_argument("--latest-by", default="", help="keep the newest row per these columns, e.g. repo,bench_name,chain_profile")
+    ap.add_argument("--group-by", default="", help="comma-separated key columns")
+    ap.add_argument("--agg", default="", help="count, fn:col (fn: n, min, max, mean, sum, p50, p95); default count")
+    ap.add_argument("--sort", default="", help="column; prefix '-' for descending (blanks always last)")
+    ap.add_argument("--top", type=int, default=0, help="keep the first N rows (0 = all)")
+    ap.add_argument("--cols", default="", help=f"output columns (default: {','.join(DEFAULT_COLS)})")
+    ap.add_argument("--format", choices=("table", "csv", "json", "jsonl"), default="table")
+    ap.add_argument("--rebuild", action="store_true", help="rebuild the index from scratch")
+    ap.add_argument("--timing", action="store_true", help="print query time to stderr")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    t0 = time.perf_counter()
+    records, cols = run(args)
+    dt = time.perf_counter() - t0
+    emit(records, cols, args.format)
+    if args.timing:
+        print(f"{len(records)} rows in {dt * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Render the pinned vendor sections of reports/protocol_readiness.md from declarations.
+
+Each vendor section is data (see SECTIONS): its marker pair <!-- X_BEGIN --> ... <!-- X_END -->,
+the repo it is pinned to, the benches it surfaces (in table order, each with its scheme), the
+table columns with their formatters, and the text above and below the table.
+
+All sections are rendered from one latest-per-bench index over data/results.jsonl and spliced
+into the report in a single pass:
+  - latest = greatest ts_utc (parsed as ISO 8601; rows without a parsable ts rank first),
+    ties broken by file order (later line wins), the same rule as scripts/query.py --latest-by
+  - a block already in the report is replaced in place
+  - a missing block is inserted after the nearest section declared before it that is present,
+    else before the nearest one declared after it, else appended at the end
+  - blocks are separated from surrounding text by exactly one blank line
+
+Usage:
+  python3 scripts/readiness_blocks.py                      # default sections
+  python3 scripts/readiness_blocks.py --only falcon        # just the FALCON_VENDOR block
+  python3 scripts/readiness_blocks.py --only dilithium     # opt-in section (not in the default set)
+  python3 scripts/readiness_blocks.py --check              # exit 1 if the report is out of date
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+OUT_MD = ROOT / "reports" / "protocol_readiness.md"
+
+BLOCK_RX = re.compile(r"<!-- ([A-Z0-9_]+)_BEGIN -->.*?<!-- \1_END -->", re.DOTALL)
+
+Row = Dict[str, Any]
+Context = Dict[str, str]
+
+
+@dataclass(frozen=True)
+class Bench:
+    name: str
+    scheme: str
+    label: str = ""                 # description column (if the section has one)
+    note: str = ""                  # fixed text appended to the notes column
+    weakest_link: bool = False      # also surface weakest_link / eff128 / gpb_eff from the row notes
+
+
+CellFn = Callable[[Bench, Row, Context], Any]
+
+
+@dataclass(frozen=True)
+class Column:
+    header: str
+    get: Union[str, CellFn]         # row field name, or fn(bench, row, ctx)
+    fmt: Callable[[Any], str] = str
+    code: bool = False              # wrap the cell in backticks
+    right: bool = False
+
+
+Lines = List[Union[str, Callable[[Dict[str, Row], Context], List[str]]]]
+
+
+@dataclass(frozen=True)
+class Section:
+    name: str
+    marker: str
+    benches: List[Bench]
+    columns: List[Column]
+    head: Lines                     # str.format(**ctx) templates, or fn(picked, ctx) -> lines
+    foot: Lines = field(default_factory=list)
+    repo: Optional[str] = None      # pin to one repo (ctx["repo_at"] = `repo`@`commit`)
+    missing: bool = False           # keep a _missing_ row for benches without data
+    empty: Optional[str] = None     # single row when no bench has data
+    default: bool = True            # rendered without --only
+
+    @property
+    def begin(self) -> str:
+        return f"<!-- {self.marker}_BEGIN -->"
+
+    @property
+    def end(self) -> str:
+        return f"<!-- {self.marker}_END -->"
+
+    def wants(self, r: Row) -> bool:
+        """True if `r` can feed this section (the report_build dataset slice)."""
+        if self.repo is not None and r.get("repo") != self.repo:
+            return False
+        return any(b.name == r.get("bench_name") and b.scheme == r.get("scheme") for b in self.benches)
+
+
+# ---- formatters ----
+
+def fmt_int(x: Any) -> str:
+    try:
+        return f"{int(float(x)):,}"
+    except (TypeError, ValueError):
+        return "" if x is None else str(x)
+
+
+def fmt_bits(x: Any) -> str:
+    try:
+        return str(int(float(x)))
+    except (TypeError, ValueError):
+        return "" if x is None else str(x)
+
+
+def fmt_repr(x: Any) -> str:
+    """float repr (128.0, 538293.84375)."""
+    try:
+        return str(float(x))
+    except (TypeError, ValueError):
+        return "" if x is None else str(x)
+
+
+def fmt_fixed(places: int) -> Callable[[Any], str]:
+    """Fixed decimals with trailing zeros stripped (40375.21484375, 128)."""
+    def f(x: Any) -> str:
+        try:
+            return f"{float(x):.{places}f}".rstrip("0").rstrip(".")
+        except (TypeError, ValueError):
+            return "" if x is None else str(x)
+    return f
+
+
+def clip(limit: int) -> Callable[[Any], str]:
+    """Collapse whitespace and cut to `limit` characters (ending in ...)."""
+    def f(x: Any) -> str:
+        s = re.sub(r"\s+", " ", str(x or "")).strip()
+        return s if len(s) <= limit else s[:limit - 3] + "..."
+    return f
+
+
+# ---- cells ----
+
+def bench_name(b: Bench, r: Row, ctx: Context) -> str:
+    return b.name
+
+
+def repo_at(b: Bench, r: Row, ctx: Context) -> str:
+    return ctx["repo_at"]
+
+
+def _note_value(notes: Any, key: str) -> str:
+    for part in str(notes or "").split():
+        if part.startswith(key + "="):
+            return part.split("=", 1)[1]
+    return ""
+
+
+def bench_note(b: Bench, r: Row, ctx: Context) -> str:
+    """The bench's fixed note, plus the weakest-link annotations for end-to-end surfaces."""
+    if not b.weakest_link:
+        return b.note
+    dep = r.get("depends_on") or ""
+    if isinstance(dep, list):
+        dep = dep[0] if dep else ""
+    extra = [f"{k}={v}" for k, v in (("weakest-link", _note_value(r.get("notes"), "weakest_link") or str(dep)),
+                                      ("eff128", _note_value(r.get("notes"), "eff128")),
+                                      ("gpb_eff", _note_value(r.get("notes"), "gpb_eff"))) if v]
+    return "; ".join([b.note, " ".join(extra)]) if extra else b.note
+
+
+def row_and_bench_note(b: Bench, r: Row, ctx: Context) -> str:
+    n = str(r.get("notes") or "").strip()
+    return "; ".join(p for p in (n, b.note) if p)
+
+
+def proof_and_notes(b: Bench, r: Row, ctx: Context) -> str:
+    """Row notes, prefixed with a ✅ on-chain proof marker when the row carries one."""
+    notes = str(r.get("notes", ""))
+    op = r.get("onchain_proof") or {}
+    if isinstance(op, dict) and op:
+        txs = op.get("tx_hashes") or []
+        bits: List[str] = []
+        if txs:
+            bits.append(f"tx={txs[0][:10]}…")
+        if op.get("contract"):
+            bits.append(f"ctr={str(op['contract'])[:10]}…")
+        if op.get("artifact_path"):
+            bits.append(f"artifact={str(op['artifact_path']).split('/')[-1]}")
+        notes = (f"✅ {' '.join(bits)} " + notes).strip()
+    return notes
+
+
+def sec192(b: Bench, r: Row, ctx: Context) -> str:
+    """ML-DSA-65 normalization hint: gas/bit at security_equiv_bits=192."""
+    try:
+        return "sec192=192 gpb192=" + f"{int(r.get('gas_verify')) / 192:,.6f}".rstrip("0").rstrip(".")
+    except (TypeError, ValueError):
+        return "sec192=192"
+
+
+def vendor_commit(b: Bench, r: Row, ctx: Context) -> str:
+    prov = r.get("provenance") or {}
+    return str(prov.get("commit", r.get("commit", "unknown")))[:12]
+
+
+def vendor_path(b: Bench, r: Row, ctx: Context) -> str:
+    return str((r.get("provenance") or {}).get("path", "vendors/ETHDILITHIUM"))
+
+
+def vector_pack(picked: Dict[str, Row], ctx: Context) -> List[str]:
+    """Vector pack provenance of the first picked row that has one (searchable in the report)."""
+    for r in picked.values():
+        if not r.get("vector_pack_ref"):
+            continue
+        lines = ["Vector pack (shared reference for these measurements):"]
+        for k in ("vector_pack_ref", "vector_pack_id", "vector_id"):
+            if r.get(k):
+                lines.append(f"- `{k}`: `{r[k]}`")
+        return lines + [""]
+    return []
+
+
+# ---- declarations ----
+
+MLDSA_REF = "feature/mldsa-ntt-opt-phase12-erc7913-packedA"
+
+SECTIONS: List[Section] = [
+    Section(
+        name="mldsa",
+        marker="MLDSA65_VENDOR",
+        benches=[Bench("verify_poc_foundry", "mldsa65"),
+                 Bench("preA_compute_w_fromPackedA_ntt_rho0_log", "mldsa65"),
+                 Bench("preA_compute_w_fromPackedA_ntt_rho1_log", "mldsa65")],
+        columns=[Column("bench", bench_name, code=True),
+                 Column("gas_verify", "gas_verify", fmt_int, right=True),
+                 Column("denom", "security_metric_type", code=True),
+                 Column("value", "security_metric_value", fmt_repr, right=True),
+                 Column("gas/bit", "gas_per_secure_bit", fmt_repr, right=True),
+                 Column("vendor commit", lambda b, r, c: str(r.get("commit", ""))[:12], code=True),
+                 Column("sec192", sec192),
+                 Column("notes", proof_and_notes, clip(93))],
+        head=["## ML-DSA-65 (vendor / pinned ref) — measured points",
+              "",
+              "These rows are produced by `scripts/run_vendor_mldsa.sh` and currently require pinning "
+              f"`MLDSA_REF={MLDSA_REF}` because upstream `main` does not "
+              "contain the gas harness tests (`test_verify_gas_poc`, `PreA_ComputeW_GasMicro`) yet.",
+              "",
+              "Note: the dataset currently records ML-DSA-65 rows with `security_metric_type=lambda_eff` "
+              "and `value=128`. To avoid rewriting later, the table keeps that denominator, and `notes` "
+              "additionally reports `security_equiv_bits=192` and `gas/bit@192` (= gas_verify/192).",
+              "",
+              vector_pack,
+              "Reproduce:",
+              "",
+              "```bash",
+              f"export MLDSA_REF={MLDSA_REF}",
+              "bash scripts/run_vendor_mldsa.sh",
+              "bash scripts/make_reports.sh",
+              "```",
+              ""],
+        missing=True,
+    ),
+    Section(
+        name="falcon",
+        marker="FALCON_VENDOR",
+        repo="QuantumAccount",
+        benches=[Bench("falcon_verifySignature_log", "falcon",
+                       note="log-isolated; Foundry logs: test_falcon_verify_gas_log => 'gas_falcon_verify: <N>'"),
+                 Bench("qa_validateUserOp_userop_log", "falcon",
+                       note="log-isolated; Foundry logs: test_validateUserOp_gas_log => 'gas_validateUserOp: <N>'"),
+                 Bench("falcon_getUserOpHash_via_entry", "falcon",
+                       note="AA surface: EntryPoint hashing only (not end-to-end AA execution)"),
+                 Bench("falcon_handleOps_userOp_e2e", "falcon",
+                       note="end-to-end AA (`handleOps`); treat as protocol-surface upper bound",
+                       weakest_link=True)],
+        columns=[Column("bench", bench_name, code=True),
+                 Column("gas", "gas_verify", fmt_int, right=True),
+                 Column("security_metric", "security_metric_type", code=True),
+                 Column("bits", "security_metric_value", fmt_int, right=True),
+                 Column("gas/bit", "gas_per_secure_bit", fmt_fixed(10), right=True),
+                 Column("repo@commit", repo_at),
+                 Column("security_model", "security_model", lambda v: str(v or ""), code=True),
+                 Column("notes", bench_note)],
+        head=["### Falcon vendor (QuantumAccount) — pinned ref", ""],
+        foot=["",
+              "Notes:",
+              "- Vendor is pinned by commit in dataset: {repo_at}.",
+              "- `security_equiv_bits = 256` is used as the Falcon-1024 normalization denominator in this repo."],
+    ),
+    Section(
+        name="dilithium",
+        marker="DILITHIUM_VENDOR",
+        repo="ZKNoxHQ/ETHDILITHIUM",
+        benches=[Bench("dilithium_verify_nistkat", "dilithium",
+                       note="path-pinned; Foundry: test/ZKNOX_dilithiumKATS.t.sol:testVerify"),
+                 Bench("ethdilithium_verify_evmfriendly", "dilithium",
+                       note="path-pinned; Foundry: test/ZKNOX_ethdilithiumKAT.t.sol:testVerify")],
+        columns=[Column("bench", bench_name, code=True),
+                 Column("gas", "gas_verify", fmt_int, right=True),
+                 Column("security_metric", "security_metric_type", code=True),
+                 Column("bits", "security_metric_value", fmt_bits, right=True),
+                 Column("gas/bit", "gas_per_secure_bit", fmt_repr, right=True),
+                 Column("repo@commit", repo_at),
+                 Column("security_model", lambda b, r, c: r.get("security_model") or r.get("security_model_type")
+                        or "standalone", code=True),
+                 Column("notes", row_and_bench_note)],
+        head=["### Dilithium vendor (ZKNoxHQ/ETHDILITHIUM) — pinned ref", ""],
+        foot=["",
+              "Notes:",
+              "- Vendor is pinned by commit in dataset: {repo_at}.",
+              "- `dilithium_verify_nistkat` is the NIST-shape verifier in the vendor repo.",
+              "- `ethdilithium_verify_evmfriendly` is the EVM-friendly variant in the same vendor repo.",
+              "- Recorded points are signature verification only (sig::verify); AA end-to-end surfaces "
+              "(validateUserOp/handleOps) are not yet measured for this vendor.",
+              "- Denominator here uses `security_equiv_bits` (override SEC_BITS_* in the runner if you confirm "
+              "a different category)."],
+        empty="| _(missing)_ | 0 | `security_equiv_bits` | 0 | 0 | {repo_at} | `standalone` | "
+              "run scripts/run_vendor_dilithium_ethdilithium.sh |",
+        default=False,
+    ),
+    Section(
+        name="ethdilithium",
+        marker="ETHDILITHIUM_VENDOR",
+        repo="ZKNoxHQ/ETHDILITHIUM",
+        benches=[Bench("ethdilithium_eth_verify_log", "dilithium", label="verify (ETH mode, log)"),
+                 Bench("ethdilithium_nist_verify_log", "dilithium", label="verify (NIST mode, log)"),
+                 Bench("ethdilithium_p256verify_log", "p256", label="P-256 verify micro (log)")],
+        columns=[Column("bench_name", bench_name, code=True),
+                 Column("scheme", lambda b, r, c: b.scheme, code=True, right=True),
+                 Column("description", lambda b, r, c: b.label),
+                 Column("gas_verify", "gas_verify", fmt_int, right=True),
+                 Column("security_metric", "security_metric_type", code=True),
+                 Column("value", lambda b, r, c: r.get("security_metric_value", 128.0), fmt_fixed(6), right=True),
+                 Column("gas/bit", "gas_per_secure_bit", fmt_fixed(6), right=True),
+                 Column("vendor_commit", vendor_commit, code=True),
+                 Column("vendor_path", vendor_path, code=True),
+                 Column("notes", "notes", clip(110))],
+        head=["",
+              "### Vendor snapshot: ZKNoxHQ/ETHDILITHIUM",
+              "",
+              "- Source: `ZKNoxHQ/ETHDILITHIUM` (pinned by commit)",
+              "- Runner: `scripts/run_vendor_ethdilithium.sh` (log-extracted `Gas used:`; excludes FFI-based tests "
+              "like `testVerifyShorter()`)",
+              ""],
+        foot=["",
+              "Notes:",
+              "- `lambda_eff=128` here is a budgeting denominator (not a finalized security-equivalence mapping for "
+              "Dilithium variants).",
+              "- If/when we normalize Dilithium to `security_equiv_bits`, we will add `secXXX=...` and `gpbXXX=...` "
+              "annotations similar to MLDSA65.",
+              ""],
+    ),
+]
+
+BY_NAME = {s.name: s for s in SECTIONS}
+
+
+# ---- latest-per-bench index ----
+
+def parse_ts(ts: Any) -> float:
+    """Epoch seconds of an ISO 8601 ts_utc (naive = UTC); -inf when missing or unparsable."""
+    s = str(ts or "")
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return float("-inf")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+Index = Dict[Tuple[str, str], Dict[str, Tuple[float, Row]]]
+
+
+def build_index(rows: List[Row], sections: List[Section]) -> Index:
+    """(scheme, bench_name) -> repo -> (ts, latest row), for the benches the sections declare."""
+    wanted = {(b.scheme, b.name) for s in sections for b in s.benches}
+    index: Index = {}
+    for r in rows:
+        key = (str(r.get("scheme", "")), str(r.get("bench_name", "")))
+        if key not in wanted:
+            continue
+        ts = parse_ts(r.get("ts_utc"))
+        per_repo = index.setdefault(key, {})
+        repo = str(r.get("repo", ""))
+        if repo not in per_repo or ts >= per_repo[repo][0]:
+            per_repo[repo] = (ts, r)
+    return index
+
+
+def pick(section: Section, index: Index) -> Dict[str, Row]:
+    """bench_name -> latest row, in bench order (benches without data are left out)."""
+    picked: Dict[str, Row] = {}
+    for b in section.benches:
+        per_repo = index.get((b.scheme, b.name), {})
+        if section.repo is not None:
+            hit = per_repo.get(section.repo)
+        else:
+            hit = max(per_repo.values(), key=lambda t: t[0], default=None)
+        if hit is not None:
+            picked[b.name] = hit[1]
+    return picked
+
+
+# ---- rendering ----
+
+def context(section: Section, picked: Dict[str, Row]) -> Context:
+    ctx: Context = {}
+    if section.repo is not None:
+        commit = next((str(r.get("commit") or "") for r in picked.values()), "")[:11]
+        ctx["repo_at"] = f"`{section.repo}`@`{commit or '(none)'}`"
+    return ctx
+
+
+def _expand(lines: Lines, picked: Dict[str, Row], ctx: Context) -> List[str]:
+    out: List[str] = []
+    for ln in lines:
+        out.extend(ln(picked, ctx) if callable(ln) else [ln.format(**ctx)])
+    return out
+
+
+def _cell(col: Column, b: Bench, r: Row, ctx: Context) -> str:
+    v = r.get(col.get, "") if isinstance(col.get, str) else col.get(b, r, ctx)
+    s = col.fmt(v)
+    return f"`{s}`" if col.code else s
+
+
+def render(section: Section, picked: Dict[str, Row]) -> str:
+    """The block text, markers included (no trailing newline)."""
+    ctx = context(section, picked)
+    cols = section.columns
+    lines = [section.begin]
+    lines.extend(_expand(section.head, picked, ctx))
+    lines.append("| " + " | ".join(c.header for c in cols) + " |")
+    lines.append("|" + "|".join("---:" if c.right else "---" for c in cols) + "|")
+    if not picked and section.empty is not None:
+        lines.append(section.empty.format(**ctx))
+    for b in section.benches:
+        r = picked.get(b.name)
+        if r is not None:
+            lines.append("| " + " | ".join(_cell(c, b, r, ctx) for c in cols) + " |")
+        elif section.missing:
+            lines.append(f"| `{b.name}` | _missing_ |" + "  |" * (len(cols) - 2))
+    lines.extend(_expand(section.foot, picked, ctx))
+    lines.append(section.end)
+    return "\n".join(lines)
+
+
+def splice(doc: str, blocks: Dict[str, str]) -> str:
+    """Replace or insert every block (marker -> text) in one pass over `doc`."""
+    for marker in blocks:
+        if (f"<!-- {marker}_BEGIN -->" in doc) != (f"<!-- {marker}_END -->" in doc):
+            raise SystemExit(f"unbalanced {marker}_BEGIN/_END markers in report; refusing to patch")
+
+    # doc -> [(marker or None, text)]: free text and marker blocks, in document order
+    parts: List[Tuple[Optional[str], str]] = []
+    pos = 0
+    for m in BLOCK_RX.finditer(doc):
+        parts.append((None, doc[pos:m.start()]))
+        parts.append((m.group(1), blocks.get(m.group(1), m.group(0))))
+        pos = m.end()
+    parts.append((None, doc[pos:]))
+
+    order = [s.marker for s in SECTIONS]
+    for marker, text in blocks.items():
+        present = [p[0] for p in parts]
+        if marker in present:
+            continue
+        i = order.index(marker) if marker in order else len(order)
+        before = [present.index(o) for o in order[:i] if o in present]
+        after = [present.index(o) for o in order[i + 1:] if o in present]
+        at = max(before) + 1 if before else min(after) if after else len(parts)
+        parts.insert(at, (marker, text))
+
+    texts = [t.strip("\n") if k is not None or n else t.rstrip("\n") for n, (k, t) in enumerate(parts)]
+    return "\n\n".join(t for t in texts if t) + "\n"
+
+
+def load_rows(path: Path) -> List[Row]:
+    rows: List[Row] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict):
+                rows.append(obj)
+    return rows
+
+
+def patch(doc: str, rows: List[Row], sections: List[Section]) -> str:
+    index = build_index(rows, sections)
+    return splice(doc, {s.marker: render(s, pick(s, index)) for s in sections})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Render the vendor sections of protocol_readiness.md.")
+    ap.add_argument("--jsonl", default=str(DATA_JSONL))
+    ap.add_argument("--report", default=str(OUT_MD))
+    ap.add_argument("--only", default="", help=f"comma-separated sections ({', '.join(BY_NAME)})")
+    ap.add_argument("--check", action="store_true", help="do not write; exit 1 if the report would change")
+    args = ap.parse_args(argv)
+
+    names = [n.strip() for n in args.only.split(",") if n.strip()]
+    for n in names:
+        if n not in BY_NAME:
+            raise SystemExit(f"unknown section {n!r} (sections: {', '.join(BY_NAME)})")
+    sections = [s for s in SECTIONS if (s.name in names if names else s.default)]
+
+    jsonl_path, report_path = Path(args.jsonl), Path(args.report)
+    if not jsonl_path.exists():
+        raise SystemExit(f"JSONL not found: {jsonl_path}")
+    if not report_path.exists():
+        raise SystemExit(f"Report not found: {report_path}; run scripts/make_protocol_readiness.py first")
+
+    old = report_path.read_text(encoding="utf-8")
+    new = patch(old, load_rows(jsonl_path), sections)
+    markers = ", ".join(s.marker for s in sections)
+    if args.check:
+        if new != old:
+            print(f"[blocks] {report_path} is out of date ({markers})", file=sys.stderr)
+            return 1
+        return 0
+    if new != old:
+        report_path.write_text(new, encoding="utf-8")
+    print(f"[blocks] wrote {report_path} ({markers})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
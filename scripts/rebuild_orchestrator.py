@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parallel dataset rebuild: run all vendor runners as a DAG with bounded concurrency.
+
+Usage:
+  python3 scripts/rebuild_orchestrator.py                    # all vendors, merge + reports
+  python3 scripts/rebuild_orchestrator.py --jobs 4 --only mldsa,ecdsa
+  python3 scripts/rebuild_orchestrator.py --reset            # start from an empty dataset
+  python3 scripts/rebuild_orchestrator.py --dry-run          # print the schedule only
+
+Model:
+- Each vendor runner (scripts/run_*.sh) is a DAG node. Edges only exist where two
+  runners share a vendor checkout (they `git checkout` the same directory), so
+  independent vendors run concurrently up to --jobs.
+- Runners write through parse_bench.py into a per-vendor staging file
+  (PARSE_BENCH_STAGE) and never touch data/results.jsonl directly.
+- A single writer task merges staged rows into data/results.jsonl with the replace
+  semantics each runner has when run on its own (Vendor.replace): by default an existing
+  row is dropped only if it shares (repo, commit, scheme, bench_name) with an incoming row,
+  so other commits' history stays (the key dedup_results.py and the QuantumAccount Falcon
+  runner's prune use); run_protocol_surfaces.sh and run_vendor_falcon.sh prune their benches
+  regardless of commit, so their rows replace on (repo, scheme, bench_name).
+- Reports are regenerated once at the end (runners get SKIP_REPORTS=1).
+
+Per-vendor stdout/stderr go to .tmp/rebuild/<vendor>.log (all attempts appended).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+DATA_CSV = ROOT / "data" / "results.csv"
+WORK_DIR = ROOT / ".tmp" / "rebuild"
+
+REPLACE_KEY = ("repo", "commit", "scheme", "bench_name")
+REPLACE_ANY_COMMIT = ("repo", "scheme", "bench_name")
+
+
+@dataclass
+class Vendor:
+    name: str
+    script: str
+    after: List[str] = field(default_factory=list)
+    env: Dict[str, str] = field(default_factory=dict)
+    timeout_s: float = 1800.0
+    replace: Tuple[str, ...] = REPLACE_KEY   # fields an older row must share with a new one to be dropped
+
+
+# QuantumAccount runners share vendors/QuantumAccount (vendors/quantumaccount on
+# case-insensitive filesystems), and the two Dilithium runners share vendors/ETHDILITHIUM,
+# so those chains are serialized. run_vendor_falcon.sh does not clone, so it runs last.
+VENDORS: List[Vendor] = [
+    Vendor("mldsa", "run_vendor_mldsa.sh",
+           env={"MLDSA_REF": os.environ.get("MLDSA_REF", "feature/mldsa-ntt-opt-phase12-erc7913-packedA")}),
+    Vendor("ecdsa", "run_ecdsa.sh", timeout_s=600.0),
+    Vendor("protocol_surfaces", "run_protocol_surfaces.sh", timeout_s=900.0, replace=REPLACE_ANY_COMMIT),
+    Vendor("quantumaccount", "run_vendor_quantumaccount.sh",
+           env={"QA_REF": os.environ.get("QA_REF", "main")}),
+    Vendor("falcon_quantumaccount", "run_vendor_falcon_quantumaccount.sh", after=["quantumaccount"]),
+    Vendor("falcon", "run_vendor_falcon.sh", after=["falcon_quantumaccount"], replace=REPLACE_ANY_COMMIT),
+    Vendor("ethdilithium", "run_vendor_ethdilithium.sh"),
+    Vendor("dilithium_ethdilithium", "run_vendor_dilithium_ethdilithium.sh", after=["ethdilithium"]),
+]
+
+
+@dataclass
+class Outcome:
+    name: str
+    status: str          # ok | failed | timeout | skipped
+    attempts: int
+    rows: int
+    seconds: float
+    log: Path
+
+
+def select_vendors(only: Optional[Set[str]]) -> Dict[str, Vendor]:
+    by_name = {v.name: v for v in VENDORS}
+    if not only:
+        return by_name
+    unknown = sorted(only - set(by_name))
+    if unknown:
+        raise SystemExit(f"unknown vendor(s): {', '.join(unknown)} (known: {', '.join(by_name)})")
+    # Edges to deselected vendors are dropped: the user asked for a partial rebuild.
+    picked: Dict[str, Vendor] = {}
+    for n in only:
+        v = by_name[n]
+        picked[n] = Vendor(v.name, v.script, [a for a in v.after if a in only], dict(v.env), v.timeout_s)
+    return picked
+
+
+def topo_order(vendors: Dict[str, Vendor]) -> List[str]:
+    """Kahn's algorithm; raises on unknown edges or cycles."""
+    indeg = {n: 0 for n in vendors}
+    for v in vendors.values():
+        for a in v.after:
+            if a not in vendors:
+                raise SystemExit(f"{v.name}: depends on unknown vendor {a}")
+            indeg[v.name] += 1
+
+    order: List[str] = []
+    ready = sorted(n for n, d in indeg.items() if d == 0)
+    while ready:
+        n = ready.pop(0)
+        order.append(n)
+        for v in vendors.values():
+            if n in v.after:
+                indeg[v.name] -= 1
+                if indeg[v.name] == 0:
+                    ready.append(v.name)
+        ready.sort()
+
+    if len(order) != len(vendors):
+        raise SystemExit("vendor DAG has a cycle")
+    return order
+
+
+def _read_rows(path: Path) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    if not path.exists():
+        return rows
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                obj = json.loads(s)
+            except Exception:
+                continue
+            if isinstance(obj, dict):
+                rows.append(obj)
+    return rows
+
+
+def _replace_key(r: Dict[str, Any], fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    return tuple(r.get(k) for k in fields)
+
+
+def merge_rows(jsonl_path: Path, incoming: List[Dict[str, Any]], replace: Tuple[str, ...] = REPLACE_KEY) -> int:
+    """
+    Replace semantics of the runner that staged `incoming`: drop existing rows that share the
+    `replace` fields with an incoming row, then append. Atomic rewrite.
+    """
+    if not incoming:
+        return 0
+    keys = {_replace_key(r, replace) for r in incoming}
+
+    kept: List[str] = []
+    if jsonl_path.exists():
+        with jsonl_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                s = line.strip()
+                if not s:
+                    continue
+                try:
+                    obj = json.loads(s)
+                except Exception:
+                    kept.append(s)
+                    continue
+                if isinstance(obj, dict) and _replace_key(obj, replace) in keys:
+                    continue
+                kept.append(s)
+
+    kept.extend(json.dumps(r, ensure_ascii=False) for r in incoming)
+
+    tmp = jsonl_path.with_suffix(".tmp")
+    tmp.write_text("\n".join(kept) + "\n", encoding="utf-8")
+    tmp.replace(jsonl_path)
+    return len(incoming)
+
+
+async def _run_once(v: Vendor, stage: Path, log: Path, timeout_s: float) -> str:
+    env = dict(os.environ)
+    env.update(v.env)
+    env["RESET_DATA"] = "0"
+    env["SKIP_REPORTS"] = "1"
+    env["PARSE_BENCH_STAGE"] = str(stage)
+
+    with log.open("ab") as lf:
+        proc = await asyncio.create_subprocess_exec(
+            "bash", str(ROOT / "scripts" / v.script),
+            cwd=str(ROOT),
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=lf,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,  # own process group, so a timeout kills forge too
+        )
+        try:
+            rc = await asyncio.wait_for(proc.wait(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            return "timeout"
+    return "ok" if rc == 0 else "failed"
+
+
+async def run_vendor(
+    v: Vendor,
+    sem: asyncio.Semaphore,
+    deps: List["asyncio.Task[Outcome]"],
+    writer_q: "asyncio.Queue[Optional[Tuple[str, List[Dict[str, Any]], Tuple[str, ...]]]]",
+    retries: int,
+    timeout_override: Optional[float],
+) -> Outcome:
+    log = WORK_DIR / f"{v.name}.log"
+    stage = WORK_DIR / f"{v.name}.stage.jsonl"
+
+    dep_results = [await d for d in deps]
+    failed_deps = [o.name for o in dep_results if o.status != "ok"]
+    if failed_deps:
+        print(f"[skip] {v.name}: upstream failed ({', '.join(failed_deps)})")
+        return Outcome(v.name, "skipped", 0, 0, 0.0, log)
+
+    timeout_s = timeout_override if timeout_override is not None else v.timeout_s
+    async with sem:
+        t0 = time.monotonic()
+        status = "failed"
+        attempt = 0
+        for attempt in range(1, retries + 2):
+            stage.unlink(missing_ok=True)
+            with log.open("a", encoding="utf-8") as lf:
+                lf.write(f"\n==== {v.name} attempt {attempt} ({v.script}, timeout={timeout_s:.0f}s) ====\n")
+            print(f"[run] {v.name} (attempt {attempt})")
+            status = await _run_once(v, stage, log, timeout_s)
+            if status == "ok":
+                break
+            print(f"[warn] {v.name}: attempt {attempt} {status} (see {log.relative_to(ROOT)})")
+        dt = time.monotonic() - t0
+
+    rows = _read_rows(stage) if status == "ok" else []
+    if rows:
+        await writer_q.put((v.name, rows, v.replace))
+    print(f"[done] {v.name}: {status} rows={len(rows)} {dt:.1f}s")
+    return Outcome(v.name, status, attempt, len(rows), dt, log)
+
+
+async def dataset_writer(
+    jsonl_path: Path,
+    q: "asyncio.Queue[Optional[Tuple[str, List[Dict[str, Any]], Tuple[str, ...]]]]",
+) -> int:
+    """The only coroutine that writes the dataset; merges run one at a time."""
+    total = 0
+    while True:
+        item = await q.get()
+        if item is None:
+            return total
+        name, rows, replace = item
+        n = await asyncio.to_thread(merge_rows, jsonl_path, rows, replace)
+        total += n
+        print(f"[merge] {name}: {n} rows -> {jsonl_path.relative_to(ROOT)}")
+
+
+async def orchestrate(
+    vendors: Dict[str, Vendor],
+    jobs: int,
+    retries: int,
+    timeout_override: Optional[float],
+) -> Tuple[List[Outcome], int]:
+    WORK_DIR.mkdir(parents=True, exist_ok=True)
+    for v in vendors.values():
+        (WORK_DIR / f"{v.name}.log").write_text("", encoding="utf-8")
+
+    sem = asyncio.Semaphore(jobs)
+    q: "asyncio.Queue[Optional[Tuple[str, List[Dict[str, Any]], Tuple[str, ...]]]]" = asyncio.Queue()
+    writer = asyncio.create_task(dataset_writer(DATA_JSONL, q))
+
+    tasks: Dict[str, "asyncio.Task[Outcome]"] = {}
+    for name in topo_order(vendors):
+        v = vendors[name]
+        deps = [tasks[a] for a in v.after]
+        tasks[name] = asyncio.create_task(run_vendor(v, sem, deps, q, retries, timeout_override))
+
+    outcomes = list(await asyncio.gather(*tasks.values()))
+    await q.put(None)
+    merged = await writer
+    return outcomes, merged
+
+
+def _run_step(argv: List[str]) -> None:
+    import subprocess
+    subprocess.run(argv, cwd=str(ROOT), check=True)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Rebuild the dataset by running vendor runners in parallel.")
+    ap.add_argument("--jobs", type=int, default=min(len(VENDORS), os.cpu_count() or 1),
+                    help="max concurrent runners (default: min(#vendors, #cpus))")
+    ap.add_argument("--only", default="", help="comma-separated vendor names")
+    ap.add_argument("--retries", type=int, default=1, help="retries per vendor after a failure/timeout")
+    ap.add_argument("--timeout", type=float, default=None, help="override every per-vendor timeout (seconds)")
+    ap.add_argument("--reset", action="store_true", help="truncate data/results.* first (like rebuild_dataset.sh)")
+    ap.add_argument("--no-reports", action="store_true", help="merge only; skip CSV regen + reports")
+    ap.add_argument("--dry-run", action="store_true", help="print the schedule and exit")
+    args = ap.parse_args()
+
+    only = {s.strip() for s in args.only.split(",") if s.strip()} or None
+    vendors = select_vendors(only)
+    order = topo_order(vendors)
+
+    if args.dry_run:
+        for n in order:
+            v = vendors[n]
+            after = ", ".join(v.after) if v.after else "-"
+            print(f"{n:24s} scripts/{v.script:40s} after={after} timeout={args.timeout or v.timeout_s:.0f}s")
+        return 0
+
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be >= 1")
+
+    if args.reset:
+        DATA_JSONL.parent.mkdir(parents=True, exist_ok=True)
+        DATA_JSONL.write_text("", encoding="utf-8")
+        DATA_CSV.write_text("", encoding="utf-8")
+
+    t0 = time.monotonic()
+    outcomes, merged = asyncio.run(orchestrate(vendors, args.jobs, args.retries, args.timeout))
+    wall = time.monotonic() - t0
+
+    print("")
+    print(f"{'vendor':24s} {'status':8s} {'tries':>5s} {'rows':>5s} {'secs':>8s}  log")
+    for o in sorted(outcomes, key=lambda o: o.name):
+        print(f"{o.name:24s} {o.status:8s} {o.attempts:>5d} {o.rows:>5d} {o.seconds:>8.1f}  {o.log.relative_to(ROOT)}")
+    slowest = max((o.seconds for o in outcomes), default=0.0)
+    print(f"merged rows={merged} wall={wall:.1f}s slowest_vendor={slowest:.1f}s")
+
+    if not args.no_reports:
+        _run_step([sys.executable, "scripts/parse_bench.py", "--regen", str(DATA_JSONL)])
+        _run_step(["bash", "scripts/make_reports.sh"])
+
+    return 0 if all(o.status == "ok" for o in outcomes) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Exhaustive differential checker for the ML-DSA modular reductions (q = 8380417).
+
+Every variant is a vectorized NumPy model of one reduction, bit-exact with its source
+(uint64 wrap-around where the contract masks to 64 bits, int32 casts where the C reference
+truncates). Inputs are scanned in chunks and compared with exact arithmetic:
+
+  mod   r == x mod q                  (canonical variants)
+  mont  r == x * 2^-32 mod q
+  non-canonical (lazy) variants only need r ≡ target (mod q) and r within their output bound.
+
+Each domain is either scanned in full (size <= --max-direct) or, when too large (e.g. all
+products a*b < q^2 = 7e13), by its two edge periods: the first and last `period` inputs.
+For a fixed residue x mod period (2^32 for Montgomery: the low word fixes the quotient
+digit; q for Barrett: the residue fixes x - floor(x/q)*q) the output is h + carry with h
+monotone in x, so the extreme outputs of every residue class sit in the two edges. The
+argument needs the model not to wrap inside the domain; a wrapping domain shows up as
+counterexamples in the top edge anyway.
+
+Variants:
+  montgomery            MontgomeryMLDSA.montgomeryReduce (reduce_once, output [0, q))
+  montgomery_lazy       same without the final conditional subtract, output [0, 2q)
+  montgomery_signed     FIPS-204 / pq-crystals int64 -> int32 reduction, output (-q, q)
+  barrett               BarrettMLDSA_experimental.barrettReduce (mul256 with MU = 2^256 div q)
+  barrett_one_sub       same with a single conditional subtract
+  reduce32              pq-crystals reduce32, int32 in, output [-6283009, 6283008]
+  reduce_once           the add/sub tail `if (r >= Q) r -= Q` on [0, 2q)
+
+Usage:
+  python3 scripts/reduction_check.py                      # every variant, default domains
+  python3 scripts/reduction_check.py --variant montgomery_lazy --variant barrett_one_sub
+  python3 scripts/reduction_check.py --variant reduce32 --domain int32 --jobs 8
+  python3 scripts/reduction_check.py --list
+  python3 scripts/reduction_check.py --json .tmp/reduction_check.json
+
+Exit status is 1 if any scanned domain has a counterexample or bound violation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+Q = 8380417
+R = 1 << 32
+R_INV = pow(R, -1, Q)           # 8265825
+Q_INV = 4236238847              # -q^-1 mod 2^32, MontgomeryMLDSA.Q_INV
+Q_INV_SIGNED = 58728449         # q^-1 mod 2^32, pq-crystals QINV
+MU = (1 << 256) // Q            # BarrettMLDSA.MU
+
+M32 = np.uint64(0xFFFFFFFF)
+U32 = np.uint64(32)
+QU = np.uint64(Q)
+
+# inputs per worker task and per NumPy chunk inside a task
+TASK = 1 << 26
+CHUNK = 1 << 22
+EXAMPLES = 8
+
+
+# ---- models ----
+
+def _reduce_once_i64(c: np.ndarray) -> np.ndarray:
+    c -= Q
+    c += (c >> 63) & Q
+    return c
+
+
+def _montgomery_c(x: np.ndarray) -> np.ndarray:
+    # c = (x + ((x mod 2^32) * Q_INV mod 2^32) * q) >> 32, uint64 wrap-around as `& MASK64`
+    a = x & M32
+    a *= np.uint64(Q_INV)
+    a &= M32
+    a *= QU
+    a += x
+    a >>= U32
+    return a.view(np.int64)
+
+
+def montgomery(x: np.ndarray) -> np.ndarray:
+    return _reduce_once_i64(_montgomery_c(x))
+
+
+def montgomery_lazy(x: np.ndarray) -> np.ndarray:
+    return _montgomery_c(x)
+
+
+def montgomery_signed(x: np.ndarray) -> np.ndarray:
+    t = (x.astype(np.int32).astype(np.int64) * Q_INV_SIGNED).astype(np.int32).astype(np.int64)
+    return (x - t * Q) >> 32
+
+
+_MU_LIMBS = [np.uint64((MU >> (32 * i)) & 0xFFFFFFFF) for i in range(8)]
+
+
+def _mulhi256_mu(x: np.ndarray) -> np.ndarray:
+    """(x * MU) >> 256 for uint64 x, exact, schoolbook on 32-bit limbs (mul256 for x < 2^128)."""
+    xs = (x & M32, x >> U32)
+    cols = [np.zeros_like(x) for _ in range(10)]
+    for i, xi in enumerate(xs):
+        for j, mj in enumerate(_MU_LIMBS):
+            p = xi * mj
+            cols[i + j] += p & M32
+            cols[i + j + 1] += p >> U32
+    carry = np.zeros_like(x)
+    for k in range(10):
+        cols[k] += carry
+        carry = cols[k] >> U32
+        cols[k] &= M32
+    return cols[8] | (cols[9] << U32)
+
+
+def _barrett(x: np.ndarray, subs: int) -> np.ndarray:
+    r = x - _mulhi256_mu(x) * QU
+    for _ in range(subs):
+        r = np.where(r >= QU, r - QU, r)
+    return r.astype(np.int64)
+
+
+def barrett(x: np.ndarray) -> np.ndarray:
+    return _barrett(x, 2)
+
+
+def barrett_one_sub(x: np.ndarray) -> np.ndarray:
+    return _barrett(x, 1)
+
+
+def reduce32(x: np.ndarray) -> np.ndarray:
+    t = ((x + (1 << 22)).astype(np.int32) >> 23).astype(np.int64)
+    return (x - t * Q).astype(np.int32).astype(np.int64)
+
+
+def reduce_once(x: np.ndarray) -> np.ndarray:
+    return _reduce_once_i64(x.astype(np.int64))
+
+
+# ---- variant registry ----
+
+# domain: (label, lo, hi) with hi exclusive
+Domain = Tuple[str, int, int]
+
+VARIANTS: Dict[str, Dict[str, object]] = {
+    "montgomery": {
+        "fn": montgomery, "dtype": np.uint64, "target": "mont", "canonical": True,
+        "bound": (0, Q - 1), "period": R,
+        "source": "contracts/field/MontgomeryMLDSA.sol montgomeryReduce",
+        "domains": [("products", 0, (Q - 1) ** 2 + 1), ("q*2^32", 0, Q * R), ("u64", 0, 1 << 64)],
+    },
+    "montgomery_lazy": {
+        "fn": montgomery_lazy, "dtype": np.uint64, "target": "mont", "canonical": False,
+        "bound": (0, 2 * Q - 1), "period": R,
+        "source": "montgomeryReduce without reduce_once",
+        "domains": [("products", 0, (Q - 1) ** 2 + 1), ("q*2^32", 0, Q * R)],
+    },
+    "montgomery_signed": {
+        "fn": montgomery_signed, "dtype": np.int64, "target": "mont", "canonical": False,
+        "bound": (-Q + 1, Q - 1), "period": R,
+        "source": "FIPS-204 reference montgomery_reduce (int64 -> int32)",
+        "domains": [("signed_products", -(Q - 1) ** 2, (Q - 1) ** 2 + 1), ("2^31*q", -(1 << 31) * Q, (1 << 31) * Q)],
+    },
+    "barrett": {
+        "fn": barrett, "dtype": np.uint64, "target": "mod", "canonical": True,
+        "bound": (0, Q - 1), "period": Q,
+        "source": "research/experimental/BarrettMLDSA_experimental.sol barrettReduce",
+        "domains": [("products", 0, (Q - 1) ** 2 + 1), ("u64", 0, 1 << 64)],
+    },
+    "barrett_one_sub": {
+        "fn": barrett_one_sub, "dtype": np.uint64, "target": "mod", "canonical": True,
+        "bound": (0, Q - 1), "period": Q,
+        "source": "barrettReduce with one conditional subtract",
+        "domains": [("products", 0, (Q - 1) ** 2 + 1), ("u64", 0, 1 << 64)],
+    },
+    "reduce32": {
+        "fn": reduce32, "dtype": np.int64, "target": "mod", "canonical": False,
+        "bound": (-6283009, 6283008), "period": 1 << 23,
+        "source": "FIPS-204 reference reduce32",
+        "domains": [("documented", -(1 << 31), (1 << 31) - (1 << 22)), ("int32", -(1 << 31), 1 << 31)],
+    },
+    "reduce_once": {
+        "fn": reduce_once, "dtype": np.int64, "target": "mod", "canonical": True,
+        "bound": (0, Q - 1), "period": Q,
+        "source": "BarrettMLDSA add/sub tail, montgomeryReduce tail",
+        "domains": [("2q", 0, 2 * Q)],
+    },
+}
+
+DEFAULT_DOMAINS = {"montgomery": ["products", "q*2^32"], "barrett": ["products"], "barrett_one_sub": ["products"],
+                   "reduce32": ["documented"]}
+
+
+# ---- scan ----
+
+def _target(x: np.ndarray, kind: str) -> np.ndarray:
+    if x.dtype == np.uint64:
+        m = (x % QU).view(np.int64)
+    else:
+        m = x % Q
+    if kind == "mont":
+        m *= R_INV
+        m %= Q
+    return m
+
+
+def scan_range(task: Tuple[str, int, int]) -> Dict[str, object]:
+    """Worker: check inputs [lo, hi) of one variant; returns counts, output extremes, examples."""
+    name, lo, hi = task
+    v = VARIANTS[name]
+    fn: Callable = v["fn"]
+    blo, bhi = v["bound"]
+    n = bad_val = bad_bound = 0
+    rmin: Optional[int] = None
+    rmax: Optional[int] = None
+    examples: List[Dict[str, object]] = []
+    for a in range(lo, hi, CHUNK):
+        b = min(a + CHUNK, hi)
+        x = np.arange(a, b, dtype=v["dtype"])
+        r = fn(x)
+        want = _target(x, v["target"])
+        if v["canonical"]:
+            wrong = r != want
+        else:
+            wrong = (r - want) % Q != 0
+        oob = (r < blo) | (r > bhi)
+        n += b - a
+        bad_val += int(wrong.sum())
+        bad_bound += int(oob.sum())
+        lo_r, hi_r = int(r.min()), int(r.max())
+        rmin = lo_r if rmin is None else min(rmin, lo_r)
+        rmax = hi_r if rmax is None else max(rmax, hi_r)
+        if len(examples) < EXAMPLES and (wrong.any() or oob.any()):
+            for i in np.flatnonzero(wrong | oob)[:EXAMPLES - len(examples)]:
+                examples.append({"x": int(x[i]), "got": int(r[i]), "want": int(want[i]),
+                                 "value_ok": not bool(wrong[i]), "in_bound": not bool(oob[i])})
+    return {"n": n, "bad_val": bad_val, "bad_bound": bad_bound, "rmin": rmin, "rmax": rmax, "examples": examples}
+
+
+def plan(domain: Domain, period: int, max_direct: int) -> Tuple[str, List[Tuple[int, int]]]:
+    _, lo, hi = domain
+    if hi - lo <= max(max_direct, 2 * period):
+        return "exhaustive", [(lo, hi)]
+    return "edges", [(lo, lo + period), (hi - period, hi)]
+
+
+def split(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    out = []
+    for lo, hi in ranges:
+        out += [(a, min(a + TASK, hi)) for a in range(lo, hi, TASK)]
+    return out
+
+
+def merge(parts: List[Dict[str, object]]) -> Dict[str, object]:
+    acc = {"n": 0, "bad_val": 0, "bad_bound": 0, "rmin": None, "rmax": None, "examples": []}
+    for p in parts:
+        acc["n"] += p["n"]
+        acc["bad_val"] += p["bad_val"]
+        acc["bad_bound"] += p["bad_bound"]
+        acc["rmin"] = p["rmin"] if acc["rmin"] is None else min(acc["rmin"], p["rmin"])
+        acc["rmax"] = p["rmax"] if acc["rmax"] is None else max(acc["rmax"], p["rmax"])
+        acc["examples"] += p["examples"][:max(0, EXAMPLES - len(acc["examples"]))]
+    return acc
+
+
+def fmt_int(v: int) -> str:
+    a = abs(v)
+    if a >= 1 << 32 and (a & (a - 1)) == 0:
+        return ("-" if v < 0 else "") + f"2^{a.bit_length() - 1}"
+    return str(v)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Exhaustive differential checker for Montgomery/Barrett reductions.")
+    ap.add_argument("--variant", action="append", default=[], choices=sorted(VARIANTS), help="repeatable; default: all")
+    ap.add_argument("--domain", action="append", default=[], help="domain label (repeatable); default: per variant")
+    ap.add_argument("--all-domains", action="store_true", help="include domains outside the documented/caller range")
+    ap.add_argument("--max-direct", type=int, default=1 << 33, help="scan domains up to this size in full")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--json", default="", help="also write the results as JSON here")
+    ap.add_argument("--list", action="store_true", help="list variants and domains and exit")
+    args = ap.parse_args()
+
+    names = args.variant or list(VARIANTS)
+    if args.list:
+        for name in names:
+            v = VARIANTS[name]
+            print(f"{name}: {v['source']}; output [{v['bound'][0]}, {v['bound'][1]}]"
+                  f"{' canonical' if v['canonical'] else ''}; target {v['target']}")
+            for label, lo, hi in v["domains"]:
+                print(f"  {label:16s} [{fmt_int(lo)}, {fmt_int(hi)})")
+        return 0
+
+    jobs: List[Tuple[str, Domain, str, List[Tuple[int, int]]]] = []
+    for name in names:
+        v = VARIANTS[name]
+        for dom in v["domains"]:
+            if args.domain:
+                if dom[0] not in args.domain:
+                    continue
+            elif not args.all_domains and name in DEFAULT_DOMAINS and dom[0] not in DEFAULT_DOMAINS[name]:
+                continue
+            method, ranges = plan(dom, int(v["period"]), args.max_direct)
+            jobs.append((name, dom, method, ranges))
+    if not jobs:
+        raise SystemExit("nothing to check (unknown --domain for the selected variants?)")
+
+    # domains of one variant often share an edge (e.g. [0, 2^32)); scan each range once
+    tasks = list(dict.fromkeys((name, a, b) for name, _, _, ranges in jobs for a, b in split(ranges)))
+    t0 = time.perf_counter()
+    if args.jobs <= 1 or len(tasks) == 1:
+        parts = list(map(scan_range, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            parts = list(ex.map(scan_range, tasks))
+    dt = time.perf_counter() - t0
+    by_task = dict(zip(tasks, parts))
+
+    results = []
+    for name, dom, method, ranges in jobs:
+        res = merge([by_task[(name, a, b)] for a, b in split(ranges)])
+        v = VARIANTS[name]
+        results.append({
+            "variant": name, "source": v["source"], "domain": dom[0], "lo": dom[1], "hi": dom[2],
+            "method": method, "bound": list(v["bound"]), "canonical": v["canonical"], **res,
+        })
+
+    print("| variant | domain | method | inputs | output range | bound | wrong value | out of bound |")
+    print("|---|---|---|---:|---|---|---:|---:|")
+    for r in results:
+        print(f"| {r['variant']} | {r['domain']} [{fmt_int(r['lo'])}, {fmt_int(r['hi'])}) | {r['method']} | {r['n']} "
+              f"| [{r['rmin']}, {r['rmax']}] | [{r['bound'][0]}, {r['bound'][1]}] | {r['bad_val']} | {r['bad_bound']} |")
+    failed = [r for r in results if r["bad_val"] or r["bad_bound"]]
+    for r in failed:
+        print(f"\nCOUNTEREXAMPLES {r['variant']} / {r['domain']}:")
+        for e in r["examples"]:
+            print(f"  x={e['x']} got={e['got']} want={e['want']}"
+                  f"{'' if e['value_ok'] else ' (wrong value)'}{'' if e['in_bound'] else ' (out of bound)'}")
+
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({"q": Q, "results": results}, indent=2) + "\n", encoding="utf-8")
+
+    total = sum(p["n"] for p in parts)
+    print(f"\nCHECKED {total} inputs in {dt:.1f}s ({total / max(dt, 1e-9) / 1e6:.1f}M/s)"
+          f"{'; FAILED ' + str(len(failed)) + ' domain(s)' if failed else ''}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
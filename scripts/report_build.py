@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Make-style incremental report build: run a report stage only when its inputs changed.
+
+Each stage declares what its output is derived from:
+  - slice    the part of data/results.jsonl it reads (a JSON projection computed here)
+  - scripts  the generator source files (their content is the stage's "version"; the report
+             text templates are embedded in these scripts)
+  - inputs   any other files it reads (e.g. data/gas_attribution.jsonl)
+and where its output lives: a whole file, a whole file minus the vendor marker blocks, or one
+<!-- X_BEGIN --> ... <!-- X_END --> block inside reports/protocol_readiness.md. The block stages are
+the default sections of scripts/readiness_blocks.py; the stale ones are rendered by one invocation.
+
+The fingerprint of every input plus a hash of the output region are stored per stage in
+.tmp/report_build/state.json. A stage runs when any fingerprint differs, when its output region is
+missing, or when the region no longer matches what the build last wrote (hand edit, other tool).
+With nothing changed no generator is started, so a no-op build costs one dataset read.
+
+Usage:
+  python3 scripts/report_build.py                   # build what is stale
+  python3 scripts/report_build.py --dry-run         # list stale stages and why
+  python3 scripts/report_build.py --force --only readiness,falcon_block
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import make_charts
+import readiness_blocks
+import report_weakest_link
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+STATE_JSON = ROOT / ".tmp" / "report_build" / "state.json"
+
+BUILD_VERSION = 1  # bump when a slice definition below changes meaning
+BLOCK_RX = re.compile(r"<!-- ([A-Z0-9_]+)_BEGIN -->.*?<!-- \1_END -->", re.DOTALL)
+
+Rows = List[Dict[str, Any]]
+
+
+@dataclass
+class Stage:
+    name: str
+    cmd: List[str]
+    output: str                              # path relative to ROOT
+    scripts: List[str]
+    select: Callable[[Rows], Any]
+    inputs: List[str] = field(default_factory=list)
+    block: Optional[str] = None              # marker name inside `output` (e.g. FALCON_VENDOR)
+    strip_blocks: bool = False               # output region = file without any marker blocks
+    section: Optional[str] = None            # readiness_blocks section; stale ones run as one `--only a,b`
+
+
+# ---- dataset slices ----
+
+def _weakest_link_slice(rows: Rows) -> Any:
+    """Candidates (weakest_link / depends_on rows) and every row a depends_on token can resolve to."""
+    cand = [r for r in rows if r.get("security_model") == "weakest_link"
+            or (isinstance(r.get("depends_on"), list) and r.get("depends_on"))]
+    refs = {str(d) for r in cand for d in r.get("depends_on") or []}
+    keep = ("scheme", "bench_name", "chain_profile", "security_model", "depends_on",
+            "security_metric_type", "security_metric_value")
+    return [{k: r.get(k) for k in keep} for r in rows
+            if r in cand or report_weakest_link.record_id(r) in refs or str(r.get("bench_name", "")) in refs]
+
+
+def _compile_slice(rows: Rows) -> Any:
+    """What the weakest-link compile (make_protocol_readiness.Record) reads, plus the pareto partition keys."""
+    keep = ("scheme", "category", "bench_name", "bench", "id", "name", "bench_id", "gas", "gas_verify", "gas_surface",
+            "security_equiv_bits", "security_metric_type", "security_metric_value", "effective_security_bits",
+            "depends_on", "ts_utc", "timestamp", "ts", "time", "chain_profile", "surface_layer")
+    return [{k: r[k] for k in keep if k in r} for r in rows]
+
+
+def _block_stage(section: readiness_blocks.Section) -> Stage:
+    return Stage(f"{section.name}_block", ["scripts/readiness_blocks.py"], "reports/protocol_readiness.md",
+                 ["scripts/readiness_blocks.py"], lambda rows: [r for r in rows if section.wants(r)],
+                 block=section.marker, section=section.name)
+
+
+STAGES: List[Stage] = [
+    Stage("csv", ["scripts/parse_bench.py", "--regen", "data/results.jsonl"], "data/results.csv",
+          ["scripts/parse_bench.py"], lambda rows: rows),
+    Stage("weakest_link", ["scripts/report_weakest_link.py"], "reports/weakest_link_report.md",
+          ["scripts/report_weakest_link.py"], _weakest_link_slice),
+    Stage("readiness", ["scripts/make_protocol_readiness.py"], "reports/protocol_readiness.md",
+          ["scripts/make_protocol_readiness.py"], lambda rows: rows,
+          inputs=["data/gas_attribution.jsonl"], strip_blocks=True),
+    *[_block_stage(s) for s in readiness_blocks.SECTIONS if s.default],
+    Stage("pareto", ["scripts/pareto_frontier.py"], "reports/pareto_frontier.md",
+          ["scripts/pareto_frontier.py", "scripts/make_protocol_readiness.py"], _compile_slice),
+    Stage("paths", ["scripts/path_cost.py"], "reports/path_cost.md",
+          ["scripts/path_cost.py", "scripts/make_protocol_readiness.py"], _compile_slice),
+    Stage("charts", ["scripts/make_charts.py"], "docs/gas_per_secure_bit.svg",
+          ["scripts/make_charts.py"], lambda rows: [make_charts.point(r) for r in rows]),
+]
+
+
+# ---- fingerprints ----
+
+def sha256_bytes(b: bytes) -> str:
+    return hashlib.sha256(b).hexdigest()
+
+
+def sha256_json(obj: Any) -> str:
+    return sha256_bytes(json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def file_sha(rel: str) -> Optional[str]:
+    p = ROOT / rel
+    return sha256_bytes(p.read_bytes()) if p.exists() else None
+
+
+def output_region(stage: Stage) -> Optional[str]:
+    p = ROOT / stage.output
+    if not p.exists():
+        return None
+    if stage.block is None and not stage.strip_blocks:
+        return sha256_bytes(p.read_bytes())
+    text = p.read_text(encoding="utf-8")
+    if stage.strip_blocks:
+        return sha256_bytes(BLOCK_RX.sub("", text).encode("utf-8"))
+    m = re.search(rf"<!-- {stage.block}_BEGIN -->.*?<!-- {stage.block}_END -->", text, re.DOTALL)
+    return sha256_bytes(m.group(0).encode("utf-8")) if m else None
+
+
+def fingerprints(stage: Stage, rows: Rows) -> Dict[str, Any]:
+    return {
+        "build": BUILD_VERSION,
+        "scripts": {s: file_sha(s) for s in stage.scripts},
+        "slice": sha256_json(stage.select(rows)),
+        "inputs": {i: file_sha(i) for i in stage.inputs},
+    }
+
+
+def stale_reason(stage: Stage, fp: Dict[str, Any], prev: Optional[Dict[str, Any]]) -> Optional[str]:
+    out = output_region(stage)
+    if out is None:
+        return "output missing"
+    if prev is None:
+        return "no previous build"
+    if prev.get("build") != fp["build"]:
+        return "build version changed"
+    if prev.get("scripts") != fp["scripts"]:
+        return "script changed: " + ", ".join(s for s in fp["scripts"] if prev["scripts"].get(s) != fp["scripts"][s])
+    if prev.get("slice") != fp["slice"]:
+        return "dataset slice changed"
+    if prev.get("inputs") != fp["inputs"]:
+        return "input changed: " + ", ".join(i for i in fp["inputs"] if prev["inputs"].get(i) != fp["inputs"][i])
+    if prev.get("output") != out:
+        return "output modified outside the build"
+    return None
+
+
+# ---- build ----
+
+def load_rows(path: Path) -> Rows:
+    rows: Rows = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict):
+                rows.append(obj)
+    return rows
+
+
+def load_state() -> Dict[str, Any]:
+    try:
+        return json.loads(STATE_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: Dict[str, Any]) -> None:
+    STATE_JSON.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_JSON.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(STATE_JSON)
+
+
+def record(names: List[str], rows: Rows, outputs: Optional[Dict[str, str]] = None) -> None:
+    """Mark stages whose output was brought up to date outside the build (scripts/watch_reports.py) as built.
+
+    `outputs` gives the expected output hash per stage; a file that differs from it is stale on the next build.
+    """
+    state = load_state()
+    for stage in STAGES:
+        if stage.name in names:
+            out = (outputs or {}).get(stage.name) or output_region(stage)
+            state[stage.name] = dict(fingerprints(stage, rows), output=out)
+    save_state(state)
+
+
+def build(only: Optional[List[str]] = None, force: bool = False, dry_run: bool = False,
+          rows: Optional[Rows] = None, verbose: bool = True) -> List[Tuple[str, str]]:
+    """Run stale stages in declaration order; returns [(stage, reason)] for the stages that ran (or would).
+
+    `rows` is the parsed dataset when the caller already holds it; `verbose=False` skips "up to date" lines.
+    """
+    if not DATA_JSONL.exists():
+        raise SystemExit(f"missing {DATA_JSONL}")
+    names = [s.name for s in STAGES]
+    for n in only or []:
+        if n not in names:
+            raise SystemExit(f"unknown stage {n!r} (stages: {', '.join(names)})")
+
+    if rows is None:
+        rows = load_rows(DATA_JSONL)
+    state = load_state()
+    stale: List[Tuple[Stage, Dict[str, Any], str]] = []
+    for stage in STAGES:
+        if only and stage.name not in only:
+            continue
+        fp = fingerprints(stage, rows)
+        reason = "forced" if force else stale_reason(stage, fp, state.get(stage.name))
+        if reason is None:
+            if verbose:
+                print(f"[build] {stage.name}: up to date")
+            continue
+        stale.append((stage, fp, reason))
+        print(f"[build] {stage.name}: {'stale' if dry_run else 'run'} ({reason})", flush=True)
+    ran = [(stage.name, reason) for stage, _, reason in stale]
+    if dry_run:
+        return ran
+
+    done: Set[str] = set()
+    for stage, _, _ in stale:
+        if stage.name in done:
+            continue
+        # Vendor block stages share one renderer: run every stale section in a single splice.
+        batch = [st for st, _, _ in stale if st.section is not None] if stage.section is not None else [stage]
+        cmd = stage.cmd + (["--only", ",".join(st.section for st in batch)] if stage.section is not None else [])
+        rc = subprocess.call([sys.executable, *cmd], cwd=ROOT)
+        if rc != 0:
+            save_state(state)
+            raise SystemExit(f"[build] {stage.name} failed (exit {rc})")
+        for st, fp, _ in stale:
+            if any(st.name == b.name for b in batch):
+                fp["output"] = output_region(st)
+                state[st.name] = fp
+                done.add(st.name)
+        save_state(state)
+    if stale:
+        # Stages sharing a file (readiness + its vendor blocks) may shift each other's regions by a
+        # blank line; every stage in a file written above is now the build's own product, so re-record
+        # them. Other files keep their recorded hash (a change made meanwhile is stale next build).
+        touched = {stage.output for stage, _, _ in stale}
+        for stage in STAGES:
+            if stage.name in state and stage.output in touched and (not only or stage.name in only):
+                state[stage.name]["output"] = output_region(stage)
+        save_state(state)
+    return ran
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Incremental report build (skips stages whose input fingerprints match).")
+    ap.add_argument("--only", default="", help="comma-separated stage names")
+    ap.add_argument("--force", action="store_true", help="run the selected stages even if up to date")
+    ap.add_argument("--dry-run", action="store_true", help="only report which stages are stale")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    ran = build(only or None, args.force, args.dry_run)
+    verb = "stale" if args.dry_run else "ran"
+    print(f"[build] {len(ran)} {verb}, {len(only or STAGES) - len(ran)} up to date in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,7 @@ set -euo pipefail
 ROOT="$(cd "$(dirname "$0")/.." && pwd)"
 cd "$ROOT"
 
-JSONL="data/results.jsonl"
+JSONL="${PARSE_BENCH_STAGE:-data/results.jsonl}"
 
 need_cmd() { command -v "$1" >/dev/null 2>&1 || { echo "missing: $1" >&2; exit 1; }; }
 need_cmd python3
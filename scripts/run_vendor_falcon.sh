@@ -12,7 +12,7 @@ need_cmd rg
 need_cmd tee
 
 QA_DIR="vendors/QuantumAccount"
-JSONL="data/results.jsonl"
+JSONL="${PARSE_BENCH_STAGE:-data/results.jsonl}"
 
 # Optional: allow pinning via env
 QA_REF="${QA_REF:-1970dcad8907c5dcb0df5ae51ea962b10fc3227b}"
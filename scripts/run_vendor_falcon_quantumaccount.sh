@@ -13,6 +13,8 @@ VENDOR_DIR="${ROOT}/vendors/QuantumAccount"
 : "${QA_TEST_HANDLEOPS:=testQuantumAccountViaEntryPoint}"
 
 # Dataset knobs
+# rows go through parse_bench.py; under scripts/rebuild_orchestrator.py that is a staging file
+JSONL="${PARSE_BENCH_STAGE:-data/results.jsonl}"
 : "${CHAIN_PROFILE:=evm-l1}"
 : "${SEC_BITS:=256}"          # Falcon-1024 normalization target
 : "${RESET_DATA:=0}"
@@ -137,21 +139,19 @@ print("[qa] wrote", p2)
 PY
 
 # Prune any prior rows with same (repo,commit,scheme,bench_name) BEFORE append,
-# so we don't rely on downstream dedup behavior.
-python3 - <<'PY'
+# so we don't rely on downstream dedup behavior. Only the file parse_bench appends to is
+# touched (the orchestrator's staging file applies the same key when it merges).
+python3 - "${JSONL}" "${ROW1_JSON_FILE}" "${ROW2_JSON_FILE}" <<'PY'
 import json
+import sys
 from pathlib import Path
 
-root = Path("/mnt/c/Users/msi/gas-per-secure-bit")
-jsonl = root / "data" / "results.jsonl"
+jsonl = Path(sys.argv[1])
 if not jsonl.exists():
-    print("[qa] no existing data/results.jsonl -> skip prune")
+    print(f"[qa] no existing {jsonl} -> skip prune")
     raise SystemExit(0)
 
-bench_files = [
-    root / ".tmp" / "qa_row_getUserOpHash.json",
-    root / ".tmp" / "qa_row_handleOps.json",
-]
+bench_files = [Path(a) for a in sys.argv[2:]]
 
 targets = set()
 for bf in bench_files:
@@ -174,7 +174,7 @@ for line in jsonl.read_text(encoding="utf-8").splitlines():
     kept.append(json.dumps(r, ensure_ascii=False))
 
 jsonl.write_text("\n".join(kept) + ("\n" if kept else ""), encoding="utf-8")
-print(f"[qa] pruned {len(targets)} target keys from data/results.jsonl")
+print(f"[qa] pruned {len(targets)} target keys from {jsonl}")
 PY
 
 echo "[qa] parse_bench -> append dataset row #1 (getUserOpHash)"
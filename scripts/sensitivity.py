@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Monte Carlo sensitivity of effective_security_bits and gas/bit to uncertain denominators and gas.
+
+Inputs are the compiled weakest-link records of reports/protocol_readiness.md (latest record per
+scheme::bench_name, depends_on resolved the same way) plus distributions for some of their own
+`bits` / `gas` values (spec/uncertainty.json by default, or --set). Every uncertain value is drawn
+N times at once (numpy, one vector per input), and the draws are pushed through the dependency
+graph in one memoized pass:
+
+  effective(r) = min(own_bits(r), effective(dep) for dep in depends_on)     (elementwise over draws)
+  gas_per_bit(r) = gas(r) / effective(r)                                     (inf when effective = 0)
+
+Missing or cyclic dependencies cap at 0, as in the readiness table. Per surface reached by any
+uncertain input the report gives the mean and central interval of both outputs and the inputs
+driving their variance: squared Spearman rank correlation of each upstream input with the output,
+as a share of the total.
+
+Distributions (spec "dist"):
+  fixed(value) | uniform(min, max) | triangular(min, mode, max) | normal(mean, sd[, min, max])
+  | choice(values[, weights]); "relative": true multiplies the draws by the recorded value.
+
+Usage:
+  python3 scripts/sensitivity.py                                  # spec/uncertainty.json, 100k draws
+  python3 scripts/sensitivity.py --draws 20000 --ci 80 --out .tmp/sensitivity.md --json .tmp/sensitivity.json
+  python3 scripts/sensitivity.py --set 'ecdsa::l1_envelope_assumption.bits={"dist": "uniform", "min": 96, "max": 128}'
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from make_protocol_readiness import Record, load_latest_records, resolve_dep_rid
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+SPEC_JSON = ROOT / "spec" / "uncertainty.json"
+
+FIELDS = ("bits", "gas")
+
+Value = Union[float, np.ndarray]        # scalar = certain, (N,) vector = draws
+
+
+# ---- distributions ----
+
+def sample(spec: Dict[str, Any], recorded: Optional[float], n: int, rng: np.random.Generator) -> np.ndarray:
+    dist = spec.get("dist")
+    if dist == "fixed":
+        x = np.full(n, float(spec["value"]))
+    elif dist == "uniform":
+        x = rng.uniform(float(spec["min"]), float(spec["max"]), n)
+    elif dist == "triangular":
+        lo, mode, hi = float(spec["min"]), float(spec["mode"]), float(spec["max"])
+        x = np.full(n, lo) if lo == hi else rng.triangular(lo, mode, hi, n)
+    elif dist == "normal":
+        x = rng.normal(float(spec["mean"]), float(spec["sd"]), n)
+        x = np.clip(x, spec.get("min", -np.inf), spec.get("max", np.inf))
+    elif dist == "choice":
+        values = np.asarray(spec["values"], dtype=np.float64)
+        w = spec.get("weights")
+        p = None if w is None else np.asarray(w, dtype=np.float64) / float(np.sum(w))
+        x = rng.choice(values, n, p=p)
+    else:
+        raise SystemExit(f"unknown distribution {dist!r} (fixed, uniform, triangular, normal, choice)")
+    if spec.get("relative"):
+        if recorded is None:
+            raise SystemExit(f"relative distribution needs a recorded value: {spec}")
+        x = x * recorded
+    return x
+
+
+def load_spec(path: Path, overrides: List[str]) -> Dict[str, Any]:
+    spec: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    inputs = spec.setdefault("inputs", {})
+    for item in overrides:
+        key, sep, dist = item.partition("=")
+        rid, dot, fld = key.rpartition(".")
+        if not sep or not dot or fld not in FIELDS:
+            raise SystemExit(f"--set expects RID.bits=JSON or RID.gas=JSON, got {item!r}")
+        try:
+            inputs.setdefault(rid, {})[fld] = json.loads(dist)
+        except json.JSONDecodeError as e:
+            raise SystemExit(f"--set {key}: bad JSON ({e})")
+    return spec
+
+
+# ---- propagation ----
+
+def own_bits(r: Record) -> float:
+    if r.effective_security_bits is not None:
+        return float(r.effective_security_bits)
+    return float(r.security_equiv_bits) if r.security_equiv_bits is not None else 0.0
+
+
+@dataclass
+class Result:
+    rid: str
+    bits: Value
+    gas: Optional[Value]
+    gpb: Optional[Value]
+    bits_upstream: Set[str]         # uncertain "rid.bits" inputs that reach effective bits
+    upstream: Set[str]              # ... plus this surface's "rid.gas" input (reach gas/bit)
+
+
+def propagate(records: Dict[str, Record], draws: Dict[str, np.ndarray]) -> Dict[str, Result]:
+    """Push every input vector through the weakest-link graph (draws keyed "rid.bits" / "rid.gas")."""
+    memo: Dict[str, Tuple[Value, Set[str]]] = {}
+    visiting: Set[str] = set()
+
+    def eff(rid: str) -> Tuple[Value, Set[str]]:
+        if rid in memo:
+            return memo[rid]
+        r = records.get(rid)
+        if rid in visiting or r is None:
+            memo[rid] = (0.0, set())
+            return memo[rid]
+        visiting.add(rid)
+        key = f"{rid}.bits"
+        cap: Value = draws[key] if key in draws else own_bits(r)
+        ups = {key} if key in draws else set()
+        for dep in r.depends_on:
+            d, d_ups = eff(resolve_dep_rid(dep, records))
+            cap = np.minimum(cap, d)
+            ups |= d_ups
+        visiting.remove(rid)
+        memo[rid] = (cap, ups)
+        return memo[rid]
+
+    out: Dict[str, Result] = {}
+    for rid, r in records.items():
+        bits, bits_ups = eff(rid)
+        key = f"{rid}.gas"
+        gas: Optional[Value] = draws[key] if key in draws else (None if r.gas is None else float(r.gas))
+        gpb: Optional[Value] = None
+        ups = bits_ups | ({key} if key in draws else set())
+        if gas is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                gpb = np.where(np.asarray(bits) > 0, np.asarray(gas) / np.where(np.asarray(bits) > 0, bits, 1.0), np.inf)
+        out[rid] = Result(rid, bits, gas, gpb, bits_ups, ups)
+    return out
+
+
+# ---- statistics ----
+
+def _rank(a: np.ndarray) -> np.ndarray:
+    """Average ranks (ties share the mean of their positions)."""
+    _, inv, cnt = np.unique(a, return_inverse=True, return_counts=True)
+    ends = np.cumsum(cnt).astype(np.float64)
+    return (ends - (cnt - 1) / 2.0)[inv]
+
+
+def drivers(y: Value, ups: Set[str], ranks: Dict[str, np.ndarray]) -> List[Tuple[str, float, float]]:
+    """[(input, spearman rho, share of sum rho^2)] sorted by share; [] when y does not vary."""
+    y = np.asarray(y)
+    if y.ndim == 0 or not ups:
+        return []
+    ry = _rank(y)
+    if np.ptp(ry) == 0:
+        return []
+    rho = {}
+    for name in sorted(ups):
+        rx = ranks[name]
+        rho[name] = float(np.corrcoef(rx, ry)[0, 1]) if np.ptp(rx) > 0 else 0.0
+    total = sum(v * v for v in rho.values())
+    if total == 0:
+        return []
+    return sorted(((k, v, v * v / total) for k, v in rho.items()), key=lambda t: (-t[2], t[0]))
+
+
+def summarize(v: Value, ci: float) -> Dict[str, float]:
+    a = np.asarray(v, dtype=np.float64)
+    if a.ndim == 0:
+        x = float(a)
+        return {"mean": x, "lo": x, "p50": x, "hi": x}
+    q = (1.0 - ci / 100.0) / 2.0
+    lo, p50, hi = np.quantile(a, [q, 0.5, 1.0 - q], method="nearest")
+    finite = a[np.isfinite(a)]
+    mean = float(finite.mean()) if len(finite) == len(a) else float("inf")
+    return {"mean": mean, "lo": float(lo), "p50": float(p50), "hi": float(hi)}
+
+
+# ---- report ----
+
+def _num(x: float) -> str:
+    if not np.isfinite(x):
+        return "∞"
+    return f"{x:,.0f}" if abs(x) >= 1000 else f"{x:.1f}"
+
+
+def _interval(s: Dict[str, float]) -> str:
+    if s["lo"] == s["hi"]:
+        return _num(s["p50"])
+    return f"{_num(s['p50'])} [{_num(s['lo'])}, {_num(s['hi'])}]"
+
+
+def _drivers_cell(ds: List[Tuple[str, float, float]], top: int = 3) -> str:
+    return ", ".join(f"`{k}` {share:.0%} (ρ={rho:+.2f})" for k, rho, share in ds[:top]) or "-"
+
+
+def analyse(records: Dict[str, Record], spec: Dict[str, Any], n: int, seed: int, ci: float) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    draws: Dict[str, np.ndarray] = {}
+    for rid in sorted(spec.get("inputs", {})):
+        r = records.get(rid)
+        if r is None:
+            raise SystemExit(f"unknown surface {rid!r} in uncertainty spec (expected scheme::bench_name)")
+        for fld in FIELDS:
+            d = spec["inputs"][rid].get(fld)
+            if d is not None:
+                recorded = own_bits(r) if fld == "bits" else (None if r.gas is None else float(r.gas))
+                draws[f"{rid}.{fld}"] = sample(d, recorded, n, rng)
+    ranks = {k: _rank(v) for k, v in draws.items()}
+
+    rows: List[Dict[str, Any]] = []
+    for rid, res in sorted(propagate(records, draws).items()):
+        if not res.upstream:
+            continue
+        rows.append({
+            "rid": rid,
+            "effective_security_bits": summarize(res.bits, ci),
+            "gas_per_bit": None if res.gpb is None else summarize(res.gpb, ci),
+            "p_capped_below_recorded": float(np.mean(np.asarray(res.bits) < own_bits(records[rid]))),
+            "drivers_bits": [{"input": k, "rho": rho, "share": s} for k, rho, s in drivers(res.bits, res.bits_upstream, ranks)],
+            "drivers_gas_per_bit": [] if res.gpb is None else
+            [{"input": k, "rho": rho, "share": s} for k, rho, s in drivers(res.gpb, res.upstream, ranks)],
+        })
+    return rows
+
+
+def render(rows: List[Dict[str, Any]], n: int, ci: float, spec_path: Path) -> str:
+    lines: List[str] = []
+    lines.append("# Sensitivity: effective_security_bits and gas/bit under uncertain inputs")
+    lines.append("")
+    lines.append(f"{n:,} draws per input from `{spec_path.relative_to(ROOT) if spec_path.is_relative_to(ROOT) else spec_path}`, "
+                 f"propagated through the weakest-link graph. Cells are median [{ci:g}% interval].")
+    lines.append("")
+    lines.append("| Surface | effective_security_bits | P(below declared) | bits drivers | gas/bit | gas/bit drivers |")
+    lines.append("|---|---:|---:|---|---:|---|")
+    for r in rows:
+        gpb = r["gas_per_bit"]
+        lines.append(
+            f"| `{r['rid']}` | {_interval(r['effective_security_bits'])} | {r['p_capped_below_recorded']:.1%} | "
+            f"{_drivers_cell([(d['input'], d['rho'], d['share']) for d in r['drivers_bits']])} | "
+            f"{'-' if gpb is None else _interval(gpb)} | "
+            f"{_drivers_cell([(d['input'], d['rho'], d['share']) for d in r['drivers_gas_per_bit']])} |"
+        )
+    if not rows:
+        lines.append("| _(no surface reached by an uncertain input)_ |  |  |  |  |  |")
+    lines.append("")
+    lines.append("Notes:")
+    lines.append("- Drivers: squared Spearman rank correlation of each upstream input with the output, as a share of the "
+                 "total (ρ sign: + raises the output).")
+    lines.append("- `P(below declared)` is the fraction of draws where effective bits fall under the record's own "
+                 "declared denominator.")
+    lines.append("- Surfaces no uncertain input reaches are deterministic and omitted; see `reports/protocol_readiness.md`.")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Monte Carlo sensitivity through the weakest-link graph.")
+    ap.add_argument("--jsonl", default=str(DATA_JSONL))
+    ap.add_argument("--spec", default=str(SPEC_JSON), help="input distributions (JSON)")
+    ap.add_argument("--set", action="append", default=[], metavar="RID.FIELD=JSON",
+                    help="add/override one distribution (FIELD = bits | gas); repeatable")
+    ap.add_argument("--draws", type=int, default=None, help="draws per input (default: spec draws or 100000)")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--ci", type=float, default=90.0, help="central interval in percent (default 90)")
+    ap.add_argument("--out", default="", help="write the markdown report here instead of stdout")
+    ap.add_argument("--json", default="", help="also write the numbers as JSON")
+    args = ap.parse_args()
+
+    jsonl_path = Path(args.jsonl)
+    if not jsonl_path.exists():
+        raise SystemExit(f"Missing {jsonl_path}")
+    if not 0 < args.ci < 100:
+        raise SystemExit("--ci must be in (0, 100)")
+    spec_path = Path(args.spec).resolve()
+    spec = load_spec(spec_path, args.set)
+    n = args.draws or int(spec.get("draws", 100000))
+    seed = args.seed if args.seed is not None else int(spec.get("seed", 0))
+
+    t0 = time.perf_counter()
+    rows = analyse(load_latest_records(jsonl_path), spec, n, seed, args.ci)
+    text = render(rows, n, args.ci, spec_path)
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(text, encoding="utf-8")
+        print(f"Wrote {args.out} ({len(rows)} surfaces, {n:,} draws, {(time.perf_counter() - t0) * 1000:.0f} ms)")
+    else:
+        print(text, end="")
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"draws": n, "seed": seed, "ci": args.ci, "surfaces": rows},
+                                              indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
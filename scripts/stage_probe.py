@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-stage gas breakdown of the verifier hot path via gasleft() checkpoints.
+
+Stage boundaries are annotated in the Solidity sources as plain comments:
+
+  // @gas-stage <name>     -- a new stage starts here
+  // @gas-stage-end        -- the last stage ends here
+
+The real sources are never modified. This script builds an instrumented copy under
+.tmp/stage_probe/ where every marker becomes
+
+  console.log("gas_stage", "<name>", gasleft());
+
+runs the bench there, and attributes gas between consecutive checkpoints to the stage
+that opened the interval (loop bodies accumulate; `hits` counts how often a stage ran).
+A calibration pair of back-to-back probes measures the probe's own cost, which is
+subtracted from every interval, so numbers from different commits stay comparable.
+
+Breakdown stages: decode_pk, decode_sig, expandA, ntt_z, a_mul_z, c_mul_t1, w1_pack, challenge
+(plus whatever else is annotated, e.g. ntt_c, intt_w). A listed stage with no marker in the
+sources (MLDSA65_Verifier_v2 has no w1 packing yet) is reported as not measured.
+
+Usage:
+  python3 scripts/stage_probe.py --parent mldsa65::verify_poc_foundry
+  python3 scripts/stage_probe.py --parent mldsa65::verify_poc_foundry --from-log /tmp/stages.out
+  python3 scripts/stage_probe.py --show mldsa65::verify_poc_foundry
+
+Output: data/gas_stages.jsonl, one JSON object per stage:
+  ts_utc, parent_rid, repo, commit, source, stage, gas, hits, share, probe_overhead, source_hash
+Re-probing the same (parent_rid, commit) replaces the previous stage records.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from gas_report_ingest import git_head, known_rids, utc_ts, write_children
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+STAGES_JSONL = ROOT / "data" / "gas_stages.jsonl"
+WORK_DIR = ROOT / ".tmp" / "stage_probe"
+
+SOURCE = "gasleft_probe"
+
+STAGES = ("decode_pk", "decode_sig", "expandA", "ntt_z", "a_mul_z", "c_mul_t1", "w1_pack", "challenge")
+
+CALIB = "__calib"
+CALIB_END = "__calib_end"
+END = "__end"
+
+_MARK = re.compile(r"^(?P<indent>[ \t]*)//[ \t]*@gas-stage(?P<end>-end)?(?:[ \t]+(?P<name>[A-Za-z0-9_]+))?[ \t]*$")
+_PRAGMA = re.compile(r"^pragma solidity[^;]*;[ \t]*$", re.M)
+_PURE = re.compile(r"\bpure\b")
+_EVENT = re.compile(r"gas_stage\s+(\S+)\s+([0-9]+)")
+
+
+def _probe(indent: str, name: str) -> str:
+    return f'{indent}console.log("gas_stage", "{name}", gasleft());'
+
+
+def instrument_source(text: str) -> Tuple[str, int]:
+    """Rewrite stage markers into probes; returns (new_text, n_markers)."""
+    out: List[str] = []
+    n = 0
+    for line in text.splitlines():
+        m = _MARK.match(line)
+        if not m:
+            out.append(line)
+            continue
+        indent = m.group("indent")
+        if n == 0:
+            out.append(_probe(indent, CALIB))
+            out.append(_probe(indent, CALIB_END))
+        if m.group("end"):
+            out.append(_probe(indent, END))
+        elif m.group("name"):
+            out.append(_probe(indent, m.group("name")))
+        else:
+            raise SystemExit(f"stage marker without a name: {line.strip()!r}")
+        n += 1
+    if n == 0:
+        return text, 0
+
+    new = "\n".join(out) + "\n"
+    pm = _PRAGMA.search(new)
+    if not pm:
+        raise SystemExit("instrumented file has no pragma line")
+    new = new[: pm.end()] + '\n\nimport "forge-std/console.sol";' + new[pm.end():]
+    return new, n
+
+
+def annotated_sources(src_root: Path) -> List[Path]:
+    return sorted(p for p in src_root.rglob("*.sol") if "@gas-stage" in p.read_text(encoding="utf-8"))
+
+
+def marker_names(paths: List[Path]) -> List[str]:
+    names: List[str] = []
+    for p in paths:
+        for line in p.read_text(encoding="utf-8").splitlines():
+            m = _MARK.match(line)
+            if m and m.group("name") and m.group("name") not in names:
+                names.append(m.group("name"))
+    return names
+
+
+def source_hash(paths: List[Path]) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(str(p.relative_to(ROOT)).encode("utf-8"))
+        h.update(b"\0")
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def build_workdir(work: Path) -> int:
+    """Copy the forge project into `work` and instrument it. Returns the number of markers."""
+    if work.exists():
+        shutil.rmtree(work)
+    work.mkdir(parents=True)
+
+    for name in ("contracts", "test"):
+        shutil.copytree(ROOT / name, work / name)
+    for name in ("foundry.toml", "remappings.txt"):
+        if (ROOT / name).exists():
+            shutil.copy2(ROOT / name, work / name)
+    for name in ("lib", "test_vectors", "vectors"):
+        if (ROOT / name).exists():
+            (work / name).symlink_to(ROOT / name, target_is_directory=True)
+
+    total = 0
+    for p in sorted((work / "contracts").rglob("*.sol")) + sorted((work / "test").rglob("*.sol")):
+        text = p.read_text(encoding="utf-8")
+        new, n = instrument_source(text)
+        # gasleft() is not allowed in pure code. This is the throwaway copy, so relax every
+        # pure to view (callers included) rather than tracking which call chains reach a probe.
+        new = _PURE.sub("view", new)
+        if new != text:
+            p.write_text(new, encoding="utf-8")
+        total += n
+    return total
+
+
+def run_forge(work: Path, match_contract: str, match_test: str) -> str:
+    cmd = ["forge", "test", "--match-contract", match_contract, "-vv"]
+    if match_test:
+        cmd += ["--match-test", match_test]
+    p = subprocess.run(cmd, cwd=str(work), text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if p.returncode != 0:
+        tail = "\n".join(p.stdout.splitlines()[-80:])
+        raise SystemExit(f"forge failed (rc={p.returncode})\n---- forge output tail ----\n{tail}")
+    return p.stdout
+
+
+def parse_events(text: str) -> List[Tuple[str, int]]:
+    return [(m.group(1), int(m.group(2))) for m in _EVENT.finditer(text)]
+
+
+def breakdown(events: List[Tuple[str, int]]) -> Tuple[Dict[str, Dict[str, int]], int, int]:
+    """
+    Attribute gas between consecutive checkpoints to the stage that opened the interval.
+    Returns ({stage: {gas, hits}}, probe_overhead, n_verifies); gas is per verify call.
+    """
+    overhead = None
+    for (a, ga), (b, gb) in zip(events, events[1:]):
+        if a == CALIB and b == CALIB_END:
+            overhead = ga - gb
+            break
+    if overhead is None:
+        raise SystemExit("no calibration probe pair in log")
+
+    n_verifies = sum(1 for name, _ in events if name == END)
+    if n_verifies == 0:
+        raise SystemExit(f"no '{END}' checkpoint in log (verify did not reach the end marker)")
+
+    acc: Dict[str, Dict[str, int]] = {}
+    order: List[str] = []
+    for (a, ga), (_b, gb) in zip(events, events[1:]):
+        if a.startswith("__"):
+            continue
+        if a not in acc:
+            acc[a] = {"gas": 0, "hits": 0}
+            order.append(a)
+        acc[a]["gas"] += max(0, ga - gb - overhead)
+        acc[a]["hits"] += 1
+
+    per_call = {
+        s: {"gas": acc[s]["gas"] // n_verifies, "hits": acc[s]["hits"] // n_verifies}
+        for s in order
+    }
+    return per_call, overhead, n_verifies
+
+
+def load_stages(path: Path, parent_rid: str) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    if not path.exists():
+        return out
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+            try:
+                r = json.loads(s)
+            except Exception:
+                continue
+            if r.get("parent_rid") == parent_rid:
+                out.append(r)
+    return out
+
+
+def show(path: Path, parent_rid: str) -> int:
+    rows = load_stages(path, parent_rid)
+    if not rows:
+        print(f"no stage records for {parent_rid} in {path}")
+        return 1
+
+    commits: List[str] = []
+    ts_by_commit: Dict[str, str] = {}
+    stages: List[str] = []
+    gas: Dict[Tuple[str, str], int] = {}
+    for r in rows:
+        c = str(r.get("commit") or "unknown")
+        if c not in ts_by_commit:
+            commits.append(c)
+        ts_by_commit[c] = max(ts_by_commit.get(c, ""), str(r.get("ts_utc") or ""))
+        st = str(r.get("stage"))
+        if st not in stages:
+            stages.append(st)
+        gas[(st, c)] = int(r.get("gas") or 0)
+    commits.sort(key=lambda c: ts_by_commit[c])
+
+    header = ["stage"] + [c[:10] for c in commits]
+    if len(commits) > 1:
+        header.append("delta")
+    print("| " + " | ".join(header) + " |")
+    print("|" + "---|" * len(header))
+    for st in stages + ["total"]:
+        if st == "total":
+            vals = [sum(gas.get((s, c), 0) for s in stages) for c in commits]
+        else:
+            vals = [gas.get((st, c), 0) for c in commits]
+        cells = [st] + [str(v) for v in vals]
+        if len(commits) > 1:
+            cells.append(f"{vals[-1] - vals[-2]:+d}")
+        print("| " + " | ".join(cells) + " |")
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Per-stage gas breakdown of the verifier via gasleft() probes.")
+    ap.add_argument("--parent", default="", help="parent rid, e.g. mldsa65::verify_poc_foundry")
+    ap.add_argument("--match-contract", default="MLDSA_RealVector_Test")
+    ap.add_argument("--match-test", default="")
+    ap.add_argument("--from-log", default="", help="parse this forge -vv output instead of running forge")
+    ap.add_argument("--instrument-only", action="store_true", help="build .tmp/stage_probe and stop")
+    ap.add_argument("--show", default="", metavar="RID", help="print the stage table across commits for RID")
+    ap.add_argument("--repo", default="", help="provenance repo (default: parent row's repo)")
+    ap.add_argument("--commit", default="", help="provenance commit (default: git HEAD)")
+    ap.add_argument("--out", default=str(STAGES_JSONL))
+    args = ap.parse_args()
+
+    if args.show:
+        return show(Path(args.out), args.show)
+
+    annotated = annotated_sources(ROOT / "contracts")
+    if not annotated:
+        raise SystemExit("no @gas-stage markers found under contracts/")
+    names = marker_names(annotated)
+    unmarked = [st for st in STAGES if st not in names]
+    if unmarked:
+        print(f"WARN: stages without a marker, not measured: {', '.join(unmarked)}", file=sys.stderr)
+
+    if args.instrument_only:
+        n = build_workdir(WORK_DIR)
+        print(f"INSTRUMENTED {n} markers in {len(annotated)} files under {WORK_DIR}")
+        return 0
+
+    if "::" not in args.parent:
+        raise SystemExit("--parent must be a canonical rid 'scheme::bench_name'")
+    parents = known_rids(DATA_JSONL)
+    if args.parent not in parents:
+        print(f"WARN: parent {args.parent} not found in {DATA_JSONL}", file=sys.stderr)
+
+    if args.from_log:
+        text = Path(args.from_log).read_text(encoding="utf-8", errors="replace")
+    else:
+        build_workdir(WORK_DIR)
+        text = run_forge(WORK_DIR, args.match_contract, args.match_test)
+
+    stages, overhead, n_verifies = breakdown(parse_events(text))
+    total = sum(v["gas"] for v in stages.values())
+
+    commit = args.commit or git_head(ROOT)
+    repo = args.repo or parents.get(args.parent) or ROOT.name
+    shash = source_hash(annotated)
+    ts = utc_ts()
+
+    children = [
+        {
+            "ts_utc": ts,
+            "parent_rid": args.parent,
+            "repo": repo,
+            "commit": commit,
+            "source": SOURCE,
+            "stage": st,
+            "gas": v["gas"],
+            "hits": v["hits"],
+            "share": round(v["gas"] / total, 4) if total else 0.0,
+            "probe_overhead": overhead,
+            "source_hash": shash,
+        }
+        for st, v in stages.items()
+    ]
+    write_children(Path(args.out), args.parent, commit, children)
+
+    print(f"APPENDED {len(children)} stage rows for {args.parent} to {args.out} "
+          f"(total={total} over {n_verifies} verify call(s), probe_overhead={overhead})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
-import csv, sys
+import sys
+from pathlib import Path
 
-path = sys.argv[1] if len(sys.argv) > 1 else "data/results.csv"
-rows = list(csv.DictReader(open(path, newline="")))
-rows.sort(key=lambda r: float(r["gas_per_secure_bit"]))
+import numpy as np
 
-for r in rows:
-    print(f'{r["scheme"]:10s} {r["bench_name"]:38s} gas={int(r["gas_verify"]):>9,d}  gas/bit={float(r["gas_per_secure_bit"]):>12,.3f}  repo={r["repo"]}@{r["commit"][:8]}')
+import query
+
+path = Path(sys.argv[1] if len(sys.argv) > 1 else "data/results.csv")
+idx = query.build_index(path)
+
+
+def num(v, spec):
+    return "-" if v is None or isinstance(v, str) else format(v, spec)
+
+
+# blank / non-numeric gas_per_secure_bit sorts last instead of crashing the sort
+for i in query.sort_rows(idx, np.arange(idx.n), "gas_per_secure_bit").tolist():
+    r = {c: idx.value(c, i) for c in ("scheme", "bench_name", "gas_verify", "gas_per_secure_bit", "repo", "commit")}
+    print(f'{r["scheme"]:10s} {r["bench_name"]:38s} gas={num(r["gas_verify"], ">9,d"):>9s}  gas/bit={num(r["gas_per_secure_bit"], ">12,.3f"):>12s}  repo={r["repo"]}@{str(r["commit"])[:8]}')
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-input gas distribution sweep over a vector pack.
+
+Runs ONE forge invocation over every vector in a pack (the harness loops and logs
+"<marker>::<vector_id> gas: <N>" per vector), then records the distribution as row fields:
+  gas_n, gas_min, gas_p50, gas_p95, gas_max, gas_stddev
+The headline `gas` (and therefore gas_per_secure_bit) is the `--stat` statistic (default p50),
+so it no longer depends on which single input happened to be picked.
+
+Usage:
+  python3 scripts/mldsa65_ref.py gen-pack --count 200 --pk-layout contract --out .tmp/mldsa65_ref_pack.json
+  python3 scripts/sweep_vector_pack.py --pack .tmp/mldsa65_ref_pack.json \\
+      --scheme mldsa65 --bench-name verify_sweep_foundry --denom security_equiv_bits --bits 192
+
+  # vendor repo / custom harness
+  python3 scripts/sweep_vector_pack.py --pack pack.json --cwd vendors/ml-dsa-65-ethereum-verification \\
+      --match-contract MyVerifySweep --scheme mldsa65 --bench-name verify_sweep_vendor
+
+  # parse an existing forge log instead of running forge
+  python3 scripts/sweep_vector_pack.py --pack pack.json --from-log /tmp/sweep.out ...
+
+Pack formats accepted (vector ids):
+  - hex JSON: {"vectors": [{"name": ...} | {"vector_id": ...}, ...]}
+  - a JSON list of such vector objects
+  - a binary .vpak (scripts/vpack.py; vector names, content-hash pack id)
+`vector_pack_id` is taken from the pack (`vector_pack_id`) or derived as sha256(pack bytes).
+Forge gets the pack staged as one small hex JSON file per vector, .tmp/sweep_pack/<hash>/<i>.json with
+`.name` set to those vector ids (SWEEP_PACK=<dir>, SWEEP_COUNT=<n>): every vm.parseJson* in the harness
+re-parses the string it is given, so reading vectors out of one pack-sized string would cost
+O(pack size) per field and grow quadratically with the pack.
+
+A vector with a boolean `expected` is also checked: the harness logs "<marker>::<vector_id> result:
+match|mismatch", counted in the row notes (mismatches are also listed on stderr). A vector without
+one (or with null) is record-only: its gas is measured, its verify() result is not judged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from vpack import VectorPack, export_hex
+
+
+ROOT = Path(__file__).resolve().parents[1]
+STAGE_DIR = ROOT / ".tmp" / "sweep_pack"
+
+STATS = ("min", "p50", "p95", "max")
+
+
+def load_pack(path: Path) -> Tuple[str, List[str]]:
+    if path.suffix == ".vpak":
+        with VectorPack(path) as pack:
+            return pack.pack_id, [pack[i]["name"] for i in range(len(pack))]
+
+    raw = path.read_bytes()
+    obj = json.loads(raw.decode("utf-8"))
+
+    pack_id: Optional[str] = None
+    vectors: List[Any]
+    if isinstance(obj, dict):
+        pid = obj.get("vector_pack_id")
+        if isinstance(pid, str) and pid:
+            pack_id = pid
+        vectors = obj.get("vectors") or []
+    elif isinstance(obj, list):
+        vectors = obj
+    else:
+        raise SystemExit(f"{path}: expected an object with 'vectors' or a list")
+
+    ids: List[str] = []
+    for i, v in enumerate(vectors):
+        vid = None
+        if isinstance(v, dict):
+            vid = v.get("vector_id") or v.get("name") or v.get("id")
+        ids.append(str(vid) if vid else f"v{i:06d}")
+
+    if pack_id is None:
+        pack_id = hashlib.sha256(raw).hexdigest()
+    return pack_id, ids
+
+
+def forge_pack(path: Path, ids: List[str]) -> Tuple[Path, int]:
+    """
+    The pack handed to forge, as (directory, vector count): <dir>/<i>.json holds vector i as hex JSON
+    whose `.name` is the vector id load_pack() reported, so every log line maps back to a vector
+    whatever key the source used. Staged under .tmp/sweep_pack/ (readable via foundry.toml
+    fs_permissions) in a directory named by the content hash.
+    """
+    if path.suffix == ".vpak":
+        with VectorPack(path) as pack:
+            obj: Any = export_hex(pack)
+    else:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(obj, list):
+            obj = {"vectors": obj}
+    vectors = [dict({k: x for k, x in v.items() if not (k == "expected" and x is None)}, name=vid)
+               if isinstance(v, dict) else {"name": vid}
+               for v, vid in zip(obj.get("vectors") or [], ids)]
+    texts = [json.dumps(v, separators=(",", ":")) + "\n" for v in vectors]
+    h = hashlib.sha256()
+    for t in texts:
+        h.update(t.encode("utf-8"))
+    out = STAGE_DIR / h.hexdigest()
+    if not out.is_dir():
+        tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+        tmp.mkdir(parents=True, exist_ok=True)
+        for i, t in enumerate(texts):
+            (tmp / f"{i}.json").write_text(t, encoding="utf-8")
+        try:
+            tmp.rename(out)     # complete or absent: a concurrent sweep of the same pack may have won
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return out, len(texts)
+
+
+def parse_sweep_log(text: str, marker: str) -> Dict[str, int]:
+    """Collect "<marker>::<vector_id> gas: <N>" lines (first value per vector wins)."""
+    # one line per vector; names may contain spaces (the last " gas: N" on the line is the value)
+    rx = re.compile(r"^\s*" + re.escape(marker) + r"::(.+)\s+gas\s*[:=]\s*([0-9]+)\s*$", re.MULTILINE)
+    out: Dict[str, int] = {}
+    for m in rx.finditer(text):
+        out.setdefault(m.group(1), int(m.group(2)))
+    return out
+
+
+def parse_sweep_results(text: str, marker: str) -> Dict[str, bool]:
+    """Collect "<marker>::<vector_id> result: match|mismatch" lines (labelled vectors only)."""
+    rx = re.compile(r"^\s*" + re.escape(marker) + r"::(.+)\s+result\s*[:=]\s*(match|mismatch)\s*$", re.MULTILINE)
+    out: Dict[str, bool] = {}
+    for m in rx.finditer(text):
+        out.setdefault(m.group(1), m.group(2) == "match")
+    return out
+
+
+def quantile(sorted_vals: List[int], q: float) -> float:
+    """Linear interpolation between closest ranks (numpy's default 'linear' method)."""
+    if not sorted_vals:
+        raise ValueError("empty sample")
+    pos = (len(sorted_vals) - 1) * q
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    if lo == hi:
+        return float(sorted_vals[lo])
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+
+def distribution(samples: List[int]) -> Dict[str, Any]:
+    xs = sorted(samples)
+    n = len(xs)
+    mean = sum(xs) / n
+    # population stddev: the pack is the full population we measured
+    var = sum((x - mean) ** 2 for x in xs) / n
+    return {
+        "gas_n": n,
+        "gas_min": xs[0],
+        "gas_p50": quantile(xs, 0.50),
+        "gas_p95": quantile(xs, 0.95),
+        "gas_max": xs[-1],
+        "gas_stddev": round(math.sqrt(var), 3),
+    }
+
+
+def run_forge(cwd: Path, pack: Tuple[Path, int], match_contract: str, match_test: str) -> str:
+    cmd = ["forge", "test", "--match-contract", match_contract, "-vv"]
+    if match_test:
+        cmd += ["--match-test", match_test]
+    env = dict(os.environ)
+    env["SWEEP_PACK"] = str(pack[0].resolve())
+    env["SWEEP_COUNT"] = str(pack[1])
+    p = subprocess.run(cmd, cwd=str(cwd), env=env, text=True,
+                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if p.returncode != 0:
+        tail = "\n".join(p.stdout.splitlines()[-80:])
+        raise SystemExit(f"forge failed (rc={p.returncode})\n---- forge output tail ----\n{tail}")
+    return p.stdout
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Sweep a bench over every vector in a pack and record the gas distribution.")
+    ap.add_argument("--pack", required=True, help="vector pack JSON")
+    ap.add_argument("--scheme", required=True)
+    ap.add_argument("--bench-name", required=True)
+    ap.add_argument("--chain-profile", default="EVM/L1")
+    ap.add_argument("--denom", default="security_equiv_bits", help="security_metric_type")
+    ap.add_argument("--bits", type=float, required=True, help="security_metric_value")
+    ap.add_argument("--stat", default="p50", choices=STATS, help="statistic used as headline gas")
+    ap.add_argument("--marker", default="sweep", help="log marker prefix (<marker>::<vector_id> gas: N)")
+    ap.add_argument("--cwd", default=".", help="forge project dir (repo root or vendors/<repo>)")
+    ap.add_argument("--match-contract", default="MLDSA_VerifySweep_Gas_Test")
+    ap.add_argument("--match-test", default="")
+    ap.add_argument("--from-log", default="", help="parse this forge output instead of running forge")
+    ap.add_argument("--vector-pack-ref", default="")
+    ap.add_argument("--surface-id", default="")
+    ap.add_argument("--surface-layer", default="")
+    ap.add_argument("--notes", default="")
+    ap.add_argument("--dry-run", action="store_true", help="print the row JSON; do not append")
+    args = ap.parse_args()
+
+    pack = Path(args.pack)
+    if not pack.exists():
+        raise SystemExit(f"pack not found: {pack}")
+    pack_id, ids = load_pack(pack)
+    if not ids:
+        raise SystemExit(f"{pack}: no vectors")
+
+    if args.from_log:
+        text = Path(args.from_log).read_text(encoding="utf-8", errors="replace")
+    else:
+        cwd = (ROOT / args.cwd) if not Path(args.cwd).is_absolute() else Path(args.cwd)
+        text = run_forge(cwd, forge_pack(pack, ids), args.match_contract, args.match_test)
+
+    by_vec = parse_sweep_log(text, args.marker)
+    missing = [v for v in ids if v not in by_vec]
+    if missing:
+        head = ", ".join(missing[:5]) + (" ..." if len(missing) > 5 else "")
+        raise SystemExit(f"sweep incomplete: {len(missing)}/{len(ids)} vectors without gas ({head})")
+
+    dist = distribution([by_vec[v] for v in ids])
+    headline = int(round(float(dist[f"gas_{args.stat}"])))
+
+    notes = (
+        f"sweep over {dist['gas_n']} vectors; gas={args.stat} "
+        f"(min={dist['gas_min']} p95={dist['gas_p95']:.0f} max={dist['gas_max']})"
+    )
+    results = parse_sweep_results(text, args.marker)
+    mismatched = [v for v in ids if results.get(v) is False]
+    if results:
+        notes += f"; expected checked on {len(results)}, {len(mismatched)} mismatched"
+    if len(results) < len(ids):
+        notes += f"; {len(ids) - len(results)} unlabelled (recorded only)"
+    if mismatched:
+        head = ", ".join(mismatched[:5]) + (" ..." if len(mismatched) > 5 else "")
+        print(f"[sweep] verify() disagrees with 'expected' on {len(mismatched)} vectors ({head})", file=sys.stderr)
+    if args.notes:
+        notes = f"{args.notes}; {notes}"
+
+    row: Dict[str, Any] = {
+        "scheme": args.scheme,
+        "bench_name": args.bench_name,
+        "chain_profile": args.chain_profile,
+        "gas": headline,
+        "denominator": args.denom,
+        "denom_bits": args.bits,
+        "gas_stat": args.stat,
+        "vector_pack_id": pack_id,
+        "notes": notes,
+    }
+    row.update(dist)
+    if args.vector_pack_ref:
+        row["vector_pack_ref"] = args.vector_pack_ref
+    if args.surface_id:
+        row["surface_id"] = args.surface_id
+    if args.surface_layer:
+        row["surface_layer"] = args.surface_layer
+
+    payload = json.dumps(row, ensure_ascii=False)
+    if args.dry_run:
+        print(payload)
+        return 0
+
+    return subprocess.call([sys.executable, str(ROOT / "scripts" / "parse_bench.py"), payload])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
+import argparse
 import json
+import os
+import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import hashlib
 
@@ -11,6 +16,22 @@ except Exception as e:
     print("ERROR: missing dependency for keccak256. Install pycryptodome: pip install pycryptodome", file=sys.stderr)
     raise
 
+PROFILES = ("fips_shake128", "fips_shake256", "keccak_ctr_xof128", "keccak_ctr_xof256")
+CTR_TAGS = {"keccak_ctr_xof128": b"KCTR128", "keccak_ctr_xof256": b"KCTR256"}
+
+# vectors per worker task when a single file is split across the pool
+CHUNK = 4096
+
+SUITE = "evm-pq-xof-vectors"
+VERSION = 1
+
+# `generate`: rough upper bound on serialized bytes per worker task, and tasks kept in flight
+# per worker; together they bound the generator's memory independently of the grid size.
+TASK_BYTES = 8 << 20
+WINDOW_PER_JOB = 2
+
+BIN_MAGIC = b"XOFV"
+
 def keccak256(data: bytes) -> bytes:
     k = keccak.new(digest_bits=256)
     k.update(data)
@@ -22,77 +43,397 @@ def u16be(n: int) -> bytes:
 def u32be(n: int) -> bytes:
     return n.to_bytes(4, "big")
 
-def gen_stream(profile: str, seed_hex: str, domain: str, out_len: int) -> bytes:
-    seed = bytes.fromhex(seed_hex)
+def domain_prefix(domain: str) -> bytes:
     d = domain.encode("utf-8")
-    prefix = u16be(len(d)) + d + seed
+    return u16be(len(d)) + d
 
-    if profile == "fips_shake128":
-        h = hashlib.shake_128()
-        h.update(prefix)
-        return h.digest(out_len)
+# SHAKE states with u16_be(len(domain)) || domain already absorbed, cloned per vector.
+_shake_domain_states = {}
 
-    if profile == "fips_shake256":
-        h = hashlib.shake_256()
-        h.update(prefix)
-        return h.digest(out_len)
+def _shake_state(profile: str, domain: str):
+    key = (profile, domain)
+    h = _shake_domain_states.get(key)
+    if h is None:
+        h = hashlib.shake_128() if profile == "fips_shake128" else hashlib.shake_256()
+        h.update(domain_prefix(domain))
+        if len(_shake_domain_states) > 4096:
+            _shake_domain_states.clear()
+        _shake_domain_states[key] = h
+    return h.copy()
 
-    if profile == "keccak_ctr_xof128":
-        tag = b"KCTR128"
-        return keccak_ctr(prefix, out_len, tag)
+def gen_stream_into(profile: str, seed: bytes, domain: str, out) -> None:
+    """Write len(out) stream bytes into `out` (bytearray / writable memoryview)."""
+    out = memoryview(out)
+    if profile in ("fips_shake128", "fips_shake256"):
+        h = _shake_state(profile, domain)
+        h.update(seed)
+        out[:] = h.digest(len(out))
+        return
 
-    if profile == "keccak_ctr_xof256":
-        tag = b"KCTR256"
-        return keccak_ctr(prefix, out_len, tag)
+    tag = CTR_TAGS.get(profile)
+    if tag is None:
+        raise ValueError(f"unknown profile: {profile}")
+    keccak_ctr_into(domain_prefix(domain) + seed, tag, out)
 
-    raise ValueError(f"unknown profile: {profile}")
+def gen_stream(profile: str, seed_hex: str, domain: str, out_len: int) -> bytes:
+    buf = bytearray(out_len)
+    gen_stream_into(profile, bytes.fromhex(seed_hex), domain, buf)
+    return bytes(buf)
 
-def keccak_ctr(prefix: bytes, out_len: int, tag: bytes) -> bytes:
-    out = b""
-    i = 0
-    while len(out) < out_len:
-        blk = prefix + u32be(i) + tag
-        out += keccak256(blk)
-        i += 1
-    return out[:out_len]
-
-def verify_file(path: Path) -> int:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    suite = data.get("suite")
-    version = data.get("version")
-    vectors = data.get("vectors", [])
+def keccak_ctr_into(prefix: bytes, tag: bytes, out) -> None:
+    # block_i = keccak256(prefix || u32_be(i) || tag). prefix || ctr || tag fits one 136-byte
+    # rate block for any realistic domain/seed, so each block is a single permutation; the
+    # prefix is built once and blocks are written in place (no quadratic `out +=`).
+    new = keccak.new
+    n = len(out)
+    full = n // 32
+    off = 0
+    for i in range(full):
+        out[off:off + 32] = new(data=prefix + i.to_bytes(4, "big") + tag, digest_bits=256).digest()
+        off += 32
+    if off < n:
+        out[off:] = new(data=prefix + full.to_bytes(4, "big") + tag, digest_bits=256).digest()[:n - off]
 
-    if suite != "evm-pq-xof-vectors" or version != 1:
-        print(f"[FAIL] {path}: unexpected suite/version ({suite}/{version})", file=sys.stderr)
-        return 1
+def keccak_ctr(prefix: bytes, out_len: int, tag: bytes) -> bytes:
+    buf = bytearray(out_len)
+    keccak_ctr_into(prefix, tag, buf)
+    return bytes(buf)
 
-    fails = 0
+def check_vectors(vectors: list) -> list:
+    """Returns [(id, ok, expected_hex | None, got_hex | None)] in input order."""
+    results = []
+    buf = bytearray()
     for v in vectors:
         vid = v["id"]
-        profile = v["xof_profile"]
-        seed_hex = v["seed_hex"]
-        domain = v["domain_sep"]
         out_len = int(v["out_len"])
-        expected_hex = v["expected_hex"].lower()
+        expected = bytes.fromhex(v["expected_hex"])
+        if len(buf) != out_len:
+            buf = bytearray(out_len)
+        gen_stream_into(v["xof_profile"], bytes.fromhex(v["seed_hex"]), v["domain_sep"], buf)
+        if buf == expected:
+            results.append((vid, True, None, None))
+        else:
+            results.append((vid, False, expected.hex(), buf.hex()))
+    return results
+
+# ---- generate: declarative grid -> suite (json), JSONL, or binary records ----
+
+def parse_out_lens(items) -> list:
+    """Accepts ints, "a,b,c" and "start:stop[:step]" (stop inclusive)."""
+    out = []
+    for item in items:
+        if isinstance(item, int):
+            out.append(item)
+            continue
+        for part in str(item).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if ":" in part:
+                bits = [int(x) for x in part.split(":")]
+                if len(bits) not in (2, 3) or (len(bits) == 3 and bits[2] <= 0):
+                    raise SystemExit(f"bad out_len range {part!r} (expected start:stop[:step])")
+                start, stop, step = bits[0], bits[1], bits[2] if len(bits) == 3 else 1
+                out.extend(range(start, stop + 1, step))
+            else:
+                out.append(int(part))
+    if any(n < 0 for n in out):
+        raise SystemExit("out_len must be >= 0")
+    return list(dict.fromkeys(out))
+
+def derive_seeds(count: int, seed_len: int, rng_seed: str) -> list:
+    # seed_i = SHAKE256("evm-pq-xof-vectors|grid-seed" || u16_be(len(rng)) || rng || u32_be(i))[:seed_len]
+    base = b"evm-pq-xof-vectors|grid-seed" + domain_prefix(rng_seed)
+    return [hashlib.shake_256(base + u32be(i)).digest(seed_len).hex() for i in range(count)]
+
+def _slug(s: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", s).strip("_") or "empty"
+
+def build_grid(spec: dict) -> dict:
+    profiles = list(dict.fromkeys(spec.get("profiles") or PROFILES))
+    for prof in profiles:
+        if prof not in PROFILES:
+            raise SystemExit(f"unknown profile {prof!r} (expected one of {', '.join(PROFILES)})")
+
+    seeds = spec.get("seeds")
+    if isinstance(seeds, dict):
+        seeds = derive_seeds(int(seeds.get("count", 1)), int(seeds.get("len", 32)), str(seeds.get("from", "")))
+    seeds = [str(x).lower().removeprefix("0x") for x in (seeds or [])]
+    if not seeds:
+        raise SystemExit("grid has no seeds")
+    for x in seeds:
+        if len(bytes.fromhex(x)) > 255:
+            raise SystemExit("seeds longer than 255 bytes are not supported")
+
+    domains = list(dict.fromkeys(spec.get("domains") or ["TEST|XOF"]))
+    out_lens = parse_out_lens(spec.get("out_lens") or [64])
+
+    # ids follow the hand-curated suite: <prefix>.<profile>.seed<i>.domain_<slug>.<n>B
+    slugs = [_slug(d) for d in domains]
+    if len(set(slugs)) != len(slugs):
+        slugs = [str(i) for i in range(len(domains))]
+
+    return {
+        "id_prefix": str(spec.get("id_prefix") or "grid"),
+        "profiles": profiles,
+        "seeds": seeds,
+        "domains": domains,
+        "domain_slugs": slugs,
+        "out_lens": out_lens,
+    }
+
+def grid_size(grid: dict) -> int:
+    return len(grid["profiles"]) * len(grid["seeds"]) * len(grid["domains"]) * len(grid["out_lens"])
 
-        got = gen_stream(profile, seed_hex, domain, out_len).hex()
-        if got != expected_hex:
-            fails += 1
-            print(f"[FAIL] {path} :: {vid}\n  expected={expected_hex}\n  got     ={got}", file=sys.stderr)
+def grid_point(grid: dict, i: int):
+    # mixed radix, out_len fastest: consecutive vectors share profile/seed/domain
+    i, li = divmod(i, len(grid["out_lens"]))
+    i, di = divmod(i, len(grid["domains"]))
+    pi, si = divmod(i, len(grid["seeds"]))
+    return pi, si, di, li
+
+_GEN = {}
+
+def _gen_init(grid: dict, fmt: str) -> None:
+    _GEN["grid"] = grid
+    _GEN["fmt"] = fmt
+    _GEN["seeds"] = [bytes.fromhex(x) for x in grid["seeds"]]
+    _GEN["domains"] = [d.encode("utf-8") for d in grid["domains"]]
+
+def _gen_range(bounds) -> bytes:
+    """Worker: serialize grid points [start, stop) in the configured format."""
+    start, stop = bounds
+    grid, fmt = _GEN["grid"], _GEN["fmt"]
+    parts = []
+    for i in range(start, stop):
+        pi, si, di, li = grid_point(grid, i)
+        profile = grid["profiles"][pi]
+        seed = _GEN["seeds"][si]
+        domain = grid["domains"][di]
+        out = bytearray(grid["out_lens"][li])
+        gen_stream_into(profile, seed, domain, out)
+        if fmt == "bin":
+            d = _GEN["domains"][di]
+            parts.append(bytes([PROFILES.index(profile), len(seed)]) + seed + u16be(len(d)) + d
+                         + u32be(len(out)) + out)
         else:
-            print(f"[OK] {path} :: {vid}")
+            vec = {
+                "id": f"{grid['id_prefix']}.{profile}.seed{si}.domain_{grid['domain_slugs'][di]}.{len(out)}B",
+                "xof_profile": profile,
+                "seed_hex": grid["seeds"][si],
+                "domain_sep": domain,
+                "out_len": len(out),
+                "expected_hex": out.hex(),
+            }
+            if fmt == "json":  # same layout as json.dump(suite, indent=4), one vector at a time
+                parts.append(("        " + json.dumps(vec, indent=4).replace("\n", "\n        ")).encode("utf-8"))
+            else:
+                parts.append(json.dumps(vec).encode("utf-8"))
+    if fmt == "bin":
+        return b"".join(parts)
+    return (b",\n" if fmt == "json" else b"\n").join(parts) + (b"" if fmt == "json" else b"\n")
+
+def _ordered(pool, fn, tasks, window: int):
+    # like pool.map, but only `window` tasks are submitted ahead of the writer
+    pending = deque()
+    for t in tasks:
+        pending.append(pool.submit(fn, t))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def generate(grid: dict, fmt: str, out, jobs: int) -> int:
+    total = grid_size(grid)
+    per_task = max(1, min(CHUNK, TASK_BYTES // (2 * max(grid["out_lens"]) + 256)))
+    tasks = ((a, min(a + per_task, total)) for a in range(0, total, per_task))
+
+    if fmt == "json":
+        out.write(f'{{\n    "suite": "{SUITE}",\n    "version": {VERSION},\n    "vectors": [\n'.encode("utf-8"))
+    elif fmt == "jsonl":
+        header = {"suite": SUITE, "version": VERSION, "count": total,
+                  "grid": {k: grid[k] for k in ("id_prefix", "profiles", "domains", "out_lens")}}
+        out.write((json.dumps(header) + "\n").encode("utf-8"))
+    else:
+        out.write(BIN_MAGIC + bytes([VERSION]) + total.to_bytes(8, "big"))
+
+    first = True
+    if jobs <= 1 or total <= per_task:
+        _gen_init(grid, fmt)
+        blobs = map(_gen_range, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_gen_init, initargs=(grid, fmt))
+        blobs = _ordered(pool, _gen_range, tasks, jobs * WINDOW_PER_JOB)
+    try:
+        for blob in blobs:
+            if fmt == "json" and not first and blob:
+                out.write(b",\n")
+            out.write(blob)
+            first = False
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if fmt == "json":
+        out.write(b"\n    ]\n}\n" if total else b"    ]\n}\n")
+    return total
+
+def generate_main(argv: list) -> int:
+    ap = argparse.ArgumentParser(
+        prog="scripts/verify_vectors.py generate",
+        description="Emit an evm-pq-xof-vectors v1 corpus from a profiles x seeds x domain_sep x out_len grid.",
+    )
+    ap.add_argument("--grid", default="", help="JSON grid spec (profiles, seeds, domains, out_lens, id_prefix)")
+    ap.add_argument("--profile", action="append", default=[], choices=PROFILES, help="repeatable; default: all")
+    ap.add_argument("--seed", action="append", default=[], help="seed hex (repeatable)")
+    ap.add_argument("--random-seeds", type=int, default=0, help="derive N seeds deterministically from --rng-seed")
+    ap.add_argument("--seed-len", type=int, default=32)
+    ap.add_argument("--rng-seed", default="", help="label the derived seeds are expanded from")
+    ap.add_argument("--domain", action="append", default=[], help="domain_sep (repeatable)")
+    ap.add_argument("--out-len", action="append", default=[], help="N, a,b,c or start:stop[:step] (repeatable)")
+    ap.add_argument("--id-prefix", default="")
+    ap.add_argument("--format", choices=("json", "jsonl", "bin"), default="",
+                    help="default: from --out suffix (.json/.jsonl/.bin), else jsonl")
+    ap.add_argument("--out", default="-", help="output path, '-' for stdout")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args(argv)
+
+    spec = json.loads(Path(args.grid).read_text(encoding="utf-8")) if args.grid else {}
+    if args.profile:
+        spec["profiles"] = args.profile
+    if args.seed or args.random_seeds:
+        seeds = list(args.seed)
+        if args.random_seeds:
+            seeds += derive_seeds(args.random_seeds, args.seed_len, args.rng_seed)
+        spec["seeds"] = seeds
+    if args.domain:
+        spec["domains"] = args.domain
+    if args.out_len:
+        spec["out_lens"] = args.out_len
+    if args.id_prefix:
+        spec["id_prefix"] = args.id_prefix
+    spec.setdefault("seeds", ["00" * 32])
+    grid = build_grid(spec)
+
+    fmt = args.format
+    if not fmt:
+        suffix = Path(args.out).suffix.lstrip(".")
+        fmt = suffix if suffix in ("json", "jsonl", "bin") else "jsonl"
+
+    if args.out == "-":
+        total = generate(grid, fmt, sys.stdout.buffer, args.jobs)
+    else:
+        path = Path(args.out)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            total = generate(grid, fmt, f, args.jobs)
+        tmp.replace(path)
+    print(f"GENERATED {total} vectors ({fmt}) -> {args.out}", file=sys.stderr)
+    return 0
+
 
+def read_bin(path: Path) -> dict:
+    """`generate --format bin` -> the same dict shape as a JSON suite."""
+    blob = path.read_bytes()
+    if blob[:4] != BIN_MAGIC:
+        return {}
+    count = int.from_bytes(blob[5:13], "big")
+    vectors = []
+    off = 13
+    for _ in range(count):
+        profile = PROFILES[blob[off]]
+        seed_len = blob[off + 1]
+        seed = blob[off + 2:off + 2 + seed_len]
+        off += 2 + seed_len
+        d_len = int.from_bytes(blob[off:off + 2], "big")
+        domain = blob[off + 2:off + 2 + d_len].decode("utf-8")
+        off += 2 + d_len
+        n = int.from_bytes(blob[off:off + 4], "big")
+        out = blob[off + 4:off + 4 + n]
+        off += 4 + n
+        vectors.append({"id": f"{path.name}#{len(vectors)}", "xof_profile": profile, "seed_hex": seed.hex(),
+                        "domain_sep": domain, "out_len": n, "expected_hex": out.hex()})
+    return {"suite": SUITE, "version": blob[4], "vectors": vectors}
+
+def load_suite(path: Path):
+    if path.suffix == ".bin":
+        data = read_bin(path)
+        if not data:
+            print(f"[FAIL] {path}: not an XOFV corpus", file=sys.stderr)
+            return None
+        return data["vectors"]
+    with path.open("r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            # `generate --format jsonl`: header line, then one vector per line
+            data = json.loads(f.readline() or "{}")
+            data["vectors"] = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+    suite = data.get("suite")
+    version = data.get("version")
+    if suite != SUITE or version != VERSION:
+        print(f"[FAIL] {path}: unexpected suite/version ({suite}/{version})", file=sys.stderr)
+        return None
+    return data.get("vectors", [])
+
+def report(path: Path, n: int, parts, quiet: bool) -> int:
+    fails = 0
+    for part in parts:
+        for vid, ok, expected_hex, got in part:
+            if not ok:
+                fails += 1
+                print(f"[FAIL] {path} :: {vid}\n  expected={expected_hex}\n  got     ={got}", file=sys.stderr)
+            elif not quiet:
+                print(f"[OK] {path} :: {vid}")
+    if quiet:
+        print(f"[{'FAIL' if fails else 'OK'}] {path}: {n - fails}/{n} vectors")
     return 1 if fails else 0
 
+def verify_file(path: Path, quiet: bool = False) -> int:
+    vectors = load_suite(path)
+    if vectors is None:
+        return 1
+    return report(path, len(vectors), [check_vectors(vectors)], quiet)
+
 def main(argv: list[str]) -> int:
-    if len(argv) < 2:
-        print("Usage: scripts/verify_vectors.py <file1.json> [file2.json ...]", file=sys.stderr)
-        return 2
+    if len(argv) > 1 and argv[1] == "generate":
+        return generate_main(argv[2:])
+    ap = argparse.ArgumentParser(
+        prog="scripts/verify_vectors.py",
+        usage="scripts/verify_vectors.py [--jobs N] [--quiet] <file1.json|.jsonl|.bin> [file2 ...]\n"
+              "       scripts/verify_vectors.py generate --help",
+    )
+    ap.add_argument("files", nargs="+")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="worker processes; all files are split into chunks of vectors across them")
+    ap.add_argument("--quiet", action="store_true", help="one summary line per file instead of one per vector")
+    args = ap.parse_args(argv[1:])
+
+    paths = [Path(p) for p in args.files]
+    if args.jobs <= 1:
+        rc = 0
+        for p in paths:
+            rc |= verify_file(p, args.quiet)
+        return rc
 
     rc = 0
-    for p in argv[1:]:
-        rc |= verify_file(Path(p))
+    suites = []
+    tasks = []
+    for p in paths:
+        vectors = load_suite(p)
+        if vectors is None:
+            rc = 1
+            continue
+        chunks = [vectors[i:i + CHUNK] for i in range(0, len(vectors), CHUNK)]
+        suites.append((p, len(vectors), len(chunks)))
+        tasks.extend(chunks)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = pool.map(check_vectors, tasks)
+        for p, n, nchunks in suites:
+            rc |= report(p, n, [next(results) for _ in range(nchunks)], args.quiet)
     return rc
 
 if __name__ == "__main__":
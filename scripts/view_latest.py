@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
-import csv
+from pathlib import Path
 
-path="data/results.csv"
-rows=list(csv.DictReader(open(path, newline='', encoding='utf-8')))
+import numpy as np
 
-latest={}
-for r in rows:
-    k=(r["repo"], r["bench_name"], r["chain_profile"])
-    if k not in latest or r["ts_utc"] > latest[k]["ts_utc"]:
-        latest[k]=r
+import query
 
-for k in sorted(latest):
-    r=latest[k]
+path = Path("data/results.csv")
+idx = query.build_index(path)
+keys = ("repo", "bench_name", "chain_profile")
+rows = query.latest_by(idx, np.arange(idx.n), keys).tolist()
+
+# print the cells as written in the CSV (the index holds numbers as float64)
+text, _ = query.read_rows(path)
+src = idx.col("row")
+
+for i in sorted(rows, key=lambda i: tuple(idx.value(k, i) for k in keys)):
+    r = text[int(src[i])]
     print(
         f'{r["ts_utc"]} '
         f'{r["repo"]} '
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Binary, memory-mappable vector packs (.vpak) with content-addressed ids.
+
+Layout (all integers little-endian):
+
+  header (128 bytes)
+    0   magic "VPAK"            4   u16 version (1)        6   u16 header size (128)
+    8   u64 count               16  u64 payload offset     24  u64 payload length
+    32  u64 table offset        40  u64 table length       48  u64 meta offset
+    56  u64 meta length         64  pack_id = sha256(payload || table || meta)   96  reserved (32)
+  payload   raw blobs; identical pk / sig / msg bytes are stored once
+  table     count x 72-byte entries: u64 off[4], u32 len[4] for (name, pk, sig, msg),
+            vector_id[16], i8 expected (-1 unknown, 0, 1), u8 mutation (index into meta.mutations), pad[6]
+  meta      UTF-8 JSON: scheme, pk_layout, source_sha256, mutations (index 0 = ""), ...
+
+vector_pack_id = pack_id hex; vector_id = sha256(pk || sig || msg)[:16] hex (same triple -> same id in any pack).
+meta holds no paths or times (sources are recorded by sha256 of their bytes), so converting the same
+input gives the same vector_pack_id wherever and however it is named.
+
+VectorPack(path) maps the file read-only: the table is a NumPy view of the mapping and every field is a
+zero-copy memoryview slice, so random access by index costs no parsing. PackWriter streams records to disk
+(payload first, table + meta at close), so packs larger than memory can be written record by record.
+
+Usage:
+  python3 scripts/vpack.py convert .tmp/mldsa65_ref_pack.json --out .tmp/mldsa65_ref_pack.vpak
+  python3 scripts/vpack.py convert test_vectors/vector_001.json test_vectors/vector_raw.json --out .tmp/tv.vpak
+  python3 scripts/vpack.py info .tmp/mldsa65_ref_pack.vpak --show 3
+  python3 scripts/vpack.py verify .tmp/mldsa65_ref_pack.vpak
+  python3 scripts/vpack.py export .tmp/mldsa65_ref_pack.vpak --out .tmp/mldsa65_ref_pack.hex.json
+
+`export` writes the hex JSON pack shape the Solidity sweep harness reads
+({"vector_pack_id", "vectors": [{"name", "vector_id", "pubkey_hex", "signature_hex", "msg_hash", "expected"}]}).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+MAGIC = b"VPAK"
+VERSION = 1
+HEADER_SIZE = 128
+HEADER = struct.Struct("<4sHHQQQQQQQ32s32s")
+
+FIELDS = ("name", "pk", "sig", "msg")
+DEDUP_FIELDS = ("pk", "sig", "msg")
+
+ENTRY = np.dtype([
+    ("off", "<u8", (4,)),
+    ("len", "<u4", (4,)),
+    ("vid", "V16"),
+    ("expected", "i1"),
+    ("mutation", "u1"),
+    ("_pad", "V6"),
+])
+assert ENTRY.itemsize == 72
+
+# JSON key aliases (first hit wins); *_b64 / *.b64 keys are base64, everything else hex
+KEYS = {
+    "name": ("name", "vector_id", "id"),
+    "pk": ("pubkey_hex", "pubkey", "public_key_raw", "pk", "pq_pubkey_b64", "pubkey.b64", "pubkey_b64"),
+    "sig": ("signature_hex", "signature", "signature_raw", "sig", "sig_pq_b64", "signature_b64", "sig_b64"),
+    "msg": ("msg_hash", "message_hash", "msg", "message"),
+    "expected": ("expected", "expected_result", "valid"),
+}
+
+
+def vector_id(pk: bytes, sig: bytes, msg: bytes) -> bytes:
+    return hashlib.sha256(pk + sig + msg).digest()[:16]
+
+
+def _blob(v: Any, key: str) -> bytes:
+    if isinstance(v, dict):  # {"raw": "0x..", "length": n}
+        v = v.get("raw") or v.get("hex") or ""
+    if not isinstance(v, str):
+        raise ValueError(f"{key}: expected a string, got {type(v).__name__}")
+    if key.endswith(("_b64", ".b64")):
+        return base64.b64decode(v, validate=True)
+    return bytes.fromhex(v.strip().removeprefix("0x"))
+
+
+def record_from_json(obj: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Normalize one JSON vector object (sweep / ref pack entry, raw dump, KAT file) to bytes fields."""
+    rec: Dict[str, Any] = {"name": "", "pk": b"", "sig": b"", "msg": b"", "expected": None,
+                           "mutation": str(obj.get("mutation") or "")}
+    for field, keys in KEYS.items():
+        for k in keys:
+            if k in obj and obj[k] is not None:
+                if field == "name":
+                    rec["name"] = str(obj[k])
+                elif field == "expected":
+                    rec["expected"] = bool(obj[k])
+                else:
+                    rec[field] = _blob(obj[k], k)
+                break
+    if not rec["name"]:
+        rec["name"] = f"v{index:06d}"
+    return rec
+
+
+def records_from_json_file(path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """(pack-level meta, records) for a JSON pack, a list of vectors, or a single vector object."""
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: not valid JSON ({e})")
+    meta: Dict[str, Any] = {}
+    if isinstance(obj, dict) and isinstance(obj.get("vectors"), list):
+        meta = {k: obj[k] for k in ("scheme", "pk_layout", "seed") if k in obj}
+        if obj.get("vector_pack_id"):
+            meta["source_vector_pack_id"] = obj["vector_pack_id"]
+        items = obj["vectors"]
+    elif isinstance(obj, dict) and isinstance(obj.get("vector"), dict):
+        items = [obj["vector"]]
+    elif isinstance(obj, list):
+        items = obj
+    elif isinstance(obj, dict):
+        items = [obj]
+        if "pq_scheme" in obj:
+            meta["scheme"] = str(obj["pq_scheme"])
+    else:
+        raise ValueError(f"{path}: expected a JSON object or list")
+    recs = [record_from_json(v, i) for i, v in enumerate(items)]
+    if len(recs) == 1 and recs[0]["name"] == "v000000":
+        recs[0]["name"] = path.stem
+    return meta, recs
+
+
+class PackWriter:
+    """Streams records into a .vpak: payload as it arrives, table + meta + header at close()."""
+
+    def __init__(self, path: Path, meta: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.f = self.tmp.open("wb")
+        self.f.write(b"\0" * HEADER_SIZE)
+        self.meta = dict(meta or {})
+        self.mutations: List[str] = [""]
+        self.entries: List[Tuple[Tuple[int, ...], Tuple[int, ...], bytes, int, int]] = []
+        self.seen: Dict[bytes, int] = {}
+        self.h = hashlib.sha256()
+        self.pos = 0
+
+    def _put(self, data: bytes, dedup: bool) -> int:
+        if dedup:
+            key = hashlib.sha256(data).digest()
+            off = self.seen.get(key)
+            if off is not None:
+                return off
+        off = self.pos
+        self.f.write(data)
+        self.h.update(data)
+        self.pos += len(data)
+        if dedup:
+            self.seen[key] = off
+        return off
+
+    def add(self, name: str, pk: bytes, sig: bytes, msg: bytes,
+            expected: Optional[bool] = None, mutation: str = "") -> str:
+        blobs = {"name": name.encode("utf-8"), "pk": bytes(pk), "sig": bytes(sig), "msg": bytes(msg)}
+        offs = tuple(self._put(blobs[f], f in DEDUP_FIELDS) for f in FIELDS)
+        lens = tuple(len(blobs[f]) for f in FIELDS)
+        if mutation not in self.mutations:
+            if len(self.mutations) == 256:
+                raise ValueError("more than 255 distinct mutation labels")
+            self.mutations.append(mutation)
+        vid = vector_id(blobs["pk"], blobs["sig"], blobs["msg"])
+        self.entries.append((offs, lens, vid, -1 if expected is None else int(bool(expected)),
+                             self.mutations.index(mutation)))
+        return vid.hex()
+
+    def add_record(self, rec: Dict[str, Any]) -> str:
+        return self.add(rec["name"], rec["pk"], rec["sig"], rec["msg"], rec.get("expected"), rec.get("mutation") or "")
+
+    def close(self) -> str:
+        table = np.zeros(len(self.entries), dtype=ENTRY)
+        for i, (offs, lens, vid, exp, mut) in enumerate(self.entries):
+            table[i]["off"] = [HEADER_SIZE + o for o in offs]
+            table[i]["len"] = lens
+            table[i]["vid"] = np.void(vid)
+            table[i]["expected"] = exp
+            table[i]["mutation"] = mut
+        tb = table.tobytes()
+        meta = dict(self.meta, mutations=self.mutations)
+        mb = json.dumps(meta, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        self.h.update(tb)
+        self.h.update(mb)
+        pack_id = self.h.digest()
+
+        table_off = HEADER_SIZE + self.pos
+        self.f.write(tb)
+        self.f.write(mb)
+        self.f.seek(0)
+        self.f.write(HEADER.pack(MAGIC, VERSION, HEADER_SIZE, len(self.entries), HEADER_SIZE, self.pos,
+                                 table_off, len(tb), table_off + len(tb), len(mb), pack_id, b"\0" * 32))
+        self.f.close()
+        self.tmp.replace(self.path)
+        return pack_id.hex()
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def abort(self) -> None:
+        self.f.close()
+        self.tmp.unlink(missing_ok=True)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class VectorPack:
+    """Read-only mmap view of a .vpak; pack[i] -> dict of zero-copy memoryviews + flags."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER_SIZE:
+            raise ValueError(f"{path}: too short for a vpak header")
+        (magic, version, hsize, count, self.payload_off, self.payload_len, table_off, table_len,
+         meta_off, meta_len, pack_id, _) = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: bad magic {magic!r}")
+        if version != VERSION or hsize != HEADER_SIZE:
+            raise ValueError(f"{path}: unsupported vpak version {version} (header {hsize})")
+        if table_len != count * ENTRY.itemsize or meta_off + meta_len > len(self.mm):
+            raise ValueError(f"{path}: truncated or inconsistent offsets")
+        self.buf = memoryview(self.mm)
+        self.table = np.frombuffer(self.mm, dtype=ENTRY, count=count, offset=table_off)
+        self.meta: Dict[str, Any] = json.loads(bytes(self.buf[meta_off:meta_off + meta_len]).decode("utf-8"))
+        self.pack_id = pack_id.hex()
+        self.table_off, self.meta_end = table_off, meta_off + meta_len
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def field(self, i: int, name: str) -> memoryview:
+        k = FIELDS.index(name)
+        off, n = int(self.table["off"][i, k]), int(self.table["len"][i, k])
+        return self.buf[off:off + n]
+
+    def vector_id(self, i: int) -> str:
+        return self.table["vid"][i].tobytes().hex()
+
+    def expected(self, i: int) -> Optional[bool]:
+        e = int(self.table["expected"][i])
+        return None if e < 0 else bool(e)
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        i %= len(self)
+        return {
+            "name": bytes(self.field(i, "name")).decode("utf-8"),
+            "vector_id": self.vector_id(i),
+            "pk": self.field(i, "pk"),
+            "sig": self.field(i, "sig"),
+            "msg": self.field(i, "msg"),
+            "expected": self.expected(i),
+            "mutation": self.meta.get("mutations", [""])[int(self.table["mutation"][i])],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def verify(self) -> List[str]:
+        """Problems found: pack_id mismatch, out-of-range fields, vector_id mismatches."""
+        problems: List[str] = []
+        # payload, table and meta are contiguous: pack_id = sha256 of everything after the header
+        if hashlib.sha256(self.buf[self.payload_off:self.meta_end]).hexdigest() != self.pack_id:
+            problems.append("pack_id does not match content")
+        end = self.payload_off + self.payload_len
+        bad = ((self.table["off"] < self.payload_off) | (self.table["off"] + self.table["len"] > end)).any(axis=1)
+        for i in np.flatnonzero(bad).tolist():
+            problems.append(f"vector {i}: field outside payload")
+        for i in np.flatnonzero(~bad).tolist():
+            vid = vector_id(bytes(self.field(i, "pk")), bytes(self.field(i, "sig")), bytes(self.field(i, "msg")))
+            if vid.hex() != self.vector_id(i):
+                problems.append(f"vector {i}: vector_id mismatch")
+        return problems
+
+    def close(self) -> None:
+        self.table = None
+        self.buf.release()
+        try:
+            self.mm.close()
+        except BufferError:  # field views still held by the caller; the mapping goes with them
+            pass
+
+    def __enter__(self) -> "VectorPack":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def convert(inputs: Iterable[Path], out: Path, meta: Dict[str, Any]) -> Tuple[str, int]:
+    n = 0
+    with PackWriter(out, meta) as w:
+        sources = []
+        for p in inputs:
+            src_meta, recs = records_from_json_file(p)
+            for k, v in src_meta.items():
+                w.meta.setdefault(k, v)
+            sources.append(file_sha256(p))   # not the path: meta is hashed into pack_id
+            for rec in recs:
+                w.add_record(rec)
+                n += 1
+        w.meta.setdefault("source_sha256", sources)
+    with VectorPack(out) as pack:
+        return pack.pack_id, n
+
+
+def export_hex(pack: VectorPack) -> Dict[str, Any]:
+    vectors = []
+    for v in pack:
+        item: Dict[str, Any] = {"name": v["name"], "vector_id": v["vector_id"]}
+        for field, key in (("pk", "pubkey_hex"), ("sig", "signature_hex"), ("msg", "msg_hash")):
+            if len(v[field]):
+                item[key] = "0x" + v[field].hex()
+        if v["expected"] is not None:
+            item["expected"] = v["expected"]
+        if v["mutation"]:
+            item["mutation"] = v["mutation"]
+        vectors.append(item)
+    meta = {k: pack.meta[k] for k in ("scheme", "pk_layout", "seed") if k in pack.meta}
+    return {"vector_pack_id": pack.pack_id, **meta, "vectors": vectors}
+
+
+def open_pack(path: Path) -> VectorPack:
+    if not path.exists():
+        raise SystemExit(f"pack not found: {path}")
+    try:
+        return VectorPack(path)
+    except (OSError, ValueError) as ex:
+        raise SystemExit(f"cannot read pack: {ex}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Binary mmap vector packs (.vpak): convert, inspect, verify, export.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    c = sub.add_parser("convert", help="JSON vector files -> one .vpak")
+    c.add_argument("inputs", nargs="+")
+    c.add_argument("--out", required=True)
+    c.add_argument("--scheme", default="", help="override meta.scheme")
+    c.add_argument("--pk-layout", default="", choices=("", "fips", "contract"), help="override meta.pk_layout")
+
+    i = sub.add_parser("info", help="header, meta and the first vectors")
+    i.add_argument("pack")
+    i.add_argument("--show", type=int, default=0, help="print this many vectors")
+
+    v = sub.add_parser("verify", help="re-hash pack_id / vector_ids and bounds-check the table")
+    v.add_argument("pack", nargs="+")
+
+    e = sub.add_parser("export", help=".vpak -> hex JSON pack (sweep harness shape)")
+    e.add_argument("pack")
+    e.add_argument("--out", required=True)
+    args = ap.parse_args()
+
+    if args.cmd == "convert":
+        meta: Dict[str, Any] = {}
+        if args.scheme:
+            meta["scheme"] = args.scheme
+        if args.pk_layout:
+            meta["pk_layout"] = args.pk_layout
+        try:
+            pack_id, n = convert([Path(p) for p in args.inputs], Path(args.out), meta)
+        except (ValueError, KeyError) as ex:
+            raise SystemExit(f"convert failed: {ex}")
+        size = Path(args.out).stat().st_size
+        in_size = sum(Path(p).stat().st_size for p in args.inputs)
+        print(f"WROTE {args.out}: {n} vectors, {size} bytes ({in_size} bytes JSON in); vector_pack_id={pack_id}",
+              file=sys.stderr)
+        return 0
+
+    if args.cmd == "verify":
+        rc = 0
+        for p in args.pack:
+            with open_pack(Path(p)) as pack:
+                problems = pack.verify()
+                for pr in problems:
+                    print(f"FAIL {p}: {pr}")
+                if problems:
+                    rc = 1
+                else:
+                    print(f"[OK] {p}: {len(pack)} vectors, vector_pack_id={pack.pack_id}")
+        return rc
+
+    with open_pack(Path(args.pack)) as pack:
+        if args.cmd == "info":
+            print(f"vector_pack_id: {pack.pack_id}")
+            print(f"vectors: {len(pack)}  payload: {pack.payload_len} bytes")
+            print(f"meta: {json.dumps(pack.meta, sort_keys=True)}")
+            for j in range(min(args.show, len(pack))):
+                r = pack[j]
+                print(f"  [{j}] {r['name']} id={r['vector_id']} pk={len(r['pk'])} sig={len(r['sig'])} "
+                      f"msg={len(r['msg'])} expected={r['expected']} mutation={r['mutation'] or '-'}")
+            return 0
+
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(export_hex(pack), separators=(",", ":")) + "\n", encoding="utf-8")
+        print(f"WROTE {out}: {len(pack)} vectors", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
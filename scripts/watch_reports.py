@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Watch data/results.jsonl and keep the derived files current while a sweep appends to it.
+
+The file is polled (size, mtime). A change starts a debounce window: the sync runs once the file
+has been quiet for --debounce seconds, or --max-wait seconds after the first change, so a burst of
+appends (one runner writing many rows) costs one sync. A sync:
+
+  1. tails the file (scripts/jsonl_tail.py): only the new complete lines of an append are parsed;
+     any other change re-reads the file
+  2. results.csv: appends the CSV rows of the new lines (parse_bench.prepare_csv_row, the same bytes
+     `--regen` writes), or accepts them when parse_bench already appended them itself, and records
+     the csv stage as built only when the file hashes to exactly what --regen would write; a
+     rewritten dataset or a CSV changed by something else (also polled) is left to the csv stage
+     (full --regen)
+  3. refreshes the query.py column index (incremental for appends; skipped without numpy)
+  4. runs report_build.build() on the in-memory rows: only the stages whose dataset slice changed run
+     (weakest-link report, readiness table, the affected vendor blocks, pareto, paths, charts)
+
+Stop with Ctrl-C. The build state in .tmp/report_build/ is shared with make_reports.sh, so a later
+make_reports.sh run starts no generator for what the watcher already built.
+
+Usage:
+  python3 scripts/watch_reports.py
+  python3 scripts/watch_reports.py --debounce 0.5 --max-wait 5
+  python3 scripts/watch_reports.py --once          # one sync, then exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import jsonl_tail
+import parse_bench
+import report_build
+
+try:
+    import query  # numpy
+except ImportError:
+    query = None
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_JSONL = ROOT / "data" / "results.jsonl"
+DATA_CSV = ROOT / "data" / "results.csv"
+
+Row = Dict[str, Any]
+
+
+def _stat(path: Path) -> Tuple[int, int]:
+    try:
+        st = path.stat()
+    except OSError:
+        return -1, -1
+    return st.st_size, st.st_mtime_ns
+
+
+def csv_bytes(rows: List[Row], header: bool = False) -> bytes:
+    """The bytes parse_bench appends / regenerates for `rows` (`header`: as the start of the file)."""
+    buf = io.StringIO(newline="")
+    w = csv.DictWriter(buf, fieldnames=parse_bench.CSV_FIELDS)
+    if header:
+        w.writeheader()
+    for r in rows:
+        w.writerow(parse_bench.prepare_csv_row(dict(r)))  # prepare_csv_row fills keys in place
+    return buf.getvalue().encode("utf-8")
+
+
+class Tail:
+    """Rows of data/results.jsonl in file order, advanced by offset tailing (jsonl_tail.Tailer)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.rows: List[Row] = []
+        self.tailer = jsonl_tail.Tailer(path)
+        self.clean = True   # every consumed line parsed to an object (parse_bench --regen would not fail)
+
+    def read(self) -> Tuple[str, List[Row]]:
+        """('load' | 'append' | 'rebuild', rows parsed now)."""
+        first = self.tailer.offset == 0
+        appended, lines = self.tailer.read()
+        mode = "append"
+        if not appended:
+            mode = "load" if first else "rebuild"
+            self.rows, self.clean = [], True
+        new: List[Row] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                obj = None
+            if isinstance(obj, dict):
+                new.append(obj)
+            else:
+                self.clean = False   # report_build.load_rows skips it; --regen rejects the file
+        self.rows.extend(new)
+        return mode, new
+
+
+class Expected:
+    """sha256 + length of the results.csv that `parse_bench.py --regen` writes for the rows consumed so far."""
+
+    def __init__(self, blob: bytes) -> None:
+        self.sha = hashlib.sha256(blob)
+        self.size = len(blob)
+
+    def extended(self, blob: bytes) -> "Expected":
+        out = Expected(b"")
+        out.sha, out.size = self.sha.copy(), self.size + len(blob)
+        out.sha.update(blob)
+        return out
+
+    def matches(self, path: Path) -> bool:
+        if _stat(path)[0] != self.size:
+            return False
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest() == self.sha.hexdigest()
+
+
+class Watcher:
+    def __init__(self, path: Path, csv_path: Path) -> None:
+        self.data = Tail(path)
+        self.csv_path = csv_path
+        self.expect: Optional[Expected] = None   # None while a consumed line is not a JSON object
+        self.index_note = True
+
+    def _append_csv(self, new: List[Row]) -> bool:
+        """Append `new` to results.csv; True when the file then holds exactly the --regen bytes."""
+        before = self.expect
+        blob = csv_bytes(new)
+        self.expect = before.extended(blob)
+        if before.matches(self.csv_path):
+            with self.csv_path.open("ab") as f:
+                f.write(blob)
+        # else parse_bench may have appended the same rows itself right after the JSONL
+        return self.expect.matches(self.csv_path)
+
+    def _index(self) -> str:
+        if query is None:
+            if self.index_note:
+                print("[watch] query index: skipped (numpy not installed)", flush=True)
+                self.index_note = False
+            return ""
+        t0 = time.perf_counter()
+        query.build_index(self.data.path)
+        return f", index {(time.perf_counter() - t0) * 1000:.0f} ms"
+
+    def sync(self) -> None:
+        t0 = time.perf_counter()
+        mode, new = self.data.read()
+        rows = self.data.rows
+        if not self.data.clean:
+            self.expect = None
+        elif mode != "append":
+            self.expect = Expected(csv_bytes(rows, header=True))
+        elif not new and self.expect is not None and self.expect.matches(self.csv_path):
+            return
+        csv_note = ""
+        if mode == "append" and new and self.expect is not None and self._append_csv(new):
+            # the expected hash, not the file: a CSV append landing from now on is stale for the build
+            report_build.record(["csv"], rows, {"csv": self.expect.sha.hexdigest()})
+            csv_note = f", csv +{len(new)}"
+        t_tail = time.perf_counter()
+        index_note = self._index()
+        t_build = time.perf_counter()
+        try:
+            ran = report_build.build(rows=rows, verbose=False)
+        except SystemExit as e:   # a failing generator must not stop the watch; retried on the next change
+            print(f"[watch] build failed: {e}", flush=True)
+            return
+        stages = ", ".join(name for name, _ in ran) or "none"
+        print(f"[watch] {mode}: +{len(new)} rows ({len(rows)} total){csv_note}{index_note}; "
+              f"tail {(t_tail - t0) * 1000:.0f} ms, stages [{stages}] {(time.perf_counter() - t_build) * 1000:.0f} ms",
+              flush=True)
+
+    def _seen(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        # results.csv too: a CSV append landing after the watcher's own one, or a hand edit, is regenerated
+        return _stat(self.data.path), _stat(self.csv_path)
+
+    def run(self, poll: float, debounce: float, max_wait: float) -> None:
+        # `seen` is taken before each sync reads the files: anything written during the sync (a row
+        # appended mid-build, the watcher's own CSV append) shows up as a change and is synced next
+        seen = self._seen()
+        self.sync()
+        first: Optional[float] = None   # first change of the pending burst
+        last = 0.0                      # latest change of the pending burst
+        while True:
+            time.sleep(poll)
+            now, cur = time.monotonic(), self._seen()
+            if cur != seen:
+                seen, last = cur, now
+                first = first if first is not None else now
+            if first is not None and (now - last >= debounce or now - first >= max_wait):
+                first = None
+                if cur[0][0] >= 0:
+                    self.sync()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Keep results.csv, the query index and reports current while results.jsonl grows.")
+    ap.add_argument("--poll", type=float, default=0.05, help="seconds between stat() polls (default 0.05)")
+    ap.add_argument("--debounce", type=float, default=0.2, help="quiet seconds that end a burst of appends (default 0.2)")
+    ap.add_argument("--max-wait", type=float, default=2.0, help="sync at most this long after a burst starts (default 2)")
+    ap.add_argument("--once", action="store_true", help="sync once and exit")
+    args = ap.parse_args()
+
+    if not DATA_JSONL.exists():
+        raise SystemExit(f"Missing {DATA_JSONL}")
+    if min(args.poll, args.debounce, args.max_wait) <= 0:
+        raise SystemExit("--poll, --debounce and --max-wait must be positive")
+
+    w = Watcher(DATA_JSONL, DATA_CSV)
+    if args.once:
+        w.sync()
+        return 0
+    print(f"[watch] {DATA_JSONL} (debounce {args.debounce:g}s, max wait {args.max_wait:g}s); Ctrl-C to stop", flush=True)
+    try:
+        w.run(args.poll, args.debounce, args.max_wait)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
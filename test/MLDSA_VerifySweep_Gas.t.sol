@@ -0,0 +1,66 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import "forge-std/Test.sol";
+import "../contracts/verifier/MLDSA65_Verifier_v2.sol";
+
+/// @notice Vector-pack gas sweep: one forge run measures verify() over every vector in a pack.
+/// @dev Driven by scripts/sweep_vector_pack.py via SWEEP_PACK=<dir> and SWEEP_COUNT=<n>: the script
+///      stages the pack under .tmp/sweep_pack/<hash>/ as one file per vector, <dir>/<i>.json =
+///      {"name","msg_hash","pubkey_hex","signature_hex"[,"expected"]}, with `name` set to its vector ids
+///      (vpak / vector_id / id) and null `expected` values dropped. Each vm.parseJson* call re-parses
+///      its whole input, so every lookup only ever sees one vector, never the full pack.
+///      Emits one log line per vector for the parser:
+///        "sweep::<name> gas: <N>"
+///      plus, only for vectors that carry `expected` (the rest are record-only):
+///        "sweep::<name> result: match|mismatch"
+///      Without SWEEP_PACK the test is a no-op, so plain `forge test` stays green.
+contract MLDSA_VerifySweep_Gas_Test is Test {
+    MLDSA65_Verifier_v2 verifier;
+
+    function setUp() public {
+        verifier = new MLDSA65_Verifier_v2();
+    }
+
+    function test_verify_sweep_gas() public {
+        string memory dir = vm.envOr("SWEEP_PACK", string(""));
+        if (bytes(dir).length == 0) {
+            return;
+        }
+        uint256 count = vm.envUint("SWEEP_COUNT");
+
+        // nothing outlives an iteration, so each one reuses the same memory (no growth with pack size)
+        uint256 fmp;
+        assembly {
+            fmp := mload(0x40)
+        }
+
+        for (uint256 i = 0; i < count; ++i) {
+            string memory json = vm.readFile(string.concat(dir, "/", vm.toString(i), ".json"));
+
+            string memory name = vm.parseJsonString(json, ".name");
+            bytes memory pkRaw = vm.parseJsonBytes(json, ".pubkey_hex");
+            bytes memory sigRaw = vm.parseJsonBytes(json, ".signature_hex");
+            bytes32 msgHash = vm.parseJsonBytes32(json, ".msg_hash");
+
+            MLDSA65_Verifier_v2.PublicKey memory pk = MLDSA65_Verifier_v2.PublicKey({raw: pkRaw});
+            MLDSA65_Verifier_v2.Signature memory sig = MLDSA65_Verifier_v2.Signature({raw: sigRaw});
+
+            // Measure only the external verify() call (log-isolated).
+            uint256 g0 = gasleft();
+            bool ok = verifier.verify(pk, sig, msgHash);
+            uint256 used = g0 - gasleft();
+
+            emit log_named_uint(string.concat("sweep::", name, " gas"), used);
+
+            if (vm.keyExistsJson(json, ".expected")) {
+                bool expected = vm.parseJsonBool(json, ".expected");
+                emit log_named_string(string.concat("sweep::", name, " result"), ok == expected ? "match" : "mismatch");
+            }
+
+            assembly {
+                mstore(0x40, fmp)
+            }
+        }
+    }
+}
@@ -1,59 +1,63 @@
 #!/usr/bin/env python3
+import hashlib
 import json
-import pathlib
+import sys
+from pathlib import Path
 
-Q = 8380417
-N = 256
-L = 5
-SIG_BYTES = 3309  # FIPS-204 сигнатура має 3309 байт, ми просто дотримуємось розміру
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import mldsa65_ref as ref  # noqa: E402
+
+NAME = "mldsa65_sig_kat_001"
+
+# Детермінований KAT: фіксований seed xi, фіксований 32-байтний msg_hash, rnd = 0^32
+SEED = bytes(range(32))
+MSG = hashlib.sha256(NAME.encode()).digest()
+
+
+def decode_v2_view(sig: bytes):
+    """
+    Що сьогодні читає MLDSA65_Verifier_v2._decodeSignatureRaw з цих байтів:
+    c = останні 32 байти, z[0][0..3] = 4× uint32 LE з початку буфера, mod q.
+    Це ще не FIPS-розбір (c_tilde || z || h) — KAT-тест фіксує поточну поведінку контракту.
+    """
+    c = sig[-32:]
+    z0 = [int.from_bytes(sig[4 * i:4 * i + 4], "little") % ref.Q for i in range(4)]
+    return c, z0
 
 
 def main() -> None:
-    # Візьмемо прості коефіцієнти для z[0][0..3]
-    z0_coeffs = [0, 1, 2, 3]
-
-    # Готуємо байтовий буфер під сигнатуру
-    sig = bytearray(SIG_BYTES)
-
-    # 1) Запаковуємо z[0][0..3] у перші 16 байтів як 4× int32 LE
-    #    Це відповідає поточному `_decodeSignatureRaw`, який читає:
-    #    z[0][i] = _decodeCoeffLE(sigRaw, i * 4) для i in 0..3.
-    for i, c in enumerate(z0_coeffs):
-        v = c % Q
-        off = 4 * i
-        sig[off:off + 4] = int(v).to_bytes(4, "little", signed=False)
-
-    # 2) Заповнюємо "тіло" (байти між 16 та останніми 32) якимось детермінованим патерном
-    for i in range(4 * len(z0_coeffs), SIG_BYTES - 32):
-        sig[i] = i % 256
-
-    # 3) Останні 32 байти = c (challenge), беремо простий патерн 0x80..0x9f
-    c_bytes = bytes(range(0x80, 0x80 + 32))
-    sig[-32:] = c_bytes
-
-    # 4) Формуємо повний z як PolyVecL (L = 5, N = 256)
-    z = []
-    row0 = z0_coeffs + [0] * (N - len(z0_coeffs))
-    z.append(row0)
-    for _ in range(L - 1):
-        z.append([0] * N)
-
-    # 5) h – поки що просто нулі, placeholder
-    h = []
-    for _ in range(L):
-        h.append([0] * N)
-
-    out = {
-        "name": "mldsa65_sig_kat_001",
+    out_path = Path("vectors/mldsa65_sig_kat_001.json")
+
+    # 1) Справжні keygen / sign (FIPS-204) з scripts/mldsa65_ref.py
+    [(pk, sk)] = ref.keygen_batch([SEED])
+    [sig] = ref.sign_batch([sk], [MSG])
+    assert len(pk) == ref.PK_BYTES and len(sig) == ref.SIG_BYTES
+
+    # 2) Підпис має проходити референсний verify
+    [ok], _ = ref.verify_batch([pk], [MSG], [sig])
+    if not ok:
+        raise SystemExit(f"{NAME}: reference verify rejected the signature")
+
+    # 3) FIPS-розбір: c_tilde (48) || z (L×256, centered) || h (K×256)
+    c_tilde, z, h = ref.sig_decode(sig)
+    assert h is not None
+    c, z0 = decode_v2_view(sig)
+
+    data = {
+        "name": NAME,
+        "seed": "0x" + SEED.hex(),
+        "msg_hash": "0x" + MSG.hex(),
+        "pubkey": "0x" + pk.hex(),                                   # FIPS: rho || t1
+        "pubkey_contract": "0x" + ref.pk_to_contract_layout(pk).hex(),  # t1 || rho (MLDSA65_Verifier_v2)
         "sig": "0x" + sig.hex(),
-        "c": "0x" + c_bytes.hex(),
-        "z": z,
-        "h": h,
+        "c_tilde": "0x" + c_tilde.hex(),
+        "z": ref.centered(z).tolist(),                                # 5×256 int
+        "h": h.astype(int).tolist(),                                  # 6×256 (0/1)
+        "decode_v2": {"c": "0x" + c.hex(), "z0": z0},
     }
 
-    path = pathlib.Path("vectors/mldsa65_sig_kat_001.json")
-    path.write_text(json.dumps(out, indent=2))
-    print(f"[+] Written {path}")
+    out_path.write_text(json.dumps(data, indent=2))
+    print(f"[+] Written {out_path}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 import json
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import bitpack  # noqa: E402
+
 # Параметри ML-DSA-65
 Q = 8380417
 K = 6
@@ -23,41 +29,14 @@ def fake_mldsa65_unpack_pk(pk_bytes: bytes):
     """
     Тимчасовий псевдо-UNPACK, який імітує Solidity _decodeT1Packed.
 
-    ВАЖЛИВО: тут ми повторюємо ту саму 4×10→5 байт схему, що й у
-    MLDSA65_Verifier_v2::_decodeT1Packed, щоб JSON-вектор і on-chain
-    декод збігалися один з одним.
+    ВАЖЛИВО: та сама 4×10→5 байт схема, що й у MLDSA65_Verifier_v2::_decodeT1Packed
+    (SimpleBitPack, little-endian бітовий порядок) — спільний кодек scripts/bitpack.py,
+    `python3 scripts/bitpack.py check` звіряє його з транслітерацією _decodeT1Packed.
     """
     assert len(pk_bytes) == PK_LEN
-    src = pk_bytes[:1920]
-
-    t1 = []
-
-    for k in range(K):
-        poly = [0] * N
-        base = k * 320  # 320 байт на поліно́м
-
-        for g in range(64):  # 64 групи по 4 коефіцієнти
-            idx = base + 5 * g
-
-            b0 = src[idx + 0]
-            b1 = src[idx + 1]
-            b2 = src[idx + 2]
-            b3 = src[idx + 3]
-            b4 = src[idx + 4]
-
-            t0 = (b0 | ((b1 & 0x03) << 8)) & 0x03FF
-            t1c = ((b1 >> 2) | ((b2 & 0x0F) << 6)) & 0x03FF
-            t2c = ((b2 >> 4) | ((b3 & 0x3F) << 4)) & 0x03FF
-            t3c = ((b3 >> 6) | (b4 << 2)) & 0x03FF
-
-            base_coeff = 4 * g
-            poly[base_coeff + 0] = t0
-            poly[base_coeff + 1] = t1c
-            poly[base_coeff + 2] = t2c
-            poly[base_coeff + 3] = t3c
-
-        t1.append(poly)
+    src = np.frombuffer(pk_bytes[:1920], dtype=np.uint8).reshape(K, 320)  # 320 байт на поліном
 
+    t1 = bitpack.decode(src, "t1").tolist()
     rho = pk_bytes[-32:]
 
     return rho, t1